@@ -3,14 +3,40 @@ REST API 서버 for Next.js Frontend
 FastAPI 기반의 간단한 REST API 엔드포인트를 제공
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import hmac
+import io
+import json
+import os
+import tempfile
+from datetime import datetime
+from fastapi import FastAPI, HTTPException, Request, Header, Body, Query, Depends, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse, Response
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 import uvicorn
-from ..database.database import ItemDatabase
+from ..database.database import ItemDatabase, get_database_path, normalize_cell
+from ..database.bulk_io import export_chunks, import_items
+from ..core.metrics import MetricsMiddleware, registry
+from ..core import profiler
 from ..models.models import Item, LEDControl
-from ..controllers.esp32_controller import ESP32Controller
+from ..controllers.esp32_controller import ESP32Controller, LEDDaemonClient, RetryPolicy
+from ..controllers.led_client import LEDDaemonError, daemon_socket_path
+from ..controllers.led_queue import LEDJob, LEDJobQueue, PRIORITIES, QueueFullError
+from ..controllers.effects import Blink, Chase, EffectsEngine, FollowMe, Pulse, Rainbow
+from ..core.event_bus import (
+    event_bus,
+    ITEM_CREATED,
+    ITEM_UPDATED,
+    ITEM_DELETED,
+    ITEM_BULK,
+    LED_ON,
+    LED_OFF,
+    LED_EXPIRED,
+    LED_JOB
+)
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -19,6 +45,9 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 요청 메트릭 (라우트별 지연 시간/상태 코드, /metrics로 노출)
+app.add_middleware(MetricsMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -29,8 +58,135 @@ app.add_middleware(
 )
 
 # 데이터베이스 및 컨트롤러 초기화
-db = ItemDatabase()
-esp32 = ESP32Controller()
+db = ItemDatabase(get_database_path())
+# ESP32 주소 (로컬 시뮬레이터: ESP32_IP=127.0.0.1 ESP32_PORT=8080), ESP32_TRANSPORT=ws면 WebSocket 채널 사용
+# ESP32_HEDGE=1이면 HTTP 응답이 최근 p95보다 늦을 때 헤지 요청
+# LED_DAEMON_SOCKET이 설정되면 하드웨어는 LED 데몬이 소유하고 API는 명령만 보냄
+_daemon_socket = daemon_socket_path()
+if _daemon_socket:
+    esp32 = LEDDaemonClient(_daemon_socket)
+else:
+    esp32 = ESP32Controller(os.getenv("ESP32_IP", "192.168.1.100"), int(os.getenv("ESP32_PORT", "80")),
+                            transport=os.getenv("ESP32_TRANSPORT", "http"),
+                            retry=RetryPolicy(hedge=os.getenv("ESP32_HEDGE") == "1"))
+
+def _on_led_job_finished(job: LEDJob):
+    """LED 작업 결과를 구독자에게 전달 (켜짐 이벤트, duration 후 만료 이벤트)"""
+    event_bus.publish(LED_JOB, {"job": job.to_dict()})
+    if job.error:
+        return
+    
+    led_control = job.led_control
+    led_event = {
+        "grid_position": led_control.grid_position,
+        "color": led_control.color,
+        "duration": led_control.duration,
+        "job_id": job.id
+    }
+    event_bus.publish(LED_ON, led_event)
+    if led_control.duration > 0:
+        asyncio.get_running_loop().call_later(
+            led_control.duration, event_bus.publish, LED_EXPIRED, led_event
+        )
+
+async def _execute_led_command(led_control: LEDControl) -> Dict[str, Any]:
+    # 실행 시점의 컨트롤러 사용 (테스트/부하 테스트에서 목업으로 교체 가능)
+    return await esp32.highlight_position(led_control)
+
+# LED 명령 작업 큐 (요청은 작업 ID만 받고 즉시 반환)
+led_jobs = LEDJobQueue(_execute_led_command, on_finished=_on_led_job_finished)
+
+registry.gauge("event_bus_subscribers", "이벤트 스트림 구독자 수", callback=lambda: event_bus.subscriber_count)
+registry.gauge("led_jobs_pending", "실행을 기다리는 LED 작업 수", callback=lambda: led_jobs.pending)
+
+# LED 효과 엔진 (첫 효과 요청 시 생성, 프레임은 API 이벤트 루프에서 전송)
+EFFECTS_FPS = 30.0
+_effects_engine: Optional[EffectsEngine] = None
+
+def _get_effects_engine() -> EffectsEngine:
+    global _effects_engine
+    if _effects_engine is None:
+        _effects_engine = EffectsEngine(
+            esp32.framebuffer, esp32.push_frame, fps=EFFECTS_FPS, loop=asyncio.get_running_loop()
+        )
+    return _effects_engine
+
+@app.on_event("startup")
+async def connect_led_daemon():
+    """LED 데몬을 쓰면 미리 연결해 그리드 크기를 데몬 하드웨어에 맞춤 (데몬이 아직 없으면 첫 요청 때 연결)"""
+    if isinstance(esp32, LEDDaemonClient):
+        try:
+            await esp32.connect()
+        except LEDDaemonError:
+            pass
+
+@app.on_event("startup")
+async def start_hardware_health():
+    """하드웨어 상태 백그라운드 확인 시작 (HARDWARE_HEALTH_INTERVAL초마다, 0이면 끔)
+    
+    probe는 API 이벤트 루프에서 실행되어 LED 명령과 같은 HTTP 세션/데몬 연결을 씁니다.
+    """
+    interval = float(os.getenv("HARDWARE_HEALTH_INTERVAL", "5"))
+    if interval > 0:
+        esp32.health.interval = interval
+        esp32.health.start(asyncio.get_running_loop())
+
+@app.on_event("shutdown")
+async def close_database():
+    """LED 작업 큐와 효과 엔진을 멈추고, 대기 중인 쓰기를 커밋한 뒤 쓰기 스레드 종료"""
+    global _effects_engine
+    await led_jobs.close()
+    # probe가 이 루프에서 실행되므로 루프를 막지 않고 대기
+    await asyncio.to_thread(esp32.health.stop)
+    if _effects_engine is not None:
+        # 엔진 스레드가 이 루프에서 마지막 프레임을 보내므로 루프를 막지 않고 대기
+        await asyncio.to_thread(_effects_engine.stop)
+        _effects_engine = None
+    db.close()
+
+# 이벤트 스트림 하트비트 간격(초) - 프록시가 연결을 끊지 않도록 유지
+EVENT_HEARTBEAT_SECONDS = 15.0
+
+# 가져오기 본문을 메모리에 보관할 최대 크기 (초과분은 임시 파일)
+IMPORT_SPOOL_MEMORY = 8 * 1024 * 1024
+
+# 직렬화된 응답 캐시: key -> (인벤토리 버전, JSON 바이트)
+RESPONSE_CACHE_SIZE = 256
+_response_cache: Dict[str, Tuple[int, bytes]] = {}
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+def _conditional_json(request: Request, key: str, build: Callable[[], Any]) -> Response:
+    """인벤토리 버전 기반 강한 ETag 응답
+    
+    If-None-Match가 일치하면 DB 조회나 직렬화 없이 304를 반환하고,
+    같은 버전의 응답은 캐시된 바이트를 그대로 돌려줍니다.
+    본문을 만드는 동안 버전이 바뀌면(동시 쓰기) 어느 버전의 데이터인지 알 수 없으므로 캐시하지 않습니다.
+    """
+    version = db.get_inventory_version()
+    etag = f'"{key}-v{version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    cached = _response_cache.get(key)
+    if cached and cached[0] == version:
+        body = cached[1]
+    else:
+        body = json.dumps(jsonable_encoder(build()), ensure_ascii=False).encode("utf-8")
+        _response_cache.pop(key, None)
+        if db.get_inventory_version() == version:
+            _response_cache[key] = (version, body)
+            while len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.pop(next(iter(_response_cache)))
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # 요청/응답 모델
 class ItemCreate(BaseModel):
@@ -45,8 +201,39 @@ class ItemUpdate(BaseModel):
     category: Optional[str] = None
     grid_position: Optional[str] = None
 
+class ItemBulkUpdate(ItemUpdate):
+    id: int
+
+# 일괄 처리 모드: atomic(전부 성공 또는 전부 롤백) / best_effort(가능한 행만 반영)
+BulkMode = Literal["atomic", "best_effort"]
+ExportFormat = Literal["csv", "jsonl"]
+
+class BulkCreateRequest(BaseModel):
+    items: List[ItemCreate]
+    mode: BulkMode = "atomic"
+
+class BulkUpdateRequest(BaseModel):
+    items: List[ItemBulkUpdate]
+    mode: BulkMode = "atomic"
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[int]
+    mode: BulkMode = "atomic"
+
 class HighlightRequest(BaseModel):
     grid_position: str
+    color: str = "red"
+    duration: float = 5.0
+    priority: Literal["interactive", "bulk", "diagnostic"] = "interactive"
+
+class EffectRequest(BaseModel):
+    type: Literal["blink", "pulse", "chase", "rainbow", "follow_me"]
+    grid_position: str
+    color: str = "green"
+    duration: Optional[float] = 10.0  # None이면 삭제할 때까지 재생
+    period: Optional[float] = None  # blink/pulse/rainbow 주기(초)
+    speed: Optional[float] = None  # chase/follow_me 속도(셀/초)
+    origin: str = "A1"  # follow_me 시작 셀
 
 class CategoryResponse(BaseModel):
     id: int
@@ -61,14 +248,42 @@ async def root():
 # Health Check
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "database": "connected"}
+    """실제 의존성을 가볍게 확인 (네트워크 호출 없음 - 하드웨어는 백그라운드 확인의 캐시)"""
+    checks: Dict[str, Any] = {}
+    try:
+        checks["database"] = db.health()
+    except Exception as e:
+        checks["database"] = {"ok": False, "error": str(e)}
+    
+    checks["event_bus"] = {"ok": True, "subscribers": event_bus.subscriber_count}
+    # 하드웨어가 꺼져 있어도 API는 동작하므로 ok는 유지하고 연결 여부만 보고
+    checks["esp32"] = {"ok": True, "controller": type(esp32).__name__, "url": esp32.base_url,
+                       **esp32.health.snapshot()}
+    checks["led_queue"] = {"ok": True, **led_jobs.stats()}
+    
+    healthy = all(check["ok"] for check in checks.values())
+    return JSONResponse(
+        status_code=200 if healthy else 503,
+        content={
+            "status": "healthy" if healthy else "unhealthy",
+            "database": "connected" if checks["database"]["ok"] else "error",
+            "checks": checks
+        }
+    )
+
+# Prometheus 메트릭 (텍스트 노출 형식)
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(content=registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 # 모든 물품 조회
 @app.get("/items", response_model=List[Item])
-async def get_all_items():
+async def get_all_items(request: Request):
     try:
-        items = db.get_all_items()
-        return [Item(**item) for item in items]
+        return _conditional_json(
+            request, "items",
+            lambda: [Item(**item) for item in db.get_all_items()]
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -81,14 +296,107 @@ async def search_items(q: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _bulk_response(action: str, mode: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """일괄 처리 결과 요약 및 이벤트 발행 (행마다가 아닌 배치당 한 번)"""
+    succeeded = [r["id"] for r in results if r["success"]]
+    if succeeded:
+        event_bus.publish(ITEM_BULK, {"action": action, "ids": succeeded})
+    return {
+        "mode": mode,
+        "total": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "results": results
+    }
+
+# 물품 일괄 추가 (단일 트랜잭션)
+@app.post("/items/bulk")
+async def create_items_bulk(request: BulkCreateRequest):
+    try:
+        results = await asyncio.to_thread(
+            db.add_items_bulk,
+            [item.model_dump() for item in request.items],
+            atomic=request.mode == "atomic"
+        )
+        return _bulk_response("created", request.mode, results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 물품 일괄 수정 (단일 트랜잭션)
+@app.put("/items/bulk")
+async def update_items_bulk(request: BulkUpdateRequest):
+    try:
+        results = await asyncio.to_thread(
+            db.update_items_bulk,
+            [item.model_dump(exclude_none=True) for item in request.items],
+            atomic=request.mode == "atomic"
+        )
+        return _bulk_response("updated", request.mode, results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 물품 일괄 삭제 (단일 트랜잭션)
+@app.delete("/items/bulk")
+async def delete_items_bulk(request: BulkDeleteRequest = Body(...)):
+    try:
+        results = await asyncio.to_thread(db.delete_items_bulk, request.ids, atomic=request.mode == "atomic")
+        return _bulk_response("deleted", request.mode, results)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 물품 대량 가져오기 (CSV/JSONL 요청 본문)
+@app.post("/items/import")
+async def import_items_stream(request: Request, format: ExportFormat = "csv",
+                              batch_size: int = Query(5000, ge=1, le=50000)):
+    # 본문은 임시 파일로 받아(큰 입력은 디스크로 넘김) 워커 스레드에서 가져오기
+    spool = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY)
+    try:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        
+        def run():
+            stream = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+            try:
+                return import_items(db, stream, format, batch_size=batch_size)
+            finally:
+                stream.detach()
+        
+        stats = await asyncio.to_thread(run)
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"UTF-8 인코딩이 아닙니다: {e}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        spool.close()
+    
+    if stats.imported:
+        event_bus.publish(ITEM_BULK, {"action": "imported", "count": stats.imported})
+    return stats.to_dict()
+
+# 물품 전체 내보내기 (커서 기반 스트리밍)
+@app.get("/items/export")
+async def export_items_stream(format: ExportFormat = "csv"):
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        export_chunks(db, format),
+        media_type=f"{media_type}; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="items.{format}"'}
+    )
+
 # 특정 물품 조회
 @app.get("/items/{item_id}", response_model=Item)
-async def get_item(item_id: int):
-    try:
+async def get_item(item_id: int, request: Request):
+    def build():
         item = db.get_item_by_id(item_id)
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
         return Item(**item)
+    
+    try:
+        return _conditional_json(request, f"item-{item_id}", build)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -104,11 +412,12 @@ async def create_item(item: ItemCreate):
             'grid_position': item.grid_position
         }
         
-        # 데이터베이스에 추가
-        item_id = db.add_item(**item_data)
+        # 데이터베이스에 추가 (커밋을 기다리는 동안 이벤트 루프를 막지 않도록 워커 스레드에서)
+        item_id = await asyncio.to_thread(db.add_item, **item_data)
         
         # 추가된 물품 반환
         new_item = db.get_item_by_id(item_id)
+        event_bus.publish(ITEM_CREATED, {"item": new_item})
         return Item(**new_item)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -134,10 +443,11 @@ async def update_item(item_id: int, item: ItemUpdate):
             update_data['grid_position'] = item.grid_position
         
         # 데이터베이스 업데이트
-        db.update_item(item_id, **update_data)
+        await asyncio.to_thread(db.update_item, item_id, **update_data)
         
         # 업데이트된 물품 반환
         updated_item = db.get_item_by_id(item_id)
+        event_bus.publish(ITEM_UPDATED, {"item": updated_item})
         return Item(**updated_item)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -152,7 +462,8 @@ async def delete_item(item_id: int):
             raise HTTPException(status_code=404, detail="Item not found")
         
         # 데이터베이스에서 삭제
-        db.delete_item(item_id)
+        await asyncio.to_thread(db.delete_item, item_id)
+        event_bus.publish(ITEM_DELETED, {"id": item_id, "grid_position": existing_item["grid_position"]})
         
         return {"message": "Item deleted successfully"}
     except Exception as e:
@@ -160,8 +471,8 @@ async def delete_item(item_id: int):
 
 # 카테고리 목록 조회
 @app.get("/categories", response_model=List[CategoryResponse])
-async def get_categories():
-    try:
+async def get_categories(request: Request):
+    def build():
         categories = db.get_categories()
         return [
             CategoryResponse(
@@ -171,35 +482,218 @@ async def get_categories():
             )
             for idx, category in enumerate(categories)
         ]
+    
+    try:
+        return _conditional_json(request, "categories", build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-# LED 하이라이트
-@app.post("/highlight")
-async def highlight_position(request: HighlightRequest):
+# 그리드 셀 점유 현황
+@app.get("/grid/occupancy", response_model=Dict[str, List[int]])
+async def get_grid_occupancy(request: Request):
     try:
-        # LED 제어 객체 생성
-        led_control = LEDControl(
-            grid_position=request.grid_position,
-            action="highlight",
-            color="red",
-            duration=5.0
-        )
-        
-        # ESP32 컨트롤러로 전송
-        result = await esp32.highlight_position(led_control)
-        
-        return {
-            "message": f"Position {request.grid_position} highlighted",
-            "result": result
-        }
+        return _conditional_json(request, "occupancy", db.get_occupancy_map)
     except Exception as e:
-        print(f"LED highlight error: {e}")
-        # LED 실패는 치명적이지 않으므로 200 반환
-        return {
-            "message": f"Position {request.grid_position} highlight requested",
-            "error": str(e)
-        }
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/grid/cells/{cell}/items", response_model=List[Item])
+async def get_items_at_cell(cell: str, request: Request):
+    def build():
+        return [Item(**item) for item in db.get_items_at(cell)]
+    
+    try:
+        return _conditional_json(request, f"cell-{normalize_cell(cell)}", build)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# LED 하이라이트 (작업 큐에 접수하고 즉시 반환)
+@app.post("/highlight", status_code=202)
+async def highlight_position(request: HighlightRequest):
+    led_control = LEDControl(
+        grid_position=request.grid_position,
+        action="highlight",
+        color=request.color,
+        duration=request.duration
+    )
+    
+    try:
+        job = led_jobs.submit(led_control, PRIORITIES[request.priority])
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    
+    return {
+        "message": f"Position {request.grid_position} highlight queued",
+        "job": job.to_dict()
+    }
+
+# LED 작업 상태 조회 (wait초 동안 완료를 기다리는 롱 폴링 지원)
+@app.get("/highlight/jobs/{job_id}")
+async def get_highlight_job(job_id: str, wait: float = Query(0.0, ge=0, le=30)):
+    job = led_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if wait and not job.finished:
+        try:
+            await led_jobs.wait(job, timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+    return job.to_dict()
+
+def _build_effect(request: EffectRequest):
+    positions = esp32.expand_positions(request.grid_position.strip().upper())
+    if not any(esp32.position_to_led_index(position) is not None for position in positions):
+        raise ValueError("No valid LED positions found")
+    color = esp32.color_name_to_rgb(request.color)
+    duration = request.duration
+    
+    if request.type == "blink":
+        return Blink(positions, color, period=request.period or 0.5, duration=duration)
+    if request.type == "pulse":
+        return Pulse(positions, color, period=request.period or 1.5, duration=duration)
+    if request.type == "chase":
+        return Chase(positions, color, speed=request.speed or 8.0, duration=duration)
+    if request.type == "rainbow":
+        return Rainbow(positions, period=request.period or 3.0, duration=duration)
+    if esp32.position_to_led_index(request.origin) is None:
+        raise ValueError(f"Invalid origin: {request.origin}")
+    return FollowMe(request.origin, positions, color, speed=request.speed or 10.0, duration=duration)
+
+# LED 효과 재생
+@app.post("/effects", status_code=201)
+async def start_effect(request: EffectRequest):
+    try:
+        effect = _build_effect(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    engine = _get_effects_engine()
+    effect_id = engine.add(effect)
+    return {"id": effect_id, "effect": type(effect).__name__, "duration": request.duration}
+
+@app.get("/effects")
+async def list_effects():
+    engine = _effects_engine
+    if engine is None:
+        return {"active": [], "stats": None}
+    return {"active": engine.active(), "stats": engine.stats()}
+
+@app.delete("/effects/{effect_id}")
+async def stop_effect(effect_id: int):
+    if _effects_engine is None or not _effects_engine.remove(effect_id):
+        raise HTTPException(status_code=404, detail="Effect not found")
+    return {"id": effect_id, "stopped": True}
+
+@app.delete("/effects")
+async def stop_all_effects():
+    if _effects_engine is not None:
+        _effects_engine.clear()
+    return {"stopped": True}
+
+# 모든 LED 끄기 (재생 중인 효과 포함)
+@app.post("/leds/off")
+async def turn_off_leds():
+    if _effects_engine is not None:
+        _effects_engine.clear()
+    result = await esp32.turn_off_all_leds()
+    if result.get("success"):
+        event_bus.publish(LED_OFF, {"all": True})
+    return result
+
+def _parse_topics(types: Optional[str]) -> Optional[List[str]]:
+    """쉼표로 구분된 이벤트 타입 필터 파싱 (예: "item,led.on")"""
+    if not types:
+        return None
+    return [t.strip() for t in types.split(",") if t.strip()]
+
+def _format_sse(event: dict) -> str:
+    """이벤트를 SSE 프레임으로 변환"""
+    payload = json.dumps(event, ensure_ascii=False, default=str)
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+# 실시간 이벤트 스트림 (Server-Sent Events)
+@app.get("/events")
+async def stream_events(
+    request: Request,
+    types: Optional[str] = None,
+    last_event_id: Optional[str] = Header(None)
+):
+    topics = _parse_topics(types)
+    
+    async def event_stream():
+        subscription = event_bus.subscribe(topics)
+        last_sent_id = 0
+        try:
+            # 재연결 시 놓친 이벤트 재전송
+            if last_event_id and last_event_id.isdigit():
+                for event in event_bus.events_since(int(last_event_id), topics):
+                    last_sent_id = event["id"]
+                    yield _format_sse(event)
+            
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=EVENT_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event["id"] <= last_sent_id:
+                    continue
+                yield _format_sse(event)
+        finally:
+            subscription.close()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# 실시간 이벤트 스트림 (WebSocket)
+@app.websocket("/ws/events")
+async def websocket_events(websocket: WebSocket, types: Optional[str] = None):
+    await websocket.accept()
+    subscription = event_bus.subscribe(_parse_topics(types))
+    try:
+        while True:
+            event = await subscription.get(timeout=EVENT_HEARTBEAT_SECONDS)
+            if event is None:
+                await websocket.send_json({"type": "ping"})
+                continue
+            await websocket.send_text(json.dumps(event, ensure_ascii=False, default=str))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
+
+# 관리자 전용 엔드포인트 (ADMIN_TOKEN 미설정 시 비활성화)
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    expected = os.getenv("ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 올바르지 않습니다")
+
+@app.post("/admin/profile", dependencies=[Depends(require_admin)], include_in_schema=False)
+async def profile_process(
+    seconds: float = Query(10.0, gt=0, le=profiler.MAX_DURATION),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    format: Literal["collapsed", "json"] = "collapsed",
+    include_idle: bool = False
+):
+    """실행 중인 프로세스를 seconds초 동안 샘플링해 collapsed-stack 파일(또는 요약 JSON)로 반환"""
+    try:
+        profile = await asyncio.to_thread(profiler.sample, seconds, interval_ms / 1000, include_idle)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if format == "json":
+        return profile.summary()
+    
+    filename = f"api-profile-{datetime.now():%Y%m%d-%H%M%S}.collapsed"
+    return Response(
+        content=profile.collapsed(),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 # 서버 실행 함수
 def run_server():
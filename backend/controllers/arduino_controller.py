@@ -3,17 +3,35 @@ Arduino Uno 시리얼 통신 기반 LED 컨트롤러
 Arduino Uno와 USB 시리얼 통신을 통해 NeoPixel LED를 제어합니다.
 """
 
+import os
 import serial
 import time
 import threading
 import logging
-from typing import Dict, List, Optional, Tuple
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel
 
+from ..core.metrics import CONTROLLER_DURATION, CONTROLLER_FAILURES
+from ..core.tracing import span
+from .framebuffer import LEDFramebuffer
+from .health import HealthPoller
+from .led_client import ArduinoDaemonClient, daemon_socket_path
+from .serial_io import SerialIO
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 마지막으로 연결에 성공한 포트를 저장하는 파일 (전역 컨트롤러용)
+DEFAULT_PORT_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "inventory", "arduino_port")
+
+# 포트 검색(comports) 결과를 재사용하는 시간(초)
+PORT_SCAN_TTL = 5.0
+
+# Arduino(정품/SRL)와 호환 보드의 USB-시리얼 칩(CH340, FTDI, CP210x) VID
+ARDUINO_USB_VIDS = {0x2341, 0x2A03, 0x1A86, 0x0403, 0x10C4}
+
 class LEDPosition(BaseModel):
     """LED 위치 정보"""
     row: str  # A-E
@@ -49,103 +67,240 @@ class LEDColor(BaseModel):
 class ArduinoLEDController:
     """Arduino Uno 기반 LED 컨트롤러"""
     
-    def __init__(self, port: str = "/dev/tty.usbmodem1101", baudrate: int = 115200):
-        self.port = port
+    def __init__(self, port: Optional[str] = None, baudrate: int = 115200,
+                 auto_connect: bool = True, reset_delay: float = 2.0, auto_reconnect: bool = True,
+                 reconnect_min: float = 0.5, reconnect_max: float = 30.0, port_cache: Optional[str] = None):
+        """
+        Args:
+            port: 연결할 시리얼 포트 (None이면 자동 검색)
+            reset_delay: 포트를 연 뒤 Arduino 자동 리셋(부트로더)을 기다리는 최대 시간(초)
+            auto_reconnect: 보드가 분리되면(또는 처음에 없으면) 백그라운드에서 다시 연결
+            reconnect_min, reconnect_max: 재연결 시도 간격(초) - 실패할 때마다 두 배로 늘어남
+            port_cache: 마지막으로 연결에 성공한 포트를 저장할 파일 (다음 실행 때 먼저 시도)
+        """
+        self.port = port or "/dev/tty.usbmodem1101"
+        self.preferred_port = port
         self.baudrate = baudrate
+        self.reset_delay = reset_delay
         self.serial_conn: Optional[serial.Serial] = None
+        self.io: Optional[SerialIO] = None  # 연결 후 포트를 소유하는 I/O 스레드
         self.is_connected = False
         self.simulation_mode = False
         
-        # LED 상태 관리 (5x8 그리드)
-        self.led_states: Dict[str, LEDColor] = {}
-        self.state_lock = threading.Lock()
+        # 핫플러그: 마지막 성공 포트, 포트 검색 결과 캐시, 재연결 모니터
+        self.auto_reconnect = auto_reconnect
+        self.reconnect_min = reconnect_min
+        self.reconnect_max = reconnect_max
+        self.port_cache = port_cache
+        self.last_good_port = self._load_cached_port()
+        self.reconnects = 0
+        self._scan: Tuple[List[str], List[str]] = ([], [])
+        self._scan_time = float("-inf")
+        self._stop_event = threading.Event()
+        self._monitor_lock = threading.Lock()
+        self.monitor_thread: Optional[threading.Thread] = None
+        
+        # LED 상태 관리 (5x8 그리드 프레임버퍼 + 셀별 만료 시각)
+        self.framebuffer = LEDFramebuffer(rows=5, cols=8)
+        self.state_lock = self.framebuffer.lock
         
         # 시리얼 통신 스레드
         self.update_thread: Optional[threading.Thread] = None
         self.should_stop = False
         
+        # 상태 캐시 (health.start()로 백그라운드 확인 시작, health.snapshot()은 요청 없이 읽음)
+        self.health = HealthPoller(self.probe, "ArduinoLEDController")
+        
         # 자동 연결 시도
-        self.connect()
+        if auto_connect:
+            self.connect(port)
     
-    def connect(self) -> bool:
-        """Arduino에 연결"""
+    def connect(self, port: Optional[str] = None) -> bool:
+        """Arduino에 연결 (port를 지정하면 해당 포트만, 아니면 마지막 성공 포트부터 시도)"""
+        self._stop_event.clear()
         try:
-            # 시리얼 포트 찾기
-            available_ports = self._find_arduino_ports()
+            if port:
+                self.preferred_port = port
+            available_ports = [port] if port else self._candidate_ports()
             
             if not available_ports:
                 logger.warning("Arduino를 찾을 수 없습니다. 시뮬레이션 모드로 전환합니다.")
                 self.simulation_mode = True
+                self._start_monitor()
                 return True
             
             # 연결 시도
-            for port in available_ports:
-                try:
-                    self.serial_conn = serial.Serial(port, self.baudrate, timeout=1)
-                    time.sleep(2)  # Arduino 초기화 대기
-                    
-                    # 연결 확인
-                    if self._test_connection():
-                        self.port = port
-                        self.is_connected = True
-                        self.simulation_mode = False
-                        logger.info(f"Arduino 연결 성공: {port}")
-                        
-                        # 업데이트 스레드 시작
-                        self._start_update_thread()
-                        return True
-                    else:
-                        self.serial_conn.close()
-                        
-                except Exception as e:
-                    logger.error(f"포트 {port} 연결 실패: {e}")
-                    continue
+            for candidate in available_ports:
+                if self._open(candidate):
+                    self._start_update_thread()
+                    return True
             
             # 모든 포트에서 연결 실패
             logger.warning("Arduino 연결 실패. 시뮬레이션 모드로 전환합니다.")
             self.simulation_mode = True
+            self._start_monitor()
             return True
-            
+        
         except Exception as e:
             logger.error(f"Arduino 연결 중 오류: {e}")
             self.simulation_mode = True
             return True
     
-    def _find_arduino_ports(self) -> List[str]:
-        """Arduino 포트 찾기"""
-        import serial.tools.list_ports
+    def _open(self, port: str) -> bool:
+        """포트를 열고 STATUS로 확인 - 성공하면 현재 프레임버퍼를 다시 보냄"""
+        conn = None
+        try:
+            conn = serial.Serial(port, self.baudrate, timeout=1)
+            # 이후 포트 읽기/쓰기는 I/O 스레드만 수행
+            self.serial_conn = conn
+            self.io = SerialIO(conn, on_error=self._on_io_error)
+            # 리셋 후 시작 배너를 받으면 바로 진행 (배너가 없으면 reset_delay만큼 대기)
+            self.io.ready.wait(self.reset_delay)
+            
+            if self._test_connection():
+                self.port = port
+                self.simulation_mode = False
+                self.is_connected = True
+                self.last_good_port = port
+                if port != self.preferred_port:
+                    self._save_cached_port(port)
+                logger.info(f"Arduino 연결 성공: {port}")
+                self._replay()
+                self.health.refresh()
+                return True
+        
+        except Exception as e:
+            logger.error(f"포트 {port} 연결 실패: {e}")
+        
+        self._release()
+        if conn is not None and conn.is_open:
+            conn.close()
+        return False
+    
+    def _release(self):
+        """I/O 스레드와 포트 정리"""
+        self.is_connected = False
+        io, conn = self.io, self.serial_conn
+        self.io = None
+        self.serial_conn = None
+        if io:
+            io.close(timeout=0)
+        if conn:
+            try:
+                conn.close()
+            except Exception:
+                pass
+    
+    def _replay(self):
+        """연결(리셋) 직후 보드는 모두 꺼진 상태 - 현재 프레임버퍼 전체를 다시 전송"""
+        with self.state_lock:
+            self.framebuffer.mark_all_sent()
+            self._send_led_states()
+    
+    def _on_io_error(self, error: BaseException):
+        """포트 쓰기/읽기 오류 (I/O 스레드에서 호출) - 연결 해제 표시 후 재연결 모니터 시작"""
+        logger.warning(f"Arduino 연결 끊김 ({self.port}): {error}")
+        self.is_connected = False
+        self.health.refresh()
+        self._start_monitor()
+    
+    def _start_monitor(self):
+        """재연결 모니터 스레드 시작 (호출자를 막지 않음)"""
+        if not self.auto_reconnect or self._stop_event.is_set():
+            return
+        with self._monitor_lock:
+            if self.monitor_thread and self.monitor_thread.is_alive():
+                return
+            self.monitor_thread = threading.Thread(target=self._monitor_loop, name="arduino-port-monitor",
+                                                   daemon=True)
+            self.monitor_thread.start()
+    
+    def _monitor_loop(self):
+        """마지막 성공 포트부터 후보 포트를 백오프 간격으로 시도"""
+        self._release()
+        delay = self.reconnect_min
+        while not self._stop_event.is_set():
+            for candidate in self._candidate_ports(strict=True):
+                if self._stop_event.is_set():
+                    return
+                if self._open(candidate):
+                    self.reconnects += 1
+                    self._start_update_thread()
+                    return
+            if self._stop_event.wait(delay):
+                return
+            delay = min(delay * 2, self.reconnect_max)
+    
+    def _candidate_ports(self, strict: bool = False) -> List[str]:
+        """시도할 포트 순서: 지정 포트, 마지막 성공 포트, 검색 결과"""
+        candidates = [p for p in (self.preferred_port, self.last_good_port) if p]
+        candidates += self._find_arduino_ports(strict=strict)
+        return list(dict.fromkeys(candidates))  # 순서 유지 중복 제거
+    
+    def _find_arduino_ports(self, strict: bool = False) -> List[str]:
+        """Arduino 포트 찾기 (확실한 후보 먼저, 검색 결과는 PORT_SCAN_TTL초 동안 재사용)
         
-        arduino_ports = []
-        ports = serial.tools.list_ports.comports()
+        Args:
+            strict: Arduino/USB-시리얼 칩으로 확인된 포트만 (백그라운드 재연결이 관계없는 USB 장치를
+                    반복해서 열지 않도록)
+        """
+        now = time.monotonic()
+        if now - self._scan_time > PORT_SCAN_TTL:
+            self._scan = self._scan_ports()
+            self._scan_time = now
         
-        for port in ports:
-            # Arduino Uno의 일반적인 VID/PID 또는 설명 확인
-            if (port.vid == 0x2341 and port.pid == 0x0043) or \
-               "Arduino" in str(port.description) or \
-               "USB" in str(port.description):
-                arduino_ports.append(port.device)
+        matched, generic = self._scan
+        return list(matched) if strict else matched + [p for p in generic if p not in matched]
+    
+    @staticmethod
+    def _scan_ports() -> Tuple[List[str], List[str]]:
+        """(Arduino로 확인된 포트, 설명에 USB만 있는 포트)"""
+        import glob
+        import serial.tools.list_ports
+        
+        matched, generic = [], []
+        for port in serial.tools.list_ports.comports():
+            description = str(port.description)
+            if port.vid in ARDUINO_USB_VIDS or "Arduino" in description:
+                matched.append(port.device)
+            elif "USB" in description:
+                generic.append(port.device)
         
         # macOS에서 일반적인 Arduino 포트 패턴
-        import glob
-        mac_ports = glob.glob("/dev/tty.usbmodem*") + glob.glob("/dev/tty.usbserial*")
-        arduino_ports.extend(mac_ports)
+        for device in sorted(glob.glob("/dev/tty.usbmodem*") + glob.glob("/dev/tty.usbserial*")):
+            if device not in matched and device not in generic:
+                generic.append(device)
         
-        return list(set(arduino_ports))  # 중복 제거
+        return matched, generic
+    
+    def _load_cached_port(self) -> Optional[str]:
+        if not self.port_cache:
+            return None
+        try:
+            with open(self.port_cache, encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+    
+    def _save_cached_port(self, port: str):
+        if not self.port_cache:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.port_cache), exist_ok=True)
+            with open(self.port_cache, "w", encoding="utf-8") as f:
+                f.write(port)
+        except OSError as e:
+            logger.warning(f"포트 캐시 저장 실패: {e}")
     
-    def _test_connection(self) -> bool:
-        """연결 테스트"""
+    def _test_connection(self, timeout: float = 3.0) -> bool:
+        """연결 테스트 (I/O 스레드로 STATUS를 보내 상태 블록 응답 확인)"""
         try:
-            if not self.serial_conn:
+            if not self.io:
                 return False
             
-            # STATUS 명령 전송
-            self.serial_conn.write(b"STATUS\n")
-            time.sleep(0.1)
-            
-            # 응답 확인
-            response = self.serial_conn.read_all().decode('utf-8', errors='ignore')
-            return "LED Status" in response or "Ready" in response
-            
+            self.io.status().result(timeout)
+            return True
+        
         except Exception as e:
             logger.error(f"연결 테스트 실패: {e}")
             return False
@@ -160,149 +315,177 @@ class ArduinoLEDController:
         self.update_thread.start()
     
     def _update_loop(self):
-        """LED 상태 업데이트 루프"""
+        """LED 상태 업데이트 루프 (만료 처리 후 바뀐 셀만 전송)"""
         while not self.should_stop:
             try:
-                if self.is_connected and self.serial_conn:
+                self.framebuffer.expire()
+                if self.is_connected and self.io:
                     self._send_led_states()
                 
                 time.sleep(0.1)  # 100ms 간격으로 업데이트
-                
+            
             except Exception as e:
                 logger.error(f"LED 업데이트 중 오류: {e}")
                 time.sleep(1)
     
-    def _send_led_states(self):
-        """현재 LED 상태를 Arduino로 전송"""
+    def _send_led_states(self) -> int:
+        """마지막 전송 이후 바뀐 셀만 I/O 스레드 큐에 넣음 (넣은 셀 수 반환)
+        
+        실제 쓰기, 프레임 병합, 펌웨어 확인과 재전송은 SerialIO가 담당합니다.
+        """
         try:
             with self.state_lock:
-                if not self.led_states:
-                    return
+                rows, cols, colors = self.framebuffer.changes()
+                if rows.size == 0:
+                    return 0
                 
-                # 명령 생성
-                commands = []
-                for position, color in self.led_states.items():
-                    commands.append(f"{position}:{color.to_string()}")
-                
-                if commands:
-                    command_str = "|".join(commands) + "\n"
-                    self.serial_conn.write(command_str.encode('utf-8'))
-                    
+                commands = self.framebuffer.encode(rows, cols, colors)
+                started = time.perf_counter()
+                with span("ArduinoLEDController.send_states", commands=len(commands)):
+                    self.io.send_cells(commands)
+                CONTROLLER_DURATION.observe(time.perf_counter() - started,
+                                            controller="ArduinoLEDController", operation="send_states")
+                self.framebuffer.mark_sent(rows, cols, colors)
+                return len(commands)
+        
         except Exception as e:
+            CONTROLLER_FAILURES.inc(controller="ArduinoLEDController", operation="send_states")
             logger.error(f"LED 상태 전송 중 오류: {e}")
+            return 0
+    
+    def flush(self) -> int:
+        """변경 사항 즉시 전송 (시뮬레이션 모드에서는 전송 기록만 갱신)
+        
+        효과 엔진(effects.EffectsEngine)의 프레임 전송 함수로도 사용됩니다.
+        """
+        if self.is_connected and self.io:
+            return self._send_led_states()
+        if self.simulation_mode:
+            rows, cols, colors = self.framebuffer.changes()
+            self.framebuffer.mark_sent(rows, cols, colors)
+            return int(rows.size)
+        return 0
     
     def highlight_position(self, position: str, color: LEDColor, duration: int = 5):
-        """특정 위치의 LED 하이라이트"""
+        """특정 위치의 LED 하이라이트 (duration 후 자동으로 꺼짐)"""
         try:
             # 위치 검증
-            led_pos = LEDPosition.from_string(position)
+            LEDPosition.from_string(position)
             
-            with self.state_lock:
-                self.led_states[position] = color
+            self.framebuffer.paint([position], (color.r, color.g, color.b), duration)
             
             if self.simulation_mode:
                 logger.info(f"[시뮬레이션] {position} 위치 하이라이트: RGB({color.r},{color.g},{color.b})")
-                return True
-            
-            # 즉시 Arduino로 전송
-            if self.is_connected and self.serial_conn:
-                command = f"{position}:{color.to_string()}\n"
-                self.serial_conn.write(command.encode('utf-8'))
-                logger.info(f"Arduino로 전송: {command.strip()}")
-            
-            # 자동 끄기 (duration 후)
-            if duration > 0:
-                threading.Timer(duration, self._turn_off_position, args=[position]).start()
             
+            self.flush()
             return True
-            
+        
         except Exception as e:
             logger.error(f"LED 하이라이트 중 오류: {e}")
             return False
     
-    def highlight_multiple_positions(self, positions: List[str], colors: List[LEDColor], duration: int = 5):
-        """여러 위치의 LED 하이라이트"""
+    def highlight_multiple_positions(self, positions: List[str], colors: List[LEDColor], duration: int = 5,
+                                     blend: str = "replace"):
+        """여러 위치의 LED 하이라이트
+        
+        겹치는 하이라이트는 blend 방식(replace/add/max)으로 합성됩니다.
+        """
         try:
             if len(positions) != len(colors):
                 raise ValueError("위치와 색상 배열의 길이가 일치하지 않습니다")
             
-            with self.state_lock:
-                for position, color in zip(positions, colors):
-                    self.led_states[position] = color
-            
-            if self.simulation_mode:
-                for position, color in zip(positions, colors):
-                    logger.info(f"[시뮬레이션] {position} 위치 하이라이트: RGB({color.r},{color.g},{color.b})")
-                return True
+            for position in positions:
+                LEDPosition.from_string(position)
             
-            # Arduino로 전송
-            if self.is_connected and self.serial_conn:
-                commands = []
-                for position, color in zip(positions, colors):
-                    commands.append(f"{position}:{color.to_string()}")
-                
-                command_str = "|".join(commands) + "\n"
-                self.serial_conn.write(command_str.encode('utf-8'))
-                logger.info(f"Arduino로 전송: {command_str.strip()}")
+            color_array = np.array([(c.r, c.g, c.b) for c in colors], dtype=np.int16)
+            self.framebuffer.paint(positions, color_array, duration, blend=blend)
             
-            # 자동 끄기
-            if duration > 0:
-                threading.Timer(duration, self._turn_off_positions, args=[positions]).start()
+            if self.simulation_mode:
+                logger.info(f"[시뮬레이션] {len(positions)}개 위치 하이라이트: {', '.join(positions)}")
             
+            self.flush()
             return True
-            
+        
         except Exception as e:
             logger.error(f"다중 LED 하이라이트 중 오류: {e}")
             return False
     
+    def set_brightness(self, brightness: float):
+        """전체 밝기 조절 (0.0-1.0, 켜진 셀은 다음 전송에 반영)"""
+        self.framebuffer.set_brightness(brightness)
+        self.flush()
+    
     def _turn_off_position(self, position: str):
         """특정 위치 LED 끄기"""
-        with self.state_lock:
-            if position in self.led_states:
-                del self.led_states[position]
-        
-        if self.is_connected and self.serial_conn:
-            command = f"{position}:0,0,0\n"
-            self.serial_conn.write(command.encode('utf-8'))
+        self._turn_off_positions([position])
     
     def _turn_off_positions(self, positions: List[str]):
         """여러 위치 LED 끄기"""
-        with self.state_lock:
-            for position in positions:
-                if position in self.led_states:
-                    del self.led_states[position]
-        
-        if self.is_connected and self.serial_conn:
-            commands = [f"{pos}:0,0,0" for pos in positions]
-            command_str = "|".join(commands) + "\n"
-            self.serial_conn.write(command_str.encode('utf-8'))
+        self.framebuffer.clear(positions)
+        self.flush()
     
     def turn_off_all_leds(self):
         """모든 LED 끄기"""
-        with self.state_lock:
-            self.led_states.clear()
+        self.framebuffer.clear()
         
         if self.simulation_mode:
+            self.framebuffer.mark_all_sent()
             logger.info("[시뮬레이션] 모든 LED 끄기")
             return True
         
-        if self.is_connected and self.serial_conn:
-            self.serial_conn.write(b"CLEAR\n")
+        if self.is_connected and self.io:
+            with self.state_lock:
+                self.io.clear()
+                self.framebuffer.mark_all_sent()
             logger.info("모든 LED 끄기 명령 전송")
         
         return True
     
-    def get_led_status(self) -> Dict[str, LEDColor]:
-        """현재 LED 상태 반환"""
-        with self.state_lock:
-            return self.led_states.copy()
+    def get_led_status(self) -> Dict[str, List[int]]:
+        """현재 켜진 LED {위치: [r, g, b]} (프레임버퍼에서 렌더링)"""
+        self.framebuffer.expire()
+        return self.framebuffer.active()
+    
+    def request_status(self, timeout: float = 5.0) -> Optional[Dict[str, List[int]]]:
+        """펌웨어에 STATUS를 요청해 실제 LED 상태 {위치: [r, g, b]} 반환 (연결되지 않았으면 None)"""
+        if not (self.is_connected and self.io):
+            return None
+        return self.io.status().result(timeout)
+    
+    def serial_stats(self) -> Optional[Dict[str, Any]]:
+        """시리얼 I/O 통계 (대기/확인 대기 명령 수, 프레임, 재전송, 펌웨어 오류)"""
+        return self.io.stats() if self.io else None
+    
+    def probe(self, timeout: float = 2.0) -> Dict[str, Any]:
+        """상태 확인 - 연결되어 있으면 STATUS 왕복으로 펌웨어 응답과 실제 LED 상태 확인 (HealthPoller가 호출)
+        
+        연결되지 않았으면(시뮬레이션 모드, 재연결 대기) 프레임버퍼 상태와 함께 reachable=False를 반환합니다.
+        """
+        details = {"port": self.port, "simulation_mode": self.simulation_mode, "reconnects": self.reconnects}
+        active = self.request_status(timeout)
+        if active is None:
+            self.framebuffer.expire()
+            error = "Arduino가 연결되지 않음 (시뮬레이션 모드)" if self.simulation_mode else "Arduino 재연결 대기 중"
+            details.update(reachable=False, error=error, active=self.framebuffer.active())
+        else:
+            details["active"] = active
+        details["active_leds"] = len(details["active"])
+        details["serial"] = self.serial_stats()
+        return details
     
     def disconnect(self):
-        """Arduino 연결 해제"""
+        """Arduino 연결 해제 (재연결 모니터도 중지)"""
         self.should_stop = True
+        self._stop_event.set()
+        self.health.stop(timeout=0)
         
-        if self.update_thread and self.update_thread.is_alive():
-            self.update_thread.join(timeout=1)
+        for thread in (self.update_thread, self.monitor_thread):
+            if thread and thread.is_alive() and thread is not threading.current_thread():
+                thread.join(timeout=1)
+        
+        if self.io:
+            self.io.close()
+            self.io = None
         
         if self.serial_conn:
             self.serial_conn.close()
@@ -315,8 +498,38 @@ class ArduinoLEDController:
         """소멸자"""
         self.disconnect()
 
-# 전역 컨트롤러 인스턴스
-arduino_controller = ArduinoLEDController()
+# 전역 컨트롤러 인스턴스 (ARDUINO_PORT로 포트 지정 가능, 예: 에뮬레이터의 pty)
+# LED_DAEMON_SOCKET이 설정되면 포트를 열지 않고 LED 데몬에 명령을 보냄
+_arduino_controller = None
+_arduino_controller_lock = threading.Lock()
+
+def get_arduino_controller():
+    """프로세스 전역 Arduino 컨트롤러 반환 (최초 호출 시 생성 - 모듈을 가져오기만 해서는 포트를 열지 않음)"""
+    global _arduino_controller
+    
+    with _arduino_controller_lock:
+        if _arduino_controller is None:
+            daemon_socket = daemon_socket_path()
+            if daemon_socket:
+                _arduino_controller = ArduinoDaemonClient(daemon_socket)
+            else:
+                _arduino_controller = ArduinoLEDController(port=os.getenv("ARDUINO_PORT"),
+                                                           port_cache=DEFAULT_PORT_CACHE)
+    
+    return _arduino_controller
+
+def start_hardware_health() -> bool:
+    """전역 컨트롤러의 상태 백그라운드 확인 시작 (HARDWARE_HEALTH_INTERVAL초마다, 0이면 끔)
+    
+    전역 컨트롤러를 쓰는 앱(Streamlit 등)이 시작할 때 호출합니다 (LED 데몬은 직접 시작). 시작했으면 True.
+    """
+    interval = float(os.getenv("HARDWARE_HEALTH_INTERVAL", "5"))
+    if interval <= 0:
+        return False
+    controller = get_arduino_controller()
+    controller.health.interval = interval
+    controller.health.start()
+    return True
 
 # 기존 함수들과의 호환성을 위한 래퍼 함수들
 def control_led(led_indices: List[int], color: Dict[str, int], duration: int = 5) -> bool:
@@ -338,27 +551,42 @@ def control_led(led_indices: List[int], color: Dict[str, int], duration: int = 5
                 colors.append(LEDColor(r=color['r'], g=color['g'], b=color['b']))
         
         if positions:
-            return arduino_controller.highlight_multiple_positions(positions, colors, duration)
+            return get_arduino_controller().highlight_multiple_positions(positions, colors, duration)
         
         return False
-        
+    
     except Exception as e:
         logger.error(f"LED 제어 중 오류: {e}")
         return False
 
 def turn_off_all_leds() -> bool:
     """모든 LED 끄기"""
-    return arduino_controller.turn_off_all_leds()
+    return get_arduino_controller().turn_off_all_leds()
 
 def get_controller_status() -> Dict:
-    """컨트롤러 상태 반환"""
+    """컨트롤러 상태 반환 (하드웨어에 요청하지 않음)
+    
+    LED/시리얼 상태는 프로세스 안의 프레임버퍼에서 바로 읽습니다 (백그라운드 확인의 캐시는 최대 한 간격 늦음).
+    데몬 클라이언트는 확인이 실행 중이면 캐시를, 아니면 데몬에 직접 요청한 값을 씁니다.
+    """
+    controller = get_arduino_controller()
+    health = controller.health.snapshot()
+    details = health["details"]
+    if isinstance(controller, ArduinoLEDController) or not controller.health.running:
+        active = controller.get_led_status()
+        serial = controller.serial_stats()
+    else:
+        active = details.get("active", {})
+        serial = details.get("serial")
     return {
         "device": "Arduino Uno NeoPixel Controller",
-        "connected": arduino_controller.is_connected,
-        "simulation_mode": arduino_controller.simulation_mode,
-        "port": arduino_controller.port,
-        "led_count": len(arduino_controller.get_led_status()),
-        "active_leds": list(arduino_controller.get_led_status().keys())
+        "connected": controller.is_connected,
+        "simulation_mode": controller.simulation_mode,
+        "port": controller.port,
+        "led_count": len(active),
+        "active_leds": list(active),
+        "serial": serial,
+        "health": health
     }
 
 # 테스트 함수
@@ -383,11 +611,11 @@ def test_arduino_connection():
         ]
         
         print("테스트 패턴 전송...")
-        arduino_controller.highlight_multiple_positions(test_positions, test_colors, 3)
+        get_arduino_controller().highlight_multiple_positions(test_positions, test_colors, 3)
         
         time.sleep(4)
         print("테스트 완료")
-        
+    
     else:
         print("⚠️ Arduino 연결 실패 - 시뮬레이션 모드")
 
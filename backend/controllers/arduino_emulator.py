@@ -0,0 +1,411 @@
+"""
+가상 Arduino Uno NeoPixel 에뮬레이터 (의사 터미널)
+hardware/arduino_uno_neopixel.ino의 명령 집합("A1:r,g,b|...", "CLEAR", "STATUS")과 응답을
+pty 위에서 그대로 흉내 내어, 실제 보드 없이 ArduinoLEDController의 시리얼 경로를 테스트하고 측정합니다.
+
+모델링하는 하드웨어/펌웨어 특성:
+- 보드레이트: 바이트당 10비트(8N1) 시간으로 수신/송신 속도 제한
+- 64바이트 수신 버퍼: 펌웨어가 읽기 전에 넘친 바이트는 버려짐
+- loop(): 루프마다 chars_per_loop 글자만 읽고(스케치는 1글자) LED 갱신(show) 후 loop_delay 대기
+- show() 동안 인터럽트가 꺼져 그 사이 도착한 바이트는 유실 (스케치는 매 루프 show)
+- 명령 처리 시간(parse_time)과 Serial.print 응답 송신 시간
+- 자동 리셋: 포트를 열면(DTR) 부트로더 시간 후 배너 출력, 시작 테스트 동안은 명령을 처리하지 않음
+
+사용 예:
+    python backend/controllers/arduino_emulator.py --profile sketch
+    ARDUINO_PORT=/dev/pts/5 python backend/api/rest_api.py
+"""
+
+import argparse
+import collections
+import fcntl
+import os
+import select
+import threading
+import time
+import tty
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+ROWS = 5
+COLS = 8
+RX_BUFFER_SIZE = 64  # Uno HardwareSerial 수신 버퍼
+
+# 펌웨어 타이밍 프로필
+PROFILES: Dict[str, Dict[str, Any]] = {
+    # 현재 arduino_uno_neopixel.ino: loop()마다 Serial.read() 한 번 + updateAllLEDs() + delay(50)
+    "sketch": {"chars_per_loop": 1, "loop_delay": 0.05, "show_always": True},
+    # while (Serial.available())로 수신 버퍼를 모두 읽고, 바뀐 경우에만 show + delay(5)
+    "drain": {"chars_per_loop": None, "loop_delay": 0.005, "show_always": False},
+}
+
+BANNER = (
+    "Arduino Uno NeoPixel Controller Ready\r\n"
+    "Format: A1:255,0,0 or A1:255,0,0|B2:0,255,0\r\n"
+    "Positions: A1-E8 (5x8 grid)\r\n"
+)
+
+def _to_int(text: str) -> int:
+    """Arduino String.toInt() - 앞쪽 공백과 부호 뒤의 숫자만 읽고, 없으면 0"""
+    text = text.lstrip()
+    sign = 1
+    if text[:1] in ("-", "+"):
+        sign = -1 if text[0] == "-" else 1
+        text = text[1:]
+    digits = ""
+    for char in text:
+        if not char.isdigit():
+            break
+        digits += char
+    return sign * int(digits) if digits else 0
+
+class ArduinoEmulator:
+    """pty 슬레이브 경로(port)를 실제 Arduino 시리얼 포트처럼 사용할 수 있는 에뮬레이터"""
+    
+    def __init__(self, profile: str = "sketch", baudrate: int = 115200,
+                 chars_per_loop: Optional[int] = -1, loop_delay: Optional[float] = None,
+                 parse_time: float = 0.0002, show_time: float = ROWS * COLS * 3 * 30e-6,
+                 boot_time: float = 0.5, startup_time: float = 2.0, echo: bool = True):
+        """
+        Args:
+            profile: 펌웨어 타이밍 프로필 (PROFILES)
+            chars_per_loop: loop()당 읽는 글자 수 (None이면 모두, -1이면 프로필 값)
+            loop_delay: loop() 끝의 delay (None이면 프로필 값)
+            parse_time: 단일 명령 파싱/적용 시간(초)
+            show_time: 5개 스트립 show() 시간 (LED당 30us)
+            boot_time: 포트를 연 뒤 부트로더가 끝날 때까지 시간 (이 동안 수신 바이트 유실)
+            startup_time: setup()의 시작 테스트 패턴 시간 (수신 버퍼에만 쌓임)
+            echo: "Received: ..." / "Set ..." 응답 출력 (스케치와 동일)
+        """
+        settings = PROFILES[profile]
+        self.profile = profile
+        self.baudrate = baudrate
+        self.byte_time = 10.0 / baudrate
+        self.chars_per_loop = settings["chars_per_loop"] if chars_per_loop == -1 else chars_per_loop
+        self.loop_delay = settings["loop_delay"] if loop_delay is None else loop_delay
+        self.show_always = settings["show_always"]
+        self.parse_time = parse_time
+        self.show_time = show_time
+        self.boot_time = boot_time
+        self.startup_time = startup_time
+        self.echo = echo
+        
+        # 펌웨어 상태 (ledStates)와 화면에 표시된 상태
+        self.states = np.zeros((ROWS, COLS, 3), dtype=np.uint8)
+        self.shown = np.zeros((ROWS, COLS, 3), dtype=np.uint8)
+        self.shown_at = np.zeros((ROWS, COLS))
+        self._changed = threading.Condition()
+        
+        # 회선(도착 시각, 바이트)과 수신 버퍼
+        self._wire: Deque[Tuple[float, int]] = collections.deque()
+        self._wire_free = 0.0
+        self._wire_lock = threading.Lock()
+        self._rx: Deque[int] = collections.deque()
+        self._line = bytearray()
+        self._show_window = (0.0, 0.0)
+        
+        self.master_fd: Optional[int] = None
+        self.port: Optional[str] = None
+        self.link: Optional[str] = None
+        self.connected = False
+        self._reset = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        
+        self.counters = collections.Counter()
+    
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    
+    def start(self, link: Optional[str] = None) -> str:
+        """pty를 만들고 스레드 시작 (포트 경로 반환)
+        
+        Args:
+            link: 슬레이브를 가리킬 고정 경로 (심볼릭 링크) - stop() 후 다시 start()하면 같은 경로로
+                  새 pty가 연결되므로 USB 분리/재연결을 흉내 낼 수 있음
+        """
+        master_fd, slave_fd = os.openpty()
+        tty.setraw(slave_fd)
+        self.port = os.ttyname(slave_fd)
+        # 슬레이브를 닫아 두면 호스트가 포트를 열고 닫는 것을 HUP 여부로 알 수 있음
+        os.close(slave_fd)
+        if link is not None:
+            if os.path.lexists(link):
+                os.unlink(link)
+            os.symlink(self.port, link)
+            self.port = link
+        self.link = link
+        flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
+        fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        self.master_fd = master_fd
+        
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._pump, name="arduino-emulator-wire", daemon=True),
+            threading.Thread(target=self._firmware, name="arduino-emulator-loop", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self.port
+    
+    def stop(self):
+        self._stop.set()
+        self._reset.set()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        self._threads = []
+        if self.master_fd is not None:
+            # 마스터를 닫으면 호스트 쪽 읽기/쓰기가 EIO로 실패 (USB 분리와 같음)
+            os.close(self.master_fd)
+            self.master_fd = None
+        self.connected = False
+        if self.link is not None and os.path.lexists(self.link):
+            os.unlink(self.link)
+    
+    def __enter__(self) -> "ArduinoEmulator":
+        self.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    
+    def active(self) -> Dict[str, List[int]]:
+        """화면에 표시 중인 셀 {위치: [r, g, b]}"""
+        with self._changed:
+            rows, cols = np.nonzero(self.shown.any(axis=2))
+            return {f"{chr(ord('A') + r)}{c + 1}": self.shown[r, c].tolist() for r, c in zip(rows, cols)}
+    
+    def wait_for(self, position: str, color: Tuple[int, int, int], timeout: float = 5.0) -> Optional[float]:
+        """position이 color로 표시될 때까지 대기 (표시된 time.monotonic() 시각, 시간 초과 시 None)"""
+        row, col = ord(position[0].upper()) - ord('A'), int(position[1:]) - 1
+        target = np.asarray(color, dtype=np.uint8)
+        with self._changed:
+            if self._changed.wait_for(lambda: np.array_equal(self.shown[row, col], target), timeout):
+                return float(self.shown_at[row, col])
+        return None
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "profile": self.profile,
+            "baudrate": self.baudrate,
+            "connected": self.connected,
+            "bytes_received": self.counters["bytes_received"],
+            "bytes_sent": self.counters["bytes_sent"],
+            "commands": self.counters["commands"],
+            "errors": self.counters["errors"],
+            "rx_overflow": self.counters["rx_overflow"],
+            "show_overrun": self.counters["show_overrun"],
+            "boot_dropped": self.counters["boot_dropped"],
+            "tx_dropped": self.counters["tx_dropped"],
+            "resets": self.counters["resets"],
+        }
+    
+    # ------------------------------------------------------------------
+    # 회선 (호스트 → 보드)
+    # ------------------------------------------------------------------
+    
+    def _pump(self):
+        """호스트가 쓴 바이트를 보드레이트에 맞춘 도착 시각과 함께 회선 큐에 넣음"""
+        poller = select.poll()
+        poller.register(self.master_fd, select.POLLIN)
+        while not self._stop.is_set():
+            events = poller.poll(10)
+            hung_up = any(event & select.POLLHUP for _, event in events)
+            if hung_up:
+                # 호스트가 포트를 닫음 - 다시 열릴 때까지 폴링 간격 유지
+                self.connected = False
+                time.sleep(0.01)
+                continue
+            if not self.connected:
+                # 포트가 열림 (DTR) → 보드 리셋
+                self.connected = True
+                self.counters["resets"] += 1
+                self._reset.set()
+            if not any(event & select.POLLIN for _, event in events):
+                continue
+            try:
+                data = os.read(self.master_fd, 4096)
+            except (BlockingIOError, OSError):
+                continue
+            
+            now = time.monotonic()
+            with self._wire_lock:
+                start = max(now, self._wire_free)
+                self._wire.extend((start + (i + 1) * self.byte_time, byte) for i, byte in enumerate(data))
+                self._wire_free = start + len(data) * self.byte_time
+            self.counters["bytes_received"] += len(data)
+    
+    def _deliver(self, drop: bool = False):
+        """도착한 바이트를 수신 버퍼로 (show 중 도착 또는 버퍼 초과분은 유실)"""
+        now = time.monotonic()
+        show_start, show_end = self._show_window
+        with self._wire_lock:
+            while self._wire and self._wire[0][0] <= now:
+                arrival, byte = self._wire.popleft()
+                if drop:
+                    self.counters["boot_dropped"] += 1
+                elif show_start <= arrival < show_end:
+                    self.counters["show_overrun"] += 1
+                elif len(self._rx) >= RX_BUFFER_SIZE:
+                    self.counters["rx_overflow"] += 1
+                else:
+                    self._rx.append(byte)
+    
+    def _write(self, text: str) -> float:
+        """Serial.print - 송신 시간 반환 (호스트가 읽지 않아 pty가 가득 차면 버림)"""
+        data = text.encode("ascii", errors="replace")
+        if self.master_fd is not None and self.connected:
+            try:
+                os.write(self.master_fd, data)
+                self.counters["bytes_sent"] += len(data)
+            except (BlockingIOError, OSError):
+                self.counters["tx_dropped"] += len(data)
+        return len(data) * self.byte_time
+    
+    # ------------------------------------------------------------------
+    # 펌웨어
+    # ------------------------------------------------------------------
+    
+    def _boot(self):
+        """리셋: 상태 초기화 → 부트로더 → setup() (배너, 시작 테스트)"""
+        self.states.fill(0)
+        self._rx.clear()
+        self._line.clear()
+        self._show()
+        
+        self._stop.wait(self.boot_time)
+        self._deliver(drop=True)
+        self._write(BANNER)
+        if self.startup_time > 0:
+            self._write("Running startup test...\r\n")
+            self._stop.wait(self.startup_time)
+            self._write("Startup test completed\r\n")
+    
+    def _firmware(self):
+        while not self._stop.is_set():
+            if self._reset.is_set():
+                self._reset.clear()
+                if self._stop.is_set():
+                    break
+                self._boot()
+                continue
+            if not self.connected:
+                self._stop.wait(0.01)
+                continue
+            
+            # loop(): 시리얼 읽기 → 명령 처리
+            self._deliver()
+            busy = 0.0
+            count = len(self._rx) if self.chars_per_loop is None else min(self.chars_per_loop, len(self._rx))
+            for _ in range(count):
+                char = self._rx.popleft()
+                if char in (0x0A, 0x0D):
+                    if self._line:
+                        busy += self._process_line(self._line.decode("ascii", errors="replace"))
+                        self._line.clear()
+                else:
+                    self._line.append(char)
+            if busy > 0:
+                time.sleep(busy)
+            
+            # updateAllLEDs() → delay()
+            if self.show_always or busy > 0:
+                self._show()
+            time.sleep(self.loop_delay)
+    
+    def _show(self):
+        """ledStates를 화면에 반영 (show 동안 도착한 바이트는 유실)"""
+        started = time.monotonic()
+        self._show_window = (started, started + self.show_time)
+        frame = self.states.copy()
+        remaining = self._show_window[1] - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        
+        # show()가 끝난 시점에 LED에 표시됨
+        with self._changed:
+            changed = np.any(self.shown != frame, axis=2)
+            if changed.any():
+                self.shown[changed] = frame[changed]
+                self.shown_at[changed] = time.monotonic()
+                self._changed.notify_all()
+    
+    def _process_line(self, command: str) -> float:
+        """processSerialCommand - 처리/송신에 걸린 시간 반환"""
+        busy = self._write(f"Received: {command}\r\n") if self.echo else 0.0
+        for single in command.split("|"):
+            busy += self.parse_time + self._process_single(single)
+        return busy
+    
+    def _process_single(self, command: str) -> float:
+        command = command.strip()
+        self.counters["commands"] += 1
+        
+        if command == "CLEAR":
+            self.states.fill(0)
+            return self._write("All LEDs cleared\r\n")
+        if command == "STATUS":
+            lines = ["=== LED Status ==="]
+            for row in range(ROWS):
+                for col in range(COLS):
+                    r, g, b = self.states[row, col].tolist()
+                    if r or g or b:
+                        lines.append(f"{chr(ord('A') + row)}{col + 1}: RGB({r},{g},{b})")
+            lines.append("==================")
+            return self._write("\r\n".join(lines) + "\r\n")
+        
+        position, sep, color = command.partition(":")
+        if not sep:
+            return self._error("Error: Invalid format")
+        if len(position) != 2 or not ("A" <= position[0] <= "E") or not ("1" <= position[1] <= "8"):
+            return self._error("Error: Invalid position")
+        
+        parts = color.split(",", 2)
+        if len(parts) != 3:
+            return self._error("Error: Invalid color")
+        r, g, b = (_to_int(part) for part in parts)
+        if not all(0 <= value <= 255 for value in (r, g, b)):
+            return self._error("Error: Invalid color")
+        
+        self.states[ord(position[0]) - ord('A'), int(position[1]) - 1] = (r, g, b)
+        if self.echo:
+            return self._write(f"Set {position} to RGB({r},{g},{b})\r\n")
+        return 0.0
+    
+    def _error(self, message: str) -> float:
+        self.counters["errors"] += 1
+        return self._write(message + "\r\n")
+
+def main():
+    parser = argparse.ArgumentParser(description="가상 Arduino NeoPixel 에뮬레이터")
+    parser.add_argument("--profile", choices=list(PROFILES), default="sketch")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--boot-time", type=float, default=0.5)
+    parser.add_argument("--startup-time", type=float, default=2.0)
+    args = parser.parse_args()
+    
+    emulator = ArduinoEmulator(args.profile, args.baudrate, boot_time=args.boot_time,
+                               startup_time=args.startup_time)
+    port = emulator.start()
+    print(f"ARDUINO_PORT={port}")
+    try:
+        last = None
+        while True:
+            time.sleep(1)
+            current = emulator.active()
+            if current != last:
+                print(f"표시 중: {current or '없음'}  {emulator.stats()}")
+                last = current
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
+
+if __name__ == "__main__":
+    main()
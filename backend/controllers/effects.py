@@ -0,0 +1,390 @@
+"""
+LED 애니메이션 효과 엔진
+깜빡임(blink), 맥동(pulse), 추적(chase), 무지개(rainbow), 길 안내(follow me) 효과를
+고정 FPS로 렌더링해 컨트롤러 프레임버퍼의 오버레이 레이어에 그립니다.
+
+- 효과는 시작 후 경과 시간 t만으로 색을 계산하므로 프레임이 누락되어도 애니메이션 속도가 유지됩니다.
+- Layered/Sequential로 효과를 조합할 수 있습니다.
+- 매 프레임 프레임버퍼의 diff(changes)만 전송합니다 (바뀐 픽셀만).
+- 전송(시리얼/HTTP)이 프레임 간격을 따라가지 못하면 FPS를 min_fps까지 낮추고,
+  여유가 생기면 목표 FPS로 서서히 되돌립니다.
+"""
+
+import asyncio
+import inspect
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .framebuffer import LEDFramebuffer
+
+logger = logging.getLogger(__name__)
+
+def _blend(canvas: np.ndarray, mask: np.ndarray, rows: np.ndarray, cols: np.ndarray,
+           colors: np.ndarray, blend: str):
+    colors = np.clip(np.asarray(colors), 0, 255)
+    if blend == "replace":
+        canvas[rows, cols] = colors
+    else:
+        # 아직 그려지지 않은 셀은 0에서 시작
+        current = np.where(mask[rows, cols, None], canvas[rows, cols], 0).astype(np.int16)
+        if blend == "add":
+            canvas[rows, cols] = np.minimum(current + colors, 255)
+        else:
+            canvas[rows, cols] = np.maximum(current, colors)
+    mask[rows, cols] = True
+
+def hsv_to_rgb(hue: np.ndarray, saturation: float = 1.0, value: float = 1.0) -> np.ndarray:
+    """색상(0-1) 배열을 RGB(0-255) (n, 3) 배열로 변환"""
+    h6 = (np.asarray(hue) % 1.0) * 6
+    k = (np.array([5, 3, 1]) + h6[:, None]) % 6
+    rgb = value - value * saturation * np.clip(np.minimum(k, 4 - k), 0, 1)
+    return np.round(rgb * 255).astype(np.int16)
+
+class Effect:
+    """효과 기본 클래스 - colors(t)가 t초 시점의 셀별 색상을 반환"""
+    
+    def __init__(self, positions: Iterable[str], color: Sequence[int] = (0, 0, 255),
+                 duration: Optional[float] = None, blend: str = "replace"):
+        self.positions = list(positions)
+        self.color = np.asarray(color, dtype=np.int16)
+        self.duration = duration
+        self.blend = blend
+        self.rows = np.empty(0, dtype=np.intp)
+        self.cols = np.empty(0, dtype=np.intp)
+    
+    def bind(self, framebuffer: LEDFramebuffer):
+        """프레임버퍼 좌표로 위치 변환 (엔진에 추가될 때 한 번)"""
+        self.rows, self.cols = framebuffer.indices(self.positions)
+    
+    def finished(self, t: float) -> bool:
+        return self.duration is not None and t >= self.duration
+    
+    def colors(self, t: float) -> Optional[np.ndarray]:
+        """(3,) 또는 (n, 3) 색상, None이면 이번 프레임에 그리지 않음"""
+        return self.color
+    
+    def draw(self, canvas: np.ndarray, mask: np.ndarray, t: float):
+        if self.rows.size == 0:
+            return
+        colors = self.colors(t)
+        if colors is not None:
+            _blend(canvas, mask, self.rows, self.cols, colors, self.blend)
+
+class Solid(Effect):
+    """고정 색상"""
+
+class Blink(Effect):
+    """period초 주기로 깜빡임 (duty는 켜져 있는 비율)"""
+    
+    def __init__(self, positions, color=(255, 0, 0), period: float = 0.5, duty: float = 0.5, **kwargs):
+        super().__init__(positions, color, **kwargs)
+        self.period = period
+        self.duty = duty
+    
+    def colors(self, t: float):
+        return self.color if (t % self.period) < self.period * self.duty else None
+
+class Pulse(Effect):
+    """밝기가 floor와 1 사이를 코사인 곡선으로 오가는 맥동"""
+    
+    def __init__(self, positions, color=(0, 0, 255), period: float = 1.5, floor: float = 0.1, **kwargs):
+        super().__init__(positions, color, **kwargs)
+        self.period = period
+        self.floor = floor
+    
+    def colors(self, t: float):
+        level = self.floor + (1 - self.floor) * (0.5 - 0.5 * np.cos(2 * np.pi * t / self.period))
+        return np.round(self.color * level).astype(np.int16)
+
+class Chase(Effect):
+    """위치 순서대로 점이 이동 (tail개 셀에 걸쳐 밝기가 줄어드는 꼬리)"""
+    
+    def __init__(self, positions, color=(0, 255, 0), speed: float = 8.0, tail: int = 3,
+                 loop: bool = True, **kwargs):
+        super().__init__(positions, color, **kwargs)
+        self.speed = speed
+        self.tail = max(1, tail)
+        self.loop = loop
+    
+    def draw(self, canvas, mask, t):
+        n = self.rows.size
+        if n == 0:
+            return
+        head = int(t * self.speed)
+        if not self.loop and head >= n + self.tail:
+            return
+        offsets = head - np.arange(n)
+        if self.loop:
+            offsets %= n
+        levels = np.where(offsets >= 0, 1 - offsets / self.tail, 0)
+        lit = levels > 0
+        colors = np.round(self.color * levels[lit, None]).astype(np.int16)
+        _blend(canvas, mask, self.rows[lit], self.cols[lit], colors, self.blend)
+
+class Rainbow(Effect):
+    """위치마다 색상(hue)을 나누고 period초마다 한 바퀴 회전"""
+    
+    def __init__(self, positions, period: float = 3.0, **kwargs):
+        super().__init__(positions, (255, 255, 255), **kwargs)
+        self.period = period
+    
+    def colors(self, t: float):
+        n = self.rows.size
+        return hsv_to_rgb(np.arange(n) / n + t / self.period)
+
+class Layered(Effect):
+    """여러 효과를 순서대로 겹쳐 그림 (뒤의 효과가 위에 그려짐)"""
+    
+    def __init__(self, effects: Sequence[Effect], duration: Optional[float] = None):
+        super().__init__([], duration=duration)
+        self.effects = list(effects)
+    
+    def bind(self, framebuffer):
+        for effect in self.effects:
+            effect.bind(framebuffer)
+    
+    def finished(self, t):
+        if self.duration is not None:
+            return t >= self.duration
+        return all(effect.finished(t) for effect in self.effects)
+    
+    def draw(self, canvas, mask, t):
+        for effect in self.effects:
+            if not effect.finished(t):
+                effect.draw(canvas, mask, t)
+
+class Sequential(Effect):
+    """효과를 차례로 재생 (마지막을 제외한 효과는 duration이 있어야 함)"""
+    
+    def __init__(self, effects: List[Effect], repeat: bool = False):
+        if any(effect.duration is None for effect in effects[:-1]):
+            raise ValueError("마지막을 제외한 효과는 duration이 필요합니다")
+        super().__init__([])
+        self.effects = effects
+        self.repeat = repeat
+        self._total = sum(effect.duration or 0 for effect in effects)
+        if repeat and effects[-1].duration is None:
+            raise ValueError("반복하려면 모든 효과에 duration이 필요합니다")
+    
+    def bind(self, framebuffer):
+        for effect in self.effects:
+            effect.bind(framebuffer)
+    
+    def finished(self, t):
+        if self.repeat:
+            return False
+        last = self.effects[-1]
+        return last.duration is not None and t >= self._total
+    
+    def draw(self, canvas, mask, t):
+        if self.repeat and self._total > 0:
+            t %= self._total
+        for effect in self.effects:
+            if effect.duration is None or t < effect.duration:
+                effect.draw(canvas, mask, t)
+                return
+            t -= effect.duration
+
+def path_between(origin: str, target: str) -> List[str]:
+    """origin에서 target까지의 ㄱ자 경로 (같은 행을 먼저 이동한 뒤 열 방향으로)"""
+    origin, target = origin.strip().upper(), target.strip().upper()
+    row, col = ord(origin[0]), int(origin[1:])
+    target_row, target_col = ord(target[0]), int(target[1:])
+    
+    path = [f"{chr(row)}{col}"]
+    while col != target_col:
+        col += 1 if target_col > col else -1
+        path.append(f"{chr(row)}{col}")
+    while row != target_row:
+        row += 1 if target_row > row else -1
+        path.append(f"{chr(row)}{col}")
+    return path
+
+class FollowMe(Layered):
+    """물품 찾기 안내: origin에서 목표 셀까지 점이 반복해서 이동하고 목표 셀은 깜빡임"""
+    
+    def __init__(self, origin: str, targets: Sequence[str], color=(0, 255, 0),
+                 target_color=(255, 255, 255), speed: float = 10.0, duration: Optional[float] = 15.0):
+        targets = list(targets)
+        path = path_between(origin, targets[0])[:-1] or [origin]
+        super().__init__([
+            Chase(path, color, speed=speed, tail=2),
+            Blink(targets, target_color, period=0.6, duty=0.6),
+        ], duration=duration)
+
+class EffectsEngine:
+    """효과를 고정 FPS로 합성해 프레임버퍼 오버레이에 그리고 바뀐 픽셀만 전송
+    
+    flush는 프레임버퍼의 changes()를 하드웨어로 보내고 mark_sent()하는 함수입니다.
+    동기 함수(ArduinoLEDController.flush)이거나 코루틴 함수(ESP32Controller.push_frame)일 수 있으며,
+    코루틴은 loop(기본: async_bridge 백그라운드 루프)에서 실행됩니다.
+    """
+    
+    def __init__(self, framebuffer: LEDFramebuffer, flush: Callable[[], Any],
+                 fps: float = 30.0, min_fps: float = 2.0,
+                 loop: Optional[asyncio.AbstractEventLoop] = None, name: str = "led-effects"):
+        self.framebuffer = framebuffer
+        self._flush = flush
+        self.target_fps = fps
+        self.min_fps = min(min_fps, fps)
+        self.current_fps = fps
+        self._loop = loop
+        self._name = name
+        
+        self._effects: Dict[int, Any] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        
+        self._canvas = np.zeros((framebuffer.rows, framebuffer.cols, 3), dtype=np.uint8)
+        self._mask = np.zeros((framebuffer.rows, framebuffer.cols), dtype=bool)
+        
+        # 통계
+        self.frames = 0
+        self.late_frames = 0
+        self.pixels_sent = 0
+        self.flush_errors = 0
+    
+    def add(self, effect: Effect) -> int:
+        """효과 재생 시작 (효과 ID 반환)"""
+        effect.bind(self.framebuffer)
+        with self._lock:
+            effect_id = next(self._ids)
+            self._effects[effect_id] = (effect, time.monotonic())
+        self._ensure_thread()
+        self._wake.set()
+        return effect_id
+    
+    def remove(self, effect_id: int) -> bool:
+        with self._lock:
+            removed = self._effects.pop(effect_id, None) is not None
+        self._wake.set()
+        return removed
+    
+    def clear(self):
+        with self._lock:
+            self._effects.clear()
+        self._wake.set()
+    
+    def active(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {"id": effect_id, "effect": type(effect).__name__, "elapsed": round(now - started, 3),
+                 "duration": effect.duration}
+                for effect_id, (effect, started) in self._effects.items()
+            ]
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "target_fps": self.target_fps,
+            "current_fps": round(self.current_fps, 2),
+            "frames": self.frames,
+            "late_frames": self.late_frames,
+            "pixels_sent": self.pixels_sent,
+            "flush_errors": self.flush_errors,
+            "effects": len(self._effects)
+        }
+    
+    def stop(self, timeout: float = 2.0):
+        """엔진 종료 (오버레이를 지우고 마지막 프레임 전송)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+    
+    def _send(self) -> int:
+        if inspect.iscoroutinefunction(self._flush):
+            if self._loop is not None:
+                sent = asyncio.run_coroutine_threadsafe(self._flush(), self._loop).result()
+            else:
+                from ..core.async_bridge import run_sync
+                sent = run_sync(self._flush())
+        else:
+            sent = self._flush()
+        return sent or 0
+    
+    def _adapt(self, elapsed: float):
+        """전송 시간에 맞춰 FPS 조절 (느리면 즉시 낮추고, 빠르면 10%씩 회복)"""
+        interval = 1.0 / self.current_fps
+        if elapsed > interval * 0.8:
+            self.late_frames += 1
+            self.current_fps = max(self.min_fps, min(self.current_fps, 0.8 / max(elapsed, 1e-6)))
+        elif elapsed < interval * 0.5 and self.current_fps < self.target_fps:
+            self.current_fps = min(self.target_fps, self.current_fps * 1.1)
+    
+    def render_frame(self, now: Optional[float] = None) -> bool:
+        """현재 시점의 효과를 합성해 오버레이에 반영 (재생 중인 효과가 있으면 True)"""
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            effects = list(self._effects.items())
+        
+        self._canvas.fill(0)
+        self._mask.fill(False)
+        finished = []
+        for effect_id, (effect, started) in effects:
+            t = now - started
+            if effect.finished(t):
+                finished.append(effect_id)
+                continue
+            effect.draw(self._canvas, self._mask, t)
+        
+        if finished:
+            with self._lock:
+                for effect_id in finished:
+                    self._effects.pop(effect_id, None)
+        
+        self.framebuffer.set_overlay(self._canvas, self._mask)
+        return len(finished) < len(effects)
+    
+    def _run(self):
+        next_frame = time.monotonic()
+        while not self._stop.is_set():
+            playing = self.render_frame()
+            
+            started = time.perf_counter()
+            try:
+                self.pixels_sent += self._send()
+            except Exception as e:
+                self.flush_errors += 1
+                logger.warning(f"LED 프레임 전송 실패: {e}")
+            elapsed = time.perf_counter() - started
+            self.frames += 1
+            
+            if not playing:
+                # 재생할 효과가 없으면 다음 add()까지 대기 (오버레이는 위에서 비워져 전송됨)
+                self._wake.clear()
+                if not self._effects:
+                    self._wake.wait()
+                next_frame = time.monotonic()
+                continue
+            
+            self._adapt(elapsed)
+            next_frame += 1.0 / self.current_fps
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+            else:
+                # 밀린 프레임은 건너뜀 (효과는 경과 시간으로 계산되므로 속도는 유지됨)
+                next_frame = time.monotonic()
+        
+        self.framebuffer.clear_overlay()
+        try:
+            self._send()
+        except Exception:
+            pass
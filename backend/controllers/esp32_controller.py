@@ -5,12 +5,13 @@ Arduino Uno 기반 LED 컨트롤러 - ESP32 호환 인터페이스
 
 # Arduino 컨트롤러 임포트
 from .arduino_controller import (
-    arduino_controller,
+    get_arduino_controller,
     LEDColor,
     LEDPosition,
     control_led,
     turn_off_all_leds,
-    get_controller_status
+    get_controller_status,
+    start_hardware_health
 )
 
 import logging
@@ -55,8 +56,8 @@ def highlight_item_location(positions: List[str], color: Dict[str, int] = None,
         for pos in positions:
             led_colors.append(LEDColor(r=color["r"], g=color["g"], b=color["b"]))
         
-        return arduino_controller.highlight_multiple_positions(positions, led_colors, duration)
-        
+        return get_arduino_controller().highlight_multiple_positions(positions, led_colors, duration)
+    
     except Exception as e:
         logger.error(f"물품 위치 하이라이트 중 오류: {e}")
         return False
@@ -97,7 +98,7 @@ def parse_grid_position(position: str) -> List[int]:
             led_indices.append(row * 8 + col)
         
         return led_indices
-        
+    
     except Exception as e:
         logger.error(f"그리드 위치 파싱 중 오류: {e}")
         return []
@@ -110,7 +111,7 @@ def get_led_status() -> Dict[str, Any]:
         Dict: LED 상태 정보
     """
     controller_status = get_controller_status()
-    led_states = arduino_controller.get_led_status()
+    led_states = get_arduino_controller().get_led_status()
     
     return {
         "device": "Arduino Uno NeoPixel Controller",
@@ -119,8 +120,8 @@ def get_led_status() -> Dict[str, Any]:
         "port": controller_status["port"],
         "total_leds": 120,  # 5x8x3 = 120개
         "active_positions": len(led_states),
-        "led_states": {pos: {"r": color.r, "g": color.g, "b": color.b} 
-                      for pos, color in led_states.items()}
+        "led_states": {pos: {"r": r, "g": g, "b": b}
+                      for pos, (r, g, b) in led_states.items()}
     }
 
 def test_led_connection() -> bool:
@@ -143,7 +144,7 @@ def test_led_connection() -> bool:
         else:
             logger.warning("Arduino가 연결되지 않음 - 시뮬레이션 모드")
             return True  # 시뮬레이션 모드에서는 True 반환
-            
+    
     except Exception as e:
         logger.error(f"LED 연결 테스트 중 오류: {e}")
         return False
@@ -192,37 +193,99 @@ CONTROLLER_INFO = {
 # 시뮬레이션 모드 확인
 def is_simulation_mode() -> bool:
     """시뮬레이션 모드 여부 확인"""
-    return arduino_controller.simulation_mode
+    return get_arduino_controller().simulation_mode
 
 def get_controller_info() -> Dict[str, Any]:
-    """컨트롤러 정보 반환"""
+    """컨트롤러 정보 반환 (하드웨어 상태는 백그라운드 확인의 캐시)"""
     status = get_controller_status()
     return {
         **CONTROLLER_INFO,
         "connected": status["connected"],
         "simulation_mode": status["simulation_mode"],
         "port": status["port"],
-        "active_leds": status["active_leds"]
+        "active_leds": status["active_leds"],
+        "health": status["health"]
     }
 
 import json
+import time
+import random
 import asyncio
+import collections
 import aiohttp
-from typing import List, Dict, Any, Optional
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
 from ..models.models import LEDControl
+from ..core.metrics import observe_controller, registry
+from .esp32_ws import ESP32_WS_FALLBACKS, ESP32WebSocket, ESP32WebSocketError
+from .framebuffer import LEDFramebuffer
+from .health import HealthPoller
+from .led_client import DEFAULT_SOCKET_PATH, LEDDaemonConnection, LEDDaemonError, daemon_socket_path
+
+ESP32_HTTP_ATTEMPTS = registry.counter("esp32_http_attempts_total", "ESP32 HTTP 요청 시도 결과", ("outcome",))
+ESP32_HTTP_HEDGES = registry.counter("esp32_http_hedges_total", "헤지 요청을 보낸 뒤 먼저 응답한 쪽", ("winner",))
+
+# 재시도할 응답 코드 (펌웨어 내부 오류, 동시 처리 한도 초과)
+RETRY_STATUSES = {500, 502, 503, 504}
+
+@dataclass
+class RetryPolicy:
+    """ESP32 HTTP 요청 재시도/헤지 설정
+    
+    명령마다 id를 붙여 보내므로 재시도나 헤지 요청이 장치에 두 번 도착해도 한 번만 적용됩니다.
+    """
+    attempt_timeout: float = 1.0       # 시도당 타임아웃(초) - 전체 제한은 호출별 timeout
+    max_attempts: int = 3
+    backoff_base: float = 0.1          # 첫 재시도 전 최대 대기(초), 이후 두 배씩 (0~최대 균등 지터)
+    backoff_max: float = 1.0
+    hedge: bool = False                # 응답이 늦으면 같은 id로 두 번째 요청을 보내고 먼저 온 응답 사용
+    hedge_after: Optional[float] = None  # 헤지 기준(초), None이면 최근 응답 시간의 p95
+    hedge_min_samples: int = 20        # p95를 쓰기 위한 최소 응답 수 (그 전에는 헤지하지 않음)
 
 class ESP32Controller:
     """ESP32 NeoPixel LED 제어 클래스"""
     
-    def __init__(self, esp32_ip: str = "192.168.1.100", port: int = 80):
+    def __init__(self, esp32_ip: str = "192.168.1.100", port: int = 80, transport: str = "http",
+                 retry: Optional[RetryPolicy] = None):
+        """
+        Args:
+            transport: "http" (명령마다 POST /led_control) 또는 "ws" (/ws WebSocket 연결 유지, 실패하면 HTTP로 대체)
+            retry: HTTP 재시도/헤지 설정 (기본: 시도당 1초, 3회)
+        """
+        if transport not in ("http", "ws"):
+            raise ValueError(f"지원하지 않는 전송 방식: {transport}")
         self.esp32_ip = esp32_ip
         self.port = port
         self.base_url = f"http://{esp32_ip}:{port}"
         
+        # HTTP 커넥션 풀 (이벤트 루프별로 하나의 세션을 재사용)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # 재시도/헤지 (최근 응답 시간으로 p95 계산)
+        self.retry = retry or RetryPolicy()
+        self._latencies: collections.deque = collections.deque(maxlen=200)
+        
+        # WebSocket 채널 (실패하면 ws_retry_interval초 동안 HTTP 사용)
+        self.transport = transport
+        self.ws: Optional[ESP32WebSocket] = None
+        if transport == "ws":
+            self.ws = ESP32WebSocket(f"ws://{esp32_ip}:{port}/ws", on_failure=self._on_ws_failure)
+        self.ws_retry_interval = 5.0
+        self._ws_retry_at = 0.0
+        self._resync = False
+        
         # 그리드 설정 (예: 5x5 그리드)
         self.grid_rows = 5
         self.grid_cols = 5
         self.grid_mapping = self._create_grid_mapping()
+        
+        # 장치 LED 상태 미러 (효과 엔진이 바뀐 픽셀만 보내는 데 사용)
+        self.framebuffer = LEDFramebuffer(self.grid_rows, self.grid_cols)
+        
+        # 상태 캐시 (health.start()로 백그라운드 확인 시작, health.snapshot()은 요청 없이 읽음)
+        self.health = HealthPoller(self.probe, type(self).__name__)
     
     def _create_grid_mapping(self) -> Dict[str, int]:
         """그리드 위치를 LED 인덱스로 매핑"""
@@ -238,10 +301,178 @@ class ESP32Controller:
         
         return mapping
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프에 묶인 공유 ClientSession 반환
+        
+        세션은 생성된 루프에서만 사용할 수 있으므로, 루프가 바뀌면 새로 만듭니다.
+        백그라운드 루프(async_bridge)와 함께 쓰면 요청 간 커넥션이 재사용됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self):
+        """공유 HTTP 세션과 WebSocket 연결 닫기"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        if self.ws is not None:
+            await self.ws.close()
+    
+    def _on_ws_failure(self, error: BaseException):
+        """WebSocket 프레임 실패 - 장치 상태를 알 수 없으므로 다음 push_frame에서 전체 프레임을 다시 보냄"""
+        self._resync = True
+    
+    async def _post(self, command: Dict[str, Any], timeout: float) -> Tuple[int, Any]:
+        """POST /led_control → (상태 코드, 200이면 JSON 응답 아니면 본문 텍스트)
+        
+        시도마다 짧은 타임아웃을 두고, 시간 초과/연결 오류/5xx면 지터를 준 지수 백오프 후 재시도합니다
+        (전체 timeout초 이내). 모든 시도가 실패하면 마지막 5xx 응답을 반환하거나 마지막 예외를 다시 발생시킵니다.
+        """
+        policy = self.retry
+        # 재시도/헤지 요청이 장치에서 한 번만 적용되도록 명령 id 부여
+        command.setdefault("id", random.getrandbits(31) or 1)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        response: Optional[Tuple[int, Any]] = None
+        error: Optional[BaseException] = None
+        
+        for attempt in range(policy.max_attempts):
+            if attempt:
+                backoff = random.uniform(0, min(policy.backoff_max, policy.backoff_base * 2 ** (attempt - 1)))
+                if loop.time() + backoff >= deadline:
+                    break
+                await asyncio.sleep(backoff)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            
+            try:
+                response = await self._hedged_attempt(command, min(policy.attempt_timeout, remaining))
+                error = None
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                response, error = None, e
+                continue
+            if response[0] not in RETRY_STATUSES:
+                return response
+        
+        if response is not None:
+            return response
+        raise error or asyncio.TimeoutError()
+    
+    async def _hedged_attempt(self, command: Dict[str, Any], timeout: float) -> Tuple[int, Any]:
+        """한 번의 시도 - 헤지가 켜져 있고 응답이 기준보다 늦으면 같은 명령을 한 번 더 보내고 먼저 성공한 응답 사용"""
+        delay = self._hedge_delay()
+        if delay is None or delay >= timeout:
+            return await self._attempt(command, timeout)
+        
+        primary = asyncio.ensure_future(self._attempt(command, timeout))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+            
+            hedge = asyncio.ensure_future(self._attempt(command, timeout - delay))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done
+                             if task.exception() is None and task.result()[0] not in RETRY_STATUSES]
+                if succeeded:
+                    ESP32_HTTP_HEDGES.inc(winner="hedge" if succeeded[0] is hedge else "primary")
+                    return succeeded[0].result()
+            # 둘 다 실패: 5xx 응답이 있으면 그 응답, 없으면 예외
+            return (hedge if primary.exception() is not None else primary).result()
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """헤지 요청을 보낼 기준 시간 (헤지를 하지 않으면 None)"""
+        policy = self.retry
+        if not policy.hedge:
+            return None
+        if policy.hedge_after is not None:
+            return policy.hedge_after
+        if len(self._latencies) < policy.hedge_min_samples:
+            return None
+        return float(np.percentile(self._latencies, 95))
+    
+    async def _attempt(self, command: Dict[str, Any], timeout: float) -> Tuple[int, Any]:
+        session = await self._get_session()
+        started = time.perf_counter()
+        try:
+            async with session.post(
+                f"{self.base_url}/led_control",
+                json=command,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status == 200:
+                    body = await response.json()
+                else:
+                    body = await response.text()
+        except asyncio.TimeoutError:
+            ESP32_HTTP_ATTEMPTS.inc(outcome="timeout")
+            raise
+        except aiohttp.ClientConnectionError:
+            ESP32_HTTP_ATTEMPTS.inc(outcome="connection_error")
+            raise
+        
+        if response.status == 200:
+            self._latencies.append(time.perf_counter() - started)
+            ESP32_HTTP_ATTEMPTS.inc(outcome="ok")
+        else:
+            ESP32_HTTP_ATTEMPTS.inc(outcome=str(response.status))
+        return response.status, body
+    
+    async def _send_command(self, command: Dict[str, Any], timeout: float, wait: bool = True) -> Tuple[int, Any]:
+        """명령 전송 (WebSocket 모드면 /ws로, 실패하면 HTTP POST로 대체)
+        
+        wait=False면 WebSocket 확인을 기다리지 않음 (HTTP로 대체되면 응답까지 기다림).
+        """
+        if self.ws is not None and time.monotonic() >= self._ws_retry_at:
+            try:
+                response = await self.ws.send(command, wait=wait)
+                if response is None:
+                    return 200, {"success": True, "action": command["action"], "queued": True}
+                return (200 if response["success"] else 400), response
+            except ESP32WebSocketError as e:
+                logger.warning(f"ESP32 WebSocket 실패, {self.ws_retry_interval}초 동안 HTTP로 전송합니다: {e}")
+                self._ws_retry_at = time.monotonic() + self.ws_retry_interval
+            except ValueError as e:
+                # 1바이트를 넘는 인덱스 등 바이너리 프레임으로 표현할 수 없는 명령
+                logger.debug(f"WebSocket 프레임 변환 불가, HTTP로 전송: {e}")
+            ESP32_WS_FALLBACKS.inc()
+        return await self._post(command, timeout)
+    
     def position_to_led_index(self, position: str) -> Optional[int]:
         """그리드 위치를 LED 인덱스로 변환"""
         return self.grid_mapping.get(position.upper())
     
+    def expand_positions(self, grid_position: str) -> List[str]:
+        """그리드 위치 문자열을 개별 위치 리스트로 변환 ("A1-A4" -> A1, A2, A3, A4)"""
+        positions = []
+        if '-' in grid_position:
+            # 범위 위치 (예: "A1-A4")
+            start, end = grid_position.split('-')
+            start_row = start[0]
+            start_col = int(start[1:])
+            end_row = end[0]
+            end_col = int(end[1:])
+            
+            for row in range(ord(start_row), ord(end_row) + 1):
+                for col in range(start_col, end_col + 1):
+                    positions.append(f"{chr(row)}{col}")
+        else:
+            # 단일 위치 (예: "A1")
+            positions.append(grid_position)
+        return positions
+    
     def color_name_to_rgb(self, color_name: str) -> tuple:
         """색상 이름을 RGB 값으로 변환"""
         colors = {
@@ -258,25 +489,12 @@ class ESP32Controller:
         }
         return colors.get(color_name.lower(), (0, 0, 255))  # 기본값: 파란색
     
+    @observe_controller("highlight_position")
     async def highlight_position(self, led_control: LEDControl) -> Dict[str, Any]:
         """특정 위치의 LED를 하이라이트"""
         try:
             # 위치 문자열을 리스트로 변환
-            positions = []
-            if '-' in led_control.grid_position:
-                # 범위 위치 (예: "A1-A4")
-                start, end = led_control.grid_position.split('-')
-                start_row = start[0]
-                start_col = int(start[1:])
-                end_row = end[0]
-                end_col = int(end[1:])
-                
-                for row in range(ord(start_row), ord(end_row) + 1):
-                    for col in range(start_col, end_col + 1):
-                        positions.append(f"{chr(row)}{col}")
-            else:
-                # 단일 위치 (예: "A1")
-                positions.append(led_control.grid_position)
+            positions = self.expand_positions(led_control.grid_position)
             
             # 위치를 LED 인덱스로 변환
             led_indices = []
@@ -308,32 +526,29 @@ class ESP32Controller:
                 "positions": positions
             }
             
-            # ESP32로 HTTP 요청 전송
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/led_control",
-                    json=command,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return {
-                            "success": True,
-                            "data": {
-                                "command": command,
-                                "esp32_response": result
-                            },
-                            "message": f"LED 제어 완료: {len(led_indices)}개 LED가 {led_control.color} 색상으로 {led_control.duration}초간 켜집니다."
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"ESP32 응답 오류: {response.status}",
-                            "message": f"ESP32에서 오류가 발생했습니다: {error_text}"
-                        }
-        
-        except aiohttp.ClientTimeout:
+            # ESP32로 전송 (WebSocket 모드가 아니거나 실패하면 HTTP)
+            status, result = await self._send_command(command, timeout=10)
+            if status == 200:
+                # 장치가 이미 켠 셀은 전송 완료로 기록 (효과가 덮고 있으면 다음 프레임에 다시 전송)
+                cells = self.framebuffer.indices(positions)
+                self.framebuffer.paint(cells, rgb_color, led_control.duration)
+                self.framebuffer.mark_sent(*cells, np.asarray(rgb_color, dtype=np.uint8))
+                return {
+                    "success": True,
+                    "data": {
+                        "command": command,
+                        "esp32_response": result
+                    },
+                    "message": f"LED 제어 완료: {len(led_indices)}개 LED가 {led_control.color} 색상으로 {led_control.duration}초간 켜집니다."
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"ESP32 응답 오류: {status}",
+                    "message": f"ESP32에서 오류가 발생했습니다: {result}"
+                }
+        
+        except asyncio.TimeoutError:
             return {
                 "success": False,
                 "error": "Timeout",
@@ -352,6 +567,7 @@ class ESP32Controller:
                 "message": f"예상치 못한 오류: {str(e)}"
             }
     
+    @observe_controller("control_leds")
     async def control_leds(self, led_control: LEDControl) -> Dict[str, Any]:
         """LED 제어 명령을 ESP32로 전송"""
         try:
@@ -385,32 +601,25 @@ class ESP32Controller:
                 "positions": led_control.positions
             }
             
-            # ESP32로 HTTP 요청 전송
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/led_control",
-                    json=command,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return {
-                            "success": True,
-                            "data": {
-                                "command": command,
-                                "esp32_response": result
-                            },
-                            "message": f"LED 제어 완료: {len(led_indices)}개 LED가 {led_control.color} 색상으로 {led_control.duration}초간 켜집니다."
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "success": False,
-                            "error": f"ESP32 응답 오류: {response.status}",
-                            "message": f"ESP32에서 오류가 발생했습니다: {error_text}"
-                        }
-        
-        except aiohttp.ClientTimeout:
+            # ESP32로 전송 (WebSocket 모드가 아니거나 실패하면 HTTP)
+            status, result = await self._send_command(command, timeout=10)
+            if status == 200:
+                return {
+                    "success": True,
+                    "data": {
+                        "command": command,
+                        "esp32_response": result
+                    },
+                    "message": f"LED 제어 완료: {len(led_indices)}개 LED가 {led_control.color} 색상으로 {led_control.duration}초간 켜집니다."
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"ESP32 응답 오류: {status}",
+                    "message": f"ESP32에서 오류가 발생했습니다: {result}"
+                }
+        
+        except asyncio.TimeoutError:
             return {
                 "success": False,
                 "error": "Timeout",
@@ -429,27 +638,25 @@ class ESP32Controller:
                 "message": f"예상치 못한 오류: {str(e)}"
             }
     
+    @observe_controller("turn_off_all_leds")
     async def turn_off_all_leds(self) -> Dict[str, Any]:
         """모든 LED 끄기"""
         try:
             command = {"action": "turn_off_all"}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/led_control",
-                    json=command,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status == 200:
-                        return {
-                            "success": True,
-                            "message": "모든 LED가 꺼졌습니다."
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "message": "LED 끄기 실패"
-                        }
+            status, _ = await self._send_command(command, timeout=5)
+            if status == 200:
+                self.framebuffer.clear()
+                self.framebuffer.mark_all_sent()
+                return {
+                    "success": True,
+                    "message": "모든 LED가 꺼졌습니다."
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": "LED 끄기 실패"
+                }
         except Exception as e:
             return {
                 "success": False,
@@ -457,56 +664,133 @@ class ESP32Controller:
                 "message": f"LED 제어 오류: {str(e)}"
             }
     
+    def _frame_pixels(self, rows, cols, colors) -> List[List[int]]:
+        """프레임버퍼 diff를 set_pixels 형식 [[LED 인덱스, r, g, b], ...]로 변환"""
+        indices = (rows * self.grid_cols + cols).tolist()
+        return [[index, r, g, b] for index, (r, g, b) in zip(indices, colors.tolist())]
+    
+    async def _push(self, command: Dict[str, Any]):
+        """프레임 명령 전송 (WebSocket이면 확인을 기다리지 않음)"""
+        status, _ = await self._send_command(command, timeout=2, wait=False)
+        if status != 200:
+            raise RuntimeError(f"ESP32 응답 오류: {status}")
+    
+    @observe_controller("push_frame")
+    async def push_frame(self) -> int:
+        """마지막 전송 이후 바뀐 픽셀만 ESP32로 전송 (효과 엔진 프레임, 전송한 픽셀 수 반환)
+        
+        WebSocket 프레임이 유실되었으면 먼저 장치를 끄고 현재 프레임 전체를 다시 보냅니다.
+        """
+        self.framebuffer.expire()
+        if self._resync:
+            await self._push({"action": "turn_off_all"})
+            self._resync = False
+            self.framebuffer.mark_all_sent()
+        
+        rows, cols, colors = self.framebuffer.changes()
+        if rows.size == 0:
+            return 0
+        
+        await self._push({"action": "set_pixels", "pixels": self._frame_pixels(rows, cols, colors)})
+        self.framebuffer.mark_sent(rows, cols, colors)
+        return int(rows.size)
+    
+    @observe_controller("get_status")
     async def get_status(self) -> Dict[str, Any]:
         """ESP32 상태 확인"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.base_url}/status",
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as response:
-                    if response.status == 200:
-                        status = await response.json()
-                        return {
-                            "success": True,
-                            "data": status,
-                            "message": "ESP32 연결 정상"
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "message": "ESP32 상태 확인 실패"
-                        }
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/status",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status == 200:
+                    status = await response.json()
+                    return {
+                        "success": True,
+                        "data": status,
+                        "message": "ESP32 연결 정상"
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "message": "ESP32 상태 확인 실패"
+                    }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
                 "message": f"ESP32 연결 실패: {str(e)}"
             }
+    
+    @observe_controller("probe")
+    async def probe(self) -> Dict[str, Any]:
+        """상태 확인 (재시도 없이 GET /status 한 번, 실패하면 예외) - HealthPoller가 주기적으로 호출"""
+        session = await self._get_session()
+        async with session.get(
+            f"{self.base_url}/status",
+            timeout=aiohttp.ClientTimeout(total=self.retry.attempt_timeout * 2)
+        ) as response:
+            response.raise_for_status()
+            status = await response.json(content_type=None)
+        return {
+            "active_leds": status.get("active_leds"),
+            "transport": self.transport,
+            "ws_connected": self.ws.connected if self.ws is not None else None,
+            "device": status
+        }
 
 # 시뮬레이션용 가상 ESP32 컨트롤러
 class MockESP32Controller(ESP32Controller):
     """개발/테스트용 가상 ESP32 컨트롤러"""
     
-    def __init__(self):
+    def __init__(self, latency: float = 0.5):
         super().__init__("127.0.0.1", 8080)
-        self.led_states = {}  # LED 상태 저장
+        self.latency = latency  # 가상 왕복 지연(초)
     
+    @observe_controller("highlight_position")
+    async def highlight_position(self, led_control: LEDControl) -> Dict[str, Any]:
+        """가상 LED 하이라이트 (HTTP 요청 없이 지연만 시뮬레이션)"""
+        try:
+            positions = self.expand_positions(led_control.grid_position)
+            led_indices = [index for index in map(self.position_to_led_index, positions) if index is not None]
+            
+            if not led_indices:
+                return {
+                    "success": False,
+                    "error": "No valid LED positions found",
+                    "message": "유효한 LED 위치를 찾을 수 없습니다."
+                }
+            
+            self.framebuffer.paint(positions, self.color_name_to_rgb(led_control.color), led_control.duration)
+            await asyncio.sleep(self.latency)
+            
+            return {
+                "success": True,
+                "data": {
+                    "led_indices": led_indices,
+                    "positions": positions,
+                    "color": led_control.color,
+                    "duration": led_control.duration,
+                    "simulation": True
+                },
+                "message": f"[시뮬레이션] LED 제어 완료: {len(led_indices)}개 LED가 {led_control.color} 색상으로 {led_control.duration}초간 켜집니다."
+            }
+        
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"시뮬레이션 오류: {str(e)}"
+            }
+    
+    @observe_controller("control_leds")
     async def control_leds(self, led_control: LEDControl) -> Dict[str, Any]:
         """가상 LED 제어 (시뮬레이션)"""
         try:
             # 위치를 LED 인덱스로 변환
-            led_indices = []
-            for position in led_control.positions:
-                led_index = self.position_to_led_index(position)
-                if led_index is not None:
-                    led_indices.append(led_index)
-                    # 가상 LED 상태 저장
-                    self.led_states[led_index] = {
-                        "position": position,
-                        "color": led_control.color,
-                        "duration": led_control.duration
-                    }
+            led_indices = [index for index in map(self.position_to_led_index, led_control.positions)
+                           if index is not None]
             
             if not led_indices:
                 return {
@@ -515,8 +799,12 @@ class MockESP32Controller(ESP32Controller):
                     "message": "유효한 LED 위치를 찾을 수 없습니다."
                 }
             
+            # 가상 LED 상태 저장
+            self.framebuffer.paint(led_control.positions, self.color_name_to_rgb(led_control.color),
+                                   led_control.duration)
+            
             # 시뮬레이션 지연
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(self.latency)
             
             return {
                 "success": True,
@@ -537,34 +825,181 @@ class MockESP32Controller(ESP32Controller):
                 "message": f"시뮬레이션 오류: {str(e)}"
             }
     
+    @observe_controller("push_frame")
+    async def push_frame(self) -> int:
+        """가상 프레임 전송 (HTTP 없이 지연만 시뮬레이션)"""
+        self.framebuffer.expire()
+        rows, cols, colors = self.framebuffer.changes()
+        if rows.size == 0:
+            return 0
+        await asyncio.sleep(self.latency / 5)
+        self.framebuffer.mark_sent(rows, cols, colors)
+        return int(rows.size)
+    
+    @observe_controller("turn_off_all_leds")
     async def turn_off_all_leds(self) -> Dict[str, Any]:
         """모든 가상 LED 끄기"""
-        self.led_states.clear()
-        await asyncio.sleep(0.1)
+        self.framebuffer.clear()
+        await asyncio.sleep(self.latency / 5)
         
         return {
             "success": True,
             "message": "[시뮬레이션] 모든 LED가 꺼졌습니다."
         }
     
+    @observe_controller("get_status")
     async def get_status(self) -> Dict[str, Any]:
         """가상 ESP32 상태"""
+        self.framebuffer.expire()
         return {
             "success": True,
             "data": {
                 "device": "Mock ESP32",
                 "ip": "127.0.0.1",
                 "led_count": self.grid_rows * self.grid_cols,
-                "active_leds": len(self.led_states),
+                "active_leds": self.framebuffer.active_count(),
+                "led_states": self.framebuffer.active(),
                 "grid_size": f"{self.grid_rows}x{self.grid_cols}",
                 "simulation": True
             },
             "message": "[시뮬레이션] ESP32 연결 정상"
         }
+    
+    @observe_controller("probe")
+    async def probe(self) -> Dict[str, Any]:
+        self.framebuffer.expire()
+        await asyncio.sleep(self.latency / 5)
+        return {"active_leds": self.framebuffer.active_count(), "simulation": True}
+
+# LED 데몬 클라이언트
+class LEDDaemonClient(ESP32Controller):
+    """하드웨어 대신 LED 데몬(led_daemon.py)에 명령을 보내는 컨트롤러
+    
+    하드웨어와 LED 상태는 데몬이 소유합니다. 이 프로세스의 프레임버퍼는 효과 엔진이 오버레이를 그리는 데만 쓰며,
+    push_frame은 바뀐 오버레이를 데몬으로 보냅니다.
+    """
+    
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: float = 10.0):
+        super().__init__("127.0.0.1", 0)
+        self.base_url = f"unix:{socket_path}"
+        self.connection = LEDDaemonConnection(socket_path, timeout)
+        self._overlay_sent: Optional[bytes] = None
+    
+    async def connect(self) -> Dict[str, Any]:
+        """데몬에 연결하고 그리드 크기를 데몬의 하드웨어에 맞춤"""
+        hello = await self.connection.connect()
+        if (hello["rows"], hello["cols"]) != (self.grid_rows, self.grid_cols):
+            self.grid_rows, self.grid_cols = hello["rows"], hello["cols"]
+            self.grid_mapping = self._create_grid_mapping()
+            self.framebuffer = LEDFramebuffer(self.grid_rows, self.grid_cols)
+        return hello
+    
+    async def close(self):
+        await self.connection.close()
+    
+    async def _request(self, op: str, **fields) -> Dict[str, Any]:
+        await self.connect()
+        return await self.connection.request(op, **fields)
+    
+    @observe_controller("highlight_position")
+    async def highlight_position(self, led_control: LEDControl) -> Dict[str, Any]:
+        """데몬에 하이라이트 요청 (다른 프로세스의 하이라이트와 같은 프레임버퍼에 합성)"""
+        return await self._highlight(led_control, position=led_control.grid_position)
+    
+    @observe_controller("control_leds")
+    async def control_leds(self, led_control: LEDControl) -> Dict[str, Any]:
+        return await self._highlight(led_control, positions=led_control.positions)
+    
+    async def _highlight(self, led_control: LEDControl, **target) -> Dict[str, Any]:
+        try:
+            result = await self._request("highlight", color=list(self.color_name_to_rgb(led_control.color)),
+                                         duration=led_control.duration, **target)
+        except LEDDaemonError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"LED 데몬 오류: {str(e)}"
+            }
+        
+        return {
+            "success": True,
+            "data": {
+                "positions": result["positions"],
+                "color": led_control.color,
+                "duration": led_control.duration,
+                "daemon": result
+            },
+            "message": f"LED 제어 완료: {result['cells']}개 LED가 {led_control.color} 색상으로 {led_control.duration}초간 켜집니다."
+        }
+    
+    @observe_controller("turn_off_all_leds")
+    async def turn_off_all_leds(self) -> Dict[str, Any]:
+        try:
+            await self._request("clear")
+        except LEDDaemonError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"LED 제어 오류: {str(e)}"
+            }
+        return {
+            "success": True,
+            "message": "모든 LED가 꺼졌습니다."
+        }
+    
+    @observe_controller("push_frame")
+    async def push_frame(self) -> int:
+        """효과 오버레이가 바뀌었으면 데몬으로 전송 (오버레이 셀 수 반환)"""
+        with self.framebuffer.lock:
+            rows, cols = np.nonzero(self.framebuffer.overlay_mask)
+            colors = self.framebuffer.overlay[rows, cols]
+        cells = np.column_stack([rows, cols, colors]).astype(np.int64)
+        signature = cells.tobytes()
+        if signature == self._overlay_sent:
+            return 0
+        
+        await self._request("overlay", cells=cells.tolist())
+        self._overlay_sent = signature
+        return int(rows.size)
+    
+    @observe_controller("get_status")
+    async def get_status(self) -> Dict[str, Any]:
+        try:
+            status = await self._request("status")
+        except LEDDaemonError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": f"LED 데몬 연결 실패: {str(e)}"
+            }
+        return {
+            "success": True,
+            "data": status,
+            "message": "LED 데몬 연결 정상"
+        }
+    
+    @observe_controller("probe")
+    async def probe(self) -> Dict[str, Any]:
+        """데몬 status 요청 (데몬이 하드웨어에 연결할 수 없다고 보고하면 연결되지 않음)"""
+        status = await self._request("status")
+        hardware = status.get("hardware", {})
+        details = {
+            "active_leds": len(status["active"]),
+            "backend": status["backend"],
+            "clients": status["clients"],
+            "hardware": hardware
+        }
+        health = hardware.get("health") or {}
+        if health.get("reachable") is False:
+            details.update(reachable=False, error=f"LED 데몬 하드웨어: {health.get('last_error')}")
+        return details
 
 # 컨트롤러 팩토리
 def create_esp32_controller(simulation_mode: bool = True) -> ESP32Controller:
-    """ESP32 컨트롤러 생성"""
+    """ESP32 컨트롤러 생성 (LED_DAEMON_SOCKET이 설정되면 LED 데몬 클라이언트)"""
+    socket_path = daemon_socket_path()
+    if socket_path:
+        return LEDDaemonClient(socket_path)
     if simulation_mode:
         return MockESP32Controller()
     else:
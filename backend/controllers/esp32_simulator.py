@@ -0,0 +1,517 @@
+"""
+로컬 ESP32 HTTP 시뮬레이터
+hardware/esp32_neopixel_server.ino와 같은 JSON 계약(/led_control: highlight, turn_off_all, set_pixels /
+/status)과 duration 만료 동작을 aiohttp 서버로 구현합니다. MockESP32Controller와 달리 실제
+ESP32Controller의 HTTP 경로(커넥션 풀, 타임아웃, 배치)를 그대로 테스트하고 부하를 줄 수 있습니다.
+/ws는 펌웨어의 바이너리 WebSocket 채널(backend/controllers/esp32_ws.py 참고)을 같은 LED 상태에 연결합니다.
+
+펌웨어/네트워크 특성 설정 (SimulatorConfig):
+- 응답 지연과 지터, 실패(500) / 연결 끊김 / 응답 없음(stall) 비율
+- 요청 본문 크기 제한: 펌웨어의 본문 핸들러는 청크(TCP 세그먼트) 하나만 파싱
+- JSON 문서 용량: StaticJsonDocument<4096> (ArduinoJson 6, 32비트 - 값/멤버당 16바이트, 문자열은 복사 안 함)
+- 동시 처리 한도 (AsyncTCP 소켓 수) 초과 시 503
+- 명령 id: 최근 RECENT_COMMANDS개 id의 응답을 기억해 재시도/헤지 요청은 다시 적용하지 않음
+- WebSocket 프레임: 지연은 프레임마다 적용하되 순서를 지키고 앞 프레임의 확인을 기다리지 않음,
+  실패 = status 1 확인, 연결 끊김 = 소켓 종료, 무응답 = 확인 없음
+
+시뮬레이터 전용 엔드포인트: GET /sim/state (LED 상태), GET /sim/stats (요청/커넥션 통계)
+
+사용 예:
+    python backend/controllers/esp32_simulator.py --port 8080 --latency 0.03 --jitter 0.02 --failure-rate 0.01
+    ESP32_IP=127.0.0.1 ESP32_PORT=8080 python backend/api/rest_api.py
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import random
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+# ArduinoJson 6의 32비트 VariantSlot 크기
+JSON_SLOT_SIZE = 16
+
+# 펌웨어가 응답을 기억하는 최근 명령 id 수
+RECENT_COMMANDS = 16
+
+# WebSocket 프레임 (펌웨어 handleWebSocketFrame과 같은 형식)
+WS_OP_HIGHLIGHT = 0x01
+WS_OP_SET_PIXELS = 0x02
+WS_OP_CLEAR = 0x03
+WS_ACK = 0x80
+WS_HEADER = struct.Struct(">BH")
+WS_HIGHLIGHT_FIELDS = struct.Struct(">BBBH")
+WS_ACK_FRAME = struct.Struct(">BHBB")
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+
+@dataclass
+class SimulatorConfig:
+    """시뮬레이터 지연/오류/용량 설정"""
+    led_count: int = 25                # 5x5 그리드
+    brightness: int = 50
+    latency: float = 0.02              # 기본 응답 지연(초)
+    jitter: float = 0.0                # 지연에 더해지는 0~jitter 균등 분포 난수(초)
+    failure_rate: float = 0.0          # 500 응답 비율
+    drop_rate: float = 0.0             # 응답 없이 연결을 끊는 비율
+    stall_rate: float = 0.0            # stall_time 동안 응답하지 않는 비율
+    stall_time: float = 30.0
+    max_body: int = 1436               # 본문 핸들러가 한 번에 받는 크기 (TCP MSS)
+    json_capacity: int = 4096          # StaticJsonDocument 용량(바이트)
+    max_concurrent: int = 8            # 동시에 처리하는 요청 수
+    expire_interval: float = 0.1       # loop()의 delay(100)
+    websocket: bool = True             # /ws 채널 (False면 WebSocket 이전 펌웨어처럼 404)
+    seed: Optional[int] = None
+
+def json_document_size(value: Any) -> int:
+    """ArduinoJson 6이 value를 역직렬화할 때 필요한 용량 (zero-copy 모드 기준)"""
+    if isinstance(value, dict):
+        return JSON_SLOT_SIZE * len(value) + sum(json_document_size(v) for v in value.values())
+    if isinstance(value, list):
+        return JSON_SLOT_SIZE * len(value) + sum(json_document_size(v) for v in value)
+    return 0
+
+class ESP32Simulator:
+    """esp32_neopixel_server.ino의 HTTP 서버를 흉내 내는 aiohttp 애플리케이션"""
+    
+    def __init__(self, config: Optional[SimulatorConfig] = None):
+        self.config = config or SimulatorConfig()
+        self._rng = random.Random(self.config.seed)
+        
+        # 펌웨어 LED 상태 (ledStates / ledTimers / ledColors)
+        count = self.config.led_count
+        self.states = [False] * count
+        self.timers = [0.0] * count
+        self.colors = [(0, 0, 0)] * count
+        
+        self.counters: collections.Counter = collections.Counter()
+        self._recent: "collections.OrderedDict[int, str]" = collections.OrderedDict()
+        self._peers = set()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self._started_at = time.monotonic()
+        
+        self.app = web.Application(middlewares=[self._fault_middleware])
+        self.app.router.add_post("/led_control", self.handle_led_control)
+        self.app.router.add_route("OPTIONS", "/led_control", self.handle_options)
+        self.app.router.add_get("/status", self.handle_status)
+        if self.config.websocket:
+            self.app.router.add_get("/ws", self.handle_ws)
+        self.app.router.add_get("/sim/state", self.handle_sim_state)
+        self.app.router.add_get("/sim/stats", self.handle_sim_stats)
+        self.app.on_startup.append(self._start_expiry)
+        self.app.on_cleanup.append(self._stop_expiry)
+        self._expiry_task: Optional[asyncio.Task] = None
+        
+        self._runner: Optional[web.AppRunner] = None
+        self.port: Optional[int] = None
+    
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    
+    def active(self) -> Dict[int, List[int]]:
+        """켜진 LED {인덱스: [r, g, b]}"""
+        return {index: list(color) for index, color in enumerate(self.colors) if any(color)}
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **{key: self.counters[key] for key in (
+                "requests", "highlight", "set_pixels", "turn_off_all", "status",
+                "failed", "dropped", "stalled", "busy", "aborted", "too_large", "no_memory", "bad_request",
+                "ws_connections", "ws_frames", "duplicates"
+            )},
+            "connections": len(self._peers),
+            "max_in_flight": self.max_in_flight,
+            "active_leds": sum(1 for color in self.colors if any(color)),
+        }
+    
+    def _expire(self, now: float) -> int:
+        """loop(): 시간이 지난 하이라이트 끄기"""
+        expired = 0
+        for index in range(self.config.led_count):
+            if self.states[index] and now >= self.timers[index]:
+                self.states[index] = False
+                self.colors[index] = (0, 0, 0)
+                expired += 1
+        return expired
+    
+    async def _expiry_loop(self):
+        while True:
+            self._expire(time.monotonic())
+            await asyncio.sleep(self.config.expire_interval)
+    
+    async def _start_expiry(self, app):
+        self._expiry_task = asyncio.get_running_loop().create_task(self._expiry_loop())
+    
+    async def _stop_expiry(self, app):
+        if self._expiry_task:
+            self._expiry_task.cancel()
+    
+    # ------------------------------------------------------------------
+    # 지연/오류 주입
+    # ------------------------------------------------------------------
+    
+    @web.middleware
+    async def _fault_middleware(self, request: web.Request, handler):
+        if request.path.startswith("/sim/") or request.path == "/ws":
+            # WebSocket은 연결이 유지되는 동안 핸들러가 끝나지 않으므로 프레임 단위로 주입 (handle_ws)
+            return await handler(request)
+        
+        config = self.config
+        self.counters["requests"] += 1
+        peer = request.transport.get_extra_info("peername") if request.transport else None
+        if peer is not None:
+            self._peers.add(peer)
+        
+        if self._in_flight >= config.max_concurrent:
+            self.counters["busy"] += 1
+            return web.Response(status=503, text="busy", headers=CORS_HEADERS)
+        
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(config.latency + self._rng.uniform(0, config.jitter))
+            
+            roll = self._rng.random()
+            if roll < config.drop_rate:
+                # WiFi 끊김: 응답 없이 연결 종료
+                self.counters["dropped"] += 1
+                if request.transport:
+                    request.transport.abort()
+                raise asyncio.CancelledError()
+            roll -= config.drop_rate
+            if roll < config.stall_rate:
+                self.counters["stalled"] += 1
+                await asyncio.sleep(config.stall_time)
+            elif roll - config.stall_rate < config.failure_rate:
+                self.counters["failed"] += 1
+                return web.Response(status=500, text="internal error", headers=CORS_HEADERS)
+            
+            response = await handler(request)
+            response.headers.update(CORS_HEADERS)
+            return response
+        finally:
+            self._in_flight -= 1
+    
+    # ------------------------------------------------------------------
+    # 펌웨어 엔드포인트
+    # ------------------------------------------------------------------
+    
+    def _json(self, payload: Dict[str, Any], status: int = 200) -> web.Response:
+        return web.Response(status=status, text=json.dumps(payload, ensure_ascii=False),
+                            content_type="application/json")
+    
+    def _error(self, message: str, counter: str) -> web.Response:
+        self.counters[counter] += 1
+        return self._json({"success": False, "error": message}, status=400)
+    
+    async def handle_options(self, request: web.Request) -> web.Response:
+        return web.Response(status=200)
+    
+    async def handle_status(self, request: web.Request) -> web.Response:
+        self.counters["status"] += 1
+        return self._json({
+            "device": "ESP32 NeoPixel Controller",
+            "ip": request.host.split(":")[0],
+            "led_count": self.config.led_count,
+            "brightness": self.config.brightness,
+            "active_leds": sum(1 for color in self.colors if any(color)),
+            "uptime_ms": int((time.monotonic() - self._started_at) * 1000),
+            "wifi_rssi": -55 - self._rng.randint(0, 15)
+        })
+    
+    async def handle_led_control(self, request: web.Request) -> web.Response:
+        try:
+            body = await request.read()
+        except ConnectionResetError:
+            # 클라이언트가 본문 전송 중 연결을 끊음 (요청 취소)
+            self.counters["aborted"] += 1
+            return web.Response(status=400)
+        # 본문 핸들러는 청크마다 호출되고 펌웨어는 첫 청크만 파싱 → 큰 본문은 IncompleteInput
+        if len(body) > self.config.max_body:
+            return self._error("JSON 파싱 오류", "too_large")
+        try:
+            doc = json.loads(body)
+        except (UnicodeDecodeError, ValueError):
+            return self._error("JSON 파싱 오류", "bad_request")
+        if json_document_size(doc) > self.config.json_capacity:
+            # DeserializationError::NoMemory
+            return self._error("JSON 파싱 오류", "no_memory")
+        if not isinstance(doc, dict):
+            return self._error("알 수 없는 액션", "bad_request")
+        
+        # 재시도/헤지로 같은 id가 다시 오면 적용하지 않고 기억한 응답을 보냄
+        command_id = self._int(doc.get("id"), 0)
+        if command_id and command_id in self._recent:
+            self.counters["duplicates"] += 1
+            return web.Response(text=self._recent[command_id], content_type="application/json")
+        
+        action = doc.get("action")
+        if action == "highlight":
+            response = self._highlight(doc)
+        elif action == "turn_off_all":
+            response = self._turn_off_all()
+        elif action == "set_pixels":
+            response = self._set_pixels(doc)
+        else:
+            return self._error("알 수 없는 액션", "bad_request")
+        
+        if command_id:
+            self._recent[command_id] = response.text
+            while len(self._recent) > RECENT_COMMANDS:
+                self._recent.popitem(last=False)
+        return response
+    
+    @staticmethod
+    def _int(value: Any, default: int) -> int:
+        """ArduinoJson의 doc["key"] | default - 정수가 아니면 기본값"""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return default
+        return int(value)
+    
+    def _highlight(self, doc: Dict[str, Any]) -> web.Response:
+        indices = doc.get("led_indices") if isinstance(doc.get("led_indices"), list) else []
+        color = doc.get("color") if isinstance(doc.get("color"), dict) else {}
+        duration = self._int(doc.get("duration"), 5)
+        r = self._int(color.get("r"), 0)
+        g = self._int(color.get("g"), 0)
+        b = self._int(color.get("b"), 255)
+        
+        self._apply_highlight([self._int(index, -1) for index in indices], (r, g, b), duration)
+        return self._json({
+            "success": True,
+            "action": "highlight",
+            "led_count": len(indices),
+            "duration": duration,
+            "color": {"r": r, "g": g, "b": b}
+        })
+    
+    def _set_pixels(self, doc: Dict[str, Any]) -> web.Response:
+        pixels = []
+        for pixel in doc.get("pixels") or []:
+            if not isinstance(pixel, list) or not pixel:
+                continue
+            pixels.append([self._int(pixel[0], -1)] + [self._int(pixel[i], 0) if i < len(pixel) else 0 for i in (1, 2, 3)])
+        applied = self._apply_set_pixels(pixels)
+        return self._json({"success": True, "action": "set_pixels", "applied": applied})
+    
+    def _turn_off_all(self) -> web.Response:
+        self._apply_turn_off_all()
+        return self._json({"success": True, "action": "turn_off_all", "message": "모든 LED가 꺼졌습니다"})
+    
+    # HTTP와 WebSocket이 공유하는 LED 상태 변경
+    
+    def _apply_highlight(self, indices: List[int], color, duration: int) -> int:
+        self.counters["highlight"] += 1
+        end_time = time.monotonic() + duration
+        applied = 0
+        for index in indices:
+            if 0 <= index < self.config.led_count:
+                self.states[index] = True
+                self.timers[index] = end_time
+                self.colors[index] = tuple(value & 0xFF for value in color)
+                applied += 1
+        return applied
+    
+    def _apply_set_pixels(self, pixels: List[List[int]]) -> int:
+        self.counters["set_pixels"] += 1
+        applied = 0
+        for index, r, g, b in pixels:
+            if 0 <= index < self.config.led_count:
+                self.states[index] = False  # 서버가 프레임을 관리하므로 자동 끄기 해제
+                self.timers[index] = 0.0
+                self.colors[index] = (r & 0xFF, g & 0xFF, b & 0xFF)
+                applied += 1
+        return applied
+    
+    def _apply_turn_off_all(self):
+        self.counters["turn_off_all"] += 1
+        count = self.config.led_count
+        self.states = [False] * count
+        self.timers = [0.0] * count
+        self.colors = [(0, 0, 0)] * count
+    
+    # ------------------------------------------------------------------
+    # WebSocket 채널
+    # ------------------------------------------------------------------
+    
+    async def handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        # 닫기 응답은 받은 프레임을 모두 적용한 뒤 보냄 (펌웨어처럼 순서대로 처리)
+        ws = web.WebSocketResponse(autoping=True, autoclose=False)
+        await ws.prepare(request)
+        self.counters["ws_connections"] += 1
+        
+        # 네트워크 지연은 프레임마다 적용하되 순서는 유지 (앞 프레임의 처리를 기다리지 않음)
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        worker = loop.create_task(self._ws_worker(request, ws, queue))
+        due = 0.0
+        try:
+            async for message in ws:
+                if message.type == web.WSMsgType.BINARY:
+                    due = max(due, loop.time() + self.config.latency + self._rng.uniform(0, self.config.jitter))
+                    queue.put_nowait((due, message.data))
+            queue.put_nowait(None)
+            await worker
+        finally:
+            worker.cancel()
+            await ws.close()
+        return ws
+    
+    async def _ws_worker(self, request: web.Request, ws: web.WebSocketResponse, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        config = self.config
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            due, data = item
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            roll = self._rng.random()
+            if roll < config.drop_rate:
+                self.counters["dropped"] += 1
+                if request.transport is not None:
+                    request.transport.abort()
+                return
+            roll -= config.drop_rate
+            if roll < config.stall_rate:
+                # 확인 없음 (클라이언트 확인 시간 초과)
+                self.counters["stalled"] += 1
+                continue
+            failed = roll - config.stall_rate < config.failure_rate
+            if failed:
+                self.counters["failed"] += 1
+            
+            ack = self._apply_frame(data, failed)
+            if ack is not None and not ws.closed:
+                try:
+                    await ws.send_bytes(ack)
+                except ConnectionError:
+                    pass  # 클라이언트가 확인을 기다리지 않고 연결을 닫음
+    
+    def _apply_frame(self, data: bytes, failed: bool = False) -> Optional[bytes]:
+        """바이너리 프레임 적용 후 확인 프레임 반환 (seq를 읽을 수 없으면 None)"""
+        self.counters["ws_frames"] += 1
+        if len(data) < WS_HEADER.size:
+            self.counters["bad_request"] += 1
+            return None
+        op, seq = WS_HEADER.unpack_from(data)
+        payload = data[WS_HEADER.size:]
+        if failed:
+            return WS_ACK_FRAME.pack(op | WS_ACK, seq, 1, 0)
+        
+        if op == WS_OP_HIGHLIGHT and len(payload) >= WS_HIGHLIGHT_FIELDS.size:
+            r, g, b, duration = WS_HIGHLIGHT_FIELDS.unpack_from(payload)
+            applied = self._apply_highlight(list(payload[WS_HIGHLIGHT_FIELDS.size:]), (r, g, b), duration)
+        elif op == WS_OP_SET_PIXELS and len(payload) % 4 == 0:
+            applied = self._apply_set_pixels([list(payload[i:i + 4]) for i in range(0, len(payload), 4)])
+        elif op == WS_OP_CLEAR:
+            self._apply_turn_off_all()
+            applied = 0
+        else:
+            self.counters["bad_request"] += 1
+            return WS_ACK_FRAME.pack(op | WS_ACK, seq, 1, 0)
+        return WS_ACK_FRAME.pack(op | WS_ACK, seq, 0, min(applied, 0xFF))
+    
+    # ------------------------------------------------------------------
+    # 시뮬레이터 전용
+    # ------------------------------------------------------------------
+    
+    async def handle_sim_state(self, request: web.Request) -> web.Response:
+        return self._json({"leds": {str(index): color for index, color in self.active().items()}})
+    
+    async def handle_sim_stats(self, request: web.Request) -> web.Response:
+        return self._json(self.stats())
+    
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """현재 루프에서 서버 시작 (실제 포트 반환, port=0이면 임의 포트)"""
+        # 클라이언트가 연결을 끊으면 핸들러 취소 (무응답 요청이 동시 처리 슬롯을 계속 차지하지 않도록)
+        self._runner = web.AppRunner(self.app, handle_signals=False, access_log=None, handler_cancellation=True)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        self.port = self._runner.addresses[0][1]
+        return self.port
+    
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+class SimulatorThread:
+    """동기 코드(테스트, 부하 테스트)에서 쓰는 백그라운드 스레드 시뮬레이터"""
+    
+    def __init__(self, config: Optional[SimulatorConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.simulator = ESP32Simulator(config)
+        self.host = host
+        self.port = port
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="esp32-simulator", daemon=True)
+    
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    def start(self) -> "SimulatorThread":
+        self._thread.start()
+        self.port = asyncio.run_coroutine_threadsafe(
+            self.simulator.start(self.host, self.port), self._loop
+        ).result(timeout=10)
+        return self
+    
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.simulator.stop(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+    
+    def __enter__(self) -> "SimulatorThread":
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 ESP32 HTTP 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.02, help="기본 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 지연 최대값(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="응답 없이 연결을 끊는 비율")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="응답하지 않는 요청 비율")
+    parser.add_argument("--json-capacity", type=int, default=4096, help="StaticJsonDocument 용량(바이트)")
+    parser.add_argument("--max-body", type=int, default=1436, help="파싱 가능한 최대 본문 크기(바이트)")
+    parser.add_argument("--max-concurrent", type=int, default=8, help="동시 처리 요청 수")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    
+    config = SimulatorConfig(
+        latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+        drop_rate=args.drop_rate, stall_rate=args.stall_rate, json_capacity=args.json_capacity,
+        max_body=args.max_body, max_concurrent=args.max_concurrent, seed=args.seed
+    )
+    simulator = ESP32Simulator(config)
+    print(f"ESP32 시뮬레이터: http://{args.host}:{args.port} (ESP32_IP={args.host} ESP32_PORT={args.port})")
+    web.run_app(simulator.app, host=args.host, port=args.port, print=None, access_log=None,
+                handler_cancellation=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+ESP32 WebSocket 채널
+명령마다 HTTP POST(JSON) 대신 ESP32의 /ws(ESPAsyncWebServer AsyncWebSocket)에 연결 하나를 유지하고
+작은 바이너리 프레임을 보냅니다. 확인(ack)을 기다리지 않고 여러 프레임을 연달아 보내며(파이프라이닝),
+확인되지 않은 프레임 수는 max_in_flight로 제한합니다. 연결 상태는 WebSocket ping/pong(heartbeat)으로 확인합니다.
+
+프레임 형식 (빅엔디언, hardware/esp32_neopixel_server.ino와 같음):
+    요청: [op:1][seq:2][payload]
+        HIGHLIGHT  payload = r, g, b, duration(초, 2바이트), LED 인덱스...
+        SET_PIXELS payload = (인덱스, r, g, b) 반복
+        CLEAR      payload 없음
+    확인: [op|0x80:1][seq:2][status:1][applied:1]  (status 0 = 성공)
+
+HTTP 경로와 같은 명령 딕셔너리({"action": "highlight", ...})를 받아 인코딩하고,
+확인 응답은 펌웨어의 JSON 응답과 같은 모양으로 돌려줍니다.
+"""
+
+import asyncio
+import logging
+import struct
+import time
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+
+from ..core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+OP_HIGHLIGHT = 0x01
+OP_SET_PIXELS = 0x02
+OP_CLEAR = 0x03
+ACK = 0x80
+
+HEADER = struct.Struct(">BH")
+HIGHLIGHT_FIELDS = struct.Struct(">BBBH")
+ACK_FRAME = struct.Struct(">BHBB")
+
+MAX_DURATION = 0xFFFF
+
+ESP32_WS_ACK_LATENCY = registry.histogram(
+    "esp32_ws_ack_seconds", "WebSocket 프레임 전송부터 ESP32 확인까지 걸린 시간",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+ESP32_WS_FRAMES = registry.counter("esp32_ws_frames_total", "WebSocket 프레임 처리 결과", ("outcome",))
+ESP32_WS_FALLBACKS = registry.counter("esp32_ws_fallback_total", "WebSocket 대신 HTTP로 보낸 명령 수")
+
+class ESP32WebSocketError(ConnectionError):
+    """WebSocket으로 보낼 수 없음 (연결 실패, 끊김, 확인 시간 초과) - 호출자는 HTTP로 대체"""
+
+def encode_command(seq: int, command: Dict[str, Any]) -> bytes:
+    """HTTP 명령 딕셔너리를 바이너리 프레임으로 변환 (인덱스/색상이 1바이트를 넘으면 ValueError)"""
+    action = command.get("action")
+    if action == "highlight":
+        color = command["color"]
+        duration = min(max(int(command.get("duration", 5)), 0), MAX_DURATION)
+        return (HEADER.pack(OP_HIGHLIGHT, seq)
+                + HIGHLIGHT_FIELDS.pack(color["r"], color["g"], color["b"], duration)
+                + bytes(command["led_indices"]))
+    if action == "set_pixels":
+        return HEADER.pack(OP_SET_PIXELS, seq) + bytes(value for pixel in command["pixels"] for value in pixel)
+    if action == "turn_off_all":
+        return HEADER.pack(OP_CLEAR, seq)
+    raise ValueError(f"WebSocket으로 보낼 수 없는 명령: {action}")
+
+def ack_response(command: Dict[str, Any], status: int, applied: int) -> Dict[str, Any]:
+    """확인 프레임을 펌웨어 HTTP 응답과 같은 딕셔너리로 변환"""
+    action = command.get("action")
+    if status != 0:
+        return {"success": False, "action": action, "error": "잘못된 프레임"}
+    if action == "highlight":
+        return {"success": True, "action": action, "led_count": len(command["led_indices"]),
+                "duration": command.get("duration", 5), "color": command["color"]}
+    if action == "set_pixels":
+        return {"success": True, "action": action, "applied": applied}
+    return {"success": True, "action": action, "message": "모든 LED가 꺼졌습니다"}
+
+class ESP32WebSocket:
+    """ESP32 /ws 연결 하나 (이벤트 루프별로 연결을 만들고 seq로 확인을 짝지음)"""
+    
+    def __init__(self, url: str, heartbeat: float = 5.0, timeout: float = 5.0, max_in_flight: int = 16,
+                 on_failure: Optional[Callable[[BaseException], Any]] = None):
+        """
+        Args:
+            url: ws://<ESP32 IP>:<포트>/ws
+            heartbeat: ping 간격(초) - pong이 없으면 연결을 끊고 대기 중인 프레임을 실패 처리
+            timeout: 연결/확인 대기 시간(초)
+            max_in_flight: 확인되지 않은 프레임 최대 수 (ESP32 수신 큐 보호)
+            on_failure: 프레임이 실패할 때 호출 (확인을 기다리지 않은 프레임 포함)
+        """
+        self.url = url
+        self.heartbeat = heartbeat
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.on_failure = on_failure
+        
+        self._seq = 0
+        self._waiters: Dict[int, asyncio.Future] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._window: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and not self._ws.closed
+    
+    @property
+    def in_flight(self) -> int:
+        return len(self._waiters)
+    
+    async def connect(self):
+        """연결 (이미 연결되어 있으면 재사용)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 다른 루프의 연결은 이 루프에서 쓸 수 없음
+            self._reset()
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._window = asyncio.Semaphore(self.max_in_flight)
+        
+        async with self._connect_lock:
+            if self.connected:
+                return
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession()
+            try:
+                ws = await asyncio.wait_for(
+                    self._session.ws_connect(self.url, heartbeat=self.heartbeat, autoping=True), self.timeout
+                )
+            except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as e:
+                raise ESP32WebSocketError(f"ESP32 WebSocket 연결 실패 ({self.url}): {e or '시간 초과'}") from e
+            self._ws = ws
+            self._reader_task = loop.create_task(self._read_acks(ws))
+            logger.info(f"ESP32 WebSocket 연결: {self.url}")
+    
+    async def send(self, command: Dict[str, Any], wait: bool = True) -> Optional[Dict[str, Any]]:
+        """명령 프레임 전송
+        
+        wait=True면 확인 응답(펌웨어 JSON 응답과 같은 딕셔너리)을 반환하고, False면 쓰기만 하고 바로 반환합니다
+        (효과 프레임처럼 결과를 기다릴 필요가 없는 경우). 어느 쪽이든 확인되지 않은 프레임이 max_in_flight개면
+        자리가 날 때까지 기다립니다.
+        """
+        await self.connect()
+        loop = asyncio.get_running_loop()
+        window = self._window
+        await window.acquire()
+        
+        seq = self._seq = (self._seq + 1) & 0xFFFF
+        try:
+            frame = encode_command(seq, command)
+        except (KeyError, TypeError, ValueError):
+            window.release()
+            raise
+        
+        waiter = loop.create_future()
+        self._waiters[seq] = waiter
+        timer = loop.call_later(self.timeout, self._expire, seq)
+        started = time.perf_counter()
+        
+        def settle(future: asyncio.Future):
+            timer.cancel()
+            window.release()
+            self._waiters.pop(seq, None)
+            error = None if future.cancelled() else future.exception()
+            if error is None and not future.cancelled():
+                ESP32_WS_ACK_LATENCY.observe(time.perf_counter() - started)
+                ESP32_WS_FRAMES.inc(outcome="acked" if future.result()[0] == 0 else "rejected")
+                return
+            ESP32_WS_FRAMES.inc(outcome="failed")
+            if self.on_failure is not None:
+                self.on_failure(error or ESP32WebSocketError("취소됨"))
+        
+        waiter.add_done_callback(settle)
+        ws = self._ws
+        try:
+            if ws is None:
+                raise ConnectionError("연결이 끊어졌습니다")
+            await ws.send_bytes(frame)
+        except (ConnectionError, RuntimeError, aiohttp.ClientError) as e:
+            # 자리를 기다리거나 보내는 중 연결이 끊김
+            error = ESP32WebSocketError(f"ESP32 WebSocket 전송 실패: {e}")
+            if not waiter.done():
+                waiter.set_exception(error)
+            raise error from e
+        
+        if not wait:
+            return None
+        status, applied = await waiter
+        return ack_response(command, status, applied)
+    
+    def _expire(self, seq: int):
+        waiter = self._waiters.get(seq)
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(ESP32WebSocketError("ESP32 WebSocket 확인 시간 초과"))
+    
+    async def _read_acks(self, ws: aiohttp.ClientWebSocketResponse):
+        try:
+            # heartbeat에 pong이 없거나 ESP32가 연결을 닫으면 반복이 끝남
+            async for message in ws:
+                if message.type != aiohttp.WSMsgType.BINARY or len(message.data) < ACK_FRAME.size:
+                    continue
+                _, seq, status, applied = ACK_FRAME.unpack_from(message.data)
+                waiter = self._waiters.get(seq)
+                if waiter is not None and not waiter.done():
+                    waiter.set_result((status, applied))
+        except (aiohttp.ClientError, OSError) as e:
+            logger.warning(f"ESP32 WebSocket 읽기 오류: {e}")
+        finally:
+            # 연결이 끊기면 확인을 기다리던 프레임 모두 실패
+            if self._ws is ws:
+                self._ws = None
+                logger.warning(f"ESP32 WebSocket 연결 끊김: {self.url}")
+            for waiter in list(self._waiters.values()):
+                if not waiter.done():
+                    waiter.set_exception(ESP32WebSocketError("ESP32 WebSocket 연결이 끊어졌습니다"))
+    
+    async def close(self):
+        ws, session = self._ws, self._session
+        if self._loop is not asyncio.get_running_loop():
+            self._reset()
+            return
+        if ws is not None:
+            # 닫기 핸드셰이크는 앞서 보낸 프레임 뒤에 처리됨
+            await ws.close()
+        self._reset()
+        if session is not None and not session.closed:
+            await session.close()
+    
+    def _reset(self):
+        if self._reader_task is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._reader_task.cancel)
+        self._ws = self._reader_task = self._session = None
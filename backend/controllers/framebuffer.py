@@ -0,0 +1,174 @@
+"""
+LED 프레임버퍼
+LED 그리드 상태를 미리 할당한 uint8[rows, cols, 3] 배열과 셀별 만료 시각 배열로 관리합니다.
+
+- 겹치는 하이라이트 합성(replace/add/max), 밝기 조절, 마지막 전송 프레임과의 비교를
+  셀 단위 파이썬 반복 없이 NumPy 연산으로 처리합니다.
+- 만료는 타이머 스레드 대신 expire() 호출 시 배열 비교 한 번으로 처리합니다.
+- 상태 조회는 배열에서 바로 렌더링하며 셀마다 모델 객체를 만들지 않습니다.
+- 애니메이션 효과(effects.py)는 저장된 색상을 바꾸지 않고 오버레이 레이어에 그려지며,
+  출력 프레임은 오버레이가 있는 셀만 오버레이 색상으로 대체해 만듭니다.
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Color = Union[Sequence[int], np.ndarray]
+
+BLEND_MODES = ("replace", "add", "max")
+
+class LEDFramebuffer:
+    """스레드 안전한 LED 그리드 프레임버퍼 (행은 A부터, 열은 1부터)"""
+    
+    def __init__(self, rows: int, cols: int, brightness: float = 1.0):
+        self.rows = rows
+        self.cols = cols
+        self.pixels = np.zeros((rows, cols, 3), dtype=np.uint8)
+        # 셀별 만료 시각 (time.monotonic 기준, inf는 만료 없음)
+        self.expires = np.full((rows, cols), np.inf)
+        self._sent = np.zeros((rows, cols, 3), dtype=np.uint8)
+        self.overlay = np.zeros((rows, cols, 3), dtype=np.uint8)
+        self.overlay_mask = np.zeros((rows, cols), dtype=bool)
+        self._names = np.array(
+            [[f"{chr(ord('A') + r)}{c + 1}" for c in range(cols)] for r in range(rows)], dtype=object
+        )
+        self._lut = np.arange(256, dtype=np.uint8)
+        self.brightness = 1.0
+        self.lock = threading.RLock()
+        self.set_brightness(brightness)
+    
+    def indices(self, positions: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """위치 이름 목록을 (행 배열, 열 배열)로 변환 (그리드 밖 위치는 제외)"""
+        rows, cols = [], []
+        for position in positions:
+            position = position.strip().upper()
+            if len(position) < 2 or not position[1:].isdigit():
+                continue
+            row = ord(position[0]) - ord('A')
+            col = int(position[1:]) - 1
+            if 0 <= row < self.rows and 0 <= col < self.cols:
+                rows.append(row)
+                cols.append(col)
+        return np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)
+    
+    def set_brightness(self, brightness: float):
+        """전체 밝기 (0.0-1.0) - 256칸 조회표로 렌더링 시 적용"""
+        brightness = min(max(float(brightness), 0.0), 1.0)
+        with self.lock:
+            self.brightness = brightness
+            self._lut = np.round(np.arange(256) * brightness).astype(np.uint8)
+    
+    def paint(self, positions: Union[Iterable[str], Tuple[np.ndarray, np.ndarray]], color: Color,
+              duration: float = 0, blend: str = "replace", now: Optional[float] = None) -> int:
+        """셀에 색 칠하기
+        
+        Args:
+            positions: 위치 이름 목록 또는 indices() 결과
+            color: (r, g, b) 하나 또는 셀별 (n, 3) 배열
+            duration: 유지 시간(초), 0 이하면 만료 없음
+            blend: replace(덮어쓰기), add(포화 덧셈), max(채널별 밝은 쪽) - add/max는 만료 시각도 늦은 쪽을 유지
+        
+        Returns:
+            칠한 셀 수
+        """
+        if blend not in BLEND_MODES:
+            raise ValueError(f"지원하지 않는 합성 방식: {blend} ({', '.join(BLEND_MODES)})")
+        
+        rows, cols = positions if isinstance(positions, tuple) else self.indices(positions)
+        if rows.size == 0:
+            return 0
+        
+        color = np.clip(np.asarray(color, dtype=np.int16), 0, 255)
+        deadline = (now if now is not None else time.monotonic()) + duration if duration > 0 else np.inf
+        
+        with self.lock:
+            if blend == "replace":
+                self.pixels[rows, cols] = color
+                self.expires[rows, cols] = deadline
+            else:
+                current = self.pixels[rows, cols].astype(np.int16)
+                if blend == "add":
+                    mixed = np.minimum(current + color, 255)
+                else:
+                    mixed = np.maximum(current, color)
+                self.pixels[rows, cols] = mixed.astype(np.uint8)
+                self.expires[rows, cols] = np.maximum(self.expires[rows, cols], deadline)
+        return int(rows.size)
+    
+    def clear(self, positions: Optional[Iterable[str]] = None):
+        """셀(또는 전체) 끄기"""
+        with self.lock:
+            if positions is None:
+                self.pixels.fill(0)
+                self.expires.fill(np.inf)
+                return
+            rows, cols = self.indices(positions)
+            self.pixels[rows, cols] = 0
+            self.expires[rows, cols] = np.inf
+    
+    def expire(self, now: Optional[float] = None) -> int:
+        """만료된 셀 끄기 (끈 셀 수 반환)"""
+        now = now if now is not None else time.monotonic()
+        with self.lock:
+            expired = self.expires <= now
+            count = int(np.count_nonzero(expired))
+            if count:
+                self.pixels[expired] = 0
+                self.expires[expired] = np.inf
+        return count
+    
+    def set_overlay(self, overlay: np.ndarray, mask: np.ndarray):
+        """효과 레이어 교체 (mask가 True인 셀만 출력에 반영)"""
+        with self.lock:
+            self.overlay[...] = overlay
+            self.overlay_mask[...] = mask
+    
+    def clear_overlay(self):
+        with self.lock:
+            self.overlay_mask.fill(False)
+    
+    def _output(self) -> np.ndarray:
+        if self.overlay_mask.any():
+            return self._lut[np.where(self.overlay_mask[..., None], self.overlay, self.pixels)]
+        return self._lut[self.pixels]
+    
+    def render(self) -> np.ndarray:
+        """밝기와 효과 레이어를 적용한 출력 프레임 (복사본)"""
+        with self.lock:
+            return self._output()
+    
+    def changes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """마지막 전송 이후 바뀐 셀 (행, 열, 출력 색상 (n, 3))"""
+        with self.lock:
+            frame = self._output()
+            changed = np.any(frame != self._sent, axis=2)
+            rows, cols = np.nonzero(changed)
+            return rows, cols, frame[rows, cols]
+    
+    def mark_sent(self, rows: np.ndarray, cols: np.ndarray, colors: np.ndarray):
+        """changes()로 얻은 셀을 전송 완료로 기록"""
+        with self.lock:
+            self._sent[rows, cols] = colors
+    
+    def mark_all_sent(self, frame: Optional[np.ndarray] = None):
+        """하드웨어 전체 상태를 알고 있을 때 (예: CLEAR 후 모두 0)"""
+        with self.lock:
+            self._sent[...] = frame if frame is not None else 0
+    
+    def encode(self, rows: np.ndarray, cols: np.ndarray, colors: np.ndarray) -> List[str]:
+        """셀 변경을 "A1:r,g,b" 명령 목록으로 변환"""
+        names = self._names[rows, cols].tolist()
+        return [f"{name}:{r},{g},{b}" for name, (r, g, b) in zip(names, colors.tolist())]
+    
+    def active(self) -> Dict[str, List[int]]:
+        """켜져 있는 셀 {위치: [r, g, b]} (저장된 색상 기준)"""
+        with self.lock:
+            mask = np.any(self.pixels != 0, axis=2)
+            return dict(zip(self._names[mask].tolist(), self.pixels[mask].tolist()))
+    
+    def active_count(self) -> int:
+        with self.lock:
+            return int(np.count_nonzero(np.any(self.pixels != 0, axis=2)))
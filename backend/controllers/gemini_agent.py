@@ -5,15 +5,18 @@ Gemini Flash 2.5 LLM을 사용한 고급 물품 관리 에이전트
 import os
 import json
 import asyncio
+import time
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import google.generativeai as genai
 from dotenv import load_dotenv
 
-from database import ItemDatabase
-from esp32_controller import create_esp32_controller
-from models import LEDControl, Item
-from mcp_server import parse_grid_position
+from ..database.database import ItemDatabase, parse_grid_position
+from ..controllers.esp32_controller import create_esp32_controller
+from ..controllers.led_queue import LEDJobQueue, PRIORITY_INTERACTIVE
+from ..models.models import LEDControl, Item
+from ..core.metrics import LLM_DURATION
+from ..core.tracing import span, traced
 
 # 환경 변수 로드
 load_dotenv()
@@ -21,9 +24,14 @@ load_dotenv()
 class GeminiItemAgent:
     """Gemini Flash 2.5를 사용한 스마트 물품 관리 에이전트"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.db = ItemDatabase()
-        self.esp32_controller = create_esp32_controller(simulation_mode=True)
+    def __init__(self, api_key: Optional[str] = None,
+                 db: Optional[ItemDatabase] = None,
+                 esp32_controller=None):
+        # 공유 리소스가 주어지면 재사용 (Streamlit 프로세스 캐시 등)
+        self.db = db or ItemDatabase()
+        self.esp32_controller = esp32_controller or create_esp32_controller(simulation_mode=True)
+        # LED 명령은 작업 큐에 접수만 하고 하드웨어 응답을 기다리지 않음
+        self.led_jobs = LEDJobQueue(self.esp32_controller.highlight_position)
         
         # Gemini 설정
         api_key = api_key or os.getenv("GOOGLE_AI_API_KEY")
@@ -70,6 +78,23 @@ class GeminiItemAgent:
 항상 JSON 형식으로만 응답하세요.
 """
     
+    async def _generate(self, prompt: str):
+        """Gemini 호출 (스레드 풀에서 실행, 소요 시간 기록)"""
+        model_name = getattr(self.model, "model_name", "gemini")
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with span("gemini.generate_content", model=model_name, prompt_chars=len(prompt)):
+                response = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda: self.model.generate_content(prompt)
+                )
+            outcome = "ok"
+            return response
+        finally:
+            LLM_DURATION.observe(time.perf_counter() - started, model=model_name, outcome=outcome)
+    
+    @traced()
     async def process_query(self, user_input: str) -> Dict[str, Any]:
         """사용자 입력을 처리하고 적절한 동작을 수행합니다."""
         if self.use_llm:
@@ -77,6 +102,7 @@ class GeminiItemAgent:
         else:
             return await self._process_with_rules(user_input)
     
+    @traced()
     async def _process_with_llm(self, user_input: str) -> Dict[str, Any]:
         """Gemini LLM을 사용한 고급 처리"""
         try:
@@ -94,10 +120,7 @@ class GeminiItemAgent:
 """
             
             # Gemini에게 질의
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, 
-                lambda: self.model.generate_content(self.system_prompt + "\n\n" + context)
-            )
+            response = await self._generate(self.system_prompt + "\n\n" + context)
             
             # JSON 응답 파싱
             try:
@@ -146,6 +169,7 @@ class GeminiItemAgent:
             # 백업: 규칙 기반 처리
             return await self._process_with_rules(user_input)
     
+    @traced()
     async def _process_with_rules(self, user_input: str) -> Dict[str, Any]:
         """규칙 기반 기본 처리 (LLM 백업용)"""
         user_input_lower = user_input.lower()
@@ -162,6 +186,7 @@ class GeminiItemAgent:
         else:
             return self._handle_search_query(user_input)
     
+    @traced()
     def _handle_search_query(self, user_input: str) -> Dict[str, Any]:
         """검색 쿼리를 처리합니다."""
         # 간단한 키워드 추출
@@ -194,6 +219,7 @@ class GeminiItemAgent:
                 "message": "물품 검색 중 오류가 발생했습니다."
             }
     
+    @traced()
     def _handle_get_all_items(self) -> Dict[str, Any]:
         """모든 물품을 조회합니다."""
         try:
@@ -214,6 +240,7 @@ class GeminiItemAgent:
                 "message": "물품 목록 조회 중 오류가 발생했습니다."
             }
     
+    @traced()
     def _handle_get_categories(self) -> Dict[str, Any]:
         """카테고리를 조회합니다."""
         try:
@@ -234,6 +261,7 @@ class GeminiItemAgent:
                 "message": "카테고리 조회 중 오류가 발생했습니다."
             }
     
+    @traced()
     async def _handle_led_query(self, user_input: str) -> Dict[str, Any]:
         """LED 제어 쿼리를 처리합니다."""
         # 물품명 추출하여 검색 후 LED 제어
@@ -253,40 +281,38 @@ class GeminiItemAgent:
             "message": "LED로 표시할 물품을 찾을 수 없습니다."
         }
     
+    @traced()
     async def highlight_item_location(self, item_id: int, duration: int = 5, color: str = "blue") -> Dict[str, Any]:
         """특정 물품의 위치를 LED로 강조 표시합니다."""
         try:
-            item = self.db.get_item_by_id(item_id)
+            row = self.db.get_item_by_id(item_id)
             
-            if not item:
+            if not row:
                 return {
                     "success": False,
                     "error": "Item not found",
                     "message": f"ID {item_id}에 해당하는 물품을 찾을 수 없습니다."
                 }
-            
-            # 그리드 위치 파싱
-            positions = parse_grid_position(item.grid_position)
+            item = Item(**row)
             
             led_control = LEDControl(
-                positions=positions,
+                grid_position=item.grid_position,
                 duration=duration,
                 color=color
             )
             
-            # ESP32 LED 제어 실행
-            esp32_result = await self.esp32_controller.control_leds(led_control)
+            # LED 작업 접수 (결과는 self.led_jobs.get(job_id)로 조회)
+            job = self.led_jobs.submit(led_control, PRIORITY_INTERACTIVE)
             
             return {
-                "success": esp32_result.get("success", False),
+                "success": True,
                 "data": {
                     "item": item.model_dump(),
                     "led_control": led_control.model_dump(),
-                    "positions": positions,
-                    "esp32_result": esp32_result.get("data", {})
+                    "positions": parse_grid_position(item.grid_position),
+                    "job": job.to_dict()
                 },
-                "message": esp32_result.get("message", f"물품 '{item.name}'의 위치({item.grid_position}) LED 제어를 시도했습니다."),
-                "esp32_status": esp32_result,
+                "message": f"물품 '{item.name}'의 위치({item.grid_position})를 LED로 표시합니다.",
                 "processing_mode": "LLM" if self.use_llm else "규칙 기반"
             }
         except Exception as e:
@@ -311,10 +337,7 @@ class GeminiItemAgent:
 사용자: {user_input}
 어시스턴트:"""
             
-            response = await asyncio.get_event_loop().run_in_executor(
-                None, 
-                lambda: self.model.generate_content(prompt)
-            )
+            response = await self._generate(prompt)
             
             return response.text
         except Exception as e:
@@ -0,0 +1,176 @@
+"""
+하드웨어 상태 백그라운드 확인
+컨트롤러의 probe를 일정 간격으로 호출해 마지막 상태(연결 여부, 왕복 시간, 마지막 오류, 켜진 LED 수)를
+캐시합니다. /health, Streamlit 사이드바, MCP는 snapshot()만 읽으므로 하드웨어에 요청을 보내지 않습니다.
+
+probe는 동기 함수(ArduinoLEDController.probe)이거나 코루틴 함수(ESP32Controller.probe)일 수 있으며,
+코루틴은 loop(기본: async_bridge 백그라운드 루프)에서 실행됩니다. probe는 상태 딕셔너리를 반환하고
+실패하면 예외를 냅니다. 반환값의 "reachable": False, "error"는 예외 없이 연결되지 않음을 알릴 때 씁니다
+(예: 시뮬레이션 모드).
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ..core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+HARDWARE_REACHABLE = registry.gauge("hardware_reachable", "마지막 상태 확인에서 하드웨어 연결 여부 (1/0)",
+                                    ("controller",))
+HARDWARE_RTT = registry.histogram(
+    "hardware_probe_rtt_seconds", "하드웨어 상태 확인 왕복 시간", ("controller",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+class HealthPoller:
+    """컨트롤러 하나의 상태를 백그라운드 스레드에서 주기적으로 확인하고 마지막 결과를 캐시"""
+    
+    def __init__(self, probe: Callable[[], Any], controller: str, interval: float = 5.0,
+                 timeout: float = 3.0, name: Optional[str] = None):
+        """
+        Args:
+            probe: 상태 확인 함수 (상태 딕셔너리 반환, 실패하면 예외)
+            controller: 메트릭/로그에 쓸 컨트롤러 이름
+            interval: 확인 간격(초)
+            timeout: 코루틴 probe를 기다리는 최대 시간(초)
+        """
+        self._probe = probe
+        self.controller = controller
+        self.interval = interval
+        self.timeout = timeout
+        self._name = name or f"{controller}-health"
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pending: Optional[concurrent.futures.Future] = None
+        
+        self._snapshot: Dict[str, Any] = {
+            "reachable": None,
+            "rtt_ms": None,
+            "active_leds": None,
+            "last_error": None,
+            "last_error_at": None,
+            "checked_at": None,
+            "consecutive_failures": 0,
+            "details": {},
+        }
+        self.checks = 0
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> "HealthPoller":
+        """확인 스레드 시작 (이미 실행 중이면 무시, loop는 코루틴 probe를 실행할 이벤트 루프)"""
+        with self._lock:
+            if loop is not None:
+                self._loop = loop
+            if self.running:
+                return self
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        self._wake.set()
+        pending = self._pending
+        if pending is not None:
+            # 응답 없는 하드웨어를 기다리지 않음
+            pending.cancel()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+    
+    def refresh(self):
+        """다음 확인을 바로 실행 (연결/해제 직후 등)"""
+        self._wake.set()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """마지막 확인 결과 (하드웨어 요청 없음, age는 마지막 확인 후 지난 시간(초))"""
+        with self._lock:
+            snapshot = dict(self._snapshot)
+        checked_at = snapshot["checked_at"]
+        snapshot["age"] = round(time.time() - checked_at, 3) if checked_at is not None else None
+        # 확인 스레드가 멈췄거나 probe가 밀려 결과가 오래됨
+        snapshot["stale"] = checked_at is None or snapshot["age"] > self.interval * 3 + self.timeout
+        snapshot["interval"] = self.interval
+        return snapshot
+    
+    def check(self) -> Dict[str, Any]:
+        """probe를 한 번 실행하고 캐시를 갱신 (갱신된 snapshot 반환)"""
+        started = time.perf_counter()
+        try:
+            details = dict(self._call_probe() or {})
+            reachable = bool(details.pop("reachable", True))
+            error = details.pop("error", None)
+        except Exception as e:
+            if self._stop.is_set():
+                # stop()이 진행 중인 probe를 취소함
+                return self.snapshot()
+            details, reachable, error = None, False, str(e) or type(e).__name__
+        rtt = time.perf_counter() - started
+        
+        now = time.time()
+        with self._lock:
+            snapshot = self._snapshot
+            previous = snapshot["reachable"]
+            snapshot["reachable"] = reachable
+            snapshot["checked_at"] = now
+            snapshot["rtt_ms"] = round(rtt * 1000, 2) if reachable else None
+            if details is not None:
+                # probe가 실패하면 마지막으로 알려진 LED 상태 유지
+                snapshot["details"] = details
+                if "active_leds" in details:
+                    snapshot["active_leds"] = details["active_leds"]
+            if error is not None:
+                snapshot["last_error"] = error
+                snapshot["last_error_at"] = now
+            snapshot["consecutive_failures"] = 0 if reachable else snapshot["consecutive_failures"] + 1
+            self.checks += 1
+        
+        HARDWARE_REACHABLE.set(1 if reachable else 0, controller=self.controller)
+        if reachable:
+            HARDWARE_RTT.observe(rtt, controller=self.controller)
+        if previous is not None and previous != reachable:
+            if reachable:
+                logger.info(f"{self.controller} 하드웨어 연결 확인됨 ({rtt * 1000:.1f}ms)")
+            else:
+                logger.warning(f"{self.controller} 하드웨어에 연결할 수 없음: {error}")
+        return self.snapshot()
+    
+    def _call_probe(self) -> Any:
+        if not inspect.iscoroutinefunction(self._probe):
+            return self._probe()
+        if self._loop is not None:
+            loop = self._loop
+        else:
+            from ..core.async_bridge import get_background_loop
+            loop = get_background_loop().loop
+        future = self._pending = asyncio.run_coroutine_threadsafe(self._probe(), loop)
+        try:
+            return future.result(self.timeout)
+        finally:
+            future.cancel()
+            self._pending = None
+    
+    def _run(self):
+        while not self._stop.is_set():
+            # 확인 중에 들어온 refresh()는 다음 확인을 바로 실행
+            self._wake.clear()
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"{self.controller} 상태 확인 오류: {e}")
+            self._wake.wait(self.interval)
@@ -0,0 +1,200 @@
+"""
+LED 데몬 클라이언트
+하드웨어(ESP32/Arduino)와 프레임버퍼는 LED 데몬(led_daemon.py) 프로세스 하나만 소유하고,
+REST API, MCP 서버, Gemini 에이전트, Streamlit 프로세스는 유닉스 도메인 소켓으로 명령만 보냅니다.
+
+프로토콜: 한 줄에 JSON 하나 (요청 {"id", "op", ...} → 응답 {"id", "ok", "result" | "error"})
+요청마다 ID가 있어 한 연결에서 여러 코루틴의 요청을 동시에 보낼 수 있습니다.
+
+LED_DAEMON_SOCKET 환경 변수가 설정되면 각 모듈의 컨트롤러가 데몬 클라이언트로 바뀝니다.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from ..core.async_bridge import run_sync
+from .health import HealthPoller
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/inventory-led.sock"
+
+def daemon_socket_path() -> Optional[str]:
+    """LED_DAEMON_SOCKET 환경 변수 (설정되지 않았으면 None - 프로세스가 하드웨어를 직접 사용)"""
+    return os.getenv("LED_DAEMON_SOCKET") or None
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+class LEDDaemonError(ConnectionError):
+    """데몬에 연결할 수 없거나 데몬이 요청을 거부함"""
+
+class LEDDaemonConnection:
+    """데몬과의 연결 하나 (이벤트 루프별로 연결을 만들고 요청을 다중화)"""
+    
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: float = 10.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.hello: Optional[Dict[str, Any]] = None
+        
+        self._ids = itertools.count(1)
+        self._waiters: Dict[int, asyncio.Future] = {}
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+    
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+    
+    async def connect(self) -> Dict[str, Any]:
+        """연결 후 hello 응답(그리드 크기, 하드웨어 종류) 반환 - 이미 연결되어 있으면 재사용"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 다른 루프의 연결은 이 루프에서 쓸 수 없음
+            self._reset()
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+        
+        async with self._connect_lock:
+            if not self.connected:
+                try:
+                    self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+                except OSError as e:
+                    raise LEDDaemonError(f"LED 데몬에 연결할 수 없습니다 ({self.socket_path}): {e}") from e
+                self._reader_task = loop.create_task(self._read_responses(self._reader))
+                self.hello = await self._send("hello", {})
+        return self.hello
+    
+    async def request(self, op: str, **fields) -> Dict[str, Any]:
+        """요청 전송 후 결과 반환 (거부되면 LEDDaemonError)"""
+        await self.connect()
+        return await self._send(op, fields)
+    
+    async def close(self):
+        writer = self._writer
+        self._reset()
+        if writer is not None and self._loop is asyncio.get_running_loop():
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+    
+    async def _send(self, op: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        if self._writer is None:
+            raise LEDDaemonError("LED 데몬 연결이 끊어졌습니다")
+        request_id = next(self._ids)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[request_id] = waiter
+        try:
+            self._writer.write(encode_message({"id": request_id, "op": op, **fields}))
+            await self._writer.drain()
+            response = await asyncio.wait_for(waiter, self.timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise LEDDaemonError(f"LED 데몬 요청 실패 ({op}): {e or '시간 초과'}") from e
+        finally:
+            self._waiters.pop(request_id, None)
+        
+        if not response.get("ok"):
+            raise LEDDaemonError(response.get("error") or f"LED 데몬이 {op} 요청을 거부했습니다")
+        return response.get("result") or {}
+    
+    async def _read_responses(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                waiter = self._waiters.get(response.get("id"))
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(response)
+        except (OSError, ValueError) as e:
+            logger.warning(f"LED 데몬 응답 읽기 오류: {e}")
+        finally:
+            # 연결이 끊기면 응답을 기다리던 요청 모두 실패
+            if self._reader is reader:
+                self._writer = None
+            for waiter in list(self._waiters.values()):
+                if not waiter.done():
+                    waiter.set_exception(LEDDaemonError("LED 데몬 연결이 끊어졌습니다"))
+    
+    def _reset(self):
+        if self._reader_task is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._reader_task.cancel)
+        self._reader = self._writer = self._reader_task = None
+        self.hello = None
+
+class ArduinoDaemonClient:
+    """ArduinoLEDController와 같은 동기 인터페이스의 데몬 클라이언트 (Streamlit 등 동기 코드용)
+    
+    요청은 async_bridge 백그라운드 루프에서 실행되므로 프로세스당 연결 하나를 재사용합니다.
+    """
+    
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: float = 10.0):
+        self.connection = LEDDaemonConnection(socket_path, timeout)
+        self.port = f"unix:{socket_path}"
+        self.simulation_mode = False
+        self.health = HealthPoller(self.probe, "ArduinoDaemonClient")
+    
+    @property
+    def is_connected(self) -> bool:
+        return self.connection.connected
+    
+    def _request(self, op: str, **fields) -> Optional[Dict[str, Any]]:
+        try:
+            return run_sync(self.connection.request(op, **fields))
+        except LEDDaemonError as e:
+            logger.error(f"LED 데몬 {op} 실패: {e}")
+            return None
+    
+    def highlight_position(self, position: str, color, duration: int = 5) -> bool:
+        return self.highlight_multiple_positions([position], [color], duration)
+    
+    def highlight_multiple_positions(self, positions: List[str], colors: List, duration: int = 5,
+                                     blend: str = "replace") -> bool:
+        if len(positions) != len(colors):
+            logger.error("위치와 색상 배열의 길이가 일치하지 않습니다")
+            return False
+        result = self._request("highlight", positions=positions, colors=[[c.r, c.g, c.b] for c in colors],
+                               duration=duration, blend=blend)
+        return result is not None
+    
+    def turn_off_all_leds(self) -> bool:
+        return self._request("clear") is not None
+    
+    def get_led_status(self) -> Dict[str, List[int]]:
+        result = self._request("status")
+        return result["active"] if result else {}
+    
+    def serial_stats(self) -> Optional[Dict[str, Any]]:
+        result = self._request("status")
+        return result.get("hardware", {}).get("serial") if result else None
+    
+    def probe(self) -> Dict[str, Any]:
+        """데몬 status 요청 (실패하면 예외) - HealthPoller가 주기적으로 호출"""
+        status = run_sync(self.connection.request("status"), timeout=self.health.timeout)
+        hardware = status.get("hardware", {})
+        details = {"port": self.port, "active": status["active"], "active_leds": len(status["active"]),
+                   "serial": hardware.get("serial"), "hardware": hardware}
+        health = hardware.get("health") or {}
+        if health.get("reachable") is False:
+            details.update(reachable=False, error=f"LED 데몬 하드웨어: {health.get('last_error')}")
+        return details
+    
+    def flush(self) -> int:
+        return 0
+    
+    def disconnect(self):
+        self.health.stop(timeout=0)
+        try:
+            run_sync(self.connection.close(), timeout=2.0)
+        except Exception:
+            pass
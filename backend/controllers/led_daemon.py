@@ -0,0 +1,384 @@
+"""
+LED 데몬 - 하드웨어와 프레임버퍼를 소유하는 단일 프로세스
+여러 프로세스(REST API, MCP 서버, Gemini 에이전트, Streamlit)가 각자 컨트롤러를 만들면
+같은 시리얼 포트/ESP32를 두고 경쟁하고 LED 상태도 따로 갖게 됩니다. 데몬은 하드웨어 컨트롤러 하나와
+그 프레임버퍼를 소유하고, 유닉스 도메인 소켓으로 highlight/clear/status/overlay 요청을 받습니다.
+
+- 모든 프로세스의 하이라이트는 같은 프레임버퍼에 합성되므로 서로의 상태를 덮어쓰지 않습니다.
+- 요청마다 바로 보내지 않고, 전송 중에 들어온 요청은 다음 전송 한 번에 묶습니다 (바뀐 셀만 전송).
+- 효과 엔진(effects.py)을 쓰는 클라이언트는 오버레이 레이어만 보내며, 연결이 끊기면 지워집니다.
+
+프로토콜과 클라이언트는 led_client.py를 참고하세요.
+
+사용 예:
+    python -m backend.controllers.led_daemon --backend mock
+    python -m backend.controllers.led_daemon --backend esp32 --esp32-url http://127.0.0.1:8080
+    python -m backend.controllers.led_daemon --backend arduino --arduino-port /dev/pts/3
+    LED_DAEMON_SOCKET=/tmp/inventory-led.sock python backend/api/rest_api.py
+"""
+
+import argparse
+import asyncio
+import collections
+import inspect
+import itertools
+import json
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+from ..database.database import expand_grid_position
+from .framebuffer import LEDFramebuffer
+from .health import HealthPoller
+from .led_client import DEFAULT_SOCKET_PATH, encode_message
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("mock", "esp32", "arduino")
+
+class LEDDaemon:
+    """유닉스 도메인 소켓 LED 서버"""
+    
+    def __init__(self, framebuffer: LEDFramebuffer, push: Callable[[], Any],
+                 socket_path: str = DEFAULT_SOCKET_PATH, backend: str = "mock",
+                 describe: Optional[Callable[[], Dict[str, Any]]] = None,
+                 close: Optional[Callable[[], Any]] = None, expire_interval: float = 0.1,
+                 health: Optional[HealthPoller] = None):
+        """
+        Args:
+            framebuffer: 하드웨어 컨트롤러의 프레임버퍼
+            push: 바뀐 셀을 하드웨어로 보내는 함수 (ESP32Controller.push_frame 또는 ArduinoLEDController.flush)
+            describe: status 응답에 넣을 하드웨어 상태 함수
+            close: 데몬 종료 시 하드웨어 정리 함수
+            expire_interval: duration 만료 확인 간격(초)
+            health: 하드웨어 상태 확인 (데몬이 실행되는 동안 백그라운드로 확인, status 응답에 캐시 포함)
+        """
+        self.framebuffer = framebuffer
+        self._push = push
+        self.socket_path = socket_path
+        self.backend = backend
+        self._describe = describe
+        self._close = close
+        self.expire_interval = expire_interval
+        self.health = health
+        
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._expire_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_waiters: List[asyncio.Future] = []
+        self._writers: Dict[int, asyncio.StreamWriter] = {}
+        self._overlays: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._client_ids = itertools.count(1)
+        self._started_at = time.time()
+        
+        self.counters = collections.Counter()
+        self._ops = {
+            "hello": self._op_hello,
+            "highlight": self._op_highlight,
+            "clear": self._op_clear,
+            "status": self._op_status,
+            "overlay": self._op_overlay,
+        }
+    
+    # ------------------------------------------------------------------
+    # 서버 수명 주기
+    # ------------------------------------------------------------------
+    
+    async def start(self):
+        """소켓 열기 (다른 데몬이 이미 사용 중이면 RuntimeError)"""
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                # 비정상 종료로 남은 소켓 파일
+                os.unlink(self.socket_path)
+            else:
+                raise RuntimeError(f"LED 데몬이 이미 실행 중입니다: {self.socket_path}")
+            finally:
+                probe.close()
+        
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        self._expire_task = asyncio.get_running_loop().create_task(self._expire_loop())
+        if self.health is not None:
+            self.health.start(asyncio.get_running_loop())
+        logger.info(f"LED 데몬 시작: {self.socket_path} ({self.backend})")
+    
+    async def stop(self):
+        """연결을 닫고 하드웨어 정리"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._expire_task is not None:
+            self._expire_task.cancel()
+            self._expire_task = None
+        if self.health is not None:
+            # probe가 이 루프에서 실행되므로 루프를 막지 않고 대기
+            await asyncio.to_thread(self.health.stop)
+        for writer in list(self._writers.values()):
+            writer.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        
+        if self._close is not None:
+            result = self._close()
+            if inspect.isawaitable(result):
+                await result
+    
+    # ------------------------------------------------------------------
+    # 연결 처리
+    # ------------------------------------------------------------------
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        client = next(self._client_ids)
+        self._writers[client] = writer
+        self.counters["connections"] += 1
+        write_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # 요청은 동시에 처리하고 응답은 끝나는 순서대로 보냄 (ID로 구분)
+                task = asyncio.get_running_loop().create_task(self._respond(client, line, writer, write_lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._writers.pop(client, None)
+            writer.close()
+            # 끊긴 클라이언트의 효과 레이어 제거
+            if self._overlays.pop(client, None) is not None:
+                self._apply_overlays()
+                try:
+                    await self._flush()
+                except Exception as e:
+                    logger.error(f"오버레이 제거 전송 실패: {e}")
+    
+    async def _respond(self, client: int, line: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            handler = self._ops.get(request.get("op"))
+            if handler is None:
+                raise ValueError(f"알 수 없는 요청: {request.get('op')}")
+            self.counters[f"op_{request['op']}"] += 1
+            response = {"id": request_id, "ok": True, "result": await handler(client, request)}
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.counters["errors"] += 1
+            response = {"id": request_id, "ok": False, "error": str(e)}
+        
+        async with write_lock:
+            try:
+                writer.write(encode_message(response))
+                await writer.drain()
+            except ConnectionError:
+                pass
+    
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+    
+    async def _op_hello(self, client: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {"backend": self.backend, "rows": self.framebuffer.rows, "cols": self.framebuffer.cols,
+                "pid": os.getpid(), "client": client}
+    
+    async def _op_highlight(self, client: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        """{"position": "A1-A3" | "positions": [...], "color": [r,g,b] | "colors": [[r,g,b], ...], "duration", "blend"}"""
+        positions = request.get("positions") or expand_grid_position(request.get("position", ""))
+        if "colors" in request:
+            if len(request["colors"]) != len(positions):
+                raise ValueError("위치와 색상 배열의 길이가 일치하지 않습니다")
+            color = np.asarray(request["colors"], dtype=np.int16)
+        else:
+            color = np.asarray(request["color"], dtype=np.int16)
+        
+        # 그리드 밖 위치는 제외 (색상 배열도 같은 셀만 남김)
+        valid = [i for i, position in enumerate(positions) if self.framebuffer.indices([position])[0].size]
+        if not valid:
+            raise ValueError("유효한 LED 위치를 찾을 수 없습니다")
+        if color.ndim == 2:
+            color = color[valid]
+        cells = [positions[i] for i in valid]
+        
+        painted = self.framebuffer.paint(cells, color, float(request.get("duration", 0)),
+                                         blend=request.get("blend", "replace"))
+        return {"cells": painted, "positions": cells, "sent": await self._flush()}
+    
+    async def _op_clear(self, client: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        """{"positions": [...]} - 없으면 전체"""
+        self.framebuffer.clear(request.get("positions"))
+        return {"sent": await self._flush()}
+    
+    async def _op_overlay(self, client: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        """{"cells": [[행, 열, r, g, b], ...]} - 이 클라이언트의 효과 레이어 교체 (빈 목록이면 제거)"""
+        cells = np.asarray(request.get("cells") or [], dtype=np.int64).reshape(-1, 5)
+        rows, cols = cells[:, 0], cells[:, 1]
+        inside = (rows >= 0) & (rows < self.framebuffer.rows) & (cols >= 0) & (cols < self.framebuffer.cols)
+        cells = cells[inside]
+        if cells.size:
+            self._overlays[client] = (cells[:, 0], cells[:, 1], np.clip(cells[:, 2:], 0, 255).astype(np.uint8))
+        else:
+            self._overlays.pop(client, None)
+        self._apply_overlays()
+        return {"cells": int(len(cells)), "sent": await self._flush()}
+    
+    async def _op_status(self, client: int, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.framebuffer.expire()
+        with self.framebuffer.lock:
+            overlay_cells = int(np.count_nonzero(self.framebuffer.overlay_mask))
+        return {
+            "backend": self.backend,
+            "rows": self.framebuffer.rows,
+            "cols": self.framebuffer.cols,
+            "active": self.framebuffer.active(),
+            "overlay_cells": overlay_cells,
+            "clients": len(self._writers),
+            "uptime": round(time.time() - self._started_at, 1),
+            "stats": dict(self.counters),
+            "hardware": self._hardware(),
+        }
+    
+    def _hardware(self) -> Dict[str, Any]:
+        hardware = self._describe() if self._describe is not None else {}
+        if self.health is not None:
+            hardware["health"] = self.health.snapshot()
+        return hardware
+    
+    def _apply_overlays(self):
+        """클라이언트별 효과 레이어를 합쳐 프레임버퍼 오버레이로 설정 (나중에 연결한 클라이언트가 위)"""
+        canvas = np.zeros((self.framebuffer.rows, self.framebuffer.cols, 3), dtype=np.uint8)
+        mask = np.zeros((self.framebuffer.rows, self.framebuffer.cols), dtype=bool)
+        for rows, cols, colors in self._overlays.values():
+            canvas[rows, cols] = colors
+            mask[rows, cols] = True
+        self.framebuffer.set_overlay(canvas, mask)
+    
+    # ------------------------------------------------------------------
+    # 하드웨어 전송
+    # ------------------------------------------------------------------
+    
+    async def _flush(self) -> int:
+        """바뀐 셀 전송 - 진행 중인 전송이 있으면 끝난 뒤 한 번에 묶어 전송 (전송한 셀 수 반환)"""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._flush_waiters.append(waiter)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_loop())
+        return await waiter
+    
+    async def _flush_loop(self):
+        while self._flush_waiters:
+            waiters, self._flush_waiters = self._flush_waiters, []
+            try:
+                sent = self._push()
+                if inspect.isawaitable(sent):
+                    sent = await sent
+                sent = int(sent or 0)
+                error = None
+            except Exception as e:
+                logger.error(f"LED 하드웨어 전송 실패: {e}")
+                self.counters["push_errors"] += 1
+                sent, error = 0, RuntimeError(f"하드웨어 전송 실패: {e}")
+            
+            self.counters["pushes"] += 1
+            self.counters["cells_sent"] += sent
+            self.counters["coalesced"] += len(waiters) - 1
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if error is not None:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(sent)
+    
+    async def _expire_loop(self):
+        """duration이 지난 셀을 끄고 전송"""
+        while True:
+            await asyncio.sleep(self.expire_interval)
+            try:
+                if self.framebuffer.expire():
+                    await self._flush()
+            except Exception as e:
+                logger.error(f"LED 만료 처리 오류: {e}")
+
+def build_daemon(backend: str, socket_path: str = DEFAULT_SOCKET_PATH, esp32_url: Optional[str] = None,
+                 arduino_port: Optional[str] = None, latency: float = 0.0) -> LEDDaemon:
+    """하드웨어 컨트롤러를 만들고 데몬으로 감쌈
+    
+    전역 Arduino 컨트롤러는 처음 사용할 때 환경 변수를 읽어 만들어지므로, 데몬 자신이 클라이언트가 되지 않도록
+    LED_DAEMON_SOCKET을 지우고 ARDUINO_PORT를 먼저 설정한 뒤 가져옵니다.
+    """
+    os.environ.pop("LED_DAEMON_SOCKET", None)
+    if arduino_port:
+        os.environ["ARDUINO_PORT"] = arduino_port
+    
+    if backend == "arduino":
+        from .arduino_controller import get_arduino_controller
+        controller = get_arduino_controller()
+        
+        def describe() -> Dict[str, Any]:
+            return {"connected": controller.is_connected, "simulation_mode": controller.simulation_mode,
+                    "port": controller.port, "serial": controller.serial_stats()}
+        
+        return LEDDaemon(controller.framebuffer, controller.flush, socket_path, backend,
+                         describe=describe, close=controller.disconnect, health=controller.health)
+    
+    from .esp32_controller import ESP32Controller, MockESP32Controller, RetryPolicy
+    if backend == "esp32":
+        # ws://로 지정하면 WebSocket 채널 사용 (실패하면 HTTP로 대체)
+        url = urlparse(esp32_url or os.getenv("ESP32_URL", "http://192.168.1.100"))
+        controller = ESP32Controller(url.hostname, url.port or 80, transport="ws" if url.scheme == "ws" else "http",
+                                     retry=RetryPolicy(hedge=os.getenv("ESP32_HEDGE") == "1"))
+    elif backend == "mock":
+        controller = MockESP32Controller(latency=latency)
+    else:
+        raise ValueError(f"지원하지 않는 백엔드: {backend} ({', '.join(BACKENDS)})")
+    
+    return LEDDaemon(controller.framebuffer, controller.push_frame, socket_path, backend,
+                     describe=lambda: {"url": controller.base_url, "transport": controller.transport},
+                     close=controller.close, health=controller.health)
+
+def main():
+    parser = argparse.ArgumentParser(description="LED 하드웨어 데몬 (유닉스 도메인 소켓)")
+    parser.add_argument("--backend", choices=BACKENDS, default="mock")
+    parser.add_argument("--socket", default=os.getenv("LED_DAEMON_SOCKET", DEFAULT_SOCKET_PATH))
+    parser.add_argument("--esp32-url", help="ESP32 주소 (예: http://192.168.1.100, WebSocket ws://192.168.1.100, "
+                        "시뮬레이터 http://127.0.0.1:8080)")
+    parser.add_argument("--arduino-port", help="Arduino 시리얼 포트 (없으면 ARDUINO_PORT 또는 자동 검색)")
+    parser.add_argument("--latency", type=float, default=0.0, help="mock 백엔드의 가상 지연(초)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    
+    daemon = build_daemon(args.backend, args.socket, args.esp32_url, args.arduino_port, args.latency)
+    
+    async def run():
+        await daemon.start()
+        print(f"LED_DAEMON_SOCKET={daemon.socket_path}", flush=True)
+        loop = asyncio.get_running_loop()
+        stopped = loop.create_future()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, lambda: stopped.done() or stopped.set_result(None))
+        try:
+            await stopped
+        finally:
+            await daemon.stop()
+    
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
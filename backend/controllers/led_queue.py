@@ -0,0 +1,263 @@
+"""
+LED 명령 작업 큐
+/highlight, MCP 도구, 챗봇이 하드웨어 왕복(시뮬레이션 0.5초, ESP32 최대 10초)을 기다리지 않도록
+LED 명령을 작업으로 접수하고 즉시 작업 ID를 돌려줍니다.
+
+- 우선순위: 사용자 조회(interactive)가 일괄(bulk)·진단(diagnostic) 패턴보다 먼저 실행됩니다.
+- 병합(coalescing): 같은 셀 집합에 대한 명령이 아직 대기 중이면 새 작업을 만들지 않고
+  기존 작업의 색상/시간을 최신 값으로 바꿉니다. 실행 중이거나 막 끝난 같은 명령
+  (coalesce_window 이내)도 중복 요청으로 보고 기존 작업을 돌려줍니다.
+- 결과는 get()/wait()로 조회하거나 on_finished 콜백(REST API는 이벤트 스트림)으로 전달됩니다.
+
+큐는 처음 submit된 이벤트 루프에서 동작하며, 루프가 바뀌면 대기 중인 작업을 새 루프로 옮깁니다.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..models.models import LEDControl
+from ..database.database import expand_grid_position
+from ..core.tracing import span
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (작을수록 먼저 실행)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+PRIORITY_DIAGNOSTIC = 2
+
+PRIORITIES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "bulk": PRIORITY_BULK,
+    "diagnostic": PRIORITY_DIAGNOSTIC,
+}
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+class QueueFullError(RuntimeError):
+    """대기 중인 작업이 max_pending을 넘음"""
+
+class LEDJob:
+    """접수된 LED 명령 하나"""
+    
+    def __init__(self, led_control: LEDControl, priority: int, cells: frozenset):
+        self.id = uuid.uuid4().hex[:12]
+        self.led_control = led_control
+        self.priority = priority
+        self.cells = cells
+        self.status = JOB_QUEUED
+        self.requests = 1  # 병합된 요청 수
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self._submitted = time.monotonic()
+        self._waiters: List[asyncio.Future] = []
+    
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "priority": next(name for name, value in PRIORITIES.items() if value == self.priority),
+            "grid_position": self.led_control.grid_position,
+            "color": self.led_control.color,
+            "duration": self.led_control.duration,
+            "requests": self.requests,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+class LEDJobQueue:
+    """우선순위 + 병합 LED 명령 큐 (단일 워커로 하드웨어 명령 순서 보장)"""
+    
+    def __init__(self, execute: Callable[[LEDControl], Awaitable[Dict[str, Any]]],
+                 coalesce_window: float = 0.25, max_pending: int = 1000,
+                 history_size: int = 1000,
+                 on_finished: Optional[Callable[[LEDJob], Any]] = None):
+        """
+        Args:
+            execute: LEDControl을 받아 컨트롤러 결과 딕셔너리를 반환하는 코루틴 함수
+                     (예: esp32.highlight_position)
+            coalesce_window: 실행 중/완료된 같은 명령을 중복으로 볼 시간(초)
+            max_pending: 대기 가능한 최대 작업 수
+            history_size: 조회용으로 보관할 최근 작업 수
+            on_finished: 작업 완료 시 루프 스레드에서 호출되는 콜백
+        """
+        self._execute = execute
+        self.coalesce_window = coalesce_window
+        self.max_pending = max_pending
+        self.history_size = history_size
+        self.on_finished = on_finished
+        
+        self._jobs: "OrderedDict[str, LEDJob]" = OrderedDict()
+        self._by_cells: Dict[frozenset, LEDJob] = {}
+        self._seq = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._worker: Optional[asyncio.Task] = None
+        
+        # 통계
+        self.submitted = 0
+        self.coalesced = 0
+        self.executed = 0
+    
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker is not None and not self._worker.done():
+            return
+        
+        self._loop = loop
+        self._queue = asyncio.PriorityQueue()
+        # 이전 루프에서 대기하던 작업은 새 루프로 옮김 (실행 중이던 작업은 실패 처리)
+        for job in self._jobs.values():
+            if job.status == JOB_QUEUED:
+                self._queue.put_nowait((job.priority, next(self._seq), job))
+            elif job.status == JOB_RUNNING:
+                job._waiters.clear()
+                self._finish(job, None, "이벤트 루프가 종료되어 중단되었습니다")
+        self._worker = loop.create_task(self._run())
+    
+    @property
+    def pending(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == JOB_QUEUED)
+    
+    def submit(self, led_control: LEDControl, priority: int = PRIORITY_INTERACTIVE) -> LEDJob:
+        """명령 접수 (이벤트 루프 스레드에서 호출, 즉시 반환)"""
+        self._ensure_worker()
+        cells = frozenset(expand_grid_position(led_control.grid_position))
+        self.submitted += 1
+        
+        existing = self._by_cells.get(cells)
+        if existing is not None:
+            if existing.status == JOB_QUEUED:
+                # 아직 실행 전: 최신 명령으로 갱신하고 더 높은 우선순위로 승격
+                existing.led_control = led_control
+                existing.requests += 1
+                self.coalesced += 1
+                if priority < existing.priority:
+                    existing.priority = priority
+                    self._queue.put_nowait((priority, next(self._seq), existing))
+                return existing
+            
+            same_command = (existing.led_control.color == led_control.color
+                            and existing.led_control.duration == led_control.duration)
+            if (same_command and existing.status != JOB_FAILED
+                    and time.monotonic() - existing._submitted < self.coalesce_window):
+                existing.requests += 1
+                self.coalesced += 1
+                return existing
+        
+        if self.pending >= self.max_pending:
+            raise QueueFullError(f"LED 작업 대기열이 가득 찼습니다 ({self.max_pending}개)")
+        
+        job = LEDJob(led_control, priority, cells)
+        self._jobs[job.id] = job
+        self._by_cells[cells] = job
+        self._queue.put_nowait((priority, next(self._seq), job))
+        self._trim_history()
+        return job
+    
+    def get(self, job_id: str) -> Optional[LEDJob]:
+        return self._jobs.get(job_id)
+    
+    async def wait(self, job: LEDJob, timeout: Optional[float] = None) -> LEDJob:
+        """작업 완료까지 대기 (timeout 시 asyncio.TimeoutError)"""
+        if not job.finished:
+            waiter = asyncio.get_running_loop().create_future()
+            job._waiters.append(waiter)
+            await asyncio.wait_for(waiter, timeout)
+        return job
+    
+    async def run(self, led_control: LEDControl, priority: int = PRIORITY_INTERACTIVE,
+                  timeout: Optional[float] = None) -> LEDJob:
+        """접수 후 완료까지 대기 (결과가 필요한 호출자용)"""
+        return await self.wait(self.submit(led_control, priority), timeout)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.pending,
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "executed": self.executed
+        }
+    
+    async def close(self):
+        """워커 중지 (대기 중인 작업은 실행하지 않음)"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+    
+    def _trim_history(self):
+        """완료된 작업을 오래된 순으로 삭제 (대기/실행 중인 작업은 건너뜀 - 그 수는 max_pending으로 제한)"""
+        excess = len(self._jobs) - self.history_size
+        if excess <= 0:
+            return
+        finished = [job for job in self._jobs.values() if job.finished][:excess]
+        for job in finished:
+            del self._jobs[job.id]
+            if self._by_cells.get(job.cells) is job:
+                del self._by_cells[job.cells]
+    
+    async def _run(self):
+        while True:
+            _, _, job = await self._queue.get()
+            # 승격으로 중복 등록된 항목이나 이미 처리된 작업은 건너뜀
+            if job.status != JOB_QUEUED:
+                continue
+            
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+            try:
+                with span("LEDJobQueue.execute", job_id=job.id, priority=job.priority,
+                          wait_ms=round((job.started_at - job.created_at) * 1000, 3)):
+                    result = await self._execute(job.led_control)
+            except asyncio.CancelledError:
+                job.status = JOB_QUEUED
+                raise
+            except Exception as e:
+                logger.error(f"LED 작업 {job.id} 실패: {e}")
+                self._finish(job, None, str(e))
+                continue
+            
+            error = None if result.get("success") else (result.get("error") or result.get("message") or "LED 제어 실패")
+            self._finish(job, result, error)
+    
+    def _finish(self, job: LEDJob, result: Optional[Dict[str, Any]], error: Optional[str]):
+        job.result = result
+        job.error = error
+        job.status = JOB_FAILED if error else JOB_SUCCEEDED
+        job.finished_at = time.time()
+        self.executed += 1
+        
+        for waiter in job._waiters:
+            if not waiter.done():
+                waiter.set_result(job)
+        job._waiters.clear()
+        
+        if self.on_finished is not None:
+            try:
+                self.on_finished(job)
+            except Exception as e:
+                logger.error(f"LED 작업 완료 콜백 오류: {e}")
+        self._trim_history()
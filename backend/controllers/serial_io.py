@@ -0,0 +1,415 @@
+"""
+Arduino 시리얼 포트 전용 I/O 스레드
+포트를 이 스레드 하나만 읽고 쓰도록 해 여러 스레드의 쓰기가 섞이지 않게 하고,
+펌웨어의 응답("Received: ...", "Set ...", "Error: ...", STATUS 블록)을 읽어 명령별 확인(ack)으로 사용합니다.
+
+- 대기 중인 같은 셀 명령은 최신 색상 하나로 병합하고, CLEAR 이전의 셀 명령은 버립니다.
+- 대기 명령을 "|"로 묶어 최소 개수의 프레임(한 줄)으로 보냅니다. 프레임은 Uno 수신 버퍼(64바이트)를
+  넘지 않으며, 확인되지 않은 바이트가 버퍼 크기를 넘지 않도록 흐름 제어합니다.
+- ack_timeout 안에 확인되지 않은 프레임은 재전송합니다 (새 값이 대기 중인 셀은 제외).
+- 포트 읽기/쓰기 오류(보드 분리)가 나면 대기 명령을 실패 처리하고 on_error를 호출한 뒤 종료합니다.
+"""
+
+import collections
+import difflib
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from ..core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+ARDUINO_RX_BUFFER = 64
+
+CELL = "cell"
+CLEAR = "clear"
+STATUS = "status"
+
+SERIAL_QUEUE_WAIT = registry.histogram(
+    "arduino_serial_queue_wait_seconds", "명령이 시리얼 큐에서 전송을 기다린 시간"
+)
+SERIAL_ACK_LATENCY = registry.histogram(
+    "arduino_serial_ack_seconds", "프레임 전송부터 펌웨어 확인까지 걸린 시간",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+SERIAL_PENDING = registry.gauge("arduino_serial_pending_commands", "전송을 기다리는 시리얼 명령 수")
+SERIAL_FRAMES = registry.counter("arduino_serial_frames_total", "시리얼 프레임 처리 결과", ("outcome",))
+SERIAL_COALESCED = registry.counter("arduino_serial_coalesced_total", "대기 중 병합되거나 버려진 명령 수")
+SERIAL_FIRMWARE_ERRORS = registry.counter("arduino_serial_firmware_errors_total", "펌웨어가 Error로 응답한 명령 수")
+
+class SerialCommandError(Exception):
+    """펌웨어가 명령을 거부함 (Error: ...)"""
+
+@dataclass
+class _Command:
+    kind: str
+    text: str
+    position: Optional[str] = None
+    futures: List[Future] = field(default_factory=list)
+    submitted_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+    
+    def resolve(self, result: Any = None, error: Optional[BaseException] = None):
+        for future in self.futures:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+@dataclass
+class _Frame:
+    line: str
+    commands: List[_Command]
+    sent_at: float
+    results: int = 0
+
+class SerialIO:
+    """시리얼 포트를 소유하는 I/O 스레드 (명령 큐, 프레임 병합, ack 추적)"""
+    
+    def __init__(self, port, max_frame_bytes: int = ARDUINO_RX_BUFFER, window_bytes: int = ARDUINO_RX_BUFFER,
+                 ack: bool = True, ack_timeout: float = 5.0, max_retries: int = 2, poll_interval: float = 0.05,
+                 on_error: Optional[Callable[[BaseException], Any]] = None, name: str = "arduino-serial-io"):
+        """
+        Args:
+            port: 열린 serial.Serial (이후 이 스레드만 사용)
+            max_frame_bytes: 프레임 한 줄의 최대 길이 (줄바꿈 포함)
+            window_bytes: 확인되지 않은 채 보낼 수 있는 최대 바이트 수
+            ack: 펌웨어 응답으로 확인 (False면 쓰기 완료를 확인으로 간주)
+            ack_timeout: 프레임 확인 대기 시간(초), 넘으면 재전송
+            max_retries: 명령당 최대 재전송 횟수
+            on_error: 포트 오류로 스레드가 끝날 때 I/O 스레드에서 호출 (예: 재연결 시작)
+        """
+        self.port = port
+        self.max_frame_bytes = max_frame_bytes
+        self.window_bytes = max(window_bytes, max_frame_bytes)
+        self.ack = ack
+        self.ack_timeout = ack_timeout
+        self.max_retries = max_retries
+        self.poll_interval = poll_interval
+        self.on_error = on_error
+        self.error: Optional[BaseException] = None
+        # 펌웨어 시작 배너("... Ready")를 받으면 설정 - 리셋 후 명령을 받을 수 있음
+        self.ready = threading.Event()
+        
+        self._lock = threading.Lock()
+        self._pending: List[_Command] = []
+        self._cells: Dict[str, _Command] = {}  # 마지막 CLEAR/STATUS 이후 대기 중인 셀 명령
+        self._in_flight: Deque[_Frame] = collections.deque()
+        self._current: Optional[_Frame] = None
+        self._status: Optional[Dict[str, List[int]]] = None
+        self._buffer = bytearray()
+        self._closed = False
+        self._stop = threading.Event()
+        self.counters = collections.Counter()
+        
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    
+    # ------------------------------------------------------------------
+    # 제출 (아무 스레드에서나 호출)
+    # ------------------------------------------------------------------
+    
+    def send_cells(self, commands: Iterable[str]) -> List[Future]:
+        """"A1:r,g,b" 명령들 전송 (같은 셀의 대기 명령은 최신 값으로 병합)"""
+        futures = []
+        with self._lock:
+            self._check_open()
+            for text in commands:
+                future: Future = Future()
+                position = text.split(":", 1)[0]
+                queued = self._cells.get(position)
+                if queued is not None:
+                    queued.text = text
+                    queued.futures.append(future)
+                    self.counters["coalesced"] += 1
+                    SERIAL_COALESCED.inc()
+                else:
+                    command = _Command(CELL, text, position, [future])
+                    self._pending.append(command)
+                    self._cells[position] = command
+                futures.append(future)
+        self._wake()
+        return futures
+    
+    def clear(self) -> Future:
+        """CLEAR 전송 (대기 중인 셀 명령은 버림)"""
+        future: Future = Future()
+        with self._lock:
+            self._check_open()
+            kept = []
+            for command in self._pending:
+                if command.kind == CELL:
+                    command.resolve()
+                    self.counters["coalesced"] += 1
+                    SERIAL_COALESCED.inc()
+                else:
+                    kept.append(command)
+            self._pending = kept + [_Command(CLEAR, "CLEAR", futures=[future])]
+            self._cells.clear()
+        self._wake()
+        return future
+    
+    def status(self) -> Future:
+        """STATUS 요청 - 펌웨어의 LED 상태 {위치: [r, g, b]}로 완료"""
+        future: Future = Future()
+        with self._lock:
+            self._check_open()
+            self._pending.append(_Command(STATUS, "STATUS", futures=[future]))
+            self._cells.clear()
+        self._wake()
+        return future
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+            in_flight = len(self._in_flight)
+        return {
+            "pending": pending,
+            "in_flight": in_flight,
+            **{key: self.counters[key] for key in (
+                "frames", "bytes", "acked", "retried", "failed", "coalesced", "firmware_errors", "corrupted"
+            )}
+        }
+    
+    def close(self, timeout: float = 2.0):
+        """대기 중인 명령을 보내고(최대 timeout초) 스레드 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and (self._pending or self._in_flight):
+            time.sleep(0.01)
+        self._stop.set()
+        self._wake()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(1.0)
+        
+        with self._lock:
+            leftovers = self._pending + [c for frame in self._in_flight for c in frame.commands]
+            self._pending = []
+            self._in_flight.clear()
+        for command in leftovers:
+            command.resolve(error=ConnectionError("시리얼 I/O가 종료되었습니다"))
+    
+    def _check_open(self):
+        if self.error is not None:
+            raise ConnectionError(f"시리얼 포트 오류: {self.error}")
+        if self._closed:
+            raise ConnectionError("시리얼 I/O가 종료되었습니다")
+    
+    def _wake(self):
+        """read 대기 중인 I/O 스레드 깨우기"""
+        cancel_read = getattr(self.port, "cancel_read", None)
+        if cancel_read is not None:
+            try:
+                cancel_read()
+            except Exception:
+                pass
+    
+    # ------------------------------------------------------------------
+    # I/O 스레드
+    # ------------------------------------------------------------------
+    
+    def _run(self):
+        self.port.timeout = self.poll_interval
+        while not self._stop.is_set():
+            try:
+                self._send_frames()
+                data = self.port.read(max(1, self.port.in_waiting))
+                if data:
+                    self._on_data(data)
+                self._check_timeouts()
+            except OSError as e:
+                # serial.SerialException 포함 - 보드 분리 등으로 포트를 더 쓸 수 없음
+                if not self._stop.is_set():
+                    self._fail(e)
+                break
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                logger.error(f"시리얼 I/O 오류: {e}")
+                time.sleep(0.5)
+            SERIAL_PENDING.set(len(self._pending))
+    
+    def _fail(self, error: BaseException):
+        """포트 오류 - 대기/확인 대기 명령을 모두 실패 처리하고 on_error 호출"""
+        logger.warning(f"시리얼 포트 오류: {error}")
+        with self._lock:
+            self.error = error
+            failed = self._pending + [c for frame in self._in_flight for c in frame.commands]
+            self._pending = []
+            self._cells.clear()
+            self._in_flight.clear()
+        self._current = None
+        for command in failed:
+            command.resolve(error=ConnectionError(f"시리얼 포트 오류: {error}"))
+        SERIAL_PENDING.set(0)
+        if self.on_error is not None:
+            try:
+                self.on_error(error)
+            except Exception as e:
+                logger.error(f"시리얼 오류 콜백 실패: {e}")
+    
+    def _take_frame(self, budget: int) -> Optional[_Frame]:
+        """대기 명령을 앞에서부터 한 줄(budget 바이트 이하)로 묶음"""
+        with self._lock:
+            if not self._pending:
+                return None
+            commands: List[_Command] = []
+            length = 1  # 줄바꿈
+            for command in self._pending:
+                extra = len(command.text) + (1 if commands else 0)
+                if length + extra > budget:
+                    break
+                commands.append(command)
+                length += extra
+            if not commands:
+                # 첫 명령이 남은 창보다 김 - 확인 대기 프레임이 없을 때 단독 전송
+                if self._in_flight:
+                    return None
+                commands = [self._pending[0]]
+            
+            del self._pending[:len(commands)]
+            for command in commands:
+                if self._cells.get(command.position) is command:
+                    del self._cells[command.position]
+            frame = _Frame("|".join(command.text for command in commands), commands, time.monotonic())
+            self._in_flight.append(frame)
+            return frame
+    
+    def _send_frames(self):
+        while True:
+            in_flight_bytes = sum(len(frame.line) + 1 for frame in self._in_flight)
+            budget = min(self.max_frame_bytes, self.window_bytes - in_flight_bytes)
+            if budget <= 1:
+                return
+            frame = self._take_frame(budget)
+            if frame is None:
+                return
+            
+            # 재전송이면 펌웨어에 남았을 수 있는 미완성 줄을 먼저 끝냄 (빈 줄은 무시됨)
+            prefix = "\n" if any(command.attempts for command in frame.commands) else ""
+            data = (prefix + frame.line + "\n").encode("ascii", errors="replace")
+            for command in frame.commands:
+                if command.attempts == 0:
+                    SERIAL_QUEUE_WAIT.observe(frame.sent_at - command.submitted_at)
+                command.attempts += 1
+            self.port.write(data)
+            self.counters["frames"] += 1
+            self.counters["bytes"] += len(data)
+            
+            if not self.ack:
+                with self._lock:
+                    self._in_flight.remove(frame)
+                for command in frame.commands:
+                    command.resolve()
+                SERIAL_FRAMES.inc(outcome="sent")
+    
+    def _on_data(self, data: bytes):
+        self._buffer.extend(data)
+        while b"\n" in self._buffer:
+            raw, _, rest = self._buffer.partition(b"\n")
+            self._buffer = bytearray(rest)
+            line = raw.decode("ascii", errors="replace").strip()
+            if line:
+                self._on_line(line)
+    
+    def _on_line(self, line: str):
+        """펌웨어 응답 한 줄 처리"""
+        if line.startswith("Received: "):
+            self._begin_frame(line[len("Received: "):])
+            return
+        if self._current is None:
+            # 배너, 시작 테스트 메시지 등
+            if "Ready" in line:
+                self.ready.set()
+            return
+        
+        if self._status is not None:
+            if line.startswith("=") and "LED Status" not in line:
+                status, self._status = self._status, None
+                self._complete(result=status)
+            elif ": RGB(" in line:
+                position, _, rgb = line.partition(": RGB(")
+                self._status[position] = [int(value) for value in rgb.rstrip(")").split(",")]
+        elif line == "=== LED Status ===":
+            self._status = {}
+        elif line.startswith("Error: "):
+            self.counters["firmware_errors"] += 1
+            SERIAL_FIRMWARE_ERRORS.inc()
+            self._complete(error=SerialCommandError(line[len("Error: "):]))
+        elif line.startswith("Set ") or line == "All LEDs cleared":
+            self._complete()
+    
+    def _begin_frame(self, received: str):
+        """"Received: ..." - 해당 프레임 앞의 확인되지 않은 프레임은 유실로 처리"""
+        self._status = None
+        with self._lock:
+            frames = list(self._in_flight)
+        match = next((frame for frame in frames if frame.line == received), None)
+        if match is None:
+            self._current = None
+            # 바이트 유실로 손상된 줄이면 가장 오래된 프레임을 다시 보냄
+            # (전혀 다른 줄은 I/O 스레드 시작 전에 보낸 명령의 응답이므로 무시)
+            if frames and difflib.SequenceMatcher(None, received, frames[0].line).ratio() >= 0.5:
+                self.counters["corrupted"] += 1
+                self._fail_frame(frames[0])
+            return
+        for frame in frames:
+            if frame is match:
+                break
+            self._fail_frame(frame)
+        self._current = match
+    
+    def _complete(self, result: Any = None, error: Optional[BaseException] = None):
+        """현재 프레임의 다음 명령 결과 기록 (모두 받으면 프레임 확인)"""
+        frame = self._current
+        if frame.results < len(frame.commands):
+            frame.commands[frame.results].resolve(result, error)
+            frame.results += 1
+        if frame.results < len(frame.commands):
+            return
+        
+        self._current = None
+        with self._lock:
+            if frame in self._in_flight:
+                self._in_flight.remove(frame)
+        self.counters["acked"] += 1
+        SERIAL_FRAMES.inc(outcome="acked")
+        SERIAL_ACK_LATENCY.observe(time.monotonic() - frame.sent_at)
+    
+    def _check_timeouts(self):
+        with self._lock:
+            head = self._in_flight[0] if self._in_flight else None
+        if head is not None and time.monotonic() - head.sent_at > self.ack_timeout:
+            logger.warning(f"시리얼 프레임 확인 시간 초과: {head.line[:40]}")
+            self._fail_frame(head)
+    
+    def _fail_frame(self, frame: _Frame):
+        """확인되지 않은 프레임 - 결과를 받지 못한 명령을 재전송하거나 실패 처리"""
+        if self._current is frame:
+            self._current = None
+        with self._lock:
+            if frame not in self._in_flight:
+                return
+            self._in_flight.remove(frame)
+            retry = []
+            for command in frame.commands[frame.results:]:
+                if command.kind == CELL and command.position in self._cells:
+                    # 더 새로운 값이 대기 중
+                    command.resolve()
+                elif command.attempts > self.max_retries:
+                    command.resolve(error=TimeoutError(f"펌웨어 확인 없음: {command.text}"))
+                    self.counters["failed"] += 1
+                else:
+                    retry.append(command)
+            self._pending[:0] = retry
+        self.counters["retried"] += 1
+        SERIAL_FRAMES.inc(outcome="retried")
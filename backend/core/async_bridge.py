@@ -0,0 +1,108 @@
+"""
+프로세스 전역 백그라운드 이벤트 루프
+동기 코드(Streamlit 핸들러 등)에서 코루틴을 실행할 때 매번 asyncio.run()으로
+루프를 만들고 닫는 대신, 하나의 장수(long-lived) 루프 스레드에 제출합니다.
+루프가 유지되므로 aiohttp 세션 같은 비동기 리소스를 요청 간에 재사용할 수 있습니다.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+class BackgroundEventLoop:
+    """별도 데몬 스레드에서 실행되는 이벤트 루프와 동기 브리지"""
+    
+    def __init__(self, name: str = "async-bridge"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._lock = threading.Lock()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행 중인 루프 반환 (필요 시 시작)"""
+        self.start()
+        return self._loop
+    
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """루프 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self.is_running():
+                return
+            
+            self._started.clear()
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        
+        self._started.wait()
+    
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._started.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            # 남은 작업 정리
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+    
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """코루틴을 루프에 제출하고 concurrent Future 반환"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """코루틴을 루프에서 실행하고 결과를 동기적으로 기다립니다."""
+        if threading.current_thread() is self._thread:
+            # 루프 스레드에서 자기 자신을 기다리면 교착 상태가 됨
+            raise RuntimeError("백그라운드 루프 스레드 안에서는 run()을 호출할 수 없습니다. await를 사용하세요.")
+        
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
+    def stop(self, timeout: float = 5.0):
+        """루프 정지 및 스레드 종료 대기"""
+        with self._lock:
+            if not self.is_running():
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            thread = self._thread
+        
+        thread.join(timeout)
+        logger.info(f"백그라운드 이벤트 루프 종료: {self.name}")
+
+# 프로세스 전역 인스턴스
+_background_loop: Optional[BackgroundEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+def get_background_loop() -> BackgroundEventLoop:
+    """프로세스 전역 백그라운드 루프 반환 (최초 호출 시 시작)"""
+    global _background_loop
+    
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = BackgroundEventLoop()
+    
+    _background_loop.start()
+    return _background_loop
+
+def run_sync(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """동기 코드에서 코루틴 실행 (asyncio.run 대체)"""
+    return get_background_loop().run(coro, timeout)
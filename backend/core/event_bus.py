@@ -0,0 +1,160 @@
+"""
+프로세스 내부 Pub/Sub 이벤트 버스
+물품 생성/수정/삭제(및 일괄 변경), LED 켜짐/꺼짐/만료와 LED 작업 완료 이벤트를 구독자에게 전달합니다.
+각 구독자는 크기가 제한된 큐를 가지며, 느린 클라이언트 때문에 발행자가
+막히지 않도록 큐가 가득 차면 가장 오래된 이벤트를 버리고 재동기화(resync)를 알립니다.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 타입
+ITEM_CREATED = "item.created"
+ITEM_UPDATED = "item.updated"
+ITEM_DELETED = "item.deleted"
+ITEM_BULK = "item.bulk"
+LED_ON = "led.on"
+LED_OFF = "led.off"
+LED_EXPIRED = "led.expired"
+LED_JOB = "led.job"
+RESYNC = "resync"
+
+class Subscription:
+    """구독자 한 명의 제한된 이벤트 큐"""
+    
+    def __init__(self, bus: "EventBus", loop: asyncio.AbstractEventLoop,
+                 topics: Optional[Iterable[str]] = None, max_queue_size: int = 100):
+        self.bus = bus
+        self.loop = loop
+        self.topics = tuple(topics) if topics else ()
+        self.max_queue_size = max_queue_size
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self._pending_resync = False
+        self.closed = False
+    
+    def matches(self, event_type: str) -> bool:
+        """토픽 필터 확인 ("item" 은 item.* 전체와 일치)"""
+        if not self.topics:
+            return True
+        return any(event_type == t or event_type.startswith(t + ".") for t in self.topics)
+    
+    def _offer(self, event: Dict[str, Any]):
+        """루프 스레드에서 호출: 큐가 가득 차면 가장 오래된 이벤트를 버림"""
+        if self.closed:
+            return
+        
+        while self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            self.dropped += 1
+            self._pending_resync = True
+        
+        self.queue.put_nowait(event)
+    
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """다음 이벤트 반환 (timeout 시 None)
+        
+        이벤트가 유실된 적이 있으면 먼저 resync 이벤트를 돌려주어
+        클라이언트가 전체 목록을 한 번 다시 불러오도록 합니다.
+        """
+        if self._pending_resync:
+            self._pending_resync = False
+            return self.bus.make_event(RESYNC, {"dropped": self.dropped})
+        
+        try:
+            if timeout is None:
+                return await self.queue.get()
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+    
+    def close(self):
+        self.bus.unsubscribe(self)
+
+class EventBus:
+    """스레드 안전한 이벤트 발행기"""
+    
+    def __init__(self, max_queue_size: int = 100, history_size: int = 256):
+        self.max_queue_size = max_queue_size
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        # 재연결 클라이언트를 위한 최근 이벤트 (SSE Last-Event-ID)
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self.published = 0
+    
+    def make_event(self, event_type: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {
+            "id": next(self._ids),
+            "type": event_type,
+            "data": data or {},
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def subscribe(self, topics: Optional[Iterable[str]] = None,
+                  max_queue_size: Optional[int] = None) -> Subscription:
+        """현재 이벤트 루프에서 사용할 구독 생성"""
+        subscription = Subscription(
+            self,
+            asyncio.get_running_loop(),
+            topics=topics,
+            max_queue_size=max_queue_size or self.max_queue_size
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+    
+    def unsubscribe(self, subscription: Subscription):
+        subscription.closed = True
+        with self._lock:
+            self._subscriptions.discard(subscription)
+    
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+    
+    def publish(self, event_type: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """이벤트 발행 (어느 스레드에서든 호출 가능, 절대 블로킹하지 않음)"""
+        event = self.make_event(event_type, data)
+        
+        with self._lock:
+            self._history.append(event)
+            targets = [s for s in self._subscriptions if s.matches(event_type)]
+        self.published += 1
+        
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        
+        for subscription in targets:
+            if subscription.loop is current_loop:
+                subscription._offer(event)
+            elif not subscription.loop.is_closed():
+                subscription.loop.call_soon_threadsafe(subscription._offer, event)
+        
+        return event
+    
+    def events_since(self, last_event_id: int, topics: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """last_event_id 이후의 보관된 이벤트 (재연결 시 누락분 재전송)"""
+        topics = tuple(topics) if topics else ()
+        with self._lock:
+            events = [e for e in self._history if e["id"] > last_event_id]
+        if not topics:
+            return events
+        return [e for e in events
+                if any(e["type"] == t or e["type"].startswith(t + ".") for t in topics)]
+
+# API 프로세스 전역 이벤트 버스
+event_bus = EventBus()
@@ -0,0 +1,307 @@
+"""
+프로세스 내 메트릭 수집 (Prometheus 텍스트 형식)
+카운터/게이지/히스토그램을 레이블별로 모아 /metrics 엔드포인트에서 그대로 내보냅니다.
+외부 라이브러리 없이 동작하며, 기록은 잠금 한 번과 덧셈 몇 번으로 끝납니다.
+"""
+
+import bisect
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .tracing import span
+
+# 기본 히스토그램 구간(초) - 1ms ~ 10s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+class _Metric:
+    kind = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames}가 필요합니다 (받음: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+    
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = "counter"
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+    
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+class Gauge(_Metric):
+    """현재 값 (증감 또는 수집 시점 콜백)"""
+    kind = "gauge"
+    
+    def __init__(self, *args, callback: Optional[Callable[[], float]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+    
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+    
+    def value(self, **labels) -> float:
+        if self._callback is not None:
+            return self._callback()
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+    
+    def _samples(self) -> List[str]:
+        if self._callback is not None:
+            try:
+                return [f"{self.name} {_format_value(self._callback())}"]
+            except Exception:
+                return []
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+class Histogram(_Metric):
+    """누적 구간 히스토그램 (_bucket, _sum, _count)"""
+    kind = "histogram"
+    
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 -> [구간별 개수..., +Inf 개수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+    
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+    
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+    
+    def count(self, **labels) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+    
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """이름별 메트릭 모음 - 같은 이름으로 다시 등록하면 기존 메트릭 반환"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name}은(는) 이미 {metric.kind}로 등록되어 있습니다")
+            return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              callback: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames, callback=callback)
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+    
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+    
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# 프로세스 전역 레지스트리
+registry = MetricsRegistry()
+
+# 컨트롤러(ESP32/Arduino) 왕복 시간과 실패
+CONTROLLER_DURATION = registry.histogram(
+    "led_controller_request_duration_seconds", "LED 컨트롤러 요청 왕복 시간", ("controller", "operation")
+)
+CONTROLLER_FAILURES = registry.counter(
+    "led_controller_failures_total", "LED 컨트롤러 요청 실패 수", ("controller", "operation")
+)
+
+# LLM 호출
+LLM_DURATION = registry.histogram(
+    "llm_request_duration_seconds", "LLM 요청 시간", ("model", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+)
+
+def observe_controller(operation: str):
+    """컨트롤러 async 메서드 계측 데코레이터
+    
+    {"success": False} 결과나 예외를 실패로 집계합니다. 컨트롤러 이름은 인스턴스 클래스명이며,
+    같은 이름(예: MockESP32Controller.highlight_position)의 트레이싱 스팬도 만듭니다.
+    """
+    def decorator(method):
+        if not inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            def sync_wrapper(self, *args, **kwargs):
+                controller = type(self).__name__
+                started = time.perf_counter()
+                failed = True
+                try:
+                    with span(f"{controller}.{method.__name__}"):
+                        result = method(self, *args, **kwargs)
+                    failed = result is False or (isinstance(result, dict) and result.get("success") is False)
+                    return result
+                finally:
+                    CONTROLLER_DURATION.observe(time.perf_counter() - started,
+                                                controller=controller, operation=operation)
+                    if failed:
+                        CONTROLLER_FAILURES.inc(controller=controller, operation=operation)
+            return sync_wrapper
+        
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            controller = type(self).__name__
+            started = time.perf_counter()
+            failed = True
+            try:
+                with span(f"{controller}.{method.__name__}"):
+                    result = await method(self, *args, **kwargs)
+                failed = isinstance(result, dict) and result.get("success") is False
+                return result
+            finally:
+                CONTROLLER_DURATION.observe(time.perf_counter() - started,
+                                            controller=controller, operation=operation)
+                if failed:
+                    CONTROLLER_FAILURES.inc(controller=controller, operation=operation)
+        return wrapper
+    return decorator
+
+# HTTP 요청
+HTTP_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+)
+HTTP_REQUESTS = registry.counter("http_requests_total", "HTTP 요청 수", ("method", "route", "status"))
+HTTP_IN_FLIGHT = registry.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+
+class MetricsMiddleware:
+    """라우트별 지연 시간/상태 코드/동시 처리 수를 기록하는 ASGI 미들웨어
+    
+    레이블에는 실제 경로 대신 라우트 템플릿(/items/{item_id})을 사용해 시계열 수가 늘지 않게 합니다.
+    """
+    
+    def __init__(self, app, exclude_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        
+        status = 500
+        
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        started = time.perf_counter()
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            # 라우팅이 끝나면 scope에 매칭된 라우트가 기록됨
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_DURATION.observe(time.perf_counter() - started, method=method, route=route)
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status))
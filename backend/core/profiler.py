@@ -0,0 +1,128 @@
+"""
+시간 제한 샘플링 프로파일러
+실행 중인 프로세스의 모든 스레드 스택을 일정 간격으로 샘플링해 collapsed-stack 형식
+(flamegraph.pl, speedscope에서 바로 열림)으로 모읍니다.
+
+요청이 있을 때만 샘플링을 수행하므로 꺼져 있는 동안에는 비용이 없습니다.
+샘플링은 sys._current_frames()로 스택만 읽기 때문에 대상 코드에 계측을 넣지 않으며,
+비동기 핸들러와 스레드 풀 작업(DB 쓰기 스레드 등)도 함께 관찰됩니다.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+# 대기 중인 스레드의 맨 위 프레임 (기본적으로 샘플에서 제외)
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("socket.py", "accept"),
+    ("socketserver.py", "serve_forever"),
+    ("thread.py", "_worker"),
+}
+
+MAX_DURATION = 60.0
+
+_active = threading.Lock()
+
+class Profile:
+    """샘플링 결과 (스택별 샘플 수)"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self.started_at = time.time()
+        self.duration = 0.0
+    
+    def collapsed(self) -> str:
+        """collapsed-stack 형식 ("스레드;프레임;프레임 샘플수")"""
+        lines = [f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + ("\n" if lines else "")
+    
+    def top(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """자체 시간(스택 맨 위 프레임) 기준 상위 함수"""
+        leaves: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack[-1]] += count
+        total = sum(leaves.values()) or 1
+        return [
+            {"frame": frame, "samples": count, "percent": round(count / total * 100, 1)}
+            for frame, count in leaves.most_common(limit)
+        ]
+    
+    def summary(self, limit: int = 20) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration": round(self.duration, 3),
+            "interval": self.interval,
+            "samples": self.samples,
+            "idle_samples": self.idle_samples,
+            "stacks": len(self.stacks),
+            "top": self.top(limit)
+        }
+
+def _frame_label(frame) -> Tuple[str, str]:
+    code = frame.f_code
+    return os.path.basename(code.co_filename), code.co_name
+
+def _stack(frame, max_depth: int) -> List[Tuple[str, str, int]]:
+    stack = []
+    while frame is not None and len(stack) < max_depth:
+        filename, name = _frame_label(frame)
+        stack.append((filename, name, frame.f_code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+def sample(duration: float, interval: float = 0.005, include_idle: bool = False,
+           max_depth: int = 64) -> Profile:
+    """호출한 스레드에서 duration초 동안 다른 모든 스레드를 샘플링
+    
+    동시에 하나의 세션만 허용합니다 (이미 실행 중이면 RuntimeError).
+    """
+    if not 0 < duration <= MAX_DURATION:
+        raise ValueError(f"duration은 0초 초과 {MAX_DURATION:.0f}초 이하여야 합니다")
+    if interval <= 0:
+        raise ValueError("interval은 0보다 커야 합니다")
+    if not _active.acquire(blocking=False):
+        raise RuntimeError("이미 프로파일링이 진행 중입니다")
+    
+    try:
+        profile = Profile(interval)
+        own_ident = threading.get_ident()
+        started = time.perf_counter()
+        deadline = started + duration
+        
+        while True:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if not include_idle and _frame_label(frame) in IDLE_FRAMES:
+                    profile.idle_samples += 1
+                    continue
+                stack = tuple(
+                    f"{name} ({filename}:{line})" for filename, name, line in _stack(frame, max_depth)
+                )
+                profile.stacks[(names.get(ident, f"thread-{ident}"),) + stack] += 1
+                profile.samples += 1
+            
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            time.sleep(min(interval, deadline - now))
+        
+        profile.duration = time.perf_counter() - started
+        return profile
+    finally:
+        _active.release()
+
+def is_running() -> bool:
+    return _active.locked()
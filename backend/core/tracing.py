@@ -0,0 +1,164 @@
+"""
+프로세스 내 구조화 트레이싱 (컨텍스트 전파 스팬)
+챗봇 → 에이전트 → DB → LED 컨트롤러로 이어지는 호출을 하나의 트레이스로 묶어
+어느 단계에서 시간이 쓰였는지 확인할 수 있게 합니다.
+
+현재 스팬은 contextvars로 전파되므로 asyncio 태스크와 asyncio.to_thread/run_in_executor로
+넘어간 작업에도 부모-자식 관계가 유지됩니다. 완료된 스팬은 JSONL 파일에 한 줄씩 기록되며,
+scripts/trace_summary.py로 요청별 플레임 형태 요약을 볼 수 있습니다.
+
+TRACE_FILE 환경 변수(또는 configure())로 출력 파일을 지정하지 않으면 스팬을 만들지 않으므로
+계측 비용은 함수 호출 한 번 수준입니다.
+"""
+
+import functools
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+class Span:
+    """하나의 작업 구간"""
+    
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes",
+                 "start", "duration_ms", "error", "_started")
+    
+    def __init__(self, name: str, parent: Optional["Span"] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else _new_id(16)
+        self.span_id = _new_id(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes or {}
+        self.start = time.time()
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+    
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+    
+    def finish(self):
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+    
+    def to_dict(self) -> Dict[str, Any]:
+        record = {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration_ms": round(self.duration_ms or 0.0, 3),
+            "thread": threading.current_thread().name,
+        }
+        if self.attributes:
+            record["attributes"] = self.attributes
+        if self.error:
+            record["error"] = self.error
+        return record
+
+def _new_id(length: int) -> str:
+    return f"{random.getrandbits(length * 4):0{length}x}"
+
+class JsonlExporter:
+    """완료된 스팬을 JSONL 파일에 추가 (스레드 안전)"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+        self._lock = threading.Lock()
+    
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+    
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporter: Optional[JsonlExporter] = None
+
+def configure(path: Optional[str]) -> Optional[JsonlExporter]:
+    """스팬 출력 파일 지정 (None이면 트레이싱 비활성화)"""
+    global _exporter
+    if _exporter is not None:
+        _exporter.close()
+    _exporter = JsonlExporter(path) if path else None
+    return _exporter
+
+def is_enabled() -> bool:
+    return _exporter is not None
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Optional[Span]]:
+    """현재 스팬의 자식 스팬 생성 (트레이싱이 꺼져 있으면 None)"""
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+    
+    current = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.finish()
+        _current_span.reset(token)
+        exporter.export(current)
+
+def traced(name: Optional[str] = None, **attributes):
+    """함수 호출을 스팬으로 감싸는 데코레이터 (동기/비동기 모두 지원)
+    
+    이름을 생략하면 함수의 qualname(예: ItemDatabase.search_items)을 사용합니다.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _exporter is None:
+                    return await func(*args, **kwargs)
+                with span(span_name, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with span(span_name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def read_spans(path: str) -> List[Dict[str, Any]]:
+    """JSONL 파일에서 스팬 읽기 (잘린 마지막 줄은 무시)"""
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+configure(os.getenv("TRACE_FILE"))
@@ -0,0 +1,161 @@
+"""
+물품 대량 가져오기/내보내기 (CSV, JSONL)
+입력을 한 줄씩 읽어 검증한 뒤 batch_size 단위로 묶어 한 트랜잭션에 executemany로 추가하고,
+내보내기는 커서에서 fetchmany로 읽어 바로 써 나가므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import io
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .database import ITEM_FIELDS, ItemDatabase, validate_item_row
+
+FORMATS = ("csv", "jsonl")
+
+# 내보내기 컬럼 순서 (가져오기는 ITEM_FIELDS 외의 컬럼을 무시)
+EXPORT_FIELDS = ('id', 'name', 'description', 'category', 'grid_position', 'created_at', 'updated_at')
+
+# 결과에 담을 최대 오류 수
+MAX_REPORTED_ERRORS = 100
+
+@dataclass
+class ImportStats:
+    """가져오기 결과 통계"""
+    rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def add_error(self, line: int, error: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "batches": self.batches,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+            "errors": self.errors
+        }
+
+def _check_format(fmt: str):
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {', '.join(FORMATS)})")
+
+def read_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """입력 스트림에서 (줄 번호, 행, 파싱 오류)를 하나씩 생성"""
+    _check_format(fmt)
+    
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+    
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"invalid JSON: {e.msg}"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "row must be a JSON object"
+            continue
+        yield line_number, row, None
+
+def import_items(db: ItemDatabase, stream: TextIO, fmt: str, batch_size: int = 5000,
+                 progress=None) -> ImportStats:
+    """CSV/JSONL 스트림을 batch_size 행씩 한 트랜잭션으로 가져오기
+    
+    Args:
+        progress: 배치마다 ImportStats를 받아 호출되는 함수 (선택)
+    """
+    stats = ImportStats()
+    started = time.perf_counter()
+    batch: List[tuple] = []
+    
+    def flush():
+        if not batch:
+            return
+        db.insert_item_rows(batch)
+        stats.imported += len(batch)
+        stats.batches += 1
+        batch.clear()
+        stats.elapsed = time.perf_counter() - started
+        if progress:
+            progress(stats)
+    
+    for line_number, row, error in read_rows(stream, fmt):
+        stats.rows += 1
+        if row is not None:
+            error = validate_item_row(row)
+        if error:
+            stats.add_error(line_number, error)
+            continue
+        
+        batch.append(tuple(row[f] for f in ITEM_FIELDS))
+        if len(batch) >= batch_size:
+            flush()
+    
+    flush()
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+def export_lines(items: Iterable[Dict[str, Any]], fmt: str) -> Iterator[str]:
+    """물품을 CSV/JSONL 텍스트 줄로 변환 (CSV는 헤더 포함)"""
+    _check_format(fmt)
+    
+    if fmt == "jsonl":
+        for item in items:
+            yield json.dumps({f: item[f] for f in EXPORT_FIELDS}, ensure_ascii=False) + "\n"
+        return
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    def take() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+    
+    writer.writerow(EXPORT_FIELDS)
+    yield take()
+    for item in items:
+        writer.writerow([item[f] for f in EXPORT_FIELDS])
+        yield take()
+
+def export_chunks(db: ItemDatabase, fmt: str, rows_per_chunk: int = 1000) -> Iterator[bytes]:
+    """HTTP 스트리밍용: rows_per_chunk 행씩 묶은 UTF-8 바이트"""
+    chunk: List[str] = []
+    for line in export_lines(db.iter_items(batch_size=rows_per_chunk), fmt):
+        chunk.append(line)
+        if len(chunk) >= rows_per_chunk:
+            yield "".join(chunk).encode("utf-8")
+            chunk = []
+    if chunk:
+        yield "".join(chunk).encode("utf-8")
+
+def export_items(db: ItemDatabase, stream: TextIO, fmt: str) -> int:
+    """모든 물품을 스트림에 기록하고 행 수 반환"""
+    count = 0
+    for line in export_lines(db.iter_items(), fmt):
+        stream.write(line)
+        count += 1
+    # CSV 헤더 줄 제외
+    return count - 1 if fmt == "csv" else count
@@ -1,58 +1,486 @@
 import sqlite3
 import os
+import re
+import threading
+import time
+import functools
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Iterable, Iterator
+
+from ..core.metrics import registry
+from ..core.tracing import span
+from .migrations import Backfill, Migration, MigrationRunner
+from .writer import WriteQueue
+
+# 쓰기 가능한 물품 컬럼
+ITEM_FIELDS = ('name', 'description', 'category', 'grid_position')
+
+# IN (...) 조회 시 한 번에 바인딩할 최대 변수 개수
+SQL_CHUNK_SIZE = 500
+
+# 메서드별 실행 시간과 반환 행 수
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds", "ItemDatabase 메서드 실행 시간", ("method",)
+)
+DB_ROWS = registry.counter("db_rows_returned_total", "ItemDatabase 조회 결과 행 수", ("method",))
+
+def _instrumented(method):
+    """ItemDatabase 메서드의 실행 시간과 결과 행 수 기록 (트레이싱 스팬 포함)"""
+    name = method.__name__
+    span_name = f"ItemDatabase.{name}"
+    
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        with span(span_name) as current:
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                DB_QUERY_DURATION.observe(time.perf_counter() - started, method=name)
+            if isinstance(result, (list, dict)):
+                rows = len(result) if isinstance(result, list) else 1
+                DB_ROWS.inc(rows, method=name)
+                if current is not None:
+                    current.set_attribute("rows", rows)
+        return result
+    return wrapper
+
+_CELL_PATTERN = re.compile(r"^([A-Z])(\d+)$")
+
+def normalize_cell(cell: str) -> str:
+    """셀 이름 정규화 (" b3 " -> "B3")"""
+    return cell.strip().upper()
+
+def expand_grid_position(grid_position: str) -> List[str]:
+    """그리드 위치 문자열을 개별 셀 목록으로 확장
+    
+    예시:
+    - "A1" -> ["A1"]
+    - "B6-B8" -> ["B6", "B7", "B8"]
+    - "A1-B2" -> ["A1", "A2", "B1", "B2"] (사각형 영역)
+    
+    형식이 맞지 않는 위치는 정규화한 문자열 하나를 셀로 취급합니다.
+    """
+    parts = [normalize_cell(p) for p in grid_position.split("-")]
+    matches = [_CELL_PATTERN.match(p) for p in parts]
+    if len(parts) not in (1, 2) or not all(matches):
+        return [normalize_cell(grid_position)] if grid_position.strip() else []
+    
+    if len(parts) == 1:
+        return parts
+    
+    (start_row, start_col), (end_row, end_col) = [(m.group(1), int(m.group(2))) for m in matches]
+    rows = range(min(ord(start_row), ord(end_row)), max(ord(start_row), ord(end_row)) + 1)
+    cols = range(min(start_col, end_col), max(start_col, end_col) + 1)
+    return [f"{chr(row)}{col}" for row in rows for col in cols]
+
+def parse_grid_position(grid_position: str) -> List[str]:
+    """
+    그리드 위치 문자열을 개별 위치 리스트로 파싱합니다.
+    
+    예시:
+    - "A1" -> ["A1"]
+    - "A1-A4" -> ["A1", "A2", "A3", "A4"]
+    - "B2-B3" -> ["B2", "B3"]
+    """
+    if "-" not in grid_position:
+        return [grid_position]
+    
+    start_pos, end_pos = grid_position.split("-")
+    
+    # 문자와 숫자 분리
+    start_letter = start_pos[0]
+    start_number = int(start_pos[1:])
+    end_letter = end_pos[0]
+    end_number = int(end_pos[1:])
+    
+    positions = []
+    
+    if start_letter == end_letter:
+        # 같은 행에서 범위
+        for i in range(start_number, end_number + 1):
+            positions.append(f"{start_letter}{i}")
+    else:
+        # 다른 행으로 확장 (복잡한 경우는 단순화)
+        positions = [start_pos, end_pos]
+    
+    return positions
+
+def get_database_path(default: str = "items.db") -> str:
+    """환경 변수 DATABASE_URL (예: sqlite:///items.db)에서 DB 파일 경로 추출"""
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        return default
+    if url.startswith("sqlite:///"):
+        return url[len("sqlite:///"):]
+    return url
+
+def validate_item_row(row: Dict[str, Any], partial: bool = False) -> Optional[str]:
+    """물품 행 검증 (오류 메시지 또는 None)"""
+    for field in ITEM_FIELDS:
+        if field not in row or row[field] is None:
+            if partial:
+                continue
+            return f"{field} is required"
+        if not isinstance(row[field], str):
+            return f"{field} must be a string"
+        if field != 'description' and not row[field].strip():
+            return f"{field} must not be empty"
+    return None
+
+def _insert_item_rows(cursor: sqlite3.Cursor, rows: List[tuple]) -> List[int]:
+    """ITEM_FIELDS 순서의 행들을 executemany로 추가하고 할당된 ID 반환
+    
+    쓰기 트랜잭션(잠금) 안에서 호출해야 AUTOINCREMENT ID가 연속으로 할당됩니다.
+    """
+    cursor.execute("""
+        SELECT MAX(COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'items'), 0),
+                   COALESCE((SELECT MAX(id) FROM items), 0))
+    """)
+    base_id = cursor.fetchone()[0]
+    cursor.executemany(
+        "INSERT INTO items (name, description, category, grid_position) VALUES (?, ?, ?, ?)", rows
+    )
+    item_ids = list(range(base_id + 1, base_id + 1 + len(rows)))
+    _write_item_cells(cursor, [(item_id, row[3]) for item_id, row in zip(item_ids, rows)])
+    return item_ids
+
+def _write_item_cells(cursor: sqlite3.Cursor, rows: Iterable[tuple]):
+    """(item_id, grid_position) 행들의 셀 색인을 새로 기록"""
+    rows = list(rows)
+    if not rows:
+        return
+    cursor.executemany("DELETE FROM item_cells WHERE item_id = ?", [(item_id,) for item_id, _ in rows])
+    cursor.executemany(
+        "INSERT OR IGNORE INTO item_cells (item_id, cell) VALUES (?, ?)",
+        [(item_id, cell) for item_id, position in rows for cell in expand_grid_position(position)]
+    )
+
+def _migrate_base_schema(cursor: sqlite3.Cursor):
+    """v1: 물품 테이블과 인벤토리 버전 카운터"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            grid_position TEXT NOT NULL,
+            category TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    # 인벤토리 버전 카운터 - 어느 프로세스에서 쓰든 트리거가 증가시킴
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS inventory_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO inventory_version (id, version) VALUES (1, 0)")
+    for operation in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS items_version_{operation.lower()}
+            AFTER {operation} ON items
+            BEGIN
+                UPDATE inventory_version SET version = version + 1 WHERE id = 1;
+            END
+        """)
+
+def _migrate_cell_index(cursor: sqlite3.Cursor):
+    """v2: 카테고리/이름 인덱스와 셀 -> 물품 역색인"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_category ON items (category)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_name ON items (name)")
+    
+    # grid_position을 개별 셀로 펼쳐 저장
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS item_cells (
+            item_id INTEGER NOT NULL,
+            cell TEXT NOT NULL,
+            PRIMARY KEY (cell, item_id)
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_item_cells_item ON item_cells (item_id)")
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS items_cells_delete
+        AFTER DELETE ON items
+        BEGIN
+            DELETE FROM item_cells WHERE item_id = OLD.id;
+        END
+    """)
+
+def _backfill_item_cells(cursor: sqlite3.Cursor, last_id: int, limit: int) -> Optional[int]:
+    """기존 물품의 셀 색인을 ID 순서로 채움"""
+    cursor.execute(
+        "SELECT id, grid_position FROM items WHERE id > ? ORDER BY id LIMIT ?", (last_id, limit)
+    )
+    rows = cursor.fetchall()
+    if not rows:
+        return None
+    _write_item_cells(cursor, rows)
+    return rows[-1][0]
+
+# 스키마 버전 목록 - 새 버전은 항상 끝에 추가하고, 적용된 항목은 수정하지 않음
+SCHEMA_MIGRATIONS = [
+    Migration(1, "base schema", _migrate_base_schema),
+    Migration(2, "category/name indexes and item_cells", _migrate_cell_index,
+              backfills=[Backfill("item_cells", _backfill_item_cells)]),
+]
+
+@dataclass
+class DatabaseConfig:
+    """SQLite 커넥션 PRAGMA 및 쓰기 큐 설정"""
+    journal_mode: str = "WAL"          # 읽기가 쓰기에 막히지 않음
+    synchronous: str = "NORMAL"        # WAL에서는 체크포인트 시에만 fsync
+    cache_size_kib: int = 16384        # 커넥션당 페이지 캐시 (16MB)
+    mmap_size: int = 128 * 1024 * 1024
+    busy_timeout_ms: int = 5000
+    use_write_queue: bool = True       # 단일 쓰기 스레드 + 그룹 커밋
+    write_batch_size: int = 256
+    write_batch_delay: float = 0.0      # 0이면 직전 커밋 중 쌓인 작업만 묶음
+    backfill_chunk_size: int = 1000    # 백필 트랜잭션 하나당 처리할 행 수
+    backfill_pause: float = 0.0        # 청크 사이 대기 시간(초)
+    backfill_in_background: bool = False
+
+class _ReaderHolder:
+    """스레드 로컬에 두는 읽기 커넥션 (스레드 종료를 weakref.finalize로 감지하기 위한 래퍼)"""
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+def _release_reader(conn: sqlite3.Connection, connections: List[sqlite3.Connection], lock: threading.Lock):
+    """종료된 스레드의 읽기 커넥션 정리 (ItemDatabase를 참조하지 않음)"""
+    with lock:
+        if conn in connections:
+            connections.remove(conn)
+    conn.close()
 
 class ItemDatabase:
-    def __init__(self, db_path: str = "items.db"):
+    def __init__(self, db_path: str = "items.db", version_check_interval: float = 1.0,
+                 config: Optional[DatabaseConfig] = None):
         self.db_path = db_path
+        self.config = config or DatabaseConfig()
+        
+        # 인벤토리 버전 캐시 (쓰기마다 트리거로 증가, ETag 생성에 사용)
+        self.version_check_interval = version_check_interval
+        self._version: Optional[int] = None
+        self._version_checked_at = 0.0
+        self._version_lock = threading.Lock()
+        
+        # 스레드별 읽기 커넥션 (WAL 모드에서는 쓰기와 동시에 읽기 가능)
+        self._local = threading.local()
+        self._read_connections: List[sqlite3.Connection] = []
+        self._read_connections_lock = threading.Lock()
+        
+        self.migrations = MigrationRunner(SCHEMA_MIGRATIONS)
         self.init_database()
+        
+        self.writer: Optional[WriteQueue] = None
+        if self.config.use_write_queue:
+            self.writer = WriteQueue(
+                lambda: self._connect(isolation_level=None, check_same_thread=False),
+                max_batch_size=self.config.write_batch_size,
+                max_batch_delay=self.config.write_batch_delay
+            )
+        
+        # 마이그레이션이 등록한 데이터 백필 (청크 단위, 필요 시 백그라운드)
+        self._backfill_stop = threading.Event()
+        self._backfill_thread: Optional[threading.Thread] = None
+        if self.config.backfill_in_background:
+            self._backfill_thread = threading.Thread(
+                target=self.run_backfills, args=(self._backfill_stop,),
+                name="sqlite-backfill", daemon=True
+            )
+            self._backfill_thread.start()
+        else:
+            self.run_backfills()
+    
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """PRAGMA가 적용된 새 커넥션 생성"""
+        conn = sqlite3.connect(self.db_path, timeout=self.config.busy_timeout_ms / 1000, **kwargs)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.config.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA synchronous = {self.config.synchronous}")
+        # 음수 값은 페이지 수가 아닌 KiB 단위
+        conn.execute(f"PRAGMA cache_size = -{int(self.config.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.config.mmap_size)}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
+    def _reader(self) -> sqlite3.Connection:
+        """현재 스레드의 읽기 커넥션 (최초 호출 시 생성 후 재사용)
+        
+        스레드가 끝나면 스레드 로컬의 holder가 사라지면서 커넥션을 닫습니다
+        (Streamlit 재실행, 스레드풀 워커처럼 짧게 사는 스레드가 커넥션을 쌓지 않도록).
+        """
+        holder = getattr(self._local, "reader", None)
+        if holder is None:
+            conn = self._connect(check_same_thread=False)
+            holder = self._local.reader = _ReaderHolder(conn)
+            with self._read_connections_lock:
+                self._read_connections.append(conn)
+            weakref.finalize(holder, _release_reader, conn, self._read_connections, self._read_connections_lock)
+        return holder.conn
+    
+    def close(self):
+        """쓰기 스레드를 종료하고 열린 커넥션을 모두 닫음
+        
+        닫은 뒤에도 인스턴스는 사용할 수 있으며, 쓰기는 호출 스레드에서 직접 실행됩니다.
+        """
+        self._backfill_stop.set()
+        if self._backfill_thread is not None:
+            self._backfill_thread.join()
+            self._backfill_thread = None
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        with self._read_connections_lock:
+            for conn in self._read_connections:
+                conn.close()
+            self._read_connections.clear()
+        self._local = threading.local()
     
     def init_database(self):
-        """데이터베이스 초기화 및 테이블 생성"""
-        conn = sqlite3.connect(self.db_path)
+        """스키마 마이그레이션 적용 및 샘플 데이터 추가"""
+        conn = self._connect(isolation_level=None)
         cursor = conn.cursor()
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                description TEXT NOT NULL,
-                grid_position TEXT NOT NULL,
-                category TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # 샘플 데이터 추가 (테이블이 비어있을 때만)
-        cursor.execute("SELECT COUNT(*) FROM items")
-        if cursor.fetchone()[0] == 0:
-            sample_items = [
-                ("노트북", "MacBook Pro 16인치", "A1-A2", "전자기기"),
-                ("마우스", "로지텍 무선 마우스", "A3", "전자기기"),
-                ("키보드", "기계식 키보드", "B1-B3", "전자기기"),
-                ("펜", "볼펜 (검은색)", "C1", "문구류"),
-                ("노트", "A4 노트", "C2-C3", "문구류"),
-                ("USB 케이블", "USB-C 케이블", "D1", "전자기기"),
-                ("헤드폰", "노이즈 캔슬링 헤드폰", "D2-D4", "전자기기"),
-                ("스마트폰", "iPhone 15 Pro", "E1", "전자기기"),
-                ("충전기", "스마트폰 충전기", "E2", "전자기기"),
-                ("책", "파이썬 프로그래밍", "F1-F2", "도서")
-            ]
+        try:
+            # journal_mode는 DB 파일에 영구 저장됨
+            cursor.execute(f"PRAGMA journal_mode = {self.config.journal_mode}").fetchall()
+            self.migrations.migrate(conn)
             
-            cursor.executemany("""
-                INSERT INTO items (name, description, grid_position, category)
-                VALUES (?, ?, ?, ?)
-            """, sample_items)
+            # 샘플 데이터 추가 (테이블이 비어있을 때만)
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT COUNT(*) FROM items")
+            if cursor.fetchone()[0] == 0:
+                sample_items = [
+                    ("노트북", "MacBook Pro 16인치", "A1-A2", "전자기기"),
+                    ("마우스", "로지텍 무선 마우스", "A3", "전자기기"),
+                    ("키보드", "기계식 키보드", "B1-B3", "전자기기"),
+                    ("펜", "볼펜 (검은색)", "C1", "문구류"),
+                    ("노트", "A4 노트", "C2-C3", "문구류"),
+                    ("USB 케이블", "USB-C 케이블", "D1", "전자기기"),
+                    ("헤드폰", "노이즈 캔슬링 헤드폰", "D2-D4", "전자기기"),
+                    ("스마트폰", "iPhone 15 Pro", "E1", "전자기기"),
+                    ("충전기", "스마트폰 충전기", "E2", "전자기기"),
+                    ("책", "파이썬 프로그래밍", "F1-F2", "도서")
+                ]
+                
+                cursor.executemany("""
+                    INSERT INTO items (name, description, grid_position, category)
+                    VALUES (?, ?, ?, ?)
+                """, sample_items)
+                cursor.execute("SELECT id, grid_position FROM items")
+                _write_item_cells(cursor, cursor.fetchall())
+            
+            version = self._fetch_version(cursor)
+            cursor.execute("COMMIT")
+            self._publish_version(version)
+        finally:
+            conn.close()
+    
+    def run_backfills(self, stop_event: Optional[threading.Event] = None) -> Dict[str, int]:
+        """남은 백필을 청크 단위 쓰기 트랜잭션으로 실행 (쓰기 큐를 통해 다른 쓰기와 번갈아 처리)"""
+        pending = self.migrations.pending_backfills(self._reader().cursor())
+        if not pending:
+            return {}
+        return self.migrations.run_backfills(
+            self._execute_write,
+            pending,
+            chunk_size=self.config.backfill_chunk_size,
+            pause=self.config.backfill_pause,
+            stop_event=stop_event
+        )
+    
+    def schema_version(self) -> int:
+        """현재 DB의 스키마 버전 (PRAGMA user_version)"""
+        return MigrationRunner.current_version(self._reader().cursor())
+    
+    @staticmethod
+    def _fetch_version(cursor: sqlite3.Cursor) -> int:
+        cursor.execute("SELECT version FROM inventory_version WHERE id = 1")
+        return cursor.fetchone()[0]
+    
+    def _read_version(self, cursor: sqlite3.Cursor) -> int:
+        """커밋된 버전 카운터를 읽어 캐시 갱신"""
+        return self._publish_version(self._fetch_version(cursor))
+    
+    def _publish_version(self, version: int) -> int:
+        """버전 캐시 갱신 - 쓰기는 COMMIT이 성공한 뒤에만 호출
+        
+        커밋 전에 올리면 그 사이 읽기가 이전 데이터를 새 ETag로 캐시할 수 있습니다.
+        """
+        with self._version_lock:
+            # 버전은 단조 증가 - 늦게 도착한 이전 값으로 되돌리지 않음
+            if self._version is None or version > self._version:
+                self._version = version
+            self._version_checked_at = time.monotonic()
+            return self._version
+    
+    def health(self) -> Dict[str, Any]:
+        """가벼운 상태 확인 (SELECT 1 왕복 시간과 쓰기 스레드 상태)"""
+        started = time.perf_counter()
+        self._reader().execute("SELECT 1").fetchone()
+        result: Dict[str, Any] = {
+            "ok": True,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+            "schema_version": self.schema_version(),
+        }
+        if self.writer is not None:
+            result["write_queue"] = {"alive": self.writer.is_alive(), **self.writer.stats()}
+            result["ok"] = self.writer.is_alive()
+        return result
+    
+    def get_inventory_version(self) -> int:
+        """현재 인벤토리 버전 반환
+        
+        이 인스턴스를 통한 쓰기는 즉시 반영되고, 다른 프로세스의 쓰기는
+        version_check_interval 초 이내에 반영됩니다. 그 사이에는 DB를 읽지 않습니다.
+        """
+        with self._version_lock:
+            if (self._version is not None and
+                    time.monotonic() - self._version_checked_at < self.version_check_interval):
+                return self._version
+        
+        return self._read_version(self._reader().cursor())
+    
+    def _execute_write(self, operation: Callable[[sqlite3.Cursor], Any]) -> Any:
+        """쓰기 작업을 하나의 트랜잭션에서 실행하고 커밋될 때까지 대기
         
-        conn.commit()
-        conn.close()
+        쓰기 큐가 켜져 있으면 전용 쓰기 스레드가 다른 작업과 묶어 한 번에 커밋합니다.
+        operation이 예외를 던지면 해당 작업의 변경만 롤백되고 예외가 전달됩니다.
+        버전 캐시는 커밋이 성공한 뒤에 갱신합니다 (쓰기 큐는 커밋 후에만 결과를 전달).
+        """
+        def run(cursor: sqlite3.Cursor):
+            result = operation(cursor)
+            return result, self._fetch_version(cursor)
+        
+        if self.writer is not None:
+            result, version = self.writer.execute(run)
+            self._publish_version(version)
+            return result
+        
+        conn = self._connect(isolation_level=None)
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                result, version = run(cursor)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            self._publish_version(version)
+            return result
+        finally:
+            conn.close()
     
+    @_instrumented
     def search_items(self, query: str, category: Optional[str] = None) -> List[Dict]:
         """물품 검색"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._reader().cursor()
         
         sql = """
             SELECT id, name, description, grid_position, category, created_at, updated_at
@@ -67,7 +495,6 @@ class ItemDatabase:
         
         cursor.execute(sql, params)
         rows = cursor.fetchall()
-        conn.close()
         
         items = []
         for row in rows:
@@ -83,14 +510,13 @@ class ItemDatabase:
         
         return items
     
+    @_instrumented
     def get_item_by_id(self, item_id: int) -> Optional[Dict]:
         """특정 ID의 물품 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._reader().cursor()
         
         cursor.execute("SELECT * FROM items WHERE id = ?", (item_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -104,27 +530,25 @@ class ItemDatabase:
             }
         return None
     
+    @_instrumented
     def add_item(self, name: str, description: Optional[str], category: str, grid_position: str) -> int:
         """새 물품 추가"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "INSERT INTO items (name, description, category, grid_position) VALUES (?, ?, ?, ?)",
-            (name, description, category, grid_position)
-        )
-        
-        item_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        def insert(cursor: sqlite3.Cursor) -> int:
+            cursor.execute(
+                "INSERT INTO items (name, description, category, grid_position) VALUES (?, ?, ?, ?)",
+                (name, description, category, grid_position)
+            )
+            _write_item_cells(cursor, [(cursor.lastrowid, grid_position)])
+            return cursor.lastrowid
         
-        return item_id
+        return self._execute_write(insert)
     
+    @_instrumented
     def update_item(self, item_id: int, **kwargs) -> bool:
         """물품 정보 수정"""
         if not kwargs:
             return False
-            
+        
         # SET 절 구성
         set_clauses = []
         values = []
@@ -140,28 +564,222 @@ class ItemDatabase:
         query = f"UPDATE items SET {', '.join(set_clauses)} WHERE id = ?"
         values.append(item_id)
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(query, values)
-        conn.commit()
-        conn.close()
+        def update(cursor: sqlite3.Cursor) -> bool:
+            cursor.execute(query, values)
+            updated = cursor.rowcount > 0
+            if updated and kwargs.get('grid_position') is not None:
+                _write_item_cells(cursor, [(item_id, kwargs['grid_position'])])
+            return updated
         
-        return cursor.rowcount > 0
+        return self._execute_write(update)
     
+    @_instrumented
     def delete_item(self, item_id: int) -> bool:
         """물품 삭제"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM items WHERE id = ?", (item_id,))
-        conn.commit()
-        conn.close()
+        def delete(cursor: sqlite3.Cursor) -> bool:
+            cursor.execute("DELETE FROM items WHERE id = ?", (item_id,))
+            return cursor.rowcount > 0
         
-        return cursor.rowcount > 0
+        return self._execute_write(delete)
     
+    def _existing_ids(self, cursor: sqlite3.Cursor, item_ids: List[int]) -> set:
+        """주어진 ID 중 실제로 존재하는 ID 집합"""
+        existing = set()
+        for start in range(0, len(item_ids), SQL_CHUNK_SIZE):
+            chunk = item_ids[start:start + SQL_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(f"SELECT id FROM items WHERE id IN ({placeholders})", chunk)
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+    
+    def _drop_missing(self, cursor: sqlite3.Cursor, results: List[Dict], indices: List[int],
+                      item_ids: List[int], atomic: bool) -> List[int]:
+        """트랜잭션 안에서 존재하지 않는 ID의 행을 실패 처리하고 제외"""
+        existing = self._existing_ids(cursor, item_ids)
+        remaining = []
+        for index, item_id in zip(indices, item_ids):
+            if item_id in existing:
+                remaining.append(index)
+            else:
+                results[index]["success"] = False
+                results[index]["error"] = "Item not found"
+        
+        if atomic and len(remaining) != len(indices):
+            raise sqlite3.IntegrityError("Item not found")
+        return remaining
+    
+    def _run_bulk(self, results: List[Dict], pending: List[int], atomic: bool, apply) -> List[Dict]:
+        """검증을 통과한 행(pending)을 하나의 트랜잭션에서 적용
+        
+        apply(cursor, indices)는 executemany로 행들을 적용합니다.
+        atomic=True이면 하나라도 실패할 때 전체를 롤백하고,
+        best-effort 모드에서는 executemany 실패 시 SAVEPOINT로 행 단위 재시도합니다.
+        """
+        if atomic and any(not r["success"] for r in results):
+            for r in results:
+                if r["success"]:
+                    r["success"] = False
+                    r["error"] = "rolled back"
+            return results
+        
+        if not pending:
+            return results
+        
+        def operation(cursor: sqlite3.Cursor):
+            cursor.execute("SAVEPOINT bulk_batch")
+            try:
+                apply(cursor, pending)
+                cursor.execute("RELEASE bulk_batch")
+                return
+            except sqlite3.Error:
+                cursor.execute("ROLLBACK TO bulk_batch")
+                cursor.execute("RELEASE bulk_batch")
+                if atomic:
+                    raise
+            
+            # 실패한 행만 골라내기 위해 행 단위 재시도
+            for index in pending:
+                results[index]["success"] = True
+                results[index]["error"] = None
+                cursor.execute("SAVEPOINT bulk_row")
+                try:
+                    apply(cursor, [index])
+                    cursor.execute("RELEASE bulk_row")
+                except sqlite3.Error as row_error:
+                    cursor.execute("ROLLBACK TO bulk_row")
+                    cursor.execute("RELEASE bulk_row")
+                    results[index]["success"] = False
+                    results[index]["error"] = str(row_error)
+                    results[index].pop("id", None)
+        
+        try:
+            self._execute_write(operation)
+        except sqlite3.Error as e:
+            for r in results:
+                r["success"] = False
+                r["error"] = r.get("error") or f"rolled back: {e}"
+                r.pop("id", None)
+        
+        return results
+    
+    @_instrumented
+    def add_items_bulk(self, rows: List[Dict[str, Any]], atomic: bool = True) -> List[Dict]:
+        """여러 물품을 하나의 트랜잭션으로 추가
+        
+        Returns:
+            행별 결과 [{"index", "success", "id" 또는 "error"}]
+        """
+        results = []
+        pending = []
+        for index, row in enumerate(rows):
+            error = validate_item_row(row)
+            results.append({"index": index, "success": error is None, "error": error})
+            if error is None:
+                pending.append(index)
+        
+        def apply(cursor: sqlite3.Cursor, indices: List[int]):
+            item_ids = _insert_item_rows(cursor, [tuple(rows[i][field] for field in ITEM_FIELDS) for i in indices])
+            for i, item_id in zip(indices, item_ids):
+                results[i]["id"] = item_id
+        
+        return self._run_bulk(results, pending, atomic, apply)
+    
+    @_instrumented
+    def update_items_bulk(self, updates: List[Dict[str, Any]], atomic: bool = True) -> List[Dict]:
+        """여러 물품을 하나의 트랜잭션으로 수정 (각 항목은 id와 변경할 필드 포함)"""
+        results = []
+        candidates = []
+        for index, update in enumerate(updates):
+            fields = {k: v for k, v in update.items() if k in ITEM_FIELDS and v is not None}
+            error = None
+            if not isinstance(update.get("id"), int):
+                error = "id is required"
+            elif not fields:
+                error = "no fields to update"
+            else:
+                error = validate_item_row(fields, partial=True)
+            results.append({"index": index, "id": update.get("id"), "success": error is None, "error": error})
+            if error is None:
+                candidates.append(index)
+        
+        def apply(cursor: sqlite3.Cursor, indices: List[int]):
+            indices = self._drop_missing(cursor, results, indices, [updates[i]["id"] for i in indices], atomic)
+            
+            # 같은 필드 조합끼리 묶어 executemany
+            groups: Dict[tuple, List[tuple]] = {}
+            for i in indices:
+                fields = tuple(f for f in ITEM_FIELDS if updates[i].get(f) is not None)
+                groups.setdefault(fields, []).append(
+                    tuple(updates[i][f] for f in fields) + (updates[i]["id"],)
+                )
+            for fields, params in groups.items():
+                set_clause = ", ".join(f"{f} = ?" for f in fields)
+                cursor.executemany(f"UPDATE items SET {set_clause} WHERE id = ?", params)
+            _write_item_cells(cursor, [
+                (updates[i]["id"], updates[i]["grid_position"])
+                for i in indices if updates[i].get("grid_position") is not None
+            ])
+        
+        return self._run_bulk(results, candidates, atomic, apply)
+    
+    @_instrumented
+    def delete_items_bulk(self, item_ids: Iterable[int], atomic: bool = True) -> List[Dict]:
+        """여러 물품을 하나의 트랜잭션으로 삭제"""
+        item_ids = list(item_ids)
+        results = [
+            {"index": index, "id": item_id, "success": True, "error": None}
+            for index, item_id in enumerate(item_ids)
+        ]
+        
+        def apply(cursor: sqlite3.Cursor, indices: List[int]):
+            indices = self._drop_missing(cursor, results, indices, [item_ids[i] for i in indices], atomic)
+            cursor.executemany("DELETE FROM items WHERE id = ?", [(item_ids[i],) for i in indices])
+        
+        return self._run_bulk(results, list(range(len(item_ids))), atomic, apply)
+    
+    @_instrumented
+    def insert_item_rows(self, rows: List[tuple]) -> List[int]:
+        """검증된 (name, description, category, grid_position) 행들을 한 트랜잭션으로 추가
+        
+        대량 가져오기용 - 행별 결과 딕셔너리를 만들지 않습니다.
+        """
+        if not rows:
+            return []
+        return self._execute_write(lambda cursor: _insert_item_rows(cursor, rows))
+    
+    def iter_items(self, batch_size: int = 1000) -> Iterator[Dict]:
+        """모든 물품을 ID 순서로 스트리밍 (fetchmany로 메모리 사용량 일정)
+        
+        전용 커넥션을 사용하므로 다른 스레드에서 이어서 소비해도 됩니다.
+        """
+        conn = self._connect(check_same_thread=False)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, name, description, grid_position, category, created_at, updated_at
+                FROM items ORDER BY id
+            """)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield {
+                        'id': row[0],
+                        'name': row[1],
+                        'description': row[2],
+                        'grid_position': row[3],
+                        'category': row[4],
+                        'created_at': row[5],
+                        'updated_at': row[6]
+                    }
+        finally:
+            conn.close()
+    
+    @_instrumented
     def get_all_items(self) -> List[Dict]:
         """모든 물품 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._reader().cursor()
         
         cursor.execute("""
             SELECT id, name, description, grid_position, category, created_at, updated_at
@@ -169,7 +787,6 @@ class ItemDatabase:
         """)
         
         rows = cursor.fetchall()
-        conn.close()
         
         items = []
         for row in rows:
@@ -185,16 +802,53 @@ class ItemDatabase:
         
         return items
     
+    @_instrumented
     def get_categories(self) -> List[str]:
         """모든 카테고리 조회"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._reader().cursor()
         
         cursor.execute("SELECT DISTINCT category FROM items WHERE category IS NOT NULL")
         rows = cursor.fetchall()
-        conn.close()
         
         return [row[0] for row in rows]
+    
+    @_instrumented
+    def get_items_at(self, cell: str) -> List[Dict]:
+        """특정 셀을 차지하는 물품 조회 (셀 역색인 사용)"""
+        cursor = self._reader().cursor()
+        
+        cursor.execute("""
+            SELECT i.id, i.name, i.description, i.grid_position, i.category, i.created_at, i.updated_at
+            FROM item_cells c JOIN items i ON i.id = c.item_id
+            WHERE c.cell = ?
+            ORDER BY i.name
+        """, (normalize_cell(cell),))
+        rows = cursor.fetchall()
+        
+        return [
+            {
+                'id': row[0],
+                'name': row[1],
+                'description': row[2],
+                'grid_position': row[3],
+                'category': row[4],
+                'created_at': row[5],
+                'updated_at': row[6]
+            }
+            for row in rows
+        ]
+    
+    @_instrumented
+    def get_occupancy_map(self) -> Dict[str, List[int]]:
+        """셀별 물품 ID 목록 (그리드 렌더링/위치 충돌 확인용)"""
+        cursor = self._reader().cursor()
+        
+        cursor.execute("SELECT cell, item_id FROM item_cells ORDER BY cell, item_id")
+        occupancy: Dict[str, List[int]] = {}
+        for cell, item_id in cursor.fetchall():
+            occupancy.setdefault(cell, []).append(item_id)
+        
+        return occupancy
 
 if __name__ == "__main__":
     # 데이터베이스 초기화 테스트
@@ -0,0 +1,165 @@
+"""
+SQLite 스키마 마이그레이션
+PRAGMA user_version으로 적용된 스키마 버전을 추적하고, 시작 시 남은 마이그레이션을
+순서대로 하나씩 트랜잭션으로 적용합니다. 대용량 데이터 변환은 마이그레이션에서
+백필(backfill)로 등록해 두고, 짧은 트랜잭션 여러 개로 나누어 온라인으로 처리합니다.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# (cursor, 마지막으로 처리한 키, 청크 크기) -> 이번 청크의 마지막 키 (더 없으면 None)
+BackfillChunk = Callable[[sqlite3.Cursor, int, int], Optional[int]]
+
+@dataclass(frozen=True)
+class Backfill:
+    """청크 단위로 나누어 실행하는 데이터 보정 작업"""
+    name: str
+    process_chunk: BackfillChunk
+
+@dataclass(frozen=True)
+class Migration:
+    """스키마 버전 하나
+    
+    apply는 IF NOT EXISTS 등을 사용해 여러 번 실행해도 안전해야 합니다.
+    backfills는 스키마 변경과 같은 트랜잭션에서 등록되고 이후 run_backfills로 처리됩니다.
+    """
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Cursor], None]
+    backfills: Sequence[Backfill] = ()
+
+class MigrationRunner:
+    """순서가 정해진 마이그레이션 목록을 적용"""
+    
+    def __init__(self, migrations: Sequence[Migration]):
+        versions = [m.version for m in migrations]
+        if versions != list(range(1, len(versions) + 1)):
+            raise ValueError(f"마이그레이션 버전은 1부터 연속이어야 합니다: {versions}")
+        
+        self.migrations = list(migrations)
+        self._backfills: Dict[str, Backfill] = {
+            b.name: b for m in self.migrations for b in m.backfills
+        }
+    
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+    
+    @staticmethod
+    def current_version(cursor: sqlite3.Cursor) -> int:
+        return cursor.execute("PRAGMA user_version").fetchone()[0]
+    
+    def migrate(self, conn: sqlite3.Connection) -> List[int]:
+        """남은 마이그레이션 적용 (conn은 isolation_level=None 커넥션)
+        
+        각 마이그레이션은 BEGIN IMMEDIATE 트랜잭션 안에서 버전을 다시 확인한 뒤 적용하므로
+        여러 프로세스가 동시에 시작해도 한 번만 적용됩니다.
+        
+        Returns:
+            이번에 적용한 버전 목록
+        """
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_backfills (
+                name TEXT PRIMARY KEY,
+                last_key INTEGER NOT NULL DEFAULT 0,
+                completed_at TIMESTAMP
+            )
+        """)
+        
+        current = self.current_version(cursor)
+        if current > self.latest_version:
+            raise RuntimeError(
+                f"데이터베이스 스키마 버전({current})이 지원하는 버전({self.latest_version})보다 높습니다"
+            )
+        
+        applied = []
+        for migration in self.migrations:
+            if migration.version <= current:
+                continue
+            
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                if self.current_version(cursor) >= migration.version:
+                    cursor.execute("COMMIT")
+                    continue
+                
+                migration.apply(cursor)
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO schema_backfills (name) VALUES (?)",
+                    [(b.name,) for b in migration.backfills]
+                )
+                # user_version은 트랜잭션과 함께 커밋/롤백됨
+                cursor.execute(f"PRAGMA user_version = {int(migration.version)}")
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            
+            logger.info(f"스키마 마이그레이션 적용: v{migration.version} {migration.name}")
+            applied.append(migration.version)
+            current = migration.version
+        
+        return applied
+    
+    def pending_backfills(self, cursor: sqlite3.Cursor) -> List[str]:
+        """완료되지 않은 백필 이름 (등록 순서)"""
+        cursor.execute("SELECT name FROM schema_backfills WHERE completed_at IS NULL ORDER BY rowid")
+        return [row[0] for row in cursor.fetchall() if row[0] in self._backfills]
+    
+    def run_backfills(self, execute: Callable[[Callable[[sqlite3.Cursor], Any]], Any],
+                      pending: Sequence[str], chunk_size: int = 1000, pause: float = 0.0,
+                      stop_event: Optional[threading.Event] = None) -> Dict[str, int]:
+        """백필을 청크 단위 트랜잭션으로 실행
+        
+        Args:
+            execute: cursor를 받는 작업을 하나의 쓰기 트랜잭션에서 실행하는 함수
+            pending: 실행할 백필 이름 (pending_backfills 결과)
+            chunk_size: 트랜잭션 하나에서 처리할 최대 행 수
+            pause: 청크 사이 대기 시간(초) - 다른 쓰기에 잠금을 양보
+            stop_event: 설정되면 현재 청크까지만 처리하고 중단 (진행 상황은 저장됨)
+        
+        Returns:
+            백필별 처리한 청크 수
+        """
+        chunks: Dict[str, int] = {}
+        
+        for name in pending:
+            backfill = self._backfills[name]
+            chunks[name] = 0
+            
+            def step(cursor: sqlite3.Cursor) -> bool:
+                row = cursor.execute(
+                    "SELECT last_key, completed_at FROM schema_backfills WHERE name = ?", (name,)
+                ).fetchone()
+                if row is None or row[1] is not None:
+                    return True
+                
+                last_key = backfill.process_chunk(cursor, row[0], chunk_size)
+                if last_key is None:
+                    cursor.execute(
+                        "UPDATE schema_backfills SET completed_at = CURRENT_TIMESTAMP WHERE name = ?", (name,)
+                    )
+                    return True
+                cursor.execute("UPDATE schema_backfills SET last_key = ? WHERE name = ?", (last_key, name))
+                return False
+            
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    return chunks
+                done = execute(step)
+                chunks[name] += 1
+                if done:
+                    logger.info(f"백필 완료: {name} ({chunks[name]}개 청크)")
+                    break
+                if pause:
+                    time.sleep(pause)
+        
+        return chunks
@@ -0,0 +1,207 @@
+"""
+SQLite 단일 쓰기 스레드 (그룹 커밋)
+모든 쓰기 작업을 하나의 전용 스레드/커넥션으로 직렬화합니다.
+대기 중인 작업들을 한 트랜잭션으로 묶어 커밋(fsync)을 한 번만 수행하고,
+여러 작업이 묶이면 작업마다 SAVEPOINT를 두어 한 작업의 실패가 같은 배치의 다른 작업에 영향을 주지 않습니다.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+WriteOperation = Callable[[sqlite3.Cursor], Any]
+
+_STOP = object()
+
+DB_WRITE_WAIT = registry.histogram("db_write_queue_wait_seconds", "쓰기 작업이 큐에서 실행을 기다린 시간")
+DB_WRITE_PENDING = registry.gauge("db_write_queue_pending", "실행을 기다리는 쓰기 작업 수")
+DB_COMMIT_DURATION = registry.histogram("db_write_batch_duration_seconds", "쓰기 배치 실행과 커밋 시간")
+DB_WRITE_BATCH_SIZE = registry.histogram(
+    "db_write_batch_size", "한 번에 커밋한 쓰기 작업 수", buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256)
+)
+
+class WriteQueue:
+    """쓰기 작업 큐와 전용 쓰기 스레드"""
+    
+    def __init__(self, connect: Callable[[], sqlite3.Connection],
+                 max_batch_size: int = 256, max_batch_delay: float = 0.0,
+                 name: str = "sqlite-writer"):
+        """
+        Args:
+            connect: 자동 커밋 모드(isolation_level=None) 커넥션을 반환하는 함수
+            max_batch_size: 한 트랜잭션에 묶을 최대 작업 수
+            max_batch_delay: 첫 작업 이후 추가 작업을 기다리는 최대 시간(초)
+        """
+        self._connect = connect
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        
+        # 통계
+        self.batches = 0
+        self.operations = 0
+        self.largest_batch = 0
+        
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    
+    def submit(self, operation: WriteOperation) -> Future:
+        """쓰기 작업 제출 (결과는 Future로 전달)"""
+        if self._closed:
+            raise RuntimeError("WriteQueue가 이미 닫혔습니다")
+        
+        future: Future = Future()
+        DB_WRITE_PENDING.inc()
+        self._queue.put((operation, future, time.perf_counter()))
+        return future
+    
+    def execute(self, operation: WriteOperation, timeout: Optional[float] = None) -> Any:
+        """쓰기 작업 제출 후 커밋될 때까지 대기"""
+        return self.submit(operation).result(timeout)
+    
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self._queue.qsize(),
+            "batches": self.batches,
+            "operations": self.operations,
+            "largest_batch": self.largest_batch,
+            "avg_batch": round(self.operations / self.batches, 2) if self.batches else 0.0
+        }
+    
+    def close(self, timeout: float = 5.0):
+        """남은 작업을 모두 커밋한 뒤 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+    
+    def _collect_batch(self, first) -> Tuple[List, bool]:
+        """첫 작업 이후 대기 중인 작업을 모아 배치 구성"""
+        batch = [first]
+        stop = False
+        deadline = time.monotonic() + self.max_batch_delay
+        
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stop = True
+                break
+            batch.append(item)
+        
+        return batch, stop
+    
+    def _run(self):
+        conn = self._connect()
+        try:
+            while True:
+                first = self._queue.get()
+                if first is _STOP:
+                    break
+                
+                batch, stop = self._collect_batch(first)
+                self._commit_batch(conn, batch)
+                if stop:
+                    break
+            
+            # 종료 요청 이후 남은 작업 처리
+            leftovers = []
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not _STOP:
+                    leftovers.append(item)
+            if leftovers:
+                self._commit_batch(conn, leftovers)
+        finally:
+            conn.close()
+    
+    def _commit_batch(self, conn: sqlite3.Connection, batch: List):
+        """배치 실행 및 대기/커밋 시간 기록"""
+        started = time.perf_counter()
+        DB_WRITE_PENDING.dec(len(batch))
+        for _, _, submitted_at in batch:
+            DB_WRITE_WAIT.observe(started - submitted_at)
+        batch = [(operation, future) for operation, future, _ in batch]
+        
+        try:
+            self._execute_batch(conn, batch)
+        finally:
+            DB_COMMIT_DURATION.observe(time.perf_counter() - started)
+            DB_WRITE_BATCH_SIZE.observe(len(batch))
+    
+    def _execute_batch(self, conn: sqlite3.Connection, batch: List):
+        """배치를 하나의 트랜잭션으로 실행하고 커밋"""
+        cursor = conn.cursor()
+        outcomes = []
+        
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            for _, future in batch:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+            return
+        
+        batch = [(operation, future) for operation, future in batch
+                 if future.set_running_or_notify_cancel()]
+        
+        # SAVEPOINT는 변경되는 페이지마다 원본을 보관하므로 대량 쓰기에서 비용이 큼 -
+        # 작업이 하나뿐이면 트랜잭션 전체 롤백으로 충분
+        if len(batch) == 1:
+            operation, future = batch[0]
+            try:
+                outcomes.append((future, operation(cursor), None))
+            except Exception as e:
+                cursor.execute("ROLLBACK")
+                future.set_exception(e)
+                return
+        else:
+            for operation, future in batch:
+                cursor.execute("SAVEPOINT write_op")
+                try:
+                    result = operation(cursor)
+                    cursor.execute("RELEASE write_op")
+                    outcomes.append((future, result, None))
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO write_op")
+                    cursor.execute("RELEASE write_op")
+                    outcomes.append((future, None, e))
+        
+        try:
+            cursor.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"그룹 커밋 실패: {e}")
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            for future, _, _ in outcomes:
+                future.set_exception(e)
+            return
+        
+        self.batches += 1
+        self.operations += len(outcomes)
+        self.largest_batch = max(self.largest_batch, len(outcomes))
+        
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
@@ -4,13 +4,15 @@
 FastMCP를 사용하여 물품 조회 기능을 제공합니다.
 """
 
+import asyncio
 import json
 from typing import List, Optional, Dict, Any
 from fastmcp import FastMCP
 from pydantic import BaseModel
-from database import ItemDatabase
-from models import Item, ItemSearch, ItemResponse, LEDControl
-from esp32_controller import create_esp32_controller
+from ..database.database import ItemDatabase, parse_grid_position
+from ..models.models import Item, ItemSearch, ItemResponse, LEDControl
+from ..controllers.esp32_controller import create_esp32_controller
+from ..controllers.led_queue import LEDJobQueue, PRIORITY_INTERACTIVE
 
 # MCP 서버 초기화
 mcp = FastMCP("Item Management System")
@@ -20,6 +22,7 @@ db = ItemDatabase()
 
 # ESP32 컨트롤러 인스턴스 (시뮬레이션 모드)
 esp32_controller = create_esp32_controller(simulation_mode=True)
+led_jobs = LEDJobQueue(esp32_controller.highlight_position)
 
 class SearchItemsArgs(BaseModel):
     """물품 검색 도구 인자"""
@@ -44,6 +47,14 @@ class HighlightItemLocationArgs(BaseModel):
     duration: Optional[int] = 5
     color: Optional[str] = "blue"
 
+class GetLEDJobArgs(BaseModel):
+    """LED 작업 조회 도구 인자"""
+    job_id: str
+
+class GetHardwareStatusArgs(BaseModel):
+    """LED 하드웨어 상태 조회 도구 인자"""
+    pass
+
 @mcp.tool()
 def search_items(args: SearchItemsArgs) -> Dict[str, Any]:
     """
@@ -177,37 +188,34 @@ async def highlight_item_location(args: HighlightItemLocationArgs) -> Dict[str,
         LED 제어 결과
     """
     try:
-        item = db.get_item_by_id(args.item_id)
+        row = db.get_item_by_id(args.item_id)
         
-        if not item:
+        if not row:
             return {
                 "success": False,
                 "error": "Item not found",
                 "message": f"ID {args.item_id}에 해당하는 물품을 찾을 수 없습니다."
             }
-        
-        # 그리드 위치 파싱 (예: "A1-A4" -> ["A1", "A2", "A3", "A4"])
-        positions = parse_grid_position(item.grid_position)
+        item = Item(**row)
         
         led_control = LEDControl(
-            positions=positions,
+            grid_position=item.grid_position,
             duration=args.duration,
             color=args.color
         )
         
-        # ESP32 LED 제어 실행
-        esp32_result = await esp32_controller.control_leds(led_control)
+        # LED 작업 접수 후 즉시 반환 (get_led_job으로 결과 조회)
+        job = led_jobs.submit(led_control, PRIORITY_INTERACTIVE)
         
         return {
-            "success": esp32_result.get("success", False),
+            "success": True,
             "data": {
                 "item": item.model_dump(),
                 "led_control": led_control.model_dump(),
-                "positions": positions,
-                "esp32_result": esp32_result.get("data", {})
+                "positions": parse_grid_position(item.grid_position),
+                "job": job.to_dict()
             },
-            "message": esp32_result.get("message", f"물품 '{item.name}'의 위치({item.grid_position}) LED 제어를 시도했습니다."),
-            "esp32_status": esp32_result
+            "message": f"물품 '{item.name}'의 위치({item.grid_position}) LED 표시를 요청했습니다."
         }
     except Exception as e:
         return {
@@ -216,37 +224,51 @@ async def highlight_item_location(args: HighlightItemLocationArgs) -> Dict[str,
             "message": "LED 제어 중 오류가 발생했습니다."
         }
 
-def parse_grid_position(grid_position: str) -> List[str]:
-    """
-    그리드 위치 문자열을 개별 위치 리스트로 파싱합니다.
-    
-    예시:
-    - "A1" -> ["A1"]
-    - "A1-A4" -> ["A1", "A2", "A3", "A4"]
-    - "B2-B3" -> ["B2", "B3"]
+@mcp.tool()
+async def get_led_job(args: GetLEDJobArgs) -> Dict[str, Any]:
     """
-    if "-" not in grid_position:
-        return [grid_position]
+    LED 작업 상태를 조회합니다.
     
-    start_pos, end_pos = grid_position.split("-")
-    
-    # 문자와 숫자 분리
-    start_letter = start_pos[0]
-    start_number = int(start_pos[1:])
-    end_letter = end_pos[0]
-    end_number = int(end_pos[1:])
+    Args:
+        job_id: highlight_item_location이 반환한 작업 ID
     
-    positions = []
+    Returns:
+        작업 상태 (queued, running, succeeded, failed)와 컨트롤러 결과
+    """
+    job = led_jobs.get(args.job_id)
+    if job is None:
+        return {
+            "success": False,
+            "error": "Job not found",
+            "message": f"작업 {args.job_id}을(를) 찾을 수 없습니다."
+        }
+    return {"success": True, "data": job.to_dict()}
+
+@mcp.tool()
+async def get_hardware_status(args: GetHardwareStatusArgs) -> Dict[str, Any]:
+    """
+    LED 하드웨어 상태를 조회합니다 (백그라운드 확인의 캐시, 하드웨어에 요청하지 않음).
     
-    if start_letter == end_letter:
-        # 같은 행에서 범위
-        for i in range(start_number, end_number + 1):
-            positions.append(f"{start_letter}{i}")
+    Returns:
+        연결 여부(reachable), 왕복 시간(rtt_ms), 켜진 LED 수, 마지막 오류, 마지막 확인 후 지난 시간(age)
+    """
+    # 첫 호출 때 서버 이벤트 루프에서 확인 시작 (LED 명령과 같은 연결 사용)
+    poller = esp32_controller.health.start(asyncio.get_running_loop())
+    deadline = asyncio.get_running_loop().time() + poller.timeout
+    while poller.checks == 0 and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.05)
+    health = poller.snapshot()
+    if health["checked_at"] is None:
+        message = "하드웨어 상태를 확인하는 중입니다. 잠시 후 다시 조회하세요."
+    elif health["reachable"]:
+        message = f"LED 하드웨어 연결 정상 (왕복 {health['rtt_ms']}ms, 켜진 LED {health['active_leds']}개)"
     else:
-        # 다른 행으로 확장 (복잡한 경우는 단순화)
-        positions = [start_pos, end_pos]
-    
-    return positions
+        message = f"LED 하드웨어에 연결할 수 없습니다: {health['last_error']}"
+    return {
+        "success": True,
+        "data": {"controller": type(esp32_controller).__name__, **health},
+        "message": message
+    }
 
 if __name__ == "__main__":
     # MCP 서버 실행
@@ -257,6 +279,8 @@ if __name__ == "__main__":
     print("- get_all_items: 모든 물품 조회")
     print("- get_categories: 카테고리 조회")
     print("- highlight_item_location: 물품 위치 LED 강조")
+    print("- get_led_job: LED 작업 상태 조회")
+    print("- get_hardware_status: LED 하드웨어 상태 조회")
     
     # FastMCP 서버 실행 (기본 STDIO 모드)
     mcp.run()
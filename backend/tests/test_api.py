@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+REST API 테스트
+FastAPI TestClient로 엔드포인트 동작을 확인합니다.
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# 테스트용 임시 데이터베이스 사용
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test_items.db')}")
+
+from fastapi.testclient import TestClient
+
+from backend.api import rest_api
+
+@pytest.fixture
+def client():
+    with TestClient(rest_api.app) as client:
+        yield client
+
+@pytest.mark.parametrize("path", ["/items", "/categories", "/items/1"])
+def test_conditional_get_returns_304(client, path, monkeypatch):
+    """If-None-Match 일치 시 DB를 건드리지 않고 304"""
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('"')
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("304 응답은 DB를 조회하지 않아야 합니다")
+    
+    monkeypatch.setattr(rest_api.db, "get_all_items", fail)
+    monkeypatch.setattr(rest_api.db, "get_categories", fail)
+    monkeypatch.setattr(rest_api.db, "get_item_by_id", fail)
+    
+    second = client.get(path, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+
+def test_write_invalidates_etag(client):
+    """쓰기 후에는 ETag가 바뀌고 새 목록을 반환"""
+    first = client.get("/items")
+    etag = first.headers["etag"]
+    
+    created = client.post("/items", json={
+        "name": "ETag 테스트",
+        "description": "버전 증가 확인",
+        "category": "테스트",
+        "grid_position": "E7"
+    }).json()
+    
+    second = client.get("/items", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.headers["etag"] != etag
+    assert any(item["id"] == created["id"] for item in second.json())
+    
+    client.delete(f"/items/{created['id']}")
+
+def test_missing_item_returns_404(client):
+    response = client.get("/items/999999")
+    assert response.status_code == 404
+
+def test_bulk_create_update_delete(client):
+    """일괄 엔드포인트: 행별 결과와 모드"""
+    created = client.post("/items/bulk", json={
+        "items": [
+            {"name": f"일괄 {i}", "description": "일괄 추가", "category": "일괄", "grid_position": "D1"}
+            for i in range(3)
+        ]
+    })
+    assert created.status_code == 200
+    body = created.json()
+    assert body["succeeded"] == 3 and body["failed"] == 0
+    ids = [r["id"] for r in body["results"]]
+    
+    updated = client.put("/items/bulk", json={
+        "items": [{"id": ids[0], "grid_position": "D2"}, {"id": 999999, "name": "없음"}],
+        "mode": "best_effort"
+    }).json()
+    assert updated["succeeded"] == 1 and updated["failed"] == 1
+    assert client.get(f"/items/{ids[0]}").json()["grid_position"] == "D2"
+    
+    deleted = client.request("DELETE", "/items/bulk", json={"ids": ids}).json()
+    assert deleted["succeeded"] == 3
+    assert client.get(f"/items/{ids[1]}").status_code == 404
+
+def test_grid_occupancy_endpoints(client):
+    """셀 점유 현황과 셀별 물품 조회"""
+    created = client.post("/items", json={
+        "name": "점퍼선", "description": "M-M 점퍼선", "category": "전자부품", "grid_position": "K1-K2"
+    }).json()
+    
+    occupancy = client.get("/grid/occupancy").json()
+    assert created["id"] in occupancy["K1"] and created["id"] in occupancy["K2"]
+    
+    items = client.get("/grid/cells/k2/items").json()
+    assert [i["id"] for i in items] == [created["id"]]
+    
+    client.delete(f"/items/{created['id']}")
+    assert client.get("/grid/cells/K2/items").json() == []
+
+def test_import_and_export_stream(client):
+    """CSV 가져오기 후 JSONL로 내보내기"""
+    body = (
+        "name,description,category,grid_position\n"
+        "가져온 부품 1,설명,전자부품,M1\n"
+        "가져온 부품 2,,전자부품,M2-M3\n"
+        ",이름 없음,전자부품,M4\n"
+    )
+    response = client.post("/items/import?format=csv&batch_size=1", content=body.encode("utf-8"))
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["imported"] == 2 and stats["failed"] == 1 and stats["batches"] == 2
+    assert stats["errors"][0]["line"] == 4
+    
+    exported = client.get("/items/export?format=jsonl")
+    assert exported.headers["content-type"].startswith("application/x-ndjson")
+    names = [json.loads(line)["name"] for line in exported.text.splitlines()]
+    assert "가져온 부품 1" in names and "가져온 부품 2" in names
+    assert len(names) == len(client.get("/items").json())
+
+def test_metrics_endpoint_uses_route_templates(client):
+    """요청 지표는 실제 경로가 아닌 라우트 템플릿으로 집계"""
+    client.get("/items/1")
+    client.get("/items/999999")
+    
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert 'http_requests_total{method="GET",route="/items/{item_id}",status="404"}' in text
+    assert 'route="/items/999999"' not in text
+    assert "db_query_duration_seconds_bucket" in text
+    assert "/metrics" not in text
+
+def test_health_reports_dependency_checks(client, monkeypatch):
+    healthy = client.get("/health")
+    assert healthy.status_code == 200
+    body = healthy.json()
+    assert body["status"] == "healthy" and body["database"] == "connected"
+    assert body["checks"]["database"]["ok"] is True
+    # 하드웨어 상태는 백그라운드 확인의 캐시 (연결되지 않아도 API는 healthy)
+    assert body["checks"]["esp32"]["ok"] is True and "reachable" in body["checks"]["esp32"]
+    
+    def broken():
+        raise RuntimeError("database is locked")
+    
+    monkeypatch.setattr(rest_api.db, "health", broken)
+    unhealthy = client.get("/health")
+    assert unhealthy.status_code == 503
+    assert unhealthy.json()["checks"]["database"]["error"] == "database is locked"
+
+def test_admin_profile_requires_token(client, monkeypatch):
+    """ADMIN_TOKEN 미설정 시 비활성화, 토큰이 틀리면 403"""
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.post("/admin/profile?seconds=0.1").status_code == 404
+    
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    assert client.post("/admin/profile?seconds=0.1").status_code == 403
+    assert client.post("/admin/profile?seconds=0.1", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    
+    response = client.post("/admin/profile?seconds=0.1&include_idle=true", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert "attachment" in response.headers["content-disposition"]
+    assert response.text.strip()
+    
+    summary = client.post("/admin/profile?seconds=0.1&format=json", headers={"X-Admin-Token": "secret"}).json()
+    assert summary["duration"] >= 0.1
+
+def test_highlight_returns_job_immediately(client, monkeypatch):
+    """하드웨어 응답을 기다리지 않고 작업 ID 반환, 완료 후 조회 가능"""
+    from backend.controllers.esp32_controller import MockESP32Controller
+    monkeypatch.setattr(rest_api, "esp32", MockESP32Controller(latency=0.05))
+    
+    response = client.post("/highlight", json={"grid_position": "A2", "color": "green", "priority": "interactive"})
+    assert response.status_code == 202
+    job = response.json()["job"]
+    assert job["status"] in ("queued", "running")
+    
+    finished = client.get(f"/highlight/jobs/{job['id']}?wait=2").json()
+    assert finished["status"] == "succeeded"
+    assert finished["color"] == "green"
+    assert client.get("/highlight/jobs/unknown").status_code == 404
+
+def test_effects_lifecycle(client, monkeypatch):
+    """효과 시작 → 목록 조회 → 개별/전체 중지"""
+    from backend.controllers.esp32_controller import MockESP32Controller
+    monkeypatch.setattr(rest_api, "esp32", MockESP32Controller(latency=0.01))
+    monkeypatch.setattr(rest_api, "_effects_engine", None)
+    
+    assert client.post("/effects", json={"type": "blink", "grid_position": "Z9"}).status_code == 400
+    
+    created = client.post("/effects", json={"type": "follow_me", "grid_position": "C3", "origin": "A1"})
+    assert created.status_code == 201
+    effect_id = created.json()["id"]
+    client.post("/effects", json={"type": "pulse", "grid_position": "B1-B2", "color": "red", "duration": None})
+    
+    listing = client.get("/effects").json()
+    assert {effect["effect"] for effect in listing["active"]} == {"FollowMe", "Pulse"}
+    assert listing["stats"]["target_fps"] == rest_api.EFFECTS_FPS
+    
+    assert client.delete(f"/effects/{effect_id}").json()["stopped"] is True
+    assert client.delete(f"/effects/{effect_id}").status_code == 404
+    client.delete("/effects")
+    assert client.get("/effects").json()["active"] == []
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+가상 Arduino 에뮬레이터 테스트
+pty 위의 시리얼 프로토콜, 자동 리셋, 수신 버퍼 초과, 실제 컨트롤러 연동을 확인합니다.
+"""
+
+import sys
+import os
+import time
+
+import pytest
+import serial
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.controllers.arduino_emulator import ArduinoEmulator
+from backend.controllers.arduino_controller import ArduinoLEDController, LEDColor
+
+@pytest.fixture
+def emulator():
+    # show() 중 바이트 유실은 별도 테스트에서 다루므로 프로토콜 테스트에서는 끔
+    with ArduinoEmulator("drain", show_time=0.0, boot_time=0.0, startup_time=0.0) as emulator:
+        yield emulator
+
+def read_until(conn, marker: str, timeout: float = 2.0) -> str:
+    deadline = time.monotonic() + timeout
+    text = ""
+    while marker not in text and time.monotonic() < deadline:
+        text += conn.read_all().decode("ascii", errors="replace")
+        time.sleep(0.01)
+    return text
+
+def test_protocol_commands(emulator):
+    with serial.Serial(emulator.port, 115200, timeout=1) as conn:
+        assert "Ready" in read_until(conn, "Ready")
+        
+        conn.write(b"A1:255,0,0|B2:0,255,0\n")
+        assert emulator.wait_for("B2", (0, 255, 0), timeout=1) is not None
+        assert emulator.active() == {"A1": [255, 0, 0], "B2": [0, 255, 0]}
+        
+        conn.write(b"STATUS\n")
+        status = read_until(conn, "==================")
+        assert "A1: RGB(255,0,0)" in status and "B2: RGB(0,255,0)" in status
+        
+        conn.write(b"Z9:1,2,3|A1:300,0,0|A1\n")
+        replies = read_until(conn, "Invalid format")
+        assert "Error: Invalid position" in replies and "Error: Invalid color" in replies
+        assert emulator.stats()["errors"] == 3
+        
+        conn.write(b"CLEAR\n")
+        assert emulator.wait_for("A1", (0, 0, 0), timeout=1) is not None
+        assert emulator.active() == {}
+
+def test_opening_port_resets_board(emulator):
+    with serial.Serial(emulator.port, 115200, timeout=1) as conn:
+        read_until(conn, "Ready")
+        conn.write(b"C3:1,2,3\n")
+        assert emulator.wait_for("C3", (1, 2, 3), timeout=1) is not None
+    
+    # 다시 열면 DTR 리셋으로 상태가 지워지고 배너가 다시 출력됨
+    with serial.Serial(emulator.port, 115200, timeout=1) as conn:
+        assert "Ready" in read_until(conn, "Ready")
+        assert emulator.active() == {}
+        assert emulator.stats()["resets"] == 2
+
+def test_sketch_loop_overflows_receive_buffer():
+    # 스케치처럼 루프당 1글자만 읽으면 64바이트 수신 버퍼가 넘침
+    with ArduinoEmulator("sketch", loop_delay=0.002, boot_time=0.0, startup_time=0.0) as emulator:
+        with serial.Serial(emulator.port, 115200, timeout=1) as conn:
+            read_until(conn, "Ready")
+            conn.write(b"|".join(f"A{col}:9,9,9".encode() for col in range(1, 9)) * 3 + b"\n")
+            time.sleep(0.2)
+    assert emulator.stats()["rx_overflow"] > 0
+
+def test_controller_drives_emulator_and_expires(emulator):
+    controller = ArduinoLEDController(auto_connect=False, reset_delay=0.05)
+    try:
+        controller.connect(emulator.port)
+        assert controller.is_connected and not controller.simulation_mode
+        
+        started = time.monotonic()
+        assert controller.highlight_position("C3", LEDColor(r=10, g=20, b=30), duration=1)
+        shown_at = emulator.wait_for("C3", (10, 20, 30), timeout=1)
+        assert shown_at is not None and shown_at - started < 0.5
+        
+        # 만료되면 업데이트 스레드가 꺼짐 명령을 보냄
+        assert emulator.wait_for("C3", (0, 0, 0), timeout=2) is not None
+    finally:
+        controller.disconnect()
+
+def test_controller_reconnects_after_unplug(tmp_path):
+    # 고정 경로(심볼릭 링크)로 USB 분리/재연결을 흉내 냄
+    link = str(tmp_path / "ttyACM0")
+    emulator = ArduinoEmulator("drain", show_time=0.0, boot_time=0.0, startup_time=0.0)
+    emulator.start(link=link)
+    controller = ArduinoLEDController(auto_connect=False, reset_delay=0.05, reconnect_min=0.05, reconnect_max=0.2)
+    try:
+        controller.connect(link)
+        assert controller.highlight_position("A1", LEDColor(r=255, g=0, b=0), duration=30)
+        assert emulator.wait_for("A1", (255, 0, 0), timeout=1) is not None
+        
+        # 분리: I/O 스레드가 읽기 오류로 끊김을 감지, 호출자는 막히지 않고 프레임버퍼만 갱신
+        emulator.stop()
+        deadline = time.monotonic() + 2
+        while controller.is_connected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not controller.is_connected
+        
+        started = time.monotonic()
+        assert controller.highlight_position("B2", LEDColor(r=0, g=0, b=255), duration=30)
+        assert time.monotonic() - started < 0.1
+        
+        # 재연결: 모니터가 같은 포트를 다시 열고 현재 프레임버퍼 전체를 다시 보냄
+        emulator.start(link=link)
+        assert emulator.wait_for("B2", (0, 0, 255), timeout=5) is not None
+        assert emulator.active() == {"A1": [255, 0, 0], "B2": [0, 0, 255]}
+        assert controller.is_connected and controller.reconnects == 1
+    finally:
+        controller.disconnect()
+        emulator.stop()
+
+def test_probe_reports_firmware_state_and_outage(tmp_path):
+    link = str(tmp_path / "ttyACM0")
+    emulator = ArduinoEmulator("drain", show_time=0.0, boot_time=0.0, startup_time=0.0)
+    emulator.start(link=link)
+    controller = ArduinoLEDController(auto_connect=False, reset_delay=0.05, auto_reconnect=False)
+    try:
+        controller.connect(link)
+        assert controller.highlight_position("C3", LEDColor(r=0, g=255, b=0), duration=30)
+        assert emulator.wait_for("C3", (0, 255, 0), timeout=1) is not None
+        
+        # STATUS 왕복으로 펌웨어의 실제 LED 상태 확인
+        online = controller.health.check()
+        assert online["reachable"] and online["rtt_ms"] is not None
+        assert online["active_leds"] == 1 and online["details"]["active"] == {"C3": [0, 255, 0]}
+        assert online["details"]["serial"]["failed"] == 0
+        
+        emulator.stop()
+        deadline = time.monotonic() + 2
+        while controller.is_connected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        offline = controller.health.check()
+        assert not offline["reachable"] and offline["last_error"] == "Arduino 재연결 대기 중"
+        assert offline["details"]["active"] == {"C3": [0, 255, 0]}
+    finally:
+        controller.disconnect()
+        emulator.stop()
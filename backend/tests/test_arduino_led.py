@@ -13,12 +13,13 @@ import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from backend.controllers.arduino_controller import (
-    arduino_controller,
+    get_arduino_controller,
     LEDColor,
     LEDPosition,
     test_arduino_connection,
     get_controller_status
 )
+from backend.controllers.effects import EffectsEngine, Rainbow, Sequential, Solid
 
 # 로깅 설정
 logging.basicConfig(
@@ -27,6 +28,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+arduino_controller = get_arduino_controller()
+
 def test_basic_connection():
     """기본 연결 테스트"""
     print("=" * 50)
@@ -94,15 +97,16 @@ def test_sequential_pattern():
     print("순차적 패턴 테스트")
     print("=" * 50)
     
-    # 행별로 순차적으로 LED 켜기
-    for row in range(5):
-        row_char = chr(ord('A') + row)
-        positions = [f"{row_char}{col}" for col in range(1, 9)]
-        colors = [LEDColor(r=50, g=50, b=255) for _ in range(8)]
-        
-        print(f"행 {row_char} 켜기...")
-        arduino_controller.highlight_multiple_positions(positions, colors, 1)
-        time.sleep(1.2)
+    # 행별로 순차적으로 LED 켜기 (효과 엔진이 프레임 타이밍과 diff 전송 담당)
+    engine = EffectsEngine(arduino_controller.framebuffer, arduino_controller.flush)
+    rows = [
+        Solid([f"{chr(ord('A') + row)}{col}" for col in range(1, 9)], (50, 50, 255), duration=1.2)
+        for row in range(5)
+    ]
+    print("행 A-E 순서대로 켜기...")
+    engine.add(Sequential(rows))
+    time.sleep(6.2)
+    engine.stop()
     
     print("✅ 순차적 패턴 테스트 완료")
     return True
@@ -113,26 +117,14 @@ def test_rainbow_pattern():
     print("무지개 패턴 테스트")
     print("=" * 50)
     
-    # 무지개 색상 배열
-    rainbow_colors = [
-        LEDColor(r=255, g=0, b=0),    # 빨강
-        LEDColor(r=255, g=127, b=0),  # 주황
-        LEDColor(r=255, g=255, b=0),  # 노랑
-        LEDColor(r=0, g=255, b=0),    # 초록
-        LEDColor(r=0, g=0, b=255),    # 파랑
-        LEDColor(r=75, g=0, b=130),   # 남색
-        LEDColor(r=148, g=0, b=211),  # 보라
-        LEDColor(r=255, g=0, b=255)   # 마젠타
-    ]
-    
-    # 각 열에 무지개 색상 적용
-    for col in range(1, 9):
-        positions = [f"{chr(ord('A') + row)}{col}" for row in range(5)]
-        colors = [rainbow_colors[col - 1] for _ in range(5)]
-        
-        print(f"열 {col} 무지개 색상 적용...")
-        arduino_controller.highlight_multiple_positions(positions, colors, 1)
-        time.sleep(0.5)
+    # 열 순서대로 색상(hue)을 나눈 무지개를 2초 주기로 회전
+    engine = EffectsEngine(arduino_controller.framebuffer, arduino_controller.flush)
+    positions = [f"{chr(ord('A') + row)}{col}" for col in range(1, 9) for row in range(5)]
+    print("무지개 효과 4초 재생...")
+    engine.add(Rainbow(positions, period=2.0, duration=4.0))
+    time.sleep(4.2)
+    print(f"엔진 통계: {engine.stats()}")
+    engine.stop()
     
     print("✅ 무지개 패턴 테스트 완료")
     return True
@@ -167,8 +159,8 @@ def test_led_status():
     led_states = arduino_controller.get_led_status()
     print(f"현재 켜진 LED 개수: {len(led_states)}")
     
-    for position, color in led_states.items():
-        print(f"  {position}: RGB({color.r}, {color.g}, {color.b})")
+    for position, (r, g, b) in led_states.items():
+        print(f"  {position}: RGB({r}, {g}, {b})")
     
     return True
 
@@ -196,8 +188,8 @@ def run_interactive_test():
             if user_input.lower() == 'status':
                 led_states = arduino_controller.get_led_status()
                 print(f"현재 켜진 LED: {len(led_states)}개")
-                for pos, color in led_states.items():
-                    print(f"  {pos}: RGB({color.r}, {color.g}, {color.b})")
+                for pos, (r, g, b) in led_states.items():
+                    print(f"  {pos}: RGB({r}, {g}, {b})")
                 continue
             
             # LED 제어 명령 파싱
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+백그라운드 이벤트 루프 브리지 테스트
+동기 코드에서 제출한 코루틴이 같은 장수 루프에서 실행되는지 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.core.async_bridge import BackgroundEventLoop, get_background_loop, run_sync
+
+def test_run_sync_reuses_same_loop():
+    """여러 번 호출해도 같은 이벤트 루프에서 실행"""
+    async def current_loop():
+        return asyncio.get_running_loop()
+    
+    first = run_sync(current_loop())
+    second = run_sync(current_loop())
+    
+    assert first is second
+    assert first is get_background_loop().loop
+    assert not first.is_closed()
+
+def test_run_returns_result_and_propagates_errors():
+    """결과 반환 및 예외 전파"""
+    bridge = BackgroundEventLoop(name="test-bridge")
+    
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+    
+    async def fail():
+        raise ValueError("boom")
+    
+    try:
+        assert bridge.run(add(1, 2)) == 3
+        with pytest.raises(ValueError):
+            bridge.run(fail())
+    finally:
+        bridge.stop()
+    
+    assert not bridge.is_running()
+
+def test_concurrent_submissions_from_threads():
+    """여러 스레드(세션)에서 동시에 제출"""
+    results = []
+    lock = threading.Lock()
+    
+    async def work(i):
+        await asyncio.sleep(0.01)
+        return i * 2
+    
+    def worker(i):
+        value = run_sync(work(i), timeout=5)
+        with lock:
+            results.append(value)
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    assert sorted(results) == [i * 2 for i in range(10)]
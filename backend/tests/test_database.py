@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+ItemDatabase 테스트
+임시 데이터베이스 파일을 사용하여 저장소 동작을 확인합니다.
+"""
+
+import sys
+import os
+import csv
+import io
+import json
+import sqlite3
+import threading
+import time
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.database.database import (
+    DatabaseConfig, ItemDatabase, SCHEMA_MIGRATIONS, expand_grid_position, parse_grid_position
+)
+from backend.database.bulk_io import export_items, import_items
+from backend.database.migrations import MigrationRunner
+
+@pytest.fixture
+def db(tmp_path):
+    database = ItemDatabase(str(tmp_path / "items.db"))
+    yield database
+    database.close()
+
+def test_inventory_version_bumps_on_every_write(db):
+    """쓰기마다 인벤토리 버전 증가"""
+    v0 = db.get_inventory_version()
+    
+    item_id = db.add_item("멀티미터", "디지털 멀티미터", "측정도구", "C1")
+    v1 = db.get_inventory_version()
+    assert v1 > v0
+    
+    db.update_item(item_id, grid_position="C2")
+    v2 = db.get_inventory_version()
+    assert v2 > v1
+    
+    db.delete_item(item_id)
+    assert db.get_inventory_version() > v2
+
+def test_inventory_version_sees_external_writes(tmp_path):
+    """다른 커넥션(다른 프로세스)의 쓰기도 트리거로 버전 증가"""
+    path = str(tmp_path / "items.db")
+    db = ItemDatabase(path, version_check_interval=0)
+    before = db.get_inventory_version()
+    
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "INSERT INTO items (name, description, grid_position, category) VALUES (?, ?, ?, ?)",
+        ("니퍼", "전선 절단", "A2", "전선작업도구")
+    )
+    conn.commit()
+    conn.close()
+    
+    assert db.get_inventory_version() == before + 1
+
+def test_inventory_version_cached_between_checks(tmp_path):
+    """확인 간격 안에서는 DB를 다시 읽지 않음"""
+    path = str(tmp_path / "items.db")
+    db = ItemDatabase(path, version_check_interval=60)
+    cached = db.get_inventory_version()
+    
+    conn = sqlite3.connect(path)
+    conn.execute("DELETE FROM items WHERE id = 1")
+    conn.commit()
+    conn.close()
+    
+    assert db.get_inventory_version() == cached
+
+def test_inventory_version_published_only_after_commit(tmp_path):
+    """커밋 전에는 새 버전이 보이지 않음 (같은 배치의 다음 작업이 실행되는 동안에도)"""
+    db = ItemDatabase(str(tmp_path / "items.db"), version_check_interval=60,
+                      config=DatabaseConfig(write_batch_delay=0.2))
+    v0 = db.get_inventory_version()
+    count0 = len(db.get_all_items())
+    
+    writer = threading.Thread(target=db.add_item, args=("새 물품", "설명", "도구", "A1"))
+    writer.start()
+    time.sleep(0.05)
+    # 첫 작업과 같은 트랜잭션에서 실행되지만 버전 캐시와 커밋된 행은 아직 이전 상태
+    observed = db.writer.submit(lambda cursor: (db.get_inventory_version(), len(db.get_all_items()))).result(5)
+    writer.join()
+    
+    assert observed == (v0, count0)
+    assert db.get_inventory_version() == v0 + 1
+    assert len(db.get_all_items()) == count0 + 1
+    db.close()
+
+def test_failed_group_commit_does_not_advance_version(tmp_path):
+    """배치 COMMIT이 실패하면 롤백된 작업의 버전은 게시되지 않음"""
+    from backend.database.writer import WriteQueue
+    
+    fail_commit = threading.Event()
+    
+    class FailingCursor(sqlite3.Cursor):
+        def execute(self, sql, *args):
+            if sql == "COMMIT" and fail_commit.is_set():
+                raise sqlite3.OperationalError("database is locked")
+            return super().execute(sql, *args)
+    
+    class FailingConnection(sqlite3.Connection):
+        def cursor(self, factory=FailingCursor):
+            return super().cursor(factory)
+    
+    db = ItemDatabase(str(tmp_path / "items.db"), version_check_interval=60,
+                      config=DatabaseConfig(write_batch_delay=0.1))
+    db.writer.close()
+    db.writer = WriteQueue(
+        lambda: db._connect(isolation_level=None, check_same_thread=False, factory=FailingConnection),
+        max_batch_delay=0.1
+    )
+    db.add_item("커밋된 물품", "설명", "도구", "A1")
+    v0 = db.get_inventory_version()
+    count0 = len(db.get_all_items())
+    
+    fail_commit.set()
+    errors = []
+    
+    def add(name):
+        try:
+            db.add_item(name, "설명", "도구", "A2")
+        except sqlite3.OperationalError as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=add, args=(f"물품{i}",)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(errors) == 3
+    assert db.get_inventory_version() == v0
+    assert len(db.get_all_items()) == count0
+    
+    fail_commit.clear()
+    db.add_item("다시 커밋", "설명", "도구", "A3")
+    assert db.get_inventory_version() == v0 + 1
+    db.close()
+
+def test_read_connections_are_released_when_threads_exit(db):
+    """짧게 사는 스레드마다 읽기 커넥션이 남지 않음 (Streamlit 재실행, 스레드풀 워커)"""
+    db.get_categories()
+    
+    for _ in range(3):
+        threads = [threading.Thread(target=db.get_categories) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    # 현재 스레드의 커넥션만 남음
+    assert len(db._read_connections) == 1
+    assert db.get_categories() == db.get_categories()
+    db.close()
+    assert db._read_connections == []
+
+def _tool(name, position="A1"):
+    return {"name": name, "description": f"{name} 설명", "category": "도구", "grid_position": position}
+
+def test_add_items_bulk_assigns_sequential_ids(db):
+    """일괄 추가는 하나의 트랜잭션에서 행별 ID를 반환"""
+    rows = [_tool(f"도구 {i}", f"B{i % 8 + 1}") for i in range(50)]
+    results = db.add_items_bulk(rows)
+    
+    assert all(r["success"] for r in results)
+    for row, result in zip(rows, results):
+        assert db.get_item_by_id(result["id"])["name"] == row["name"]
+
+def test_add_items_bulk_atomic_rolls_back_everything(db):
+    """atomic 모드: 한 행이라도 잘못되면 아무것도 쓰지 않음"""
+    before = len(db.get_all_items())
+    rows = [_tool("정상"), {"name": "", "description": "x", "category": "도구", "grid_position": "A1"}]
+    
+    results = db.add_items_bulk(rows, atomic=True)
+    
+    assert [r["success"] for r in results] == [False, False]
+    assert results[0]["error"] == "rolled back"
+    assert "name" in results[1]["error"]
+    assert len(db.get_all_items()) == before
+
+def test_add_items_bulk_best_effort_keeps_valid_rows(db):
+    """best-effort 모드: 유효한 행만 반영"""
+    rows = [_tool("정상 1"), {"name": "설명 없음", "category": "도구", "grid_position": "A1"}, _tool("정상 2")]
+    
+    results = db.add_items_bulk(rows, atomic=False)
+    
+    assert [r["success"] for r in results] == [True, False, True]
+    assert db.get_item_by_id(results[2]["id"])["name"] == "정상 2"
+
+def test_update_and_delete_bulk(db):
+    """일괄 수정/삭제와 존재하지 않는 ID 처리"""
+    ids = [r["id"] for r in db.add_items_bulk([_tool("수정 1"), _tool("수정 2")])]
+    
+    results = db.update_items_bulk([
+        {"id": ids[0], "grid_position": "D4"},
+        {"id": ids[1], "name": "수정됨", "category": "측정도구"},
+        {"id": 999999, "name": "없음"}
+    ], atomic=False)
+    
+    assert [r["success"] for r in results] == [True, True, False]
+    assert results[2]["error"] == "Item not found"
+    assert db.get_item_by_id(ids[0])["grid_position"] == "D4"
+    assert db.get_item_by_id(ids[1])["name"] == "수정됨"
+    
+    # atomic 모드에서는 없는 ID 하나 때문에 전체 롤백
+    atomic = db.delete_items_bulk([ids[0], 999999], atomic=True)
+    assert not any(r["success"] for r in atomic)
+    assert db.get_item_by_id(ids[0]) is not None
+    
+    results = db.delete_items_bulk(ids)
+    assert all(r["success"] for r in results)
+    assert db.get_item_by_id(ids[0]) is None
+
+def test_connections_use_wal_and_tuned_pragmas(db):
+    """WAL 저널과 커넥션 PRAGMA 적용"""
+    cursor = db._reader().cursor()
+    assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert cursor.execute("PRAGMA busy_timeout").fetchone()[0] == db.config.busy_timeout_ms
+
+def test_concurrent_writes_are_group_committed(tmp_path):
+    """여러 스레드의 쓰기가 단일 쓰기 스레드에서 묶여 커밋됨"""
+    db = ItemDatabase(str(tmp_path / "items.db"), config=DatabaseConfig(write_batch_delay=0.05))
+    before = db.writer.stats()
+    barrier = threading.Barrier(16)
+    ids = []
+    
+    def worker(n):
+        barrier.wait()
+        ids.append(db.add_item(f"저항 {n}", "1kΩ", "전자부품", "B2"))
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    stats = db.writer.stats()
+    db.close()
+    
+    assert len(set(ids)) == 16
+    assert stats["operations"] - before["operations"] == 16
+    assert stats["batches"] - before["batches"] < 16
+    assert stats["largest_batch"] > 1
+
+def test_failed_write_does_not_affect_batch(db):
+    """배치 안에서 실패한 작업만 롤백되고 나머지는 커밋됨"""
+    def bad(cursor):
+        cursor.execute("INSERT INTO items (name, description, grid_position) VALUES ('x', 'y', 'Z9')")
+        cursor.execute("INSERT INTO items (name) VALUES (NULL)")
+    
+    def good(cursor):
+        cursor.execute("INSERT INTO items (name, description, grid_position) VALUES ('ok', 'ok', 'Z8')")
+        return cursor.lastrowid
+    
+    failed = db.writer.submit(bad)
+    succeeded = db.writer.submit(good)
+    
+    with pytest.raises(sqlite3.IntegrityError):
+        failed.result(5)
+    item_id = succeeded.result(5)
+    
+    assert db.get_item_by_id(item_id)["grid_position"] == "Z8"
+    assert all(item["grid_position"] != "Z9" for item in db.get_all_items())
+
+def test_writes_without_queue(tmp_path):
+    """쓰기 큐를 끄면 호출 스레드에서 직접 트랜잭션 실행"""
+    db = ItemDatabase(str(tmp_path / "items.db"), config=DatabaseConfig(use_write_queue=False))
+    assert db.writer is None
+    
+    item_id = db.add_item("드라이버", "십자 드라이버", "공구", "A4")
+    assert db.update_item(item_id, grid_position="A5")
+    results = db.add_items_bulk([_tool("일괄 1"), {"name": "잘못된 행"}], atomic=False)
+    assert [r["success"] for r in results] == [True, False]
+    assert db.delete_item(item_id)
+    db.close()
+
+def test_expand_grid_position():
+    """그리드 위치 문자열을 개별 셀로 확장"""
+    assert expand_grid_position("A1") == ["A1"]
+    assert expand_grid_position("b6-b8") == ["B6", "B7", "B8"]
+    assert expand_grid_position("A1-B2") == ["A1", "A2", "B1", "B2"]
+    assert expand_grid_position("선반 위") == ["선반 위"]
+
+def test_parse_grid_position():
+    """LED 표시용 위치 목록 (같은 행 범위만 확장)"""
+    assert parse_grid_position("A1") == ["A1"]
+    assert parse_grid_position("A1-A4") == ["A1", "A2", "A3", "A4"]
+    assert parse_grid_position("B2-C3") == ["B2", "C3"]
+
+def test_secondary_indexes_are_used(db):
+    """카테고리/이름 조회가 인덱스를 사용"""
+    cursor = db._reader().cursor()
+    plan = " ".join(str(row) for row in cursor.execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT category FROM items WHERE category IS NOT NULL"))
+    assert "idx_items_category" in plan
+    plan = " ".join(str(row) for row in cursor.execute(
+        "EXPLAIN QUERY PLAN SELECT id, name FROM items ORDER BY name"))
+    assert "idx_items_name" in plan
+
+def test_item_cells_follow_every_write(db):
+    """단건/일괄 쓰기마다 셀 역색인 갱신"""
+    item_id = db.add_item("인두기", "납땜 인두", "납땜도구", "G1-G3")
+    assert [i["id"] for i in db.get_items_at("g2")] == [item_id]
+    
+    db.update_item(item_id, grid_position="H1")
+    assert db.get_items_at("G2") == []
+    assert item_id in db.get_occupancy_map()["H1"]
+    
+    ids = [r["id"] for r in db.add_items_bulk([_tool("흡연기", "H1-H2")])]
+    assert sorted(db.get_occupancy_map()["H1"]) == sorted([item_id] + ids)
+    
+    db.update_items_bulk([{"id": ids[0], "grid_position": "H3"}])
+    assert db.get_occupancy_map()["H1"] == [item_id]
+    
+    db.delete_item(item_id)
+    db.delete_items_bulk(ids)
+    occupancy = db.get_occupancy_map()
+    assert "H1" not in occupancy and "H3" not in occupancy
+
+def _downgrade_to_v1(path):
+    """셀 색인 도입(v2) 이전 스키마로 되돌린 DB 파일 만들기"""
+    ItemDatabase(path).close()
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        DROP TABLE item_cells;
+        DROP TRIGGER items_cells_delete;
+        DROP INDEX idx_items_category;
+        DROP INDEX idx_items_name;
+        DELETE FROM schema_backfills;
+        PRAGMA user_version = 1;
+    """)
+    conn.executemany(
+        "INSERT INTO items (name, description, grid_position, category) VALUES (?, ?, ?, ?)",
+        [(f"부품 {n}", "", f"J{n}", "전자부품") for n in range(1, 26)]
+    )
+    conn.commit()
+    conn.close()
+
+def test_migrations_upgrade_existing_database(tmp_path):
+    """기존 v1 DB를 최신 버전으로 올리고 셀 색인을 청크 단위로 백필"""
+    path = str(tmp_path / "items.db")
+    _downgrade_to_v1(path)
+    
+    db = ItemDatabase(path, config=DatabaseConfig(backfill_chunk_size=10))
+    assert db.schema_version() == db.migrations.latest_version
+    assert [i["name"] for i in db.get_items_at("J5")] == ["부품 5"]
+    assert db.get_items_at("A1")  # 샘플 데이터도 색인됨
+    assert db.migrations.pending_backfills(db._reader().cursor()) == []
+    db.close()
+    
+    # 다시 열어도 마이그레이션/백필을 반복하지 않음
+    db = ItemDatabase(path)
+    assert db.run_backfills() == {}
+    db.close()
+
+def test_backfill_resumes_after_stop(tmp_path):
+    """중단된 백필은 마지막 청크 이후부터 이어서 실행"""
+    path = str(tmp_path / "items.db")
+    _downgrade_to_v1(path)
+    
+    stop = threading.Event()
+    runner = MigrationRunner(SCHEMA_MIGRATIONS)
+    conn = sqlite3.connect(path, isolation_level=None)
+    runner.migrate(conn)
+    
+    def execute(operation):
+        conn.execute("BEGIN IMMEDIATE")
+        result = operation(conn.cursor())
+        conn.execute("COMMIT")
+        stop.set()  # 첫 청크 후 중단
+        return result
+    
+    assert runner.run_backfills(execute, ["item_cells"], chunk_size=5, stop_event=stop) == {"item_cells": 1}
+    assert conn.execute("SELECT last_key FROM schema_backfills WHERE name = 'item_cells'").fetchone()[0] == 5
+    conn.close()
+    
+    db = ItemDatabase(path, config=DatabaseConfig(backfill_chunk_size=5))
+    assert db.migrations.pending_backfills(db._reader().cursor()) == []
+    assert len(db.get_occupancy_map()) >= 25
+    db.close()
+
+def test_migration_runner_rejects_newer_schema(tmp_path):
+    """코드보다 새로운 스키마 버전은 거부"""
+    conn = sqlite3.connect(str(tmp_path / "items.db"), isolation_level=None)
+    conn.execute("PRAGMA user_version = 99")
+    with pytest.raises(RuntimeError):
+        MigrationRunner(SCHEMA_MIGRATIONS).migrate(conn)
+    conn.close()
+
+def test_bulk_import_export_round_trip(db, tmp_path):
+    """JSONL 가져오기/CSV 내보내기 왕복"""
+    lines = [json.dumps(_tool(f"대량 {n}", f"N{n}"), ensure_ascii=False) for n in range(1, 8)]
+    lines.insert(3, "{not json")
+    stats = import_items(db, io.StringIO("\n".join(lines) + "\n"), "jsonl", batch_size=3)
+    
+    assert stats.imported == 7 and stats.failed == 1 and stats.batches == 3
+    assert stats.errors[0]["line"] == 4
+    assert [i["name"] for i in db.get_items_at("N7")] == ["대량 7"]
+    
+    output = io.StringIO()
+    count = export_items(db, output, "csv")
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert count == len(rows) == len(db.get_all_items())
+    
+    other = ItemDatabase(str(tmp_path / "copy.db"))
+    before = len(other.get_all_items())
+    assert import_items(other, io.StringIO(output.getvalue()), "csv").imported == count
+    assert len(other.get_all_items()) == before + count
+    other.close()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+LED 효과 엔진 테스트
+효과별 색상 계산, 조합, diff 전송, 전송 지연에 따른 FPS 조절을 확인합니다.
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.controllers.framebuffer import LEDFramebuffer
+from backend.controllers.effects import (
+    Blink,
+    Chase,
+    EffectsEngine,
+    FollowMe,
+    Pulse,
+    Rainbow,
+    Sequential,
+    Solid,
+    path_between
+)
+
+def draw(effect, t, rows=5, cols=8):
+    fb = LEDFramebuffer(rows, cols)
+    effect.bind(fb)
+    canvas = np.zeros((rows, cols, 3), dtype=np.uint8)
+    mask = np.zeros((rows, cols), dtype=bool)
+    effect.draw(canvas, mask, t)
+    fb.set_overlay(canvas, mask)
+    frame = fb.render()
+    # 효과가 그린 셀만 {위치: [r, g, b]}
+    return {f"{chr(ord('A') + r)}{c + 1}": frame[r, c].tolist() for r, c in zip(*np.nonzero(mask))}
+
+def test_blink_and_pulse_follow_elapsed_time():
+    blink = Blink(["A1"], (255, 0, 0), period=1.0, duty=0.5)
+    assert draw(blink, 0.2) == {"A1": [255, 0, 0]}
+    assert draw(blink, 0.7) == {}
+    assert draw(blink, 1.2) == {"A1": [255, 0, 0]}
+    
+    pulse = Pulse(["B2"], (0, 0, 200), period=2.0, floor=0.0)
+    assert draw(pulse, 0.0) == {"B2": [0, 0, 0]}
+    assert draw(pulse, 1.0) == {"B2": [0, 0, 200]}
+    assert draw(pulse, 0.5)["B2"] == [0, 0, 100]
+
+def test_chase_head_and_tail():
+    chase = Chase(["A1", "A2", "A3", "A4"], (0, 240, 0), speed=1.0, tail=3)
+    frame = draw(chase, 2.0)
+    assert frame["A3"] == [0, 240, 0]
+    assert frame["A2"] == [0, 160, 0]
+    assert frame["A1"] == [0, 80, 0]
+    assert "A4" not in frame
+    
+    # 반복하지 않으면 마지막 셀을 지나 사라짐
+    once = Chase(["A1", "A2"], speed=1.0, tail=1, loop=False)
+    assert draw(once, 5.0) == {}
+
+def test_rainbow_and_sequential():
+    frame = draw(Rainbow(["A1", "A2", "A3"], period=3.0), 0.0)
+    assert frame["A1"] == [255, 0, 0]
+    assert len({tuple(color) for color in frame.values()}) == 3
+    
+    sequence = Sequential([Solid(["A1"], (1, 1, 1), duration=1.0), Solid(["B1"], (2, 2, 2), duration=1.0)])
+    assert draw(sequence, 0.5) == {"A1": [1, 1, 1]}
+    assert draw(sequence, 1.5) == {"B1": [2, 2, 2]}
+    assert sequence.finished(2.0)
+
+def test_follow_me_path_and_target():
+    assert path_between("A1", "C3") == ["A1", "A2", "A3", "B3", "C3"]
+    
+    effect = FollowMe("A1", ["C3"], (0, 255, 0), target_color=(255, 255, 255), speed=1.0)
+    frame = draw(effect, 0.1)
+    assert frame["C3"] == [255, 255, 255]
+    assert frame["A1"] == [0, 255, 0]
+    assert effect.finished(15.0)
+
+class RecordingFlush:
+    """changes()를 전송한 것으로 기록하는 가짜 전송 함수"""
+    
+    def __init__(self, framebuffer, delay=0.0):
+        self.framebuffer = framebuffer
+        self.delay = delay
+        self.sent = []
+    
+    def __call__(self):
+        rows, cols, colors = self.framebuffer.changes()
+        if self.delay:
+            time.sleep(self.delay)
+        self.framebuffer.mark_sent(rows, cols, colors)
+        self.sent.append(len(rows))
+        return len(rows)
+
+def test_engine_sends_only_changed_pixels():
+    fb = LEDFramebuffer(5, 8)
+    flush = RecordingFlush(fb)
+    engine = EffectsEngine(fb, flush, fps=50)
+    
+    effect_id = engine.add(Solid(["A1", "A2", "A3"], (0, 0, 255)))
+    time.sleep(0.2)
+    engine.remove(effect_id)
+    time.sleep(0.1)
+    engine.stop()
+    
+    # 첫 프레임에 3픽셀, 이후 같은 프레임은 0픽셀, 제거 후 3픽셀을 끔
+    assert flush.sent[0] == 3
+    assert sum(flush.sent) == 6
+    assert engine.frames > 3
+    assert fb.render().sum() == 0
+
+def test_engine_lowers_fps_when_flush_is_slow():
+    fb = LEDFramebuffer(5, 8)
+    engine = EffectsEngine(fb, RecordingFlush(fb, delay=0.05), fps=60, min_fps=5)
+    engine.add(Rainbow(["A1", "A2"], duration=0.5))
+    time.sleep(0.4)
+    stats = engine.stats()
+    engine.stop()
+    
+    assert stats["late_frames"] > 0
+    assert 5 <= stats["current_fps"] < 20
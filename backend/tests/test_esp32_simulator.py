@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+ESP32 HTTP 시뮬레이터 테스트
+실제 ESP32Controller로 펌웨어 JSON 계약, duration 만료, 본문/JSON 용량 제한, 오류 주입을 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+import aiohttp
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.models.models import LEDControl
+from backend.controllers.esp32_controller import ESP32Controller, RetryPolicy
+from backend.controllers.esp32_simulator import SimulatorConfig, SimulatorThread, json_document_size
+
+def run_with_controller(simulator: SimulatorThread, scenario, transport: str = "http",
+                        retry: RetryPolicy = None):
+    """시뮬레이터에 연결한 실제 ESP32Controller로 scenario(controller) 실행"""
+    async def main():
+        controller = ESP32Controller("127.0.0.1", simulator.port, transport=transport, retry=retry)
+        try:
+            return await scenario(controller)
+        finally:
+            await controller.close()
+    return asyncio.run(main())
+
+@pytest.fixture
+def simulator():
+    with SimulatorThread(SimulatorConfig(latency=0.0)) as simulator:
+        yield simulator
+
+def test_highlight_expires_after_duration(simulator):
+    async def scenario(controller):
+        result = await controller.highlight_position(LEDControl(grid_position="A1-A3", color="red", duration=1))
+        status = await controller.get_status()
+        return result, status
+    
+    result, status = run_with_controller(simulator, scenario)
+    assert result["success"]
+    assert result["data"]["esp32_response"] == {
+        "success": True, "action": "highlight", "led_count": 3, "duration": 1, "color": {"r": 255, "g": 0, "b": 0}
+    }
+    assert status["data"]["led_count"] == 25
+    assert simulator.simulator.active() == {0: [255, 0, 0], 1: [255, 0, 0], 2: [255, 0, 0]}
+    
+    time.sleep(1.3)
+    assert simulator.simulator.active() == {}
+
+def test_set_pixels_and_turn_off_reuse_one_connection(simulator):
+    async def scenario(controller):
+        controller.framebuffer.paint(["B1", "B2"], (0, 0, 9))
+        sent = await controller.push_frame()
+        snapshot = simulator.simulator.active()
+        await controller.turn_off_all_leds()
+        return sent, snapshot
+    
+    sent, snapshot = run_with_controller(simulator, scenario)
+    assert sent == 2
+    assert snapshot == {5: [0, 0, 9], 6: [0, 0, 9]}
+    assert simulator.simulator.active() == {}
+    assert simulator.simulator.stats()["connections"] == 1
+
+def test_payload_limits():
+    pixels = [[index, 1, 2, 3] for index in range(25)]
+    # 픽셀당 배열 슬롯 1개 + 값 4개
+    assert json_document_size({"action": "set_pixels", "pixels": pixels}) == 16 * 2 + 16 * 25 + 16 * 100
+    
+    async def post(url, payload):
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{url}/led_control", json=payload) as response:
+                return response.status, await response.json()
+    
+    payload = {"action": "set_pixels", "pixels": pixels}
+    with SimulatorThread(SimulatorConfig(latency=0.0, json_capacity=1024, max_body=4096)) as simulator:
+        status, body = asyncio.run(post(simulator.url, payload))
+        assert status == 400 and body["error"] == "JSON 파싱 오류"
+        assert simulator.simulator.stats()["no_memory"] == 1
+    
+    with SimulatorThread(SimulatorConfig(latency=0.0, max_body=256)) as simulator:
+        status, _ = asyncio.run(post(simulator.url, payload))
+        assert status == 400
+        assert simulator.simulator.stats()["too_large"] == 1
+        
+        status, body = asyncio.run(post(simulator.url, {"action": "blink"}))
+        assert status == 400 and body["error"] == "알 수 없는 액션"
+
+def test_injected_failures_are_reported_not_raised():
+    async def scenario(controller):
+        return await controller.highlight_position(LEDControl(grid_position="C3"))
+    
+    with SimulatorThread(SimulatorConfig(latency=0.0, failure_rate=1.0)) as simulator:
+        result = run_with_controller(simulator, scenario)
+        assert not result["success"] and "500" in result["error"]
+    
+    with SimulatorThread(SimulatorConfig(latency=0.0, drop_rate=1.0)) as simulator:
+        result = run_with_controller(simulator, scenario)
+        assert not result["success"] and result["error"].startswith("Connection error")
+        # 기본 정책은 3회 시도
+        assert simulator.simulator.stats()["dropped"] == 3
+
+def test_websocket_pipelines_frames_on_one_connection(simulator):
+    async def scenario(controller):
+        result = await controller.highlight_position(LEDControl(grid_position="A1-A2", color="green", duration=30))
+        # 효과 프레임은 확인을 기다리지 않고 연달아 전송
+        for step in range(10):
+            controller.framebuffer.paint(["C3"], (step + 1, 0, 0))
+            await controller.push_frame()
+        results = await asyncio.gather(*(
+            controller.highlight_position(LEDControl(grid_position=f"E{col}", color="blue", duration=30))
+            for col in range(1, 6)
+        ))
+        return result, results
+    
+    result, results = run_with_controller(simulator, scenario, transport="ws")
+    assert result["data"]["esp32_response"] == {
+        "success": True, "action": "highlight", "led_count": 2, "duration": 30, "color": {"r": 0, "g": 255, "b": 0}
+    }
+    assert all(r["success"] for r in results)
+    active = simulator.simulator.active()
+    assert active[0] == active[1] == [0, 255, 0] and active[12] == [10, 0, 0]
+    assert [active[index] for index in range(20, 25)] == [[0, 0, 255]] * 5
+    stats = simulator.simulator.stats()
+    assert stats["ws_connections"] == 1 and stats["requests"] == 0
+    assert stats["ws_frames"] == 16
+
+def test_websocket_falls_back_to_http_and_resyncs_lost_frames():
+    async def highlight(controller):
+        return await controller.highlight_position(LEDControl(grid_position="B2", color="red"))
+    
+    # WebSocket을 지원하지 않는 펌웨어: HTTP로 대체
+    with SimulatorThread(SimulatorConfig(latency=0.0, websocket=False)) as simulator:
+        assert run_with_controller(simulator, highlight, transport="ws")["success"]
+        assert simulator.simulator.stats()["requests"] == 1
+        assert simulator.simulator.active() == {6: [255, 0, 0]}
+    
+    # 확인이 오지 않은 프레임은 다음 push_frame에서 장치를 끄고 전체 프레임으로 다시 전송
+    with SimulatorThread(SimulatorConfig(latency=0.0, stall_rate=1.0)) as simulator:
+        async def scenario(controller):
+            controller.ws.timeout = 0.1
+            controller.framebuffer.paint(["A1", "A2"], (5, 5, 5))
+            await controller.push_frame()
+            await asyncio.sleep(0.3)
+            simulator.simulator.config.stall_rate = 0.0
+            controller.framebuffer.paint(["A3"], (7, 7, 7))
+            return await controller.push_frame()
+        
+        sent = run_with_controller(simulator, scenario, transport="ws")
+        assert sent == 3
+        assert simulator.simulator.stats()["turn_off_all"] == 1
+        assert simulator.simulator.active() == {0: [5, 5, 5], 1: [5, 5, 5], 2: [7, 7, 7]}
+
+def test_retries_reuse_command_id_and_are_applied_once():
+    async def highlight(controller):
+        return await controller.highlight_position(LEDControl(grid_position="D4", color="yellow"))
+    
+    # seed 9: 첫 요청의 roll만 0.5 미만
+    with SimulatorThread(SimulatorConfig(latency=0.0, drop_rate=0.5, seed=9)) as simulator:
+        result = run_with_controller(simulator, highlight, retry=RetryPolicy(backoff_base=0.01))
+        assert result["success"] and isinstance(result["data"]["command"]["id"], int)
+        assert simulator.simulator.stats()["dropped"] == 1
+        assert simulator.simulator.active() == {18: [255, 255, 0]}
+    
+    async def post_twice(url):
+        command = {"action": "set_pixels", "pixels": [[0, 1, 1, 1]], "id": 1234}
+        async with aiohttp.ClientSession() as session:
+            for _ in range(2):
+                async with session.post(f"{url}/led_control", json=command) as response:
+                    assert response.status == 200
+                    assert await response.json() == {"success": True, "action": "set_pixels", "applied": 1}
+    
+    with SimulatorThread(SimulatorConfig(latency=0.0)) as simulator:
+        asyncio.run(post_twice(simulator.url))
+        stats = simulator.simulator.stats()
+        assert stats["set_pixels"] == 1 and stats["duplicates"] == 1
+
+def test_short_attempt_timeout_and_hedging_bound_tail_latency():
+    async def highlight(controller):
+        started = time.monotonic()
+        result = await controller.highlight_position(LEDControl(grid_position="A5", color="cyan"))
+        return result, time.monotonic() - started
+    
+    # 첫 요청이 무응답: 시도당 타임아웃 뒤 재시도
+    with SimulatorThread(SimulatorConfig(latency=0.0, stall_rate=0.5, stall_time=1.0, seed=9)) as simulator:
+        retry = RetryPolicy(attempt_timeout=0.2, backoff_base=0.01)
+        result, elapsed = run_with_controller(simulator, highlight, retry=retry)
+        assert result["success"] and 0.2 <= elapsed < 1.0
+        assert simulator.simulator.stats()["stalled"] == 1
+    
+    # 헤지: 기준 시간(50ms)이 지나면 같은 id로 두 번째 요청, 먼저 온 응답 사용
+    with SimulatorThread(SimulatorConfig(latency=0.0, stall_rate=0.5, stall_time=1.0, seed=9)) as simulator:
+        retry = RetryPolicy(attempt_timeout=2.0, hedge=True, hedge_after=0.05)
+        result, elapsed = run_with_controller(simulator, highlight, retry=retry)
+        assert result["success"] and elapsed < 0.5
+        assert simulator.simulator.stats()["highlight"] == 1
+        assert simulator.simulator.active() == {4: [0, 255, 255]}
+
+def test_health_poller_caches_status_and_detects_outage():
+    simulator = SimulatorThread(SimulatorConfig(latency=0.0)).start()
+    stopped = []
+    
+    async def wait_for(poller, condition, timeout=3.0):
+        deadline = time.monotonic() + timeout
+        while not condition(poller.snapshot()) and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        return poller.snapshot()
+    
+    async def scenario(controller):
+        controller.health.interval = 0.05
+        controller.health.start(asyncio.get_running_loop())
+        try:
+            await controller.highlight_position(LEDControl(grid_position="A1-A3", color="red", duration=30))
+            online = await wait_for(controller.health, lambda health: health["active_leds"] == 3)
+            
+            requests = simulator.simulator.counters["status"]
+            for _ in range(100):
+                controller.health.snapshot()
+            reads = simulator.simulator.counters["status"] - requests
+            
+            await asyncio.to_thread(simulator.stop)
+            stopped.append(True)
+            offline = await wait_for(controller.health, lambda health: health["reachable"] is False)
+            return online, reads, offline
+        finally:
+            await asyncio.to_thread(controller.health.stop)
+    
+    try:
+        online, reads, offline = run_with_controller(simulator, scenario)
+    finally:
+        if not stopped:
+            simulator.stop()
+    
+    assert online["reachable"] and online["rtt_ms"] is not None and online["details"]["device"]["led_count"] == 25
+    # 캐시 읽기는 장치에 요청하지 않음 (그 사이 백그라운드 확인이 한 번 있을 수 있음)
+    assert reads <= 1
+    assert not offline["reachable"] and offline["last_error"]
+    assert offline["active_leds"] == 3 and offline["consecutive_failures"] >= 1
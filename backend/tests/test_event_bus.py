@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+이벤트 버스 및 실시간 이벤트 스트림 테스트
+구독 필터, 백프레셔(가장 오래된 이벤트 폐기 + resync), WebSocket 전달을 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# 테스트용 임시 데이터베이스 사용
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test_items.db')}")
+
+from fastapi.testclient import TestClient
+
+from backend.core.event_bus import EventBus, ITEM_CREATED, ITEM_DELETED, LED_ON, RESYNC
+from backend.api.rest_api import app
+
+def test_topic_filter():
+    """토픽 접두사 필터"""
+    async def scenario():
+        bus = EventBus()
+        items_only = bus.subscribe(["item"])
+        everything = bus.subscribe()
+        
+        bus.publish(LED_ON, {"grid_position": "A1"})
+        bus.publish(ITEM_CREATED, {"item": {"id": 1}})
+        
+        first = await items_only.get(timeout=1)
+        assert first["type"] == ITEM_CREATED
+        assert await items_only.get(timeout=0.05) is None
+        
+        types = [(await everything.get(timeout=1))["type"] for _ in range(2)]
+        assert types == [LED_ON, ITEM_CREATED]
+    
+    asyncio.run(scenario())
+
+def test_slow_subscriber_drops_oldest_and_resyncs():
+    """느린 구독자는 오래된 이벤트를 잃고 resync를 먼저 받음"""
+    async def scenario():
+        bus = EventBus()
+        subscription = bus.subscribe(max_queue_size=3)
+        
+        for i in range(10):
+            bus.publish(ITEM_DELETED, {"id": i})
+        
+        resync = await subscription.get(timeout=1)
+        assert resync["type"] == RESYNC
+        assert resync["data"]["dropped"] == 7
+        
+        remaining = [(await subscription.get(timeout=1))["data"]["id"] for _ in range(3)]
+        assert remaining == [7, 8, 9]
+    
+    asyncio.run(scenario())
+
+def test_publish_from_other_thread():
+    """다른 스레드(타이머, 동기 핸들러)에서 발행"""
+    async def scenario():
+        bus = EventBus()
+        subscription = bus.subscribe()
+        
+        thread = threading.Thread(target=bus.publish, args=(LED_ON, {"grid_position": "B2"}))
+        thread.start()
+        thread.join()
+        
+        event = await subscription.get(timeout=1)
+        assert event["data"]["grid_position"] == "B2"
+    
+    asyncio.run(scenario())
+
+def test_events_since_replays_history():
+    """Last-Event-ID 이후 이벤트 재전송"""
+    bus = EventBus(history_size=5)
+    ids = [bus.publish(ITEM_CREATED, {"n": i})["id"] for i in range(8)]
+    
+    replay = bus.events_since(ids[4])
+    assert [e["id"] for e in replay] == ids[5:]
+
+def test_websocket_receives_item_deltas():
+    """물품 추가 시 WebSocket 구독자가 델타를 받음"""
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/events?types=item") as ws:
+            response = client.post("/items", json={
+                "name": "테스트 드라이버",
+                "description": "이벤트 테스트",
+                "category": "도구",
+                "grid_position": "E8"
+            })
+            assert response.status_code == 200
+            
+            event = ws.receive_json()
+            assert event["type"] == ITEM_CREATED
+            assert event["data"]["item"]["name"] == "테스트 드라이버"
+            
+            client.delete(f"/items/{event['data']['item']['id']}")
+            deleted = ws.receive_json()
+            assert deleted["type"] == ITEM_DELETED
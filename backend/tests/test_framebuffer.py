@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+LED 프레임버퍼 테스트
+합성, 만료, 밝기, 전송 diff를 확인합니다.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.controllers.framebuffer import LEDFramebuffer
+
+def test_paint_blend_modes_and_bounds():
+    fb = LEDFramebuffer(rows=5, cols=8)
+    assert fb.paint(["A1", "a2", "Z9", "F1", "A9"], (200, 0, 10)) == 2
+    
+    fb.paint(["A1"], (100, 50, 0), blend="add")
+    fb.paint(["A2"], (50, 80, 0), blend="max")
+    assert fb.active() == {"A1": [255, 50, 10], "A2": [200, 80, 10]}
+    
+    # 셀별 색상 배열
+    fb.paint(["B1", "B2"], np.array([(1, 2, 3), (4, 5, 6)]))
+    assert fb.active()["B2"] == [4, 5, 6]
+    assert fb.active_count() == 4
+
+def test_expiry_is_per_cell():
+    fb = LEDFramebuffer(rows=5, cols=8)
+    fb.paint(["A1", "A2"], (255, 0, 0), duration=5, now=100.0)
+    fb.paint(["A2"], (0, 255, 0), duration=20, now=100.0)
+    fb.paint(["C3"], (0, 0, 255))  # 만료 없음
+    
+    assert fb.expire(now=104.9) == 0
+    assert fb.expire(now=105.0) == 1
+    assert sorted(fb.active()) == ["A2", "C3"]
+    assert fb.expire(now=1e9) == 1
+    assert list(fb.active()) == ["C3"]
+
+def test_changes_only_reports_diff_with_brightness():
+    fb = LEDFramebuffer(rows=5, cols=8)
+    fb.paint(["A1", "B2"], (200, 100, 0))
+    rows, cols, colors = fb.changes()
+    assert fb.encode(rows, cols, colors) == ["A1:200,100,0", "B2:200,100,0"]
+    fb.mark_sent(rows, cols, colors)
+    
+    assert fb.changes()[0].size == 0
+    
+    fb.paint(["B2"], (200, 100, 0))  # 같은 색 - 변화 없음
+    fb.clear(["A1"])
+    rows, cols, colors = fb.changes()
+    assert fb.encode(rows, cols, colors) == ["A1:0,0,0"]
+    fb.mark_sent(rows, cols, colors)
+    
+    fb.set_brightness(0.5)
+    rows, cols, colors = fb.changes()
+    assert fb.encode(rows, cols, colors) == ["B2:100,50,0"]
+    # 밝기는 출력에만 적용되고 저장된 색상은 유지
+    assert fb.active() == {"B2": [200, 100, 0]}
+    assert fb.render()[1, 1].tolist() == [100, 50, 0]
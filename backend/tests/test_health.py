@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+하드웨어 상태 확인(HealthPoller) 테스트
+캐시 갱신, 실패 시 마지막 LED 상태 유지, 응답 없는 probe의 종료를 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.core.async_bridge import get_background_loop
+from backend.controllers.health import HealthPoller
+
+def test_snapshot_tracks_reachability_and_keeps_last_known_leds():
+    results = [{"active_leds": 3, "port": "/dev/ttyACM0"}, ConnectionError("포트가 닫혔습니다"),
+               {"reachable": False, "error": "시뮬레이션 모드", "active_leds": 1}, {"active_leds": 0}]
+    
+    def probe():
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    poller = HealthPoller(probe, "TestController", interval=60)
+    initial = poller.snapshot()
+    assert initial["reachable"] is None and initial["stale"] and initial["age"] is None
+    
+    ok = poller.check()
+    assert ok["reachable"] and ok["active_leds"] == 3 and ok["rtt_ms"] is not None
+    assert ok["details"] == {"active_leds": 3, "port": "/dev/ttyACM0"} and not ok["stale"]
+    
+    failed = poller.check()
+    assert not failed["reachable"] and failed["rtt_ms"] is None
+    assert failed["last_error"] == "포트가 닫혔습니다" and failed["consecutive_failures"] == 1
+    assert failed["active_leds"] == 3 and failed["details"]["port"] == "/dev/ttyACM0"
+    
+    offline = poller.check()
+    assert not offline["reachable"] and offline["last_error"] == "시뮬레이션 모드"
+    assert offline["active_leds"] == 1 and offline["consecutive_failures"] == 2
+    
+    recovered = poller.check()
+    assert recovered["reachable"] and recovered["consecutive_failures"] == 0
+    assert recovered["last_error"] == "시뮬레이션 모드" and poller.checks == 4
+
+def test_background_thread_refreshes_and_stop_cancels_hung_probe():
+    calls = []
+    
+    async def probe():
+        calls.append(time.monotonic())
+        if len(calls) > 1:
+            await asyncio.sleep(60)  # 응답 없는 하드웨어
+        return {"active_leds": 0}
+    
+    poller = HealthPoller(probe, "TestController", interval=60, timeout=30)
+    poller.start(get_background_loop().loop)
+    deadline = time.monotonic() + 2
+    while poller.checks == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert poller.snapshot()["reachable"]
+    
+    # refresh()는 간격을 기다리지 않고 다시 확인
+    poller.refresh()
+    while len(calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 2
+    
+    started = time.monotonic()
+    poller.stop()
+    assert time.monotonic() - started < 1
+    assert not poller.running
+    # 취소된 확인은 실패로 기록하지 않음
+    assert poller.checks == 1 and poller.snapshot()["reachable"]
+
+def test_controller_status_uses_live_framebuffer_without_poller(monkeypatch):
+    from backend.controllers import arduino_controller as module
+    
+    controller = module.ArduinoLEDController(auto_connect=False, auto_reconnect=False)
+    monkeypatch.setattr(module, "_arduino_controller", controller)
+    monkeypatch.setenv("HARDWARE_HEALTH_INTERVAL", "0")
+    assert not module.start_hardware_health() and not controller.health.running
+    
+    red = module.LEDColor(r=255, g=0, b=0)
+    controller.highlight_multiple_positions(["A1", "B2"], [red, red], 5)
+    status = module.get_controller_status()
+    # 확인 결과가 없어도 켜진 LED는 프레임버퍼에서 바로 보임
+    assert status["health"]["active_leds"] is None
+    assert status["led_count"] == 2 and sorted(status["active_leds"]) == ["A1", "B2"]
+    
+    controller.turn_off_all_leds()
+    assert module.get_controller_status()["led_count"] == 0
+    controller.disconnect()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+LED 데몬 테스트
+여러 클라이언트 연결의 하이라이트 합성, 효과 오버레이, 동기 클라이언트로 Arduino(에뮬레이터) 구동을 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.models.models import LEDControl
+from backend.core.async_bridge import run_sync
+from backend.controllers.arduino_controller import ArduinoLEDController, LEDColor
+from backend.controllers.arduino_emulator import ArduinoEmulator
+from backend.controllers.esp32_controller import LEDDaemonClient, MockESP32Controller
+from backend.controllers.health import HealthPoller
+from backend.controllers.led_client import ArduinoDaemonClient
+from backend.controllers.led_daemon import LEDDaemon
+
+def test_highlights_from_separate_clients_are_merged(tmp_path):
+    socket_path = str(tmp_path / "led.sock")
+    
+    async def main():
+        controller = MockESP32Controller(latency=0.0)
+        daemon = LEDDaemon(controller.framebuffer, controller.push_frame, socket_path)
+        await daemon.start()
+        api, chatbot = LEDDaemonClient(socket_path), LEDDaemonClient(socket_path)
+        try:
+            results = await asyncio.gather(
+                api.highlight_position(LEDControl(grid_position="A1-A2", color="red", duration=30)),
+                chatbot.highlight_position(LEDControl(grid_position="C3", color="blue", duration=30)),
+            )
+            invalid = await api.highlight_position(LEDControl(grid_position="Z9", color="red", duration=5))
+            status = await chatbot.get_status()
+            await api.turn_off_all_leds()
+            cleared = await chatbot.get_status()
+            return results, invalid, status, cleared
+        finally:
+            await api.close()
+            await chatbot.close()
+            await daemon.stop()
+    
+    results, invalid, status, cleared = asyncio.run(main())
+    assert all(result["success"] for result in results)
+    assert results[0]["data"]["positions"] == ["A1", "A2"]
+    assert not invalid["success"] and "유효한 LED 위치" in invalid["error"]
+    assert status["data"]["active"] == {"A1": [255, 0, 0], "A2": [255, 0, 0], "C3": [0, 0, 255]}
+    assert status["data"]["clients"] == 2
+    assert cleared["data"]["active"] == {}
+    assert not os.path.exists(socket_path)
+
+def test_effect_overlay_is_removed_when_client_disconnects(tmp_path):
+    socket_path = str(tmp_path / "led.sock")
+    
+    async def main():
+        controller = MockESP32Controller(latency=0.0)
+        daemon = LEDDaemon(controller.framebuffer, controller.push_frame, socket_path)
+        await daemon.start()
+        client = LEDDaemonClient(socket_path)
+        try:
+            mask = client.framebuffer.overlay_mask.copy()
+            mask[1, 2] = True
+            overlay = client.framebuffer.overlay.copy()
+            overlay[1, 2] = (0, 200, 0)
+            client.framebuffer.set_overlay(overlay, mask)
+            sent = await client.push_frame()
+            unchanged = await client.push_frame()
+            shown = controller.framebuffer.render()[1, 2].tolist()
+            
+            await client.close()
+            await asyncio.sleep(0.05)
+            return sent, unchanged, shown, controller.framebuffer.render()[1, 2].tolist()
+        finally:
+            await daemon.stop()
+    
+    sent, unchanged, shown, after = asyncio.run(main())
+    assert (sent, unchanged) == (1, 0)
+    assert shown == [0, 200, 0]
+    assert after == [0, 0, 0]
+
+def test_sync_client_drives_arduino_owned_by_daemon(tmp_path):
+    socket_path = str(tmp_path / "led.sock")
+    with ArduinoEmulator("drain", show_time=0.0, boot_time=0.0, startup_time=0.0) as emulator:
+        arduino = ArduinoLEDController(auto_connect=False, reset_delay=0.05)
+        arduino.connect(emulator.port)
+        daemon = LEDDaemon(arduino.framebuffer, arduino.flush, socket_path, "arduino", close=arduino.disconnect)
+        run_sync(daemon.start())
+        client = ArduinoDaemonClient(socket_path)
+        try:
+            assert client.highlight_multiple_positions(["A1", "E8"], [LEDColor(r=9, g=0, b=0), LEDColor(r=0, g=0, b=9)],
+                                                       duration=1)
+            assert client.is_connected
+            assert emulator.wait_for("E8", (0, 0, 9), timeout=1) is not None
+            assert client.get_led_status() == {"A1": [9, 0, 0], "E8": [0, 0, 9]}
+            
+            # 만료는 데몬이 처리
+            assert emulator.wait_for("A1", (0, 0, 0), timeout=2) is not None
+            assert client.get_led_status() == {}
+        finally:
+            client.disconnect()
+            run_sync(daemon.stop())
+    assert not arduino.is_connected
+
+def test_client_health_reflects_daemon_hardware(tmp_path):
+    socket_path = str(tmp_path / "led.sock")
+    hardware = {"plugged": True}
+    
+    async def main():
+        controller = MockESP32Controller(latency=0.0)
+        
+        async def probe():
+            if not hardware["plugged"]:
+                raise ConnectionError("ESP32 응답 없음")
+            return await controller.probe()
+        
+        health = HealthPoller(probe, "MockESP32Controller", interval=0.05)
+        daemon = LEDDaemon(controller.framebuffer, controller.push_frame, socket_path, health=health)
+        await daemon.start()
+        client = LEDDaemonClient(socket_path)
+        client.health.interval = 0.05
+        client.health.start(asyncio.get_running_loop())
+        
+        async def wait_for(condition):
+            deadline = time.monotonic() + 3
+            while not condition(client.health.snapshot()) and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            return client.health.snapshot()
+        
+        try:
+            await client.highlight_position(LEDControl(grid_position="B1-B2", color="green", duration=30))
+            online = await wait_for(lambda snapshot: snapshot["active_leds"] == 2)
+            
+            # 데몬은 살아 있지만 하드웨어 확인이 실패하면 클라이언트도 연결되지 않음으로 보고
+            hardware["plugged"] = False
+            offline = await wait_for(lambda snapshot: snapshot["reachable"] is False)
+            return online, offline
+        finally:
+            await asyncio.to_thread(client.health.stop)
+            await client.close()
+            await daemon.stop()
+    
+    online, offline = asyncio.run(main())
+    assert online["reachable"] and online["details"]["backend"] == "mock"
+    assert online["details"]["hardware"]["health"]["reachable"]
+    assert not offline["reachable"] and offline["last_error"] == "LED 데몬 하드웨어: ESP32 응답 없음"
+    assert offline["active_leds"] == 2 and offline["details"]["hardware"]["health"]["consecutive_failures"] >= 1
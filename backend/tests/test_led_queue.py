@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+LED 작업 큐 테스트
+우선순위, 같은 셀 명령 병합, 결과 대기를 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.models.models import LEDControl
+from backend.controllers.led_queue import (
+    LEDJobQueue,
+    PRIORITY_BULK,
+    PRIORITY_DIAGNOSTIC,
+    PRIORITY_INTERACTIVE,
+    JOB_FAILED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED
+)
+
+class FakeController:
+    def __init__(self, latency: float = 0.01):
+        self.latency = latency
+        self.executed = []
+    
+    async def highlight_position(self, led_control: LEDControl):
+        self.executed.append((led_control.grid_position, led_control.color))
+        await asyncio.sleep(self.latency)
+        if led_control.grid_position == "Z99":
+            return {"success": False, "error": "No valid LED positions found"}
+        return {"success": True}
+
+def test_interactive_jobs_run_before_bulk():
+    async def scenario():
+        controller = FakeController()
+        queue = LEDJobQueue(controller.highlight_position)
+        blocker = queue.submit(LEDControl(grid_position="A1"), PRIORITY_BULK)
+        await asyncio.sleep(0)  # 첫 작업 실행 시작
+        
+        diagnostic = queue.submit(LEDControl(grid_position="B1"), PRIORITY_DIAGNOSTIC)
+        bulk = queue.submit(LEDControl(grid_position="C1"), PRIORITY_BULK)
+        interactive = queue.submit(LEDControl(grid_position="D1"), PRIORITY_INTERACTIVE)
+        
+        for job in (blocker, diagnostic, bulk, interactive):
+            await queue.wait(job, timeout=1)
+        await queue.close()
+        return controller.executed
+    
+    executed = asyncio.run(scenario())
+    assert [position for position, _ in executed] == ["A1", "D1", "C1", "B1"]
+
+def test_same_cells_are_coalesced_while_queued():
+    async def scenario():
+        controller = FakeController()
+        queue = LEDJobQueue(controller.highlight_position)
+        blocker = queue.submit(LEDControl(grid_position="A1"))
+        await asyncio.sleep(0)
+        
+        first = queue.submit(LEDControl(grid_position="B1-B2", color="red"), PRIORITY_BULK)
+        # 같은 셀 집합(표기만 다름): 최신 색상으로 갱신되고 우선순위 승격
+        second = queue.submit(LEDControl(grid_position="B2-B1", color="green"), PRIORITY_INTERACTIVE)
+        other = queue.submit(LEDControl(grid_position="C1"), PRIORITY_BULK)
+        
+        await queue.wait(other, timeout=1)
+        await queue.close()
+        return controller, queue, blocker, first, second
+    
+    controller, queue, blocker, first, second = asyncio.run(scenario())
+    assert first is second
+    assert second.requests == 2 and second.status == JOB_SUCCEEDED
+    assert ("B1-B2", "red") not in controller.executed
+    assert [p for p, _ in controller.executed].count("B2-B1") == 1
+    assert queue.stats()["coalesced"] == 1
+
+def test_duplicate_of_recent_job_is_deduplicated_and_failures_reported():
+    async def scenario():
+        controller = FakeController()
+        queue = LEDJobQueue(controller.highlight_position, coalesce_window=10)
+        done = await queue.run(LEDControl(grid_position="E1"), timeout=1)
+        duplicate = queue.submit(LEDControl(grid_position="E1"))
+        failed = await queue.run(LEDControl(grid_position="Z99"), timeout=1)
+        await queue.close()
+        return controller, done, duplicate, failed
+    
+    controller, done, duplicate, failed = asyncio.run(scenario())
+    assert duplicate is done and len(controller.executed) == 2
+    assert failed.status == JOB_FAILED
+    assert failed.to_dict()["error"] == "No valid LED positions found"
+
+def test_history_evicts_finished_jobs_behind_unfinished_ones():
+    async def scenario():
+        release = asyncio.Event()
+        
+        async def execute(led_control):
+            if led_control.grid_position == "A1":
+                await release.wait()  # 응답 없는 하드웨어
+            return {"success": True}
+        
+        queue = LEDJobQueue(execute, history_size=3)
+        stuck = queue.submit(LEDControl(grid_position="A1"), PRIORITY_BULK)
+        # 나중에 접수됐지만 먼저 실행되는 작업들
+        jobs = [queue.submit(LEDControl(grid_position=f"B{i}")) for i in range(1, 9)]
+        for job in jobs:
+            await queue.wait(job, timeout=1)
+        await asyncio.sleep(0)  # stuck 실행 시작
+        
+        kept = [job for job in jobs if queue.get(job.id) is not None]
+        result = (stuck.status, queue.get(stuck.id) is stuck, kept, jobs[-2:])
+        release.set()
+        await queue.wait(stuck, timeout=1)
+        await queue.close()
+        return result
+    
+    status, stuck_kept, kept, latest = asyncio.run(scenario())
+    # 가장 오래된 작업이 끝나지 않아도 완료된 작업은 history_size까지 정리됨
+    assert status == JOB_RUNNING and stuck_kept
+    assert kept == latest
+
+def _item_database(tmp_path):
+    from backend.database.database import ItemDatabase
+    db = ItemDatabase(str(tmp_path / "inventory.db"))
+    return db, db.add_item("십자 드라이버", "PH2", "공구", "B1-B2")
+
+def test_mcp_highlight_tool_submits_job(tmp_path, monkeypatch):
+    pytest.importorskip("fastmcp")
+    # 모듈 전역 DB(items.db)가 저장소에 만들어지지 않도록
+    monkeypatch.chdir(tmp_path)
+    from backend.mcp import mcp_server
+    
+    db, item_id = _item_database(tmp_path)
+    monkeypatch.setattr(mcp_server, "db", db)
+    
+    async def scenario():
+        controller = FakeController()
+        queue = LEDJobQueue(controller.highlight_position)
+        monkeypatch.setattr(mcp_server, "led_jobs", queue)
+        result = await mcp_server.highlight_item_location(mcp_server.HighlightItemLocationArgs(item_id=item_id))
+        job = await queue.wait(queue.get(result["data"]["job"]["id"]), timeout=1)
+        looked_up = await mcp_server.get_led_job(mcp_server.GetLEDJobArgs(job_id=job.id))
+        await queue.close()
+        return controller, result, looked_up
+    
+    controller, result, looked_up = asyncio.run(scenario())
+    assert result["success"] and result["data"]["positions"] == ["B1", "B2"]
+    assert controller.executed == [("B1-B2", "blue")]
+    assert looked_up["data"]["status"] == JOB_SUCCEEDED
+    db.close()
+
+def test_gemini_agent_highlight_submits_job(tmp_path, monkeypatch):
+    pytest.importorskip("google.generativeai")
+    from backend.controllers.gemini_agent import GeminiItemAgent
+    
+    monkeypatch.delenv("GOOGLE_AI_API_KEY", raising=False)
+    db, item_id = _item_database(tmp_path)
+    
+    async def scenario():
+        controller = FakeController()
+        agent = GeminiItemAgent(db=db, esp32_controller=controller)
+        result = await agent.highlight_item_location(item_id, duration=3, color="red")
+        job = await agent.led_jobs.wait(agent.led_jobs.get(result["data"]["job"]["id"]), timeout=1)
+        await agent.led_jobs.close()
+        return controller, result, job
+    
+    controller, result, job = asyncio.run(scenario())
+    assert result["success"] and job.status == JOB_SUCCEEDED
+    assert controller.executed == [("B1-B2", "red")]
+    db.close()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+메트릭 레지스트리 테스트
+카운터/게이지/히스토그램 기록과 Prometheus 텍스트 출력을 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.core.metrics import MetricsRegistry, CONTROLLER_FAILURES, observe_controller
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("op_seconds", "작업 시간", ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, op="read")
+    
+    text = registry.render()
+    assert '# TYPE op_seconds histogram' in text
+    assert 'op_seconds_bucket{op="read",le="0.1"} 2' in text
+    assert 'op_seconds_bucket{op="read",le="1"} 3' in text
+    assert 'op_seconds_bucket{op="read",le="+Inf"} 4' in text
+    assert 'op_seconds_count{op="read"} 4' in text
+    assert histogram.count(op="read") == 4
+
+def test_counter_labels_and_reregistration():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "요청 수", ("status",))
+    counter.inc(status="200")
+    counter.inc(2, status="500")
+    
+    # 같은 이름은 같은 메트릭, 다른 종류로는 등록 불가
+    assert registry.counter("requests_total", "요청 수", ("status",)) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("requests_total", "요청 수")
+    with pytest.raises(ValueError):
+        counter.inc(method="GET")
+    
+    text = registry.render()
+    assert 'requests_total{status="200"} 1' in text
+    assert 'requests_total{status="500"} 2' in text
+
+def test_gauge_callback():
+    registry = MetricsRegistry()
+    values = [3]
+    registry.gauge("queue_depth", "큐 길이", callback=lambda: values[0])
+    assert "queue_depth 3" in registry.render()
+    values[0] = 5
+    assert "queue_depth 5" in registry.render()
+
+def test_observe_controller_counts_failures():
+    class FakeController:
+        @observe_controller("highlight")
+        async def highlight(self, ok: bool):
+            return {"success": ok}
+    
+    labels = {"controller": "FakeController", "operation": "highlight"}
+    before = CONTROLLER_FAILURES.value(**labels)
+    asyncio.run(FakeController().highlight(True))
+    asyncio.run(FakeController().highlight(False))
+    assert CONTROLLER_FAILURES.value(**labels) == before + 1
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+샘플링 프로파일러 테스트
+"""
+
+import sys
+import os
+import threading
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.core import profiler
+
+def busy_loop(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+def test_sampler_captures_busy_thread():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        profile = profiler.sample(0.2, interval=0.002)
+    finally:
+        stop.set()
+        worker.join()
+    
+    assert profile.samples > 0
+    lines = profile.collapsed().splitlines()
+    assert any(line.startswith("busy-worker;") and "busy_loop (test_profiler.py:" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert profile.top(1)[0]["samples"] > 0
+
+def test_only_one_session_at_a_time():
+    results = []
+    first = threading.Thread(target=lambda: results.append(profiler.sample(0.3)))
+    first.start()
+    while not profiler.is_running():
+        pass
+    with pytest.raises(RuntimeError):
+        profiler.sample(0.1)
+    first.join()
+    assert not profiler.is_running()
+
+def test_rejects_unbounded_duration():
+    with pytest.raises(ValueError):
+        profiler.sample(profiler.MAX_DURATION + 1)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+시리얼 I/O 스레드 테스트
+에뮬레이터(pty)를 상대로 명령 병합, 펌웨어 응답 확인(ack), 흐름 제어, 재전송을 확인합니다.
+"""
+
+import sys
+import os
+import time
+
+import pytest
+import serial
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.controllers.arduino_emulator import ArduinoEmulator
+from backend.controllers.serial_io import ARDUINO_RX_BUFFER, SerialCommandError, SerialIO
+
+def open_io(emulator, **kwargs):
+    conn = serial.Serial(emulator.port, 115200, timeout=1)
+    deadline = time.monotonic() + 2
+    text = ""
+    while "Ready" not in text and time.monotonic() < deadline:
+        text += conn.read_all().decode("ascii", errors="replace")
+        time.sleep(0.01)
+    return conn, SerialIO(conn, **kwargs)
+
+def test_commands_are_acked_and_coalesced():
+    with ArduinoEmulator("drain", show_time=0.0, boot_time=0.0, startup_time=0.0) as emulator:
+        conn, io = open_io(emulator)
+        try:
+            futures = io.send_cells(["A1:1,1,1", "B2:0,9,0", "A1:255,0,0"])
+            for future in futures:
+                assert future.result(2) is None
+            # 펌웨어는 show() 전에 응답하므로 표시는 잠시 뒤
+            assert emulator.wait_for("A1", (255, 0, 0), timeout=1) is not None
+            assert emulator.active() == {"A1": [255, 0, 0], "B2": [0, 9, 0]}
+            
+            with pytest.raises(SerialCommandError, match="Invalid position"):
+                io.send_cells(["Z9:1,2,3"])[0].result(2)
+            
+            assert io.status().result(2) == {"A1": [255, 0, 0], "B2": [0, 9, 0]}
+            
+            # CLEAR 이전의 대기 셀 명령은 보내지 않음
+            dropped = io.send_cells(["C3:5,5,5"])
+            io.clear().result(2)
+            dropped[0].result(2)
+            assert emulator.wait_for("A1", (0, 0, 0), timeout=1) is not None
+            assert emulator.active() == {}
+            
+            stats = io.stats()
+            assert stats["coalesced"] >= 1 and stats["firmware_errors"] == 1
+            assert stats["pending"] == 0 and stats["in_flight"] == 0 and stats["retried"] == 0
+        finally:
+            io.close()
+            conn.close()
+
+def test_flow_control_keeps_sketch_buffer_from_overflowing():
+    # 루프당 1글자만 읽는 스케치에도 확인된 만큼만 보내므로 64바이트 수신 버퍼가 넘치지 않음
+    with ArduinoEmulator("sketch", loop_delay=0.002, show_time=0.0, boot_time=0.0, startup_time=0.0) as emulator:
+        conn, io = open_io(emulator)
+        try:
+            commands = [f"{row}{col}:9,9,9" for row in "ABCDE" for col in range(1, 9)]
+            for future in io.send_cells(commands):
+                future.result(10)
+            
+            assert emulator.wait_for("E8", (9, 9, 9), timeout=1) is not None
+            assert len(emulator.active()) == 40
+            assert emulator.stats()["rx_overflow"] == 0
+            stats = io.stats()
+            assert stats["frames"] < len(commands)
+            assert stats["bytes"] / stats["frames"] <= ARDUINO_RX_BUFFER
+        finally:
+            io.close()
+            conn.close()
+
+def test_unacked_frames_are_retried_then_failed():
+    # 응답을 보내지 않는 펌웨어 - 재전송 후 TimeoutError
+    with ArduinoEmulator("drain", show_time=0.0, boot_time=0.0, startup_time=0.0, echo=False) as emulator:
+        conn, io = open_io(emulator, ack_timeout=0.1, max_retries=1)
+        try:
+            future = io.send_cells(["A1:1,2,3"])[0]
+            with pytest.raises(TimeoutError):
+                future.result(2)
+            stats = io.stats()
+            assert stats["retried"] == 2 and stats["failed"] == 1 and stats["frames"] == 2
+        finally:
+            io.close()
+            conn.close()
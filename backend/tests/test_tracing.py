@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+트레이싱 테스트
+스팬의 부모-자식 전파(asyncio, 스레드 풀)와 JSONL 출력을 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from backend.core import tracing
+from backend.core.tracing import read_spans, span, traced
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = str(tmp_path / "spans.jsonl")
+    tracing.configure(path)
+    yield path
+    tracing.configure(None)
+
+@traced("lookup")
+def lookup(name: str) -> str:
+    return name.upper()
+
+@traced("query")
+async def query():
+    # 스레드 풀로 넘어간 호출도 같은 트레이스의 자식이 되어야 함
+    await asyncio.to_thread(lookup, "a")
+    await asyncio.gather(*(asyncio.to_thread(lookup, n) for n in "bc"))
+
+def test_spans_propagate_across_tasks_and_threads(trace_file):
+    asyncio.run(query())
+    
+    spans = read_spans(trace_file)
+    [root] = [s for s in spans if s["name"] == "query"]
+    children = [s for s in spans if s["name"] == "lookup"]
+    assert len(children) == 3
+    assert all(c["trace_id"] == root["trace_id"] for c in children)
+    assert all(c["parent_id"] == root["span_id"] for c in children)
+    assert root["parent_id"] is None
+    assert root["duration_ms"] >= max(c["duration_ms"] for c in children)
+
+def test_span_records_errors_and_attributes(trace_file):
+    with pytest.raises(ValueError):
+        with span("outer", item_id=3) as current:
+            current.set_attribute("rows", 2)
+            raise ValueError("boom")
+    
+    [record] = read_spans(trace_file)
+    assert record["error"] == "ValueError: boom"
+    assert record["attributes"] == {"item_id": 3, "rows": 2}
+
+def test_disabled_tracing_creates_no_spans():
+    tracing.configure(None)
+    with span("noop") as current:
+        assert current is None
+    assert lookup("x") == "X"
@@ -4,7 +4,7 @@
 """
 
 import streamlit as st
-import asyncio
+import hmac
 import json
 import sys
 import os
@@ -18,12 +18,19 @@ from dataclasses import dataclass
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 프로세스 전역 백그라운드 이벤트 루프 (세션/메시지마다 루프를 새로 만들지 않음)
+from backend.core.async_bridge import run_sync
+from backend.core.tracing import current_span, traced
+from backend.core import profiler
+
 # 기존 시스템 컴포넌트 import
 try:
-    from backend.database.database import ItemDatabase
+    from backend.database.database import ItemDatabase, parse_grid_position
     from backend.models.models import Item, LEDControl
-    from backend.controllers.esp32_controller import highlight_item_location, control_leds, turn_off_all_leds
-    from backend.mcp.mcp_server import parse_grid_position
+    from backend.controllers.esp32_controller import (
+        highlight_item_location, control_leds, turn_off_all_leds, get_controller_info, start_hardware_health,
+        create_esp32_controller
+    )
     DATABASE_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️ 데이터베이스 모듈 import 실패: {e}")
@@ -196,23 +203,54 @@ class ToolKnowledgeBase:
         
         return suggestions[:5]  # 최대 5개 제안
 
+# 프로세스 공유 리소스
+@dataclass
+class SharedResources:
+    """모든 세션이 공유하는 리소스 (DB, 지식 베이스, LLM 에이전트, LED 컨트롤러)"""
+    db: Optional[ItemDatabase] = None
+    knowledge_base: Optional[ToolKnowledgeBase] = None
+    gemini_agent: Optional[Any] = None
+    led_controller: Optional[Any] = None
+
+@st.cache_resource(show_spinner=False)
+def get_shared_resources() -> SharedResources:
+    """프로세스당 한 번만 리소스를 생성하고 이후 세션에서는 재사용합니다.
+    
+    ItemDatabase는 호출마다 커넥션을 열고, ToolKnowledgeBase는 읽기 전용이므로
+    여러 세션 스레드에서 동시에 사용해도 안전합니다.
+    """
+    db = ItemDatabase() if DATABASE_AVAILABLE else None
+    knowledge_base = ToolKnowledgeBase()
+    # 에이전트의 LED 작업 큐가 쓰는 컨트롤러 (프로세스당 하나)
+    led_controller = create_esp32_controller(simulation_mode=True) if DATABASE_AVAILABLE else None
+    
+    # Gemini 에이전트 초기화 (DB와 컨트롤러는 공유 인스턴스 재사용)
+    gemini_agent = None
+    if GEMINI_AVAILABLE:
+        try:
+            gemini_agent = GeminiItemAgent(db=db, esp32_controller=led_controller)
+        except Exception as e:
+            print(f"⚠️ Gemini 초기화 실패: {e}")
+    
+    # LED 하드웨어 상태 백그라운드 확인 (사이드바는 캐시만 읽음)
+    if DATABASE_AVAILABLE:
+        start_hardware_health()
+    
+    return SharedResources(db=db, knowledge_base=knowledge_base, gemini_agent=gemini_agent,
+                           led_controller=led_controller)
+
 # 지능형 AI 챗봇 클래스
 class IntelligentChatBot:
-    def __init__(self):
-        self.db = ItemDatabase() if DATABASE_AVAILABLE else None
-        self.knowledge_base = ToolKnowledgeBase()
-        
-        # Gemini 에이전트 초기화
-        if GEMINI_AVAILABLE:
-            try:
-                self.gemini_agent = GeminiItemAgent()
-                self.use_gemini = True
-            except Exception as e:
-                print(f"⚠️ Gemini 초기화 실패: {e}")
-                self.use_gemini = False
-        else:
-            self.use_gemini = False
-        
+    """세션별 대화 상태만 보유하고, 무거운 리소스는 SharedResources에서 가져옵니다."""
+    
+    def __init__(self, shared: Optional[SharedResources] = None):
+        shared = shared or get_shared_resources()
+        self.db = shared.db
+        self.knowledge_base = shared.knowledge_base or ToolKnowledgeBase()
+        self.gemini_agent = shared.gemini_agent
+        self.use_gemini = self.gemini_agent is not None
+        
+        # 세션별 대화 상태
         self.conversation_history = []
         self.user_context = {
             "skill_level": "beginner",  # beginner, intermediate, advanced
@@ -220,6 +258,7 @@ class IntelligentChatBot:
             "preferences": {}
         }
     
+    @traced()
     def analyze_user_intent(self, query: str) -> Dict[str, Any]:
         """사용자 의도 분석"""
         query_lower = query.lower()
@@ -263,6 +302,7 @@ class IntelligentChatBot:
         
         return intent
     
+    @traced()
     def generate_educational_response(self, intent: Dict[str, Any], query: str) -> ChatResponse:
         """교육적 응답 생성"""
         
@@ -390,11 +430,15 @@ class IntelligentChatBot:
             confidence=0.5
         )
     
+    @traced()
     async def process_query(self, user_input: str) -> ChatResponse:
         """사용자 쿼리 처리"""
         
         # 사용자 의도 분석
         intent = self.analyze_user_intent(user_input)
+        span = current_span()
+        if span is not None:
+            span.set_attribute("intent", intent["type"])
         
         # 교육적 응답 생성
         educational_response = self.generate_educational_response(intent, user_input)
@@ -553,9 +597,9 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 세션 상태 초기화
+# 세션 상태 초기화 (세션에는 대화 상태만, 리소스는 프로세스 공유)
 if 'chatbot' not in st.session_state:
-    st.session_state.chatbot = IntelligentChatBot()
+    st.session_state.chatbot = IntelligentChatBot(get_shared_resources())
 
 if 'stt_manager' not in st.session_state:
     st.session_state.stt_manager = STTManager()
@@ -582,6 +626,18 @@ st.sidebar.info(f"💾 데이터베이스: {'✅ 연결됨' if DATABASE_AVAILABL
 st.sidebar.info(f"🧠 AI 엔진: {'✅ Gemini' if GEMINI_AVAILABLE else '⚠️ 기본 모드'}")
 st.sidebar.info(f"🎤 음성 인식: {'✅ 사용 가능' if STT_AVAILABLE else '❌ 사용 불가'}")
 
+# LED 하드웨어 (백그라운드 확인의 캐시 - 화면을 다시 그려도 하드웨어에 요청하지 않음)
+if DATABASE_AVAILABLE:
+    hardware = get_controller_info()["health"]
+    if hardware["reachable"]:
+        st.sidebar.info(f"💡 LED 하드웨어: ✅ 연결됨 ({hardware['rtt_ms']}ms, 켜진 LED {hardware['active_leds']}개)")
+    elif hardware["reachable"] is None:
+        st.sidebar.info("💡 LED 하드웨어: ⏳ 확인 중")
+    else:
+        st.sidebar.warning(f"💡 LED 하드웨어: ❌ 연결 안됨 ({hardware['last_error']})")
+    if hardware["age"] is not None:
+        st.sidebar.caption(f"{hardware['age']:.0f}초 전 확인" + (" (오래됨)" if hardware["stale"] else ""))
+
 # 사용자 레벨 설정
 st.sidebar.subheader("👤 사용자 설정")
 user_level = st.sidebar.selectbox(
@@ -638,6 +694,32 @@ for question in quick_questions:
     if st.sidebar.button(f"❓ {question}"):
         st.session_state.quick_question = question
 
+# 관리자 전용 프로파일링 (ADMIN_TOKEN 설정 시에만 표시)
+admin_token = os.getenv("ADMIN_TOKEN")
+if admin_token:
+    with st.sidebar.expander("🔬 프로파일링 (관리자)"):
+        entered_token = st.text_input("관리자 토큰", type="password", key="admin_token")
+        if entered_token and hmac.compare_digest(entered_token, admin_token):
+            profile_seconds = st.slider("샘플링 시간(초)", 1, int(profiler.MAX_DURATION), 10)
+            if st.button("▶️ 프로파일 수집"):
+                try:
+                    with st.spinner(f"{profile_seconds}초 동안 샘플링 중..."):
+                        profile = profiler.sample(profile_seconds)
+                    st.session_state.profile_result = profile
+                except RuntimeError as e:
+                    st.warning(str(e))
+            
+            profile = st.session_state.get("profile_result")
+            if profile is not None:
+                st.caption(f"샘플 {profile.samples}개, 스택 {len(profile.stacks)}개")
+                st.download_button(
+                    "💾 collapsed-stack 다운로드",
+                    data=profile.collapsed(),
+                    file_name=f"chatbot-profile-{datetime.fromtimestamp(profile.started_at):%Y%m%d-%H%M%S}.collapsed",
+                    mime="text/plain"
+                )
+                st.table(profile.top(10))
+
 # 메인 채팅 영역
 col1, col2 = st.columns([3, 1])
 
@@ -745,7 +827,7 @@ with col1:
         with st.chat_message("assistant"):
             with st.spinner("🤖 분석하고 답변을 생성하고 있습니다..."):
                 try:
-                    response = asyncio.run(st.session_state.chatbot.process_query(user_input))
+                    response = run_sync(st.session_state.chatbot.process_query(user_input))
                     
                     # 응답 표시
                     st.markdown(response.message)
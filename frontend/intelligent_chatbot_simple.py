@@ -4,7 +4,6 @@
 """
 
 import streamlit as st
-import asyncio
 import json
 import sys
 import os
@@ -16,6 +15,9 @@ from dataclasses import dataclass
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 프로세스 전역 백그라운드 이벤트 루프 (세션/메시지마다 루프를 새로 만들지 않음)
+from backend.core.async_bridge import run_sync
+
 # 간단한 Item 클래스
 @dataclass
 class Item:
@@ -178,11 +180,24 @@ class ToolKnowledgeBase:
         
         return suggestions[:5]  # 최대 5개 제안
 
+# 프로세스 공유 리소스 (읽기 전용 DB 래퍼와 지식 베이스는 세션 간 공유)
+@st.cache_resource(show_spinner=False)
+def get_shared_resources() -> Tuple[SimpleItemDatabase, ToolKnowledgeBase]:
+    """프로세스당 한 번만 생성되는 DB/지식 베이스 인스턴스"""
+    return SimpleItemDatabase(), ToolKnowledgeBase()
+
 # 지능형 챗봇
 class IntelligentChatBot:
-    def __init__(self):
-        self.db = SimpleItemDatabase()
-        self.knowledge_base = ToolKnowledgeBase()
+    def __init__(self, db: Optional[SimpleItemDatabase] = None,
+                 knowledge_base: Optional[ToolKnowledgeBase] = None):
+        if db is None or knowledge_base is None:
+            shared_db, shared_kb = get_shared_resources()
+            db = db or shared_db
+            knowledge_base = knowledge_base or shared_kb
+        self.db = db
+        self.knowledge_base = knowledge_base
+        
+        # 세션별 대화 상태
         self.conversation_history = []
     
     def analyze_intent(self, query: str) -> str:
@@ -394,7 +409,7 @@ st.set_page_config(
 
 # 세션 상태 초기화
 if 'chatbot' not in st.session_state:
-    st.session_state.chatbot = IntelligentChatBot()
+    st.session_state.chatbot = IntelligentChatBot(*get_shared_resources())
 
 if 'messages' not in st.session_state:
     st.session_state.messages = []
@@ -499,7 +514,7 @@ if user_input:
     with st.chat_message("assistant"):
         with st.spinner("🤖 분석하고 답변을 생성하고 있습니다..."):
             try:
-                response = asyncio.run(st.session_state.chatbot.process_query(user_input))
+                response = run_sync(st.session_state.chatbot.process_query(user_input))
                 
                 # 응답 표시
                 st.markdown(response.message)
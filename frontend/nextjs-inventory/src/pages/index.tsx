@@ -3,7 +3,7 @@ import InventoryGrid from '@/components/InventoryGrid';
 import SearchInterface from '@/components/SearchInterface';
 import ItemManager from '@/components/ItemManager';
 import ItemEditModal from '@/components/ItemEditModal';
-import { Item, Category } from '@/types';
+import { Item, Category, InventoryEvent } from '@/types';
 import { InventoryAPI } from '@/lib/api';
 
 // 간단한 아이콘 컴포넌트 (heroicons 대신 사용)
@@ -54,6 +54,63 @@ const InventoryManagementPage: React.FC = () => {
     loadData();
   }, []);
 
+  // 실시간 변경 구독 (SSE) - 전체 목록 재조회 대신 변경분만 반영
+  useEffect(() => {
+    const source = new EventSource('http://localhost:8001/events?types=item,led,resync');
+
+    const applyItem = (item: Item) => {
+      setItems(list =>
+        list.some(i => i.id === item.id)
+          ? list.map(i => (i.id === item.id ? item : i))
+          : [...list, item]
+      );
+      // 검색 결과는 현재 검색어에 맞는 목록이므로 이미 있는 항목만 갱신
+      setSearchResults(list => list.map(i => (i.id === item.id ? item : i)));
+    };
+
+    const onItemChanged = (e: MessageEvent) => {
+      const event: InventoryEvent = JSON.parse(e.data);
+      if (event.data.item) applyItem(event.data.item);
+    };
+
+    const onItemDeleted = (e: MessageEvent) => {
+      const event: InventoryEvent = JSON.parse(e.data);
+      const remove = (list: Item[]) => list.filter(i => i.id !== event.data.id);
+      setItems(remove);
+      setSearchResults(remove);
+    };
+
+    const onLedOn = (e: MessageEvent) => {
+      const event: InventoryEvent = JSON.parse(e.data);
+      if (event.data.grid_position) {
+        setHighlightPositions(parseItemPositions(event.data.grid_position));
+      }
+    };
+
+    const onLedOff = () => setHighlightPositions([]);
+
+    // 만료된 작업의 위치만 끔 (이후에 켜진 하이라이트는 유지)
+    const onLedExpired = (e: MessageEvent) => {
+      const event: InventoryEvent = JSON.parse(e.data);
+      if (!event.data.grid_position) return;
+      const expired = new Set(parseItemPositions(event.data.grid_position));
+      setHighlightPositions(positions => positions.filter(p => !expired.has(p)));
+    };
+
+    source.addEventListener('item.created', onItemChanged);
+    source.addEventListener('item.updated', onItemChanged);
+    source.addEventListener('item.deleted', onItemDeleted);
+    // 일괄 변경은 ID 목록만 오므로 한 번 재조회
+    source.addEventListener('item.bulk', () => loadData());
+    source.addEventListener('led.on', onLedOn);
+    source.addEventListener('led.off', onLedOff);
+    source.addEventListener('led.expired', onLedExpired);
+    // 이벤트가 유실된 경우 한 번 전체 재조회
+    source.addEventListener('resync', () => loadData());
+
+    return () => source.close();
+  }, []);
+
   const loadData = async () => {
     setLoading(true);
     try {
@@ -73,11 +130,10 @@ const InventoryManagementPage: React.FC = () => {
     }
   };
 
-  // 물품 추가
+  // 물품 추가 (추가/수정/삭제 후 목록은 item.* 이벤트로 갱신 - 전체 재조회 없음)
   const handleItemAdd = async (itemData: Omit<Item, 'id'>) => {
     try {
       await api.addItem(itemData);
-      await loadData(); // 데이터 새로고침
     } catch (err) {
       throw new Error('물품 추가 중 오류가 발생했습니다.');
     }
@@ -87,7 +143,6 @@ const InventoryManagementPage: React.FC = () => {
   const handleItemUpdate = async (id: number, itemData: Partial<Item>) => {
     try {
       await api.updateItem(id, itemData);
-      await loadData(); // 데이터 새로고침
     } catch (err) {
       throw new Error('물품 수정 중 오류가 발생했습니다.');
     }
@@ -97,7 +152,6 @@ const InventoryManagementPage: React.FC = () => {
   const handleItemDelete = async (id: number) => {
     try {
       await api.deleteItem(id);
-      await loadData(); // 데이터 새로고침
     } catch (err) {
       throw new Error('물품 삭제 중 오류가 발생했습니다.');
     }
@@ -123,7 +177,6 @@ const InventoryManagementPage: React.FC = () => {
       } else {
         await api.updateItem(updatedItem.id, updatedItem);
       }
-      await loadData();
       setEditModalOpen(false);
       setEditingItem(null);
       setIsNewItem(false);
@@ -34,6 +34,23 @@ export interface ApiResponse<T> {
   error?: string;
 }
 
+// 실시간 이벤트 스트림 (/events) 페이로드
+export interface InventoryEvent {
+  id: number;
+  type: string; // item.created | item.updated | item.deleted | item.bulk | led.on | led.off | led.expired | resync
+  data: {
+    item?: Item;
+    id?: number;
+    ids?: number[];
+    action?: string;
+    grid_position?: string;
+    color?: string;
+    duration?: number;
+    dropped?: number;
+  };
+  timestamp: string;
+}
+
 export interface LEDControlRequest {
   item_id: number;
   duration?: number;
@@ -1,6 +1,9 @@
 /*
  * ESP32 NeoPixel LED 제어 서버
  * 물품 관리 시스템에서 HTTP 요청을 받아 LED를 제어합니다.
+ * /ws WebSocket으로 연결을 유지하면 JSON 대신 바이너리 프레임으로 명령을 받습니다.
+ *   요청: [op][seq 상위][seq 하위][payload]  (op 1 = 하이라이트, 2 = 픽셀 설정, 3 = 모두 끄기)
+ *   확인: [op|0x80][seq 상위][seq 하위][status][적용 LED 수]  (status 0 = 성공)
  * 
  * 필요한 라이브러리:
  * - Adafruit NeoPixel
@@ -24,9 +27,25 @@ const char* password = "YOUR_WIFI_PASSWORD";
 #define LED_COUNT 25     // 5x5 그리드 = 25개 LED
 #define BRIGHTNESS 50    // 밝기 (0-255)
 
+// WebSocket 프레임
+#define WS_OP_HIGHLIGHT 0x01   // payload: r, g, b, duration(초, 2바이트), LED 인덱스...
+#define WS_OP_SET_PIXELS 0x02  // payload: (인덱스, r, g, b) 반복
+#define WS_OP_CLEAR 0x03       // payload 없음
+#define WS_ACK 0x80
+#define WS_PING_INTERVAL 5000  // 클라이언트 연결 확인 ping 간격(ms)
+
 // 객체 생성
 Adafruit_NeoPixel strip(LED_COUNT, LED_PIN, NEO_GRB + NEO_KHZ800);
 AsyncWebServer server(80);
+AsyncWebSocket ws("/ws");
+unsigned long lastPing = 0;
+
+// 재시도/헤지 요청 중복 제거: 최근 명령 id와 보낸 응답
+#define RECENT_COMMANDS 16
+uint32_t recentIds[RECENT_COMMANDS] = {0};
+String recentResponses[RECENT_COMMANDS];
+int recentNext = 0;
+uint32_t currentCommandId = 0;  // 처리 중인 /led_control 명령 id (0 = id 없음)
 
 // LED 상태 관리
 bool ledStates[LED_COUNT] = {false};
@@ -67,11 +86,13 @@ void setup() {
   
   // 상태 확인 엔드포인트
   server.on("/status", HTTP_GET, [](AsyncWebServerRequest *request){
-    StaticJsonDocument<200> doc;
+    StaticJsonDocument<256> doc;
     doc["device"] = "ESP32 NeoPixel Controller";
     doc["ip"] = WiFi.localIP().toString();
     doc["led_count"] = LED_COUNT;
     doc["brightness"] = BRIGHTNESS;
+    doc["active_leds"] = countActiveLEDs();
+    doc["uptime_ms"] = millis();
     doc["wifi_rssi"] = WiFi.RSSI();
     
     String response;
@@ -84,6 +105,10 @@ void setup() {
     request->send(200);
   });
   
+  // WebSocket 채널 (ping에는 라이브러리가 pong으로 응답)
+  ws.onEvent(onWebSocketEvent);
+  server.addHandler(&ws);
+  
   server.begin();
   Serial.println("HTTP 서버 시작됨");
 }
@@ -100,12 +125,91 @@ void loop() {
     }
   }
   
+  // 끊긴 WebSocket 클라이언트 정리 및 연결 확인 ping
+  ws.cleanupClients();
+  if (currentTime - lastPing >= WS_PING_INTERVAL) {
+    ws.pingAll();
+    lastPing = currentTime;
+  }
+  
   strip.show();
   delay(100);
 }
 
+void onWebSocketEvent(AsyncWebSocket *server, AsyncWebSocketClient *client, AwsEventType type,
+                      void *arg, uint8_t *data, size_t len) {
+  if (type == WS_EVT_CONNECT) {
+    Serial.printf("WebSocket 클라이언트 #%u 연결\n", client->id());
+  } else if (type == WS_EVT_DISCONNECT) {
+    Serial.printf("WebSocket 클라이언트 #%u 연결 해제\n", client->id());
+  } else if (type == WS_EVT_DATA) {
+    AwsFrameInfo *info = (AwsFrameInfo *)arg;
+    // 명령 프레임은 수백 바이트 이하 - 한 번에 도착한 바이너리 메시지만 처리
+    if (info->opcode == WS_BINARY && info->final && info->index == 0 && info->len == len) {
+      handleWebSocketFrame(client, data, len);
+    }
+  }
+}
+
+void handleWebSocketFrame(AsyncWebSocketClient *client, uint8_t *data, size_t len) {
+  if (len < 3) {
+    return;  // seq가 없으면 확인할 수 없음
+  }
+  
+  uint8_t op = data[0];
+  uint8_t *payload = data + 3;
+  size_t payloadLen = len - 3;
+  uint8_t status = 0;
+  int applied = 0;
+  
+  if (op == WS_OP_HIGHLIGHT && payloadLen >= 5) {
+    uint32_t pixelColor = strip.Color(payload[0], payload[1], payload[2]);
+    unsigned long duration = ((unsigned long)payload[3] << 8) | payload[4];
+    unsigned long endTime = millis() + duration * 1000;
+    
+    for (size_t i = 5; i < payloadLen; i++) {
+      int index = payload[i];
+      if (index < LED_COUNT) {
+        ledStates[index] = true;
+        ledTimers[index] = endTime;
+        ledColors[index] = pixelColor;
+        strip.setPixelColor(index, pixelColor);
+        applied++;
+      }
+    }
+  } else if (op == WS_OP_SET_PIXELS && payloadLen % 4 == 0) {
+    for (size_t i = 0; i < payloadLen; i += 4) {
+      int index = payload[i];
+      if (index < LED_COUNT) {
+        uint32_t pixelColor = strip.Color(payload[i + 1], payload[i + 2], payload[i + 3]);
+        ledStates[index] = false;  // 서버가 프레임을 관리하므로 자동 끄기 해제
+        ledTimers[index] = 0;
+        ledColors[index] = pixelColor;
+        strip.setPixelColor(index, pixelColor);
+        applied++;
+      }
+    }
+  } else if (op == WS_OP_CLEAR) {
+    for (int i = 0; i < LED_COUNT; i++) {
+      ledStates[i] = false;
+      ledTimers[i] = 0;
+      ledColors[i] = 0;
+      strip.setPixelColor(i, 0);
+    }
+  } else {
+    status = 1;  // 알 수 없는 명령 또는 잘못된 길이
+  }
+  
+  if (status == 0) {
+    strip.show();
+  }
+  
+  uint8_t ack[5] = {(uint8_t)(op | WS_ACK), data[1], data[2], status, (uint8_t)min(applied, 255)};
+  client->binary(ack, sizeof(ack));
+}
+
 void handleLEDControl(AsyncWebServerRequest *request, uint8_t *data, size_t len) {
-  StaticJsonDocument<1024> doc;
+  StaticJsonDocument<4096> doc;
   DeserializationError error = deserializeJson(doc, data, len);
   
   if (error) {
@@ -119,12 +223,25 @@ void handleLEDControl(AsyncWebServerRequest *request, uint8_t *data, size_t len)
     return;
   }
   
+  // 같은 id의 명령은 한 번만 적용하고 기억한 응답을 다시 보냄
+  currentCommandId = doc["id"] | 0;
+  if (currentCommandId != 0) {
+    for (int i = 0; i < RECENT_COMMANDS; i++) {
+      if (recentIds[i] == currentCommandId) {
+        request->send(200, "application/json", recentResponses[i]);
+        return;
+      }
+    }
+  }
+  
   String action = doc["action"];
   
   if (action == "highlight") {
     handleHighlightAction(request, doc);
   } else if (action == "turn_off_all") {
     handleTurnOffAllAction(request);
+  } else if (action == "set_pixels") {
+    handleSetPixelsAction(request, doc);
   } else {
     StaticJsonDocument<100> errorDoc;
     errorDoc["success"] = false;
@@ -136,7 +253,16 @@ void handleLEDControl(AsyncWebServerRequest *request, uint8_t *data, size_t len)
   }
 }
 
-void handleHighlightAction(AsyncWebServerRequest *request, StaticJsonDocument<1024> &doc) {
+void sendCommandResponse(AsyncWebServerRequest *request, const String &response) {
+  if (currentCommandId != 0) {
+    recentIds[recentNext] = currentCommandId;
+    recentResponses[recentNext] = response;
+    recentNext = (recentNext + 1) % RECENT_COMMANDS;
+  }
+  request->send(200, "application/json", response);
+}
+
+void handleHighlightAction(AsyncWebServerRequest *request, StaticJsonDocument<4096> &doc) {
   JsonArray ledIndices = doc["led_indices"];
   JsonObject color = doc["color"];
   int duration = doc["duration"] | 5; // 기본값 5초
@@ -176,7 +302,7 @@ void handleHighlightAction(AsyncWebServerRequest *request, StaticJsonDocument<10
   
   String responseStr;
   serializeJson(response, responseStr);
-  request->send(200, "application/json", responseStr);
+  sendCommandResponse(request, responseStr);
   
   Serial.print("LED 하이라이트: ");
   Serial.print(ledIndices.size());
@@ -187,6 +313,36 @@ void handleHighlightAction(AsyncWebServerRequest *request, StaticJsonDocument<10
   Serial.print(duration); Serial.println("초");
 }
 
+// 애니메이션 프레임: 바뀐 픽셀만 [인덱스, r, g, b] 배열로 전달 (타이머 없음)
+void handleSetPixelsAction(AsyncWebServerRequest *request, StaticJsonDocument<4096> &doc) {
+  JsonArray pixels = doc["pixels"];
+  int applied = 0;
+  
+  for (JsonArray pixel : pixels) {
+    int index = pixel[0] | -1;
+    
+    if (index >= 0 && index < LED_COUNT) {
+      uint32_t pixelColor = strip.Color(pixel[1] | 0, pixel[2] | 0, pixel[3] | 0);
+      ledStates[index] = false;  // 서버가 프레임을 관리하므로 자동 끄기 해제
+      ledTimers[index] = 0;
+      ledColors[index] = pixelColor;
+      strip.setPixelColor(index, pixelColor);
+      applied++;
+    }
+  }
+  
+  strip.show();
+  
+  StaticJsonDocument<100> response;
+  response["success"] = true;
+  response["action"] = "set_pixels";
+  response["applied"] = applied;
+  
+  String responseStr;
+  serializeJson(response, responseStr);
+  sendCommandResponse(request, responseStr);
+}
+
 void handleTurnOffAllAction(AsyncWebServerRequest *request) {
   // 모든 LED 끄기
   for (int i = 0; i < LED_COUNT; i++) {
@@ -205,11 +361,22 @@ void handleTurnOffAllAction(AsyncWebServerRequest *request) {
   
   String responseStr;
   serializeJson(response, responseStr);
-  request->send(200, "application/json", responseStr);
+  sendCommandResponse(request, responseStr);
   
   Serial.println("모든 LED 끄기");
 }
 
+// 켜진 LED 수 (/status, 서버의 상태 확인용)
+int countActiveLEDs() {
+  int count = 0;
+  for (int i = 0; i < LED_COUNT; i++) {
+    if (ledColors[i] != 0) {
+      count++;
+    }
+  }
+  return count;
+}
+
 // 부팅 시 LED 테스트 (선택사항)
 void testLEDs() {
   Serial.println("LED 테스트 시작");
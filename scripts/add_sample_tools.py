@@ -90,24 +90,17 @@ def add_sample_tools():
     
     # 기존 데이터 확인
     existing_items = db.get_all_items()
-    existing_names = {item.name for item in existing_items}
+    existing_names = {item['name'] for item in existing_items}
     
     # 새로운 도구만 추가
     new_tools = [tool for tool in all_tools if tool[0] not in existing_names]
     
     if new_tools:
-        # 데이터베이스에 추가
-        import sqlite3
-        conn = sqlite3.connect(db.db_path)
-        cursor = conn.cursor()
-        
-        cursor.executemany("""
-            INSERT INTO items (name, description, grid_position, category)
-            VALUES (?, ?, ?, ?)
-        """, new_tools)
-        
-        conn.commit()
-        conn.close()
+        # 데이터베이스에 추가 (한 트랜잭션, 셀 색인 포함)
+        db.insert_item_rows([
+            (name, description, category, grid_position)
+            for name, description, grid_position, category in new_tools
+        ])
         
         print(f"✅ {len(new_tools)}개의 새로운 도구를 데이터베이스에 추가했습니다.")
         
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Arduino LED 시리얼 경로 벤치마크
+가상 Arduino 에뮬레이터(pty)에 실제 ArduinoLEDController를 연결해
+명령 처리량(commands/sec)과 하이라이트 요청부터 LED 표시까지의 지연 시간을 측정합니다.
+
+펌웨어 프로필(sketch: 현재 .ino, drain: 수신 버퍼를 모두 읽는 루프)과 보드레이트별로 비교하며,
+수신 버퍼 초과/show 중 유실 바이트도 함께 보고합니다.
+
+사용 예:
+    python scripts/benchmark_arduino.py
+    python scripts/benchmark_arduino.py --profiles drain --baudrates 9600 115200 --burst 200
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from backend.controllers.arduino_controller import ArduinoLEDController, LEDColor
+from backend.controllers.arduino_emulator import PROFILES, ArduinoEmulator
+from benchmark_database import percentile
+
+POSITIONS = [f"{row}{col}" for row in "ABCDE" for col in range(1, 9)]
+
+def color_for(i: int) -> LEDColor:
+    """반복마다 다른 색상 (이전 값과 같아 diff가 비는 일이 없도록)"""
+    return LEDColor(r=1 + i % 255, g=(i * 7) % 256, b=(i * 13) % 256)
+
+def measure_latency(controller: ArduinoLEDController, emulator: ArduinoEmulator,
+                    iterations: int, timeout: float) -> Dict[str, Any]:
+    """하이라이트 1건씩: highlight_position 호출부터 에뮬레이터 화면 반영까지"""
+    latencies: List[float] = []
+    lost = 0
+    for i in range(iterations):
+        position = POSITIONS[i % len(POSITIONS)]
+        color = color_for(i)
+        started = time.monotonic()
+        controller.highlight_position(position, color, duration=60)
+        shown_at = emulator.wait_for(position, (color.r, color.g, color.b), timeout)
+        if shown_at is None:
+            lost += 1
+        else:
+            latencies.append(shown_at - started)
+    
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "lost": lost,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2) if latencies else None,
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+    }
+
+def measure_throughput(controller: ArduinoLEDController, emulator: ArduinoEmulator,
+                       burst: int, timeout: float) -> Dict[str, Any]:
+    """하이라이트를 연달아 burst건 보내고 에뮬레이터가 처리한 셀 명령 수로 처리량 계산"""
+    before = emulator.stats()
+    targets = {}
+    started = time.monotonic()
+    for i in range(burst):
+        position = POSITIONS[i % len(POSITIONS)]
+        color = color_for(10_000 + i)
+        controller.highlight_position(position, color, duration=60)
+        targets[position] = (color.r, color.g, color.b)
+    submitted = time.monotonic() - started
+    
+    # 셀마다 마지막 색상이 표시되면 완료 (중간 값은 diff로 합쳐질 수 있음)
+    deadline = started + timeout
+    shown = 0
+    for position, color in targets.items():
+        if emulator.wait_for(position, color, max(0.0, deadline - time.monotonic())) is not None:
+            shown += 1
+    elapsed = time.monotonic() - started
+    
+    after = emulator.stats()
+    commands = after["commands"] - before["commands"]
+    return {
+        "burst": burst,
+        "submit_ms": round(submitted * 1000, 2),
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "commands": commands,
+        "commands_per_sec": round(commands / elapsed, 1) if elapsed > 0 else 0.0,
+        "cells_shown": f"{shown}/{len(targets)}",
+        "bytes_sent": after["bytes_received"] - before["bytes_received"],
+        "rx_overflow": after["rx_overflow"] - before["rx_overflow"],
+        "show_overrun": after["show_overrun"] - before["show_overrun"],
+    }
+
+def run_case(profile: str, baudrate: int, iterations: int, burst: int, timeout: float) -> Dict[str, Any]:
+    emulator = ArduinoEmulator(profile, baudrate, boot_time=0.0, startup_time=0.0)
+    emulator.start()
+    controller = ArduinoLEDController(baudrate=baudrate, auto_connect=False, reset_delay=0.2)
+    try:
+        controller.connect(emulator.port)
+        if not controller.is_connected:
+            return {"profile": profile, "baudrate": baudrate, "error": "연결 실패 (STATUS/배너 응답 없음)"}
+        
+        latency = measure_latency(controller, emulator, iterations, timeout)
+        controller.turn_off_all_leds()
+        time.sleep(0.2)
+        throughput = measure_throughput(controller, emulator, burst, timeout)
+        return {"profile": profile, "baudrate": baudrate, "latency": latency, "throughput": throughput,
+                "emulator": emulator.stats()}
+    finally:
+        controller.disconnect()
+        emulator.stop()
+
+def print_results(results: List[Dict[str, Any]]):
+    print(f"\n{'프로필':<8} {'보드레이트':>10} {'p50(ms)':>9} {'p95(ms)':>9} {'유실':>5} "
+          f"{'cmd/s':>8} {'표시':>8} {'버퍼초과':>8} {'show유실':>8}")
+    for result in results:
+        if "error" in result:
+            print(f"{result['profile']:<8} {result['baudrate']:>10}  {result['error']}")
+            continue
+        latency, throughput = result["latency"], result["throughput"]
+        print(f"{result['profile']:<8} {result['baudrate']:>10} {str(latency['p50_ms']):>9} "
+              f"{str(latency['p95_ms']):>9} {latency['lost']:>5} {throughput['commands_per_sec']:>8} "
+              f"{throughput['cells_shown']:>8} {throughput['rx_overflow']:>8} {throughput['show_overrun']:>8}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Arduino LED 시리얼 경로 벤치마크 (에뮬레이터)")
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES))
+    parser.add_argument("--baudrates", type=int, nargs="+", default=[115200])
+    parser.add_argument("--iterations", type=int, default=20, help="지연 시간 측정 반복 횟수")
+    parser.add_argument("--burst", type=int, default=40, help="처리량 측정 시 연달아 보낼 하이라이트 수")
+    parser.add_argument("--timeout", type=float, default=5.0, help="표시 대기 시간(초)")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: bench_results/arduino_<시각>.json)")
+    args = parser.parse_args()
+    
+    results = []
+    for profile in args.profiles:
+        for baudrate in args.baudrates:
+            print(f"⏱️  {profile} @ {baudrate} 측정 중...", file=sys.stderr)
+            results.append(run_case(profile, baudrate, args.iterations, args.burst, args.timeout))
+    print_results(results)
+    
+    output = args.output or os.path.join("bench_results", f"arduino_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "iterations": args.iterations,
+                "burst": args.burst,
+            },
+            "results": results
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+ItemDatabase 벤치마크
+합성 데이터(generate_inventory.py)로 크기별 DB를 만들고 모든 ItemDatabase 메서드의
+처리량(ops/sec)과 지연 시간 백분위수를 측정해 JSON으로 저장합니다.
+
+사용 예:
+    python scripts/benchmark_database.py --sizes 10000 100000
+    python scripts/benchmark_database.py --sizes 1000000 --backends wal-queue --output bench_results/1m.json
+    python scripts/benchmark_database.py --sizes 10000 --compare bench_results/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from backend.database.database import DatabaseConfig, ItemDatabase
+from generate_inventory import CATALOG, DEFAULT_SEED, generate_items, populate
+
+# 비교할 저장소 설정
+BACKENDS: Dict[str, DatabaseConfig] = {
+    "wal-queue": DatabaseConfig(),
+    "wal-direct": DatabaseConfig(use_write_queue=False),
+    "rollback-direct": DatabaseConfig(journal_mode="DELETE", synchronous="FULL", use_write_queue=False),
+}
+
+SEARCH_TERMS = [name for names in CATALOG.values() for name in names]
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값에서 최근접 순위 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+def measure(operation: Callable[[int], Any], iterations: int, threads: int = 1) -> Dict[str, float]:
+    """operation(i)를 반복 실행하고 처리량/지연 시간 통계 반환"""
+    latencies: List[float] = []
+    lock = threading.Lock()
+    
+    def worker(indices):
+        local = []
+        for i in indices:
+            started = time.perf_counter()
+            operation(i)
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+    
+    started = time.perf_counter()
+    if threads == 1:
+        worker(range(iterations))
+    else:
+        pool = [threading.Thread(target=worker, args=(range(t, iterations, threads),)) for t in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "threads": threads,
+        "ops_per_sec": round(iterations / elapsed, 1) if elapsed > 0 else 0.0,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 4),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "max_ms": round(latencies[-1] * 1000, 4),
+    }
+
+def build_cases(db: ItemDatabase, size: int, iterations: int, seed: int) -> Dict[str, Dict[str, Any]]:
+    """측정할 작업 목록: 이름 -> {operation, iterations, threads}"""
+    rng = random.Random(seed)
+    max_id = size + 10  # 초기 샘플 10개 포함
+    ids = [rng.randint(1, max_id) for _ in range(iterations)]
+    terms = [rng.choice(SEARCH_TERMS) for _ in range(iterations)]
+    categories = [rng.choice(list(CATALOG)) for _ in range(iterations)]
+    cells = [f"{rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}{rng.randint(1, 50)}" for _ in range(iterations)]
+    # 목록 전체를 읽는 작업은 크기에 비례하므로 반복 횟수를 줄임
+    scans = max(3, min(iterations, 2_000_000 // max(size, 1)))
+    
+    new_rows = list(generate_items(iterations * 2, seed=seed + 1))
+    written: List[int] = []
+    written_lock = threading.Lock()
+    
+    def add(i):
+        name, description, category, position = new_rows[i]
+        item_id = db.add_item(name, description, category, position)
+        with written_lock:
+            written.append(item_id)
+    
+    def add_concurrent(i):
+        add(iterations + i)
+    
+    return {
+        "search_items": {"operation": lambda i: db.search_items(terms[i]), "iterations": min(iterations, scans * 10)},
+        "search_items+category": {
+            "operation": lambda i: db.search_items(terms[i], categories[i]), "iterations": min(iterations, scans * 10)
+        },
+        "get_item_by_id": {"operation": lambda i: db.get_item_by_id(ids[i]), "iterations": iterations},
+        "get_all_items": {"operation": lambda i: db.get_all_items(), "iterations": scans},
+        "get_categories": {"operation": lambda i: db.get_categories(), "iterations": min(iterations, scans * 10)},
+        "get_items_at": {"operation": lambda i: db.get_items_at(cells[i]), "iterations": iterations},
+        "get_occupancy_map": {"operation": lambda i: db.get_occupancy_map(), "iterations": scans},
+        "get_inventory_version": {"operation": lambda i: db.get_inventory_version(), "iterations": iterations},
+        "add_item": {"operation": add, "iterations": iterations},
+        "add_item x8 threads": {"operation": add_concurrent, "iterations": iterations, "threads": 8},
+        "update_item": {
+            "operation": lambda i: db.update_item(written[i], grid_position=cells[i]), "iterations": iterations
+        },
+        "add_items_bulk (100 rows)": {
+            "operation": lambda i: db.add_items_bulk([
+                {"name": n, "description": d, "category": c, "grid_position": p}
+                for n, d, c, p in new_rows[i % len(new_rows):i % len(new_rows) + 100]
+            ]),
+            "iterations": max(1, iterations // 20)
+        },
+        "delete_item": {"operation": lambda i: db.delete_item(written[i]), "iterations": iterations},
+    }
+
+def run_benchmark(sizes: List[int], backends: List[str], iterations: int, seed: int,
+                  workdir: str, operations: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    results = []
+    for size in sizes:
+        for backend in backends:
+            path = os.path.join(workdir, f"bench_{size}_{backend}.db")
+            for suffix in ("", "-wal", "-shm", "-journal"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            
+            db = ItemDatabase(path, config=BACKENDS[backend])
+            load_seconds = populate(db, size, seed=seed)
+            print(f"\n📦 {size:,}행 / {backend}: 적재 {load_seconds:.1f}초 "
+                  f"({size / load_seconds:,.0f} rows/sec)", file=sys.stderr)
+            results.append({
+                "size": size, "backend": backend, "operation": "load (populate)",
+                "iterations": size, "threads": 1, "ops_per_sec": round(size / load_seconds, 1),
+                "seconds": round(load_seconds, 3)
+            })
+            
+            try:
+                for name, case in build_cases(db, size, iterations, seed).items():
+                    if operations and name not in operations:
+                        continue
+                    stats = measure(case["operation"], case["iterations"], case.get("threads", 1))
+                    print(f"  {name:<28} {stats['ops_per_sec']:>12,.1f} ops/s  "
+                          f"p50 {stats['p50_ms']:>9.3f}ms  p95 {stats['p95_ms']:>9.3f}ms  "
+                          f"p99 {stats['p99_ms']:>9.3f}ms", file=sys.stderr)
+                    results.append({"size": size, "backend": backend, "operation": name, **stats})
+            finally:
+                db.close()
+                for suffix in ("", "-wal", "-shm", "-journal"):
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+    return results
+
+def compare(results: List[Dict[str, Any]], baseline_path: str):
+    """이전 결과 파일과 ops/sec 비교 출력"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (r["size"], r["backend"], r["operation"]): r for r in json.load(f)["results"]
+        }
+    
+    print(f"\n📊 {baseline_path} 대비 ops/sec 변화:", file=sys.stderr)
+    for r in results:
+        before = baseline.get((r["size"], r["backend"], r["operation"]))
+        if not before or not before["ops_per_sec"]:
+            continue
+        change = (r["ops_per_sec"] - before["ops_per_sec"]) / before["ops_per_sec"] * 100
+        marker = "🔻" if change < -10 else "  "
+        print(f"{marker} {r['size']:>9,} {r['backend']:<16} {r['operation']:<28} {change:+7.1f}%", file=sys.stderr)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ItemDatabase 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="데이터셋 크기 (행 수)")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument("--iterations", type=int, default=1000, help="작업당 반복 횟수")
+    parser.add_argument("--operations", nargs="+", help="측정할 작업 이름 (기본: 전체)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workdir", default=tempfile.gettempdir(), help="벤치마크 DB를 만들 디렉토리")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: bench_results/db_<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+    
+    results = run_benchmark(args.sizes, args.backends, args.iterations, args.seed, args.workdir, args.operations)
+    
+    output = args.output or os.path.join("bench_results", f"db_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+                "seed": args.seed,
+                "iterations": args.iterations,
+            },
+            "results": results
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {output}", file=sys.stderr)
+    
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+ESP32 전송 방식 벤치마크 (HTTP POST vs WebSocket)
+로컬 ESP32 시뮬레이터에 실제 ESP32Controller를 연결해 두 전송 방식을 비교합니다.
+
+- 지연 시간: 하이라이트를 1건씩 보내고 응답(확인)을 받을 때까지
+- 동시 처리량: 하이라이트 burst건을 한꺼번에 보냈을 때 초당 명령 수
+- 효과 프레임: push_frame을 연달아 호출했을 때 초당 프레임 수 (WebSocket은 확인을 기다리지 않음)
+- 불안정한 Wi-Fi(--drop-rate, --stall-rate)에서 HTTP 재시도/헤지(--hedge)에 따른 꼬리 지연(p99/최대)
+
+사용 예:
+    python scripts/benchmark_esp32.py
+    python scripts/benchmark_esp32.py --latency 0.03 --jitter 0.01 --iterations 100 --burst 200
+    python scripts/benchmark_esp32.py --transports http --stall-rate 0.02 --iterations 500 --hedge
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from backend.controllers.esp32_controller import ESP32Controller, RetryPolicy
+from backend.controllers.esp32_simulator import SimulatorConfig, SimulatorThread
+from backend.models.models import LEDControl
+from benchmark_database import percentile
+
+TRANSPORTS = ("http", "ws")
+POSITIONS = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
+COLORS = ["red", "green", "blue", "yellow", "purple", "cyan"]
+
+def led_control(i: int) -> LEDControl:
+    return LEDControl(grid_position=POSITIONS[i % len(POSITIONS)], color=COLORS[i % len(COLORS)], duration=60)
+
+async def measure_latency(controller: ESP32Controller, iterations: int) -> Dict[str, Any]:
+    """하이라이트 1건씩: 호출부터 ESP32 응답까지"""
+    latencies: List[float] = []
+    failed = 0
+    for i in range(iterations):
+        started = time.perf_counter()
+        result = await controller.highlight_position(led_control(i))
+        if result["success"]:
+            latencies.append(time.perf_counter() - started)
+        else:
+            failed += 1
+    
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "failed": failed,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2) if latencies else None,
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+    }
+
+async def measure_burst(controller: ESP32Controller, burst: int) -> Dict[str, Any]:
+    """하이라이트 burst건을 동시에 보내고 모두 응답받을 때까지"""
+    started = time.perf_counter()
+    results = await asyncio.gather(*(controller.highlight_position(led_control(i)) for i in range(burst)))
+    elapsed = time.perf_counter() - started
+    ok = sum(1 for result in results if result["success"])
+    return {
+        "burst": burst,
+        "ok": ok,
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "commands_per_sec": round(ok / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+async def measure_frames(controller: ESP32Controller, simulator: SimulatorThread, frames: int) -> Dict[str, Any]:
+    """효과 프레임: 매 프레임 픽셀 하나씩 바꿔 push_frame, 마지막 프레임이 장치에 반영될 때까지"""
+    started = time.perf_counter()
+    for i in range(frames):
+        controller.framebuffer.paint([POSITIONS[i % len(POSITIONS)]], (1 + i % 255, 0, 0))
+        await controller.push_frame()
+    submitted = time.perf_counter() - started
+    
+    last_index = (frames - 1) % len(POSITIONS)
+    last_color = [1 + (frames - 1) % 255, 0, 0]
+    while simulator.simulator.active().get(last_index) != last_color and time.perf_counter() - started < 30:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - started
+    return {
+        "frames": frames,
+        "submit_ms": round(submitted * 1000, 2),
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "frames_per_sec": round(frames / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+def run_case(transport: str, config: SimulatorConfig, retry: RetryPolicy, iterations: int, burst: int,
+             frames: int) -> Dict[str, Any]:
+    with SimulatorThread(config) as simulator:
+        async def main():
+            controller = ESP32Controller("127.0.0.1", simulator.port, transport=transport, retry=retry)
+            try:
+                # 연결 수립(TCP/WebSocket 핸드셰이크)은 측정에서 제외
+                await controller.turn_off_all_leds()
+                latency = await measure_latency(controller, iterations)
+                throughput = await measure_burst(controller, burst)
+                effects = await measure_frames(controller, simulator, frames)
+                return latency, throughput, effects
+            finally:
+                await controller.close()
+        
+        latency, throughput, effects = asyncio.run(main())
+        return {"transport": transport, "latency": latency, "burst": throughput, "frames": effects,
+                "simulator": simulator.simulator.stats()}
+
+def print_results(results: List[Dict[str, Any]]):
+    print(f"\n{'전송':<6} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9} {'실패':>5} "
+          f"{'burst 성공':>10} {'burst cmd/s':>12} {'frame/s':>9} {'연결':>5}")
+    for result in results:
+        latency, burst, frames = result["latency"], result["burst"], result["frames"]
+        stats = result["simulator"]
+        connections = stats["ws_connections"] + stats["connections"]
+        print(f"{result['transport']:<6} {str(latency['p50_ms']):>9} {str(latency['p95_ms']):>9} "
+              f"{str(latency['p99_ms']):>9} {str(latency['max_ms']):>9} {latency['failed']:>5} {burst['ok']:>5}/{burst['burst']:<4} {burst['commands_per_sec']:>12} "
+              f"{frames['frames_per_sec']:>9} {connections:>5}")
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ESP32 전송 방식 벤치마크 (HTTP vs WebSocket, 시뮬레이터)")
+    parser.add_argument("--transports", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS))
+    parser.add_argument("--latency", type=float, default=0.02, help="시뮬레이터 기본 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="시뮬레이터 추가 지연 최대값(초)")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="응답 없이 연결을 끊는 비율")
+    parser.add_argument("--stall-rate", type=float, default=0.0, help="응답하지 않는 요청 비율")
+    parser.add_argument("--attempt-timeout", type=float, default=1.0, help="HTTP 시도당 타임아웃(초)")
+    parser.add_argument("--hedge", action="store_true", help="최근 p95보다 늦으면 HTTP 헤지 요청")
+    parser.add_argument("--iterations", type=int, default=50, help="지연 시간 측정 반복 횟수")
+    parser.add_argument("--burst", type=int, default=100, help="동시에 보낼 하이라이트 수")
+    parser.add_argument("--frames", type=int, default=200, help="효과 프레임 수")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: bench_results/esp32_<시각>.json)")
+    args = parser.parse_args()
+    
+    config = SimulatorConfig(latency=args.latency, jitter=args.jitter, drop_rate=args.drop_rate,
+                             stall_rate=args.stall_rate, stall_time=5.0, seed=1)
+    retry = RetryPolicy(attempt_timeout=args.attempt_timeout, hedge=args.hedge)
+    results = []
+    for transport in args.transports:
+        print(f"⏱️  {transport} 측정 중...", file=sys.stderr)
+        results.append(run_case(transport, config, retry, args.iterations, args.burst, args.frames))
+    print_results(results)
+    
+    output = args.output or os.path.join("bench_results", f"esp32_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "latency": args.latency,
+                "jitter": args.jitter,
+                "drop_rate": args.drop_rate,
+                "stall_rate": args.stall_rate,
+                "attempt_timeout": args.attempt_timeout,
+                "hedge": args.hedge,
+            },
+            "results": results
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+대용량 합성 물품 데이터 생성 스크립트
+같은 시드와 행 수에는 항상 같은 물품 목록을 만들어 벤치마크 결과를 비교할 수 있게 합니다.
+
+사용 예:
+    python scripts/generate_inventory.py 100000 --db bench.db
+    python scripts/generate_inventory.py 1000000 --output items.jsonl
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Iterator, Tuple
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from backend.database.bulk_io import FORMATS, export_lines
+from backend.database.database import ItemDatabase
+
+DEFAULT_SEED = 42
+
+# 카테고리별 물품 이름 (사용자가 실제로 검색할 법한 단어)
+CATALOG = {
+    "전선작업도구": ["와이어 커터", "니퍼", "와이어 스트리퍼", "압착 펜치", "케이블 타이", "수축 튜브"],
+    "나사작업도구": ["십자 드라이버", "일자 드라이버", "육각 렌치", "토크 드라이버", "비트 세트", "너트 드라이버"],
+    "측정도구": ["디지털 멀티미터", "오실로스코프", "캘리퍼스", "줄자", "수평계", "전류 클램프"],
+    "납땜도구": ["납땜 인두", "납 흡입기", "플럭스", "솔더 윅", "인두 거치대", "열풍기"],
+    "전자부품": ["저항", "콘덴서", "트랜지스터", "LED", "브레드보드", "점퍼선", "전압 레귤레이터"],
+    "전자기기": ["노트북", "마우스", "키보드", "USB 케이블", "충전기", "모니터", "허브"],
+    "문구류": ["볼펜", "노트", "포스트잇", "형광펜", "스테이플러", "가위"],
+    "안전장비": ["보안경", "작업 장갑", "방진 마스크", "귀마개", "안전화"],
+    "공구": ["망치", "펜치", "톱", "전동 드릴", "글루건", "바이스"],
+    "도서": ["파이썬 프로그래밍", "회로 이론", "아두이노 입문", "임베디드 시스템", "데이터베이스 설계"],
+}
+
+BRANDS = ["삼성", "LG", "보쉬", "마끼다", "플루크", "하코", "크레텍", "세신", "로지텍", "스탠리"]
+ADJECTIVES = ["소형", "대형", "정밀", "휴대용", "고급형", "보급형", "산업용", "무선", "절연", "다기능"]
+COLORS = ["검은색", "흰색", "빨간색", "파란색", "노란색", "회색"]
+DETAILS = ["여분 보관", "자주 사용", "수리 필요", "신품", "교육용", "대여 가능", "공용"]
+
+def generate_items(count: int, seed: int = DEFAULT_SEED, rows: int = 26,
+                   cols: int = 50) -> Iterator[Tuple[str, str, str, str]]:
+    """(name, description, category, grid_position) 행을 결정적으로 생성
+    
+    Args:
+        rows: 그리드 행 수 (A부터, 최대 26)
+        cols: 행당 칸 수
+    """
+    rng = random.Random(seed)
+    categories = list(CATALOG)
+    row_letters = [chr(ord("A") + i) for i in range(min(rows, 26))]
+    
+    for n in range(count):
+        category = rng.choice(categories)
+        base = rng.choice(CATALOG[category])
+        name = f"{rng.choice(ADJECTIVES)} {base} {rng.choice(BRANDS)}-{n % 1000:03d}"
+        description = f"{rng.choice(BRANDS)} {base} ({rng.choice(COLORS)}), {rng.choice(DETAILS)}"
+        
+        row = rng.choice(row_letters)
+        col = rng.randint(1, cols)
+        # 약 20%는 같은 행의 여러 칸을 차지
+        if rng.random() < 0.2 and col < cols:
+            grid_position = f"{row}{col}-{row}{min(cols, col + rng.randint(1, 3))}"
+        else:
+            grid_position = f"{row}{col}"
+        
+        yield name, description, category, grid_position
+
+def populate(db: ItemDatabase, count: int, seed: int = DEFAULT_SEED, batch_size: int = 10000,
+             rows: int = 26, cols: int = 50) -> float:
+    """DB에 count개 물품을 배치 트랜잭션으로 추가하고 걸린 시간(초) 반환"""
+    started = time.perf_counter()
+    batch = []
+    for item in generate_items(count, seed, rows, cols):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            db.insert_item_rows(batch)
+            batch = []
+    db.insert_item_rows(batch)
+    return time.perf_counter() - started
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="대용량 합성 물품 데이터 생성")
+    parser.add_argument("count", type=int, help="생성할 물품 수 (예: 10000 ~ 5000000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="난수 시드")
+    parser.add_argument("--rows", type=int, default=26, help="그리드 행 수 (A-Z)")
+    parser.add_argument("--cols", type=int, default=50, help="행당 칸 수")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--db", help="물품을 추가할 데이터베이스 파일")
+    target.add_argument("--output", help="CSV/JSONL 파일로 저장 ('-'는 표준 출력)")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl", help="--output 형식")
+    args = parser.parse_args()
+    
+    if args.db:
+        db = ItemDatabase(args.db)
+        try:
+            elapsed = populate(db, args.count, args.seed, rows=args.rows, cols=args.cols)
+        finally:
+            db.close()
+        rate = args.count / elapsed if elapsed > 0 else 0.0
+        print(f"✅ {args.count:,}개 물품 생성 ({elapsed:.1f}초, {rate:,.0f} rows/sec)", file=sys.stderr)
+        return 0
+    
+    items = (
+        {"id": n, "name": name, "description": description, "category": category,
+         "grid_position": position, "created_at": None, "updated_at": None}
+        for n, (name, description, category, position)
+        in enumerate(generate_items(args.count, args.seed, args.rows, args.cols), start=1)
+    )
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        for line in export_lines(items, args.format):
+            stream.write(line)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
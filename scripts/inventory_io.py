@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+물품 대량 가져오기/내보내기 스크립트 (CSV, JSONL)
+
+사용 예:
+    python scripts/inventory_io.py import tools.csv
+    python scripts/inventory_io.py import - --format jsonl < items.jsonl
+    python scripts/inventory_io.py export items.jsonl --format jsonl
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from backend.database.bulk_io import FORMATS, export_items, import_items
+from backend.database.database import ItemDatabase, get_database_path
+
+def _detect_format(path: str, fmt: str) -> str:
+    if fmt:
+        return fmt
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    return extension if extension in FORMATS else "csv"
+
+def run_import(db: ItemDatabase, args) -> int:
+    fmt = _detect_format(args.file, args.format)
+    
+    def progress(stats):
+        print(f"  ... {stats.imported:,}행 ({stats.rows_per_sec:,.0f} rows/sec)", file=sys.stderr)
+    
+    if args.file == "-":
+        stats = import_items(db, sys.stdin, fmt, batch_size=args.batch_size, progress=progress)
+    else:
+        with open(args.file, newline="", encoding="utf-8") as stream:
+            stats = import_items(db, stream, fmt, batch_size=args.batch_size, progress=progress)
+    
+    print(f"✅ {stats.imported:,}개 물품 가져오기 완료 "
+          f"({stats.elapsed:.2f}초, {stats.rows_per_sec:,.0f} rows/sec, 배치 {stats.batches}개)", file=sys.stderr)
+    if stats.failed:
+        print(f"⚠️ {stats.failed:,}개 행 건너뜀:", file=sys.stderr)
+        for error in stats.errors[:10]:
+            print(f"  • {error['line']}행: {error['error']}", file=sys.stderr)
+    return 1 if stats.failed and not stats.imported else 0
+
+def run_export(db: ItemDatabase, args) -> int:
+    fmt = _detect_format(args.file, args.format)
+    started = time.perf_counter()
+    
+    if args.file == "-":
+        count = export_items(db, sys.stdout, fmt)
+    else:
+        with open(args.file, "w", newline="", encoding="utf-8") as stream:
+            count = export_items(db, stream, fmt)
+    
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"✅ {count:,}개 물품 내보내기 완료 ({elapsed:.2f}초, {rate:,.0f} rows/sec)", file=sys.stderr)
+    return 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="물품 대량 가져오기/내보내기 (CSV, JSONL)")
+    parser.add_argument("--db", default=get_database_path(), help="데이터베이스 파일 (기본: DATABASE_URL 또는 items.db)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    import_parser = subparsers.add_parser("import", help="파일에서 물품 추가")
+    import_parser.add_argument("file", help="입력 파일 ('-'는 표준 입력)")
+    import_parser.add_argument("--format", choices=FORMATS, help="입력 형식 (기본: 확장자로 판단)")
+    import_parser.add_argument("--batch-size", type=int, default=5000, help="트랜잭션당 행 수")
+    
+    export_parser = subparsers.add_parser("export", help="모든 물품을 파일로 저장")
+    export_parser.add_argument("file", help="출력 파일 ('-'는 표준 출력)")
+    export_parser.add_argument("--format", choices=FORMATS, help="출력 형식 (기본: 확장자로 판단)")
+    
+    args = parser.parse_args()
+    db = ItemDatabase(args.db)
+    try:
+        if args.command == "import":
+            return run_import(db, args)
+        return run_export(db, args)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
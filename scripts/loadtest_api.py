@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+REST API 부하 테스트
+asyncio + httpx로 설정한 비율의 요청(/items, /items/search, /categories, 쓰기, /highlight)을
+동시에 보내고 RPS, 지연 시간 백분위수, 오류율, 서버 이벤트 루프 지연(lag)을 측정합니다.
+ESP32는 지연만 흉내 내는 MockESP32Controller로 대체하며, --esp32-sim을 주면 로컬 ESP32 HTTP 시뮬레이터에
+실제 ESP32Controller를 연결해 커넥션 풀/타임아웃 경로까지 부하를 줍니다.
+
+사용 예:
+    python scripts/loadtest_api.py                                   # 프로세스 내 ASGI
+    python scripts/loadtest_api.py --mode uvicorn --workers 4 --concurrency 64
+    python scripts/loadtest_api.py --mix items=50,search=30,highlight=20 --duration 30
+    python scripts/loadtest_api.py --url http://localhost:8001       # 실행 중인 서버
+    python scripts/loadtest_api.py --mix highlight=100 --esp32-sim --esp32-latency 0.03 --esp32-failure-rate 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.join(SCRIPTS_DIR, '..')
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmark_database import SEARCH_TERMS, percentile
+
+DEFAULT_MIX = "items=30,search=25,categories=10,item=15,create=5,update=5,delete=3,highlight=7"
+GRID_CELLS = [f"{row}{col}" for row in "ABCDE" for col in range(1, 6)]
+
+class LagMonitor:
+    """이벤트 루프 지연 측정: interval마다 깨어나 예정보다 늦은 시간을 기록"""
+    
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - started - self.interval))
+    
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+    
+    def summary(self) -> Dict[str, float]:
+        values = sorted(self.samples)
+        return {
+            "samples": len(values),
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p99_ms": round(percentile(values, 99) * 1000, 3),
+            "max_ms": round((values[-1] if values else 0.0) * 1000, 3),
+        }
+
+def make_esp32(latency: float, simulator_url: Optional[str] = None):
+    """부하 테스트용 ESP32 컨트롤러 (시뮬레이터 주소가 있으면 실제 HTTP 컨트롤러)"""
+    from backend.controllers.esp32_controller import ESP32Controller, MockESP32Controller
+    
+    if simulator_url:
+        host, _, port = simulator_url.removeprefix("http://").partition(":")
+        return ESP32Controller(host, int(port or 80))
+    return MockESP32Controller(latency=latency)
+
+def start_simulator(args):
+    """--esp32-sim: 백그라운드 스레드에서 ESP32 시뮬레이터 실행"""
+    from backend.controllers.esp32_simulator import SimulatorConfig, SimulatorThread
+    
+    config = SimulatorConfig(latency=args.esp32_latency, jitter=args.esp32_jitter,
+                             failure_rate=args.esp32_failure_rate, seed=args.seed)
+    return SimulatorThread(config).start()
+
+def serve_app():
+    """uvicorn --factory 진입점: 목업(또는 시뮬레이터 연결) ESP32와 루프 지연 측정을 붙인 rest_api.app"""
+    from backend.api import rest_api
+    
+    rest_api.esp32 = make_esp32(float(os.environ.get("LOADTEST_ESP32_LATENCY", "0.05")),
+                                os.environ.get("LOADTEST_ESP32_URL"))
+    monitor = LagMonitor()
+    
+    @rest_api.app.on_event("startup")
+    async def start_lag_monitor():
+        monitor.start()
+    
+    @rest_api.app.on_event("shutdown")
+    async def write_lag_samples():
+        monitor.stop()
+        lag_dir = os.environ.get("LOADTEST_LAG_DIR")
+        if lag_dir:
+            with open(os.path.join(lag_dir, f"lag_{os.getpid()}.json"), "w") as f:
+                json.dump(monitor.samples, f)
+    
+    return rest_api.app
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in OPERATIONS:
+            raise ValueError(f"알 수 없는 작업: {name} (가능: {', '.join(OPERATIONS)})")
+        mix.append((name.strip(), float(weight or 1)))
+    return mix
+
+class Worker:
+    """요청을 연속으로 보내는 가상 사용자 하나 (자신이 만든 물품만 수정/삭제)"""
+    
+    def __init__(self, client: httpx.AsyncClient, rng: random.Random, max_item_id: int):
+        self.client = client
+        self.rng = rng
+        self.max_item_id = max_item_id
+        self.created: List[int] = []
+    
+    async def items(self):
+        return await self.client.get("/items")
+    
+    async def search(self):
+        return await self.client.get("/items/search", params={"q": self.rng.choice(SEARCH_TERMS)})
+    
+    async def categories(self):
+        return await self.client.get("/categories")
+    
+    async def item(self):
+        return await self.client.get(f"/items/{self.rng.randint(1, self.max_item_id)}")
+    
+    async def create(self):
+        response = await self.client.post("/items", json={
+            "name": f"부하 테스트 {self.rng.randint(0, 10**6)}",
+            "description": "load test",
+            "category": "부하테스트",
+            "grid_position": self.rng.choice(GRID_CELLS)
+        })
+        if response.status_code == 200:
+            self.created.append(response.json()["id"])
+        return response
+    
+    async def update(self):
+        if not self.created:
+            return await self.create()
+        return await self.client.put(
+            f"/items/{self.rng.choice(self.created)}", json={"grid_position": self.rng.choice(GRID_CELLS)}
+        )
+    
+    async def delete(self):
+        if not self.created:
+            return await self.create()
+        return await self.client.delete(f"/items/{self.created.pop()}")
+    
+    async def highlight(self):
+        return await self.client.post("/highlight", json={"grid_position": self.rng.choice(GRID_CELLS)})
+
+OPERATIONS = ("items", "search", "categories", "item", "create", "update", "delete", "highlight")
+
+async def run_load(client: httpx.AsyncClient, mix: List[Tuple[str, float]], concurrency: int,
+                   duration: float, warmup: float, max_item_id: int, seed: int) -> Dict[str, Any]:
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    records: List[Tuple[str, float, bool]] = []
+    errors: Dict[str, int] = {}
+    
+    loop = asyncio.get_running_loop()
+    measure_from = loop.time() + warmup
+    deadline = measure_from + duration
+    
+    async def user(index: int):
+        worker = Worker(client, random.Random(seed + index), max_item_id)
+        while loop.time() < deadline:
+            name = worker.rng.choices(names, weights)[0]
+            started = loop.time()
+            try:
+                response = await getattr(worker, name)()
+                ok = response.status_code < 400 or (name == "item" and response.status_code == 404)
+                reason = None if ok else f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                ok, reason = False, type(e).__name__
+            if started >= measure_from:
+                records.append((name, loop.time() - started, ok))
+                if reason:
+                    errors[reason] = errors.get(reason, 0) + 1
+            # 프로세스 내 ASGI 요청은 한 번도 대기하지 않고 끝날 수 있으므로 다른 사용자에게 양보
+            await asyncio.sleep(0)
+    
+    await asyncio.gather(*(user(i) for i in range(concurrency)))
+    
+    operations = {}
+    for name in names:
+        latencies = sorted(latency for op, latency, _ in records if op == name)
+        failed = sum(1 for op, _, ok in records if op == name and not ok)
+        if not latencies:
+            continue
+        operations[name] = {
+            "requests": len(latencies),
+            "rps": round(len(latencies) / duration, 1),
+            "errors": failed,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        }
+    
+    latencies = sorted(latency for _, latency, _ in records)
+    failed = sum(1 for _, _, ok in records if not ok)
+    return {
+        "requests": len(records),
+        "rps": round(len(records) / duration, 1),
+        "error_rate": round(failed / len(records), 4) if records else 0.0,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "operations": operations,
+    }
+
+def prepare_database(items: int, seed: int) -> str:
+    """합성 물품으로 채운 임시 DB 경로 반환"""
+    from backend.database.database import ItemDatabase
+    from generate_inventory import populate
+    
+    path = os.path.join(tempfile.mkdtemp(prefix="loadtest_"), "items.db")
+    db = ItemDatabase(path)
+    populate(db, items, seed=seed)
+    db.close()
+    return path
+
+async def run_inprocess(args, mix) -> Dict[str, Any]:
+    os.environ["DATABASE_URL"] = f"sqlite:///{prepare_database(args.items, args.seed)}"
+    from backend.api import rest_api
+    
+    rest_api.esp32 = make_esp32(args.esp32_latency, args.esp32_url)
+    # 프로세스 내 모드에서는 클라이언트와 서버가 같은 루프를 사용
+    monitor = LagMonitor()
+    monitor.start()
+    try:
+        transport = httpx.ASGITransport(app=rest_api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            result = await run_load(client, mix, args.concurrency, args.duration, args.warmup,
+                                    args.items + 10, args.seed)
+    finally:
+        monitor.stop()
+        rest_api.db.close()
+    result["event_loop_lag"] = monitor.summary()
+    return result
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+async def _wait_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"서버가 {timeout}초 안에 시작되지 않았습니다: {url}")
+
+async def run_against_url(url: str, args, mix) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        return await run_load(client, mix, args.concurrency, args.duration, args.warmup,
+                              args.items + 10, args.seed)
+
+async def run_uvicorn(args, mix) -> Dict[str, Any]:
+    lag_dir = tempfile.mkdtemp(prefix="loadtest_lag_")
+    port = _free_port()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{prepare_database(args.items, args.seed)}",
+        LOADTEST_ESP32_LATENCY=str(args.esp32_latency),
+        LOADTEST_ESP32_URL=args.esp32_url or "",
+        LOADTEST_LAG_DIR=lag_dir,
+        PYTHONPATH=os.pathsep.join([SCRIPTS_DIR, PROJECT_ROOT, os.environ.get("PYTHONPATH", "")]),
+    )
+    server = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "loadtest_api:serve_app", "--factory",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(args.workers), "--log-level", "warning"
+    ], env=env)
+    
+    url = f"http://127.0.0.1:{port}"
+    try:
+        await _wait_ready(url)
+        result = await run_against_url(url, args, mix)
+    finally:
+        server.send_signal(signal.SIGINT)
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    
+    monitor = LagMonitor()
+    for name in os.listdir(lag_dir):
+        with open(os.path.join(lag_dir, name)) as f:
+            monitor.samples.extend(json.load(f))
+    result["event_loop_lag"] = monitor.summary()
+    return result
+
+def print_report(result: Dict[str, Any], duration: float):
+    print(f"\n{'작업':<12}{'요청':>9}{'RPS':>10}{'오류':>7}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}")
+    for name, op in result["operations"].items():
+        print(f"{name:<12}{op['requests']:>9,}{op['rps']:>10,.1f}{op['errors']:>7}"
+              f"{op['p50_ms']:>10.2f}{op['p95_ms']:>10.2f}{op['p99_ms']:>10.2f}")
+    print(f"\n📈 전체: {result['requests']:,}건 / {duration:.0f}초 = {result['rps']:,.1f} RPS, "
+          f"p50 {result['p50_ms']}ms, p95 {result['p95_ms']}ms, p99 {result['p99_ms']}ms")
+    print(f"❗ 오류율: {result['error_rate'] * 100:.2f}% {result['errors'] or ''}")
+    simulator = result.get("esp32_simulator")
+    if simulator:
+        print(f"📡 ESP32 시뮬레이터: 요청 {simulator['requests']:,}건, TCP 커넥션 {simulator['connections']}개, "
+              f"최대 동시 처리 {simulator['max_in_flight']}, 503 {simulator['busy']}건, 주입한 500 {simulator['failed']}건")
+    lag = result.get("event_loop_lag")
+    if lag and lag["samples"]:
+        print(f"⏱️ 이벤트 루프 지연: p50 {lag['p50_ms']}ms, p99 {lag['p99_ms']}ms, 최대 {lag['max_ms']}ms")
+
+def main() -> int:
+    # 요청마다 남는 httpx 로그 숨기기
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    
+    parser = argparse.ArgumentParser(description="REST API 부하 테스트")
+    parser.add_argument("--mode", choices=["inprocess", "uvicorn"], default="inprocess",
+                        help="inprocess: ASGI 직접 호출, uvicorn: 서버 프로세스 실행")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (지정 시 --mode 무시)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 프로세스 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="측정 전 예열 시간(초)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"작업=비율 목록 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--items", type=int, default=10000, help="테스트 DB에 미리 넣을 물품 수")
+    parser.add_argument("--esp32-latency", type=float, default=0.05, help="목업/시뮬레이터 ESP32 응답 지연(초)")
+    parser.add_argument("--esp32-sim", action="store_true", help="목업 대신 로컬 ESP32 HTTP 시뮬레이터 사용")
+    parser.add_argument("--esp32-jitter", type=float, default=0.0, help="시뮬레이터 추가 지연 최대값(초)")
+    parser.add_argument("--esp32-failure-rate", type=float, default=0.0, help="시뮬레이터 500 응답 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 (기본: bench_results/load_<시각>.json)")
+    args = parser.parse_args()
+    
+    mix = parse_mix(args.mix)
+    simulator = start_simulator(args) if args.esp32_sim else None
+    args.esp32_url = simulator.url if simulator else None
+    print(f"🚀 부하 테스트: {args.url or args.mode}, 동시 사용자 {args.concurrency}, "
+          f"{args.duration:.0f}초 (예열 {args.warmup:.0f}초)")
+    
+    if args.url:
+        result = asyncio.run(run_against_url(args.url, args, mix))
+    elif args.mode == "uvicorn":
+        result = asyncio.run(run_uvicorn(args, mix))
+    else:
+        result = asyncio.run(run_inprocess(args, mix))
+    
+    if simulator:
+        result["esp32_simulator"] = simulator.simulator.stats()
+        simulator.stop()
+    print_report(result, args.duration)
+    
+    output = args.output or os.path.join("bench_results", f"load_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "target": args.url or args.mode,
+                "workers": args.workers if args.mode == "uvicorn" and not args.url else None,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "mix": dict(mix),
+                "items": args.items,
+                "esp32_latency": args.esp32_latency,
+                "esp32": "simulator" if args.esp32_sim else "mock",
+            },
+            "result": result
+        }, f, ensure_ascii=False, indent=2)
+    print(f"💾 결과 저장: {output}")
+    return 1 if result["error_rate"] > 0.01 else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
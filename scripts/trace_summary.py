@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+트레이싱 스팬 요약
+backend/core/tracing.py가 기록한 JSONL 파일을 읽어 요청(트레이스)별로
+플레임 형태의 시간 분해를 출력합니다. 같은 부모 아래 같은 이름의 스팬은
+한 줄로 합쳐 "×횟수"로 표시합니다 (예: 반복된 search_items 호출).
+
+사용 예:
+    TRACE_FILE=traces/spans.jsonl streamlit run frontend/intelligent_chatbot_client.py
+    python scripts/trace_summary.py traces/spans.jsonl                 # 최근 5개 요청
+    python scripts/trace_summary.py traces/spans.jsonl --slowest 3     # 가장 느린 3개 요청
+    python scripts/trace_summary.py traces/spans.jsonl --aggregate     # 전체 요청 합산
+    python scripts/trace_summary.py traces/spans.jsonl --folded > out.folded   # flamegraph.pl 입력
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from backend.core.tracing import read_spans
+
+BAR_WIDTH = 30
+
+class Node:
+    """같은 경로의 스팬 묶음 (포함 시간, 자체 시간, 호출 수)"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total_ms = 0.0
+        self.errors = 0
+        self.children: Dict[str, "Node"] = {}
+    
+    @property
+    def self_ms(self) -> float:
+        return max(self.total_ms - sum(c.total_ms for c in self.children.values()), 0.0)
+    
+    def child(self, name: str) -> "Node":
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = Node(name)
+        return node
+
+def group_traces(spans: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    traces: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for span in spans:
+        traces[span["trace_id"]].append(span)
+    return traces
+
+def add_trace(root: Node, spans: List[Dict[str, Any]]):
+    """트레이스 하나를 이름 경로 트리에 합산 (부모가 기록되지 않은 스팬은 루트로 취급)"""
+    ids = {span["span_id"] for span in spans}
+    children = defaultdict(list)
+    for span in spans:
+        parent = span.get("parent_id")
+        children[parent if parent in ids else None].append(span)
+    
+    def visit(node: Node, span: Dict[str, Any]):
+        current = node.child(span["name"])
+        current.count += 1
+        current.total_ms += span["duration_ms"]
+        if span.get("error"):
+            current.errors += 1
+        for child in sorted(children[span["span_id"]], key=lambda s: s["start"]):
+            visit(current, child)
+    
+    for span in sorted(children[None], key=lambda s: s["start"]):
+        visit(root, span)
+
+def trace_info(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """트레이스의 루트 스팬 정보 (시작 시각, 전체 시간)"""
+    ids = {span["span_id"] for span in spans}
+    roots = [s for s in spans if s.get("parent_id") not in ids]
+    first = min(roots, key=lambda s: s["start"])
+    return {
+        "trace_id": first["trace_id"],
+        "name": first["name"],
+        "start": first["start"],
+        "duration_ms": sum(s["duration_ms"] for s in roots),
+        "spans": len(spans)
+    }
+
+def render(root: Node, min_ms: float = 0.0) -> List[str]:
+    """들여쓰기 트리 + 포함 시간 막대"""
+    total = sum(c.total_ms for c in root.children.values()) or 1.0
+    lines = [f"{'total':>10} {'self':>10} {'%':>6}  {'':<{BAR_WIDTH}}  span"]
+    
+    def visit(node: Node, depth: int):
+        if node.total_ms < min_ms:
+            return
+        share = node.total_ms / total
+        bar = "█" * max(1, round(share * BAR_WIDTH)) if node.total_ms else ""
+        name = node.name + (f" ×{node.count}" if node.count > 1 else "")
+        if node.errors:
+            name += f"  [오류 {node.errors}]"
+        lines.append(
+            f"{node.total_ms:>8.1f}ms {node.self_ms:>8.1f}ms {share * 100:>5.1f}%  "
+            f"{bar:<{BAR_WIDTH}}  {'  ' * depth}{name}"
+        )
+        for child in sorted(node.children.values(), key=lambda c: c.total_ms, reverse=True):
+            visit(child, depth + 1)
+    
+    for child in sorted(root.children.values(), key=lambda c: c.total_ms, reverse=True):
+        visit(child, 0)
+    return lines
+
+def folded(root: Node) -> List[str]:
+    """flamegraph.pl 입력 형식 (경로;경로 자체시간_us)"""
+    lines = []
+    
+    def visit(node: Node, path: List[str]):
+        path = path + [node.name.replace(";", ",")]
+        self_us = round(node.self_ms * 1000)
+        if self_us:
+            lines.append(f"{';'.join(path)} {self_us}")
+        for child in node.children.values():
+            visit(child, path)
+    
+    for child in root.children.values():
+        visit(child, [])
+    return lines
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="트레이싱 스팬(JSONL) 요청별 시간 분해")
+    parser.add_argument("file", help="스팬 JSONL 파일 (TRACE_FILE)")
+    parser.add_argument("--trace", help="특정 트레이스 ID (앞부분만 입력해도 됨)")
+    parser.add_argument("--last", type=int, default=5, help="최근 N개 요청 (기본 5)")
+    parser.add_argument("--slowest", type=int, help="가장 느린 N개 요청")
+    parser.add_argument("--name", help="루트 스팬 이름 필터 (예: IntelligentChatBot.process_query)")
+    parser.add_argument("--aggregate", action="store_true", help="선택한 요청을 하나의 트리로 합산")
+    parser.add_argument("--folded", action="store_true", help="flamegraph.pl 입력 형식으로 출력")
+    parser.add_argument("--min-ms", type=float, default=0.0, help="이보다 짧은 노드는 생략")
+    args = parser.parse_args()
+    
+    try:
+        spans = read_spans(args.file)
+    except FileNotFoundError:
+        print(f"❌ 파일이 없습니다: {args.file}", file=sys.stderr)
+        return 1
+    
+    traces = group_traces(spans)
+    infos = [trace_info(s) for s in traces.values()]
+    if args.trace:
+        infos = [i for i in infos if i["trace_id"].startswith(args.trace)]
+    if args.name:
+        infos = [i for i in infos if i["name"] == args.name]
+    
+    if args.slowest:
+        infos = sorted(infos, key=lambda i: i["duration_ms"], reverse=True)[:args.slowest]
+    elif not args.trace:
+        infos = sorted(infos, key=lambda i: i["start"])[-args.last:]
+    
+    if not infos:
+        print("표시할 트레이스가 없습니다.", file=sys.stderr)
+        return 1
+    
+    if args.aggregate or args.folded:
+        root = Node("")
+        for info in infos:
+            add_trace(root, traces[info["trace_id"]])
+        if args.folded:
+            print("\n".join(folded(root)))
+        else:
+            print(f"📊 {len(infos)}개 요청 합산 (스팬 {sum(i['spans'] for i in infos)}개)\n")
+            print("\n".join(render(root, args.min_ms)))
+        return 0
+    
+    for info in infos:
+        root = Node("")
+        add_trace(root, traces[info["trace_id"]])
+        started = datetime.fromtimestamp(info["start"]).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"🔎 {info['trace_id']}  {info['name']}  {info['duration_ms']:.1f}ms  ({started}, 스팬 {info['spans']}개)")
+        print("\n".join(render(root, args.min_ms)))
+        print()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())